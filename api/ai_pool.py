@@ -0,0 +1,439 @@
+"""
+Bounded thread pool for blocking AI calls.
+
+AICoach, AIValidator and DocumentExtractor use the synchronous Anthropic
+client, which is shared with the Streamlit app. Calling them directly inside
+an `async def` endpoint blocks the event loop for the whole LLM round trip,
+freezing every other request on the worker. Routers instead await
+`run_in_ai_pool()`, which runs the call on a small dedicated thread pool:
+
+- at most AI_MAX_CONCURRENCY calls run at once
+- waiting calls get a thread in priority order, using the gateway's lanes:
+  INTERACTIVE calls (chat, coaching) ahead of BACKGROUND ones (AI
+  validation, document extraction), first come first served within a lane;
+  AI_RESERVED_INTERACTIVE threads never run BACKGROUND calls, so chat gets
+  a thread even while long extractions occupy the rest
+- at most AI_MAX_QUEUED more wait for a thread; beyond that, or after
+  waiting AI_QUEUE_TIMEOUT seconds, the request is refused with 503 rather
+  than piling up
+- a call running longer than AI_REQUEST_TIMEOUT seconds (counted from when
+  it gets a thread, not from when it was queued) is answered with 504;
+  document extraction runs far longer and passes AI_EXTRACTION_TIMEOUT
+- a call whose caller gives up (timeout or disconnect) has its CancelScope
+  cancelled: the gateway closes its open response stream and sends no
+  further requests for it, so the thread is freed instead of streaming on
+
+Streaming calls (a generator of text chunks) go through `open_stream()`,
+which hands chunks to the event loop as the thread produces them. The
+stream holds its thread until it ends; AI_REQUEST_TIMEOUT then bounds the
+wait for each chunk rather than the whole reply. Time to first chunk is
+recorded for every stream and reported by `stats()`.
+
+Configuration (environment variables):
+    AI_MAX_CONCURRENCY       Concurrent AI calls per worker (default 4)
+    AI_RESERVED_INTERACTIVE  Of those, threads kept for INTERACTIVE calls (default 1)
+    AI_MAX_QUEUED            AI calls allowed to wait for a thread (default 16)
+    AI_QUEUE_TIMEOUT         Seconds a call may wait for a thread (default 60)
+    AI_REQUEST_TIMEOUT       Seconds before a running AI call is abandoned (default 90)
+    AI_EXTRACTION_TIMEOUT    The same for each document extraction chunk (default 600)
+"""
+
+import asyncio
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from fastapi import HTTPException
+
+from src.pyramid_builder.ai.gateway import BACKGROUND, INTERACTIVE, LANES, CancelScope
+from src.pyramid_builder.settings import env_number
+
+AI_MAX_CONCURRENCY = int(env_number("AI_MAX_CONCURRENCY", 4) or 1)
+AI_RESERVED_INTERACTIVE = env_number("AI_RESERVED_INTERACTIVE", 1) or 0
+AI_MAX_QUEUED = env_number("AI_MAX_QUEUED", 16)
+AI_QUEUE_TIMEOUT: Optional[float] = env_number("AI_QUEUE_TIMEOUT", 60.0, cast=float)
+AI_REQUEST_TIMEOUT: Optional[float] = env_number("AI_REQUEST_TIMEOUT", 90.0, cast=float)
+AI_EXTRACTION_TIMEOUT: Optional[float] = env_number("AI_EXTRACTION_TIMEOUT", 600.0, cast=float)
+
+# Recent streams kept for the time-to-first-chunk percentiles
+TTFT_SAMPLES = 200
+
+logger = logging.getLogger(__name__)
+
+
+class _PriorityExecutor:
+    """
+    Worker threads taking queued calls in lane order.
+
+    Like ThreadPoolExecutor, but a queued INTERACTIVE call is started before
+    any queued BACKGROUND call, and at most `max_background` threads run
+    BACKGROUND calls at a time. Threads are started on the first submit.
+    """
+
+    def __init__(self, max_workers: int, max_background: int):
+        self.max_workers = max_workers
+        self.max_background = max_background
+        self._cond = threading.Condition()
+        self._queues = {priority: deque() for priority in LANES}
+        self._running = {priority: 0 for priority in LANES}
+        self._threads: List[threading.Thread] = []
+
+    def submit(self, func: Callable[..., Any], *args, priority: int = INTERACTIVE) -> Future:
+        """Queue a call in its lane; returns its future."""
+        future: Future = Future()
+        with self._cond:
+            self._queues[priority].append((future, func, args))
+            while len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work, name=f"ai-call_{len(self._threads)}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+            self._cond.notify()
+        return future
+
+    def queued(self) -> Dict[str, int]:
+        """Calls waiting for a thread, per lane."""
+        with self._cond:
+            return {
+                LANES[priority]: sum(not future.cancelled() for future, _, _ in queue)
+                for priority, queue in self._queues.items()
+            }
+
+    def _next(self) -> Optional[tuple]:
+        """The next call to start, by lane, or None; call with the lock held."""
+        for priority in sorted(self._queues):
+            queue = self._queues[priority]
+            if not queue:
+                continue
+            if priority == BACKGROUND and self._running[BACKGROUND] >= self.max_background:
+                continue
+            return (priority, *queue.popleft())
+        return None
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next()
+                while job is None:
+                    self._cond.wait()
+                    job = self._next()
+                priority, future, func, args = job
+                self._running[priority] += 1
+            try:
+                # False if the caller cancelled it while it was queued
+                if future.set_running_or_notify_cancel():
+                    try:
+                        result = func(*args)
+                    except BaseException as e:
+                        future.set_exception(e)
+                    else:
+                        future.set_result(result)
+            finally:
+                with self._cond:
+                    self._running[priority] -= 1
+                    # A BACKGROUND call may have been waiting for this lane
+                    self._cond.notify_all()
+
+
+class AIPool:
+    """A priority thread pool with an admission limit, queue timeout and per-call timeout."""
+
+    def __init__(
+        self,
+        max_concurrency: int = AI_MAX_CONCURRENCY,
+        max_queued: Optional[int] = AI_MAX_QUEUED,
+        timeout: Optional[float] = AI_REQUEST_TIMEOUT,
+        queue_timeout: Optional[float] = AI_QUEUE_TIMEOUT,
+        reserved_interactive: int = AI_RESERVED_INTERACTIVE,
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            max_concurrency: Worker threads, i.e. calls running at once
+            max_queued: Calls allowed to wait for a thread (None = unbounded)
+            timeout: Seconds a call may run before it is abandoned (None = never)
+            queue_timeout: Seconds a call may wait for a thread (None = forever)
+            reserved_interactive: Threads that only run INTERACTIVE calls
+                (BACKGROUND calls always get at least one)
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queued = max_queued
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self.max_background = max(1, max_concurrency - reserved_interactive)
+        self._executor = _PriorityExecutor(max_concurrency, self.max_background)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.streams = 0
+        self._ttft_ms: deque = deque(maxlen=TTFT_SAMPLES)
+
+    def _admit(self) -> None:
+        """Count a new call in flight, or refuse it when saturated."""
+        with self._lock:
+            saturated = self.max_queued is not None and self._in_flight >= self.max_concurrency + self.max_queued
+            if not saturated:
+                self._in_flight += 1
+        if saturated:
+            raise self._refuse()
+
+    def _refuse(self) -> HTTPException:
+        """Count a refused call and return the 503 to raise."""
+        with self._lock:
+            self.rejected += 1
+        return HTTPException(
+            status_code=503,
+            detail="AI service busy. Please retry shortly.",
+        )
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args,
+        priority: int = INTERACTIVE,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Run a blocking call on the pool without blocking the event loop.
+
+        Args:
+            priority: Lane the call waits in (INTERACTIVE or BACKGROUND)
+            timeout: Seconds the call may run once it has a thread
+                (default: the pool's timeout)
+
+        Raises:
+            HTTPException: 503 if the pool is saturated or no thread frees
+                up within queue_timeout, 504 on timeout
+        """
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        started = asyncio.Event()
+        scope = CancelScope()
+
+        def call():
+            loop.call_soon_threadsafe(started.set)
+            with scope:
+                return func(*args, **kwargs)
+
+        self._admit()
+        try:
+            future = self._executor.submit(call, priority=priority)
+        except BaseException:
+            self._call_done(None)
+            raise
+        # Released when the thread finishes (or the queued call is
+        # cancelled), not when the caller stops waiting
+        future.add_done_callback(self._call_done)
+
+        try:
+            try:
+                await asyncio.wait_for(started.wait(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                # Unless a thread picked it up just now
+                if future.cancel():
+                    raise self._refuse()
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            scope.cancel()
+            with self._lock:
+                self.timeouts += 1
+            raise HTTPException(
+                status_code=504,
+                detail=f"AI call timed out after {timeout:g}s",
+            )
+        except BaseException:
+            # Refused, failed or the caller went away: stop the call too
+            future.cancel()
+            scope.cancel()
+            raise
+
+    def open_stream(
+        self, func: Callable[..., Iterable[Any]], *args, priority: int = INTERACTIVE, **kwargs
+    ) -> "AIStream":
+        """
+        Start a blocking generator on the pool and iterate it asynchronously.
+
+        Must be called from the event loop. Admission is checked here, so a
+        saturated pool refuses the request before any response is sent.
+        `priority` is the lane it waits in, as for run().
+
+        Raises:
+            HTTPException: 503 if the pool is saturated
+        """
+        loop = asyncio.get_running_loop()
+        self._admit()
+        stream = AIStream(self, loop)
+
+        try:
+            future = self._executor.submit(stream._produce, func, args, kwargs, priority=priority)
+        except BaseException:
+            self._call_done(None)
+            raise
+        future.add_done_callback(self._call_done)
+        stream._future = future
+        with self._lock:
+            self.streams += 1
+        return stream
+
+    def _record_ttft(self, ms: float) -> None:
+        with self._lock:
+            self._ttft_ms.append(ms)
+
+    def _call_done(self, future: Optional[Future]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if future is not None and not future.cancelled():
+                self.completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool occupancy and outcome counters."""
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "max_queued": self.max_queued,
+                "max_background": self.max_background,
+                "timeout": self.timeout,
+                "queue_timeout": self.queue_timeout,
+                "in_flight": self._in_flight,
+                "queued": self._executor.queued(),
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "streams": self.streams,
+                "ttft_ms": _percentiles(self._ttft_ms),
+            }
+
+
+class AIStream:
+    """
+    Async iterator over the chunks of a generator running on an AIPool thread.
+
+    The thread pushes chunks onto an asyncio queue as they arrive. Closing
+    the stream (aclose, e.g. when the client disconnects or a chunk times
+    out) cancels its CancelScope, closing the API response the generator
+    reads, and the thread stops and closes the generator.
+    """
+
+    def __init__(self, pool: AIPool, loop: asyncio.AbstractEventLoop):
+        self._pool = pool
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._closed = threading.Event()
+        self._scope = CancelScope()
+        self._running = asyncio.Event()
+        self._future: Optional[Future] = None
+        self._done = False
+        self.started = time.perf_counter()
+        # Milliseconds from open_stream() to the first chunk, once known
+        self.ttft_ms: Optional[float] = None
+        self.chunks = 0
+
+    def _produce(self, func: Callable[..., Iterable[Any]], args, kwargs) -> None:
+        """Run on the pool thread: iterate the generator, forwarding chunks."""
+        try:
+            self._loop.call_soon_threadsafe(self._running.set)
+        except RuntimeError:
+            return
+        try:
+            with self._scope:
+                iterator = iter(func(*args, **kwargs))
+                try:
+                    for chunk in iterator:
+                        if self._closed.is_set():
+                            break
+                        self._put(("chunk", chunk))
+                finally:
+                    close = getattr(iterator, "close", None)
+                    if close is not None:
+                        close()
+            self._put(("end", None))
+        except BaseException as e:
+            self._put(("error", e))
+
+    def _put(self, item) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        except RuntimeError:
+            # Event loop already closed: nobody is listening any more
+            self._closed.set()
+
+    def __aiter__(self) -> "AIStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._done:
+            raise StopAsyncIteration
+        if not self._running.is_set():
+            # The chunk timeout starts once the generator has a thread
+            try:
+                await asyncio.wait_for(self._running.wait(), self._pool.queue_timeout)
+            except asyncio.TimeoutError:
+                if self._future.cancel():
+                    await self.aclose()
+                    raise self._pool._refuse()
+        try:
+            kind, value = await asyncio.wait_for(self._queue.get(), self._pool.timeout)
+        except asyncio.TimeoutError:
+            with self._pool._lock:
+                self._pool.timeouts += 1
+            await self.aclose()
+            raise HTTPException(
+                status_code=504,
+                detail=f"AI stream stalled for {self._pool.timeout:g}s",
+            )
+
+        if kind == "chunk":
+            if self.ttft_ms is None:
+                self.ttft_ms = round((time.perf_counter() - self.started) * 1000, 1)
+                self._pool._record_ttft(self.ttft_ms)
+                logger.info("AI stream first chunk after %.1f ms", self.ttft_ms)
+            self.chunks += 1
+            return value
+
+        self._done = True
+        if kind == "error":
+            raise value
+        raise StopAsyncIteration
+
+    async def aclose(self) -> None:
+        """Stop iterating and close the API response; the pool thread then stops."""
+        self._done = True
+        self._closed.set()
+        if self._future is not None:
+            self._future.cancel()
+        self._scope.cancel()
+
+    @property
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 1)
+
+
+def _percentiles(samples) -> Optional[Dict[str, float]]:
+    """p50/p95/max of recent samples, or None before the first one."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return {
+        "p50": round(statistics.median(ordered), 1),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+        "max": round(ordered[-1], 1),
+        "samples": len(ordered),
+    }
+
+
+# Shared by every router
+ai_pool = AIPool()
+
+
+async def run_in_ai_pool(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking AI call on the shared pool (see AIPool.run)."""
+    return await ai_pool.run(func, *args, **kwargs)
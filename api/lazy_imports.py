@@ -0,0 +1,70 @@
+"""
+AI modules imported on first use.
+
+The AI services bring in the Anthropic SDK, httpx and the document parsers,
+which take over a second to import. Routers refer to them through
+LazyImport, so the API starts and serves pyramid, validation and export
+requests without loading them. The first AI request imports them once:
+
+    AICoach = LazyImport("src.pyramid_builder.ai.coach", "AICoach")
+
+    if not AICoach.available:      # imports the module; False on ImportError
+        ...
+    coach = AICoach(timeout=30)    # calls the class
+    AICoach.MAX_TOKENS             # attributes of the class
+"""
+
+import importlib
+import threading
+from typing import Any, Optional
+
+
+class LazyImport:
+    """Stands in for `from <module> import <name>` until first used."""
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._target: Any = None
+        self._error: Optional[ImportError] = None
+
+    def load(self) -> Any:
+        """
+        Import the module (once) and return the object.
+
+        Raises:
+            ImportError: The module or one of its dependencies is missing
+        """
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    try:
+                        self._target = getattr(importlib.import_module(self.module), self.name)
+                    except ImportError as e:
+                        self._error = e
+                    self._loaded = True
+        if self._error is not None:
+            raise ImportError(f"{self.module}.{self.name} unavailable: {self._error}") from self._error
+        return self._target
+
+    @property
+    def available(self) -> bool:
+        """Whether the object can be imported (importing it if not yet done)."""
+        try:
+            self.load()
+            return True
+        except ImportError:
+            return False
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the import has been attempted."""
+        return self._loaded
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.load()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
@@ -10,6 +10,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from api.routers import pyramids, validation, exports, visualizations, ai, documents, context
+from api.ai_pool import ai_pool
+from api.parse_pool import parse_pool
+from src.pyramid_builder.ai.document_cache import get_document_cache
+from src.pyramid_builder.ai.gateway import ai_gateway
+from src.pyramid_builder.ai.prompt_cache import prompt_cache_stats
+from src.pyramid_builder.ai.response_cache import get_response_cache
+from api.session_store import SESSION_STORES
 
 app = FastAPI(
     title="Strategic Pyramid Builder API",
@@ -58,6 +65,31 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/sessions")
+async def session_stats():
+    """Session store occupancy and cache hit/miss/eviction counters."""
+    return {namespace: store.stats() for namespace, store in SESSION_STORES.items()}
+
+
+@app.get("/health/ai")
+async def ai_pool_stats():
+    """AI call pool occupancy, gateway, response cache and prompt cache counters."""
+    cache = get_response_cache()
+    return {
+        **ai_pool.stats(),
+        "gateway": ai_gateway.stats(),
+        "cache": cache.stats() if cache else None,
+        "prompt_cache": prompt_cache_stats.stats(),
+    }
+
+
+@app.get("/health/parse")
+async def parse_pool_stats():
+    """Document parsing pool size and outcome counters, and document cache stats."""
+    cache = get_document_cache()
+    return {**parse_pool.stats(), "document_cache": cache.stats() if cache else None}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,239 @@
+"""
+Process pool for CPU-bound document parsing.
+
+pypdf, python-docx and python-pptx parse in pure Python, holding the GIL:
+on a thread they would still stall the event loop, and one file at a time
+a 5-file upload takes the sum of its parse times. Routers instead iterate
+`parse_pool.parse_each()`, which parses every file in a separate worker
+process and yields each result as soon as that file is done.
+
+- at most PARSE_MAX_WORKERS files are parsed at once, further files wait
+  for a free worker (the default of 5 parses a whole upload at once; with
+  fewer CPUs the processes share them)
+- a file not parsed within PARSE_TIMEOUT seconds of starting gets an
+  error result; its worker cannot be interrupted, so the pool is retired
+  (new files go to a fresh pool) and its processes are terminated once the
+  other files still running on it have finished
+
+Worker processes are started with "spawn" (forking a process that runs
+threads is unsafe) when the first upload arrives, and reused after that.
+
+Configuration (environment variables):
+    PARSE_MAX_WORKERS   Files parsed at once (default 5)
+    PARSE_TIMEOUT       Seconds allowed per file (default 30)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+from src.pyramid_builder.settings import env_number
+
+PARSE_MAX_WORKERS = int(env_number("PARSE_MAX_WORKERS", 5) or 1)
+PARSE_TIMEOUT: Optional[float] = env_number("PARSE_TIMEOUT", 30.0, cast=float)
+
+# Seconds between checks for a free worker while files are queued
+QUEUE_POLL_INTERVAL = 0.05
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_document(file_content: bytes, filename: str, **options) -> Dict[str, Any]:
+    """Run in a worker process: parse one file with DocumentParser."""
+    from src.pyramid_builder.ai.document_parser import DocumentParser
+
+    return DocumentParser.parse(file_content, filename, **options)
+
+
+class _Generation:
+    """One ProcessPoolExecutor and the files submitted to it."""
+
+    def __init__(self, max_workers: int):
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self.running: Set[Future] = set()
+        self.abandoned: Set[Future] = set()
+        self.retired = False
+        self.closed = False
+
+
+class ParsePool:
+    """A process pool yielding parse results as files finish, with timeouts."""
+
+    def __init__(
+        self,
+        parse: Callable[..., Dict[str, Any]] = _parse_document,
+        max_workers: int = PARSE_MAX_WORKERS,
+        timeout: Optional[float] = PARSE_TIMEOUT,
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            parse: Picklable function (file_content, filename, **options) -> parse result
+            max_workers: Worker processes, i.e. files parsed at once
+            timeout: Seconds allowed per file (None = never time out)
+        """
+        self.parse = parse
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._generation: Optional[_Generation] = None
+        self.parsed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.restarts = 0
+
+    def _try_submit(self, file_content: bytes, filename: str, options: Dict[str, Any]) -> Optional[Tuple[_Generation, Future]]:
+        """Start parsing a file if a worker is free, so it runs at once."""
+        with self._lock:
+            if self._generation is None:
+                self._generation = _Generation(self.max_workers)
+            generation = self._generation
+            if len(generation.running) >= self.max_workers:
+                return None
+            future = generation.executor.submit(self.parse, file_content, filename, **options)
+            generation.running.add(future)
+        future.add_done_callback(lambda f: self._finished(generation, f))
+        return generation, future
+
+    def _finished(self, generation: _Generation, future: Future) -> None:
+        with self._lock:
+            generation.running.discard(future)
+        self._reap(generation)
+
+    def _retire(self, generation: _Generation, future: Future) -> None:
+        """Stop using a pool whose worker is stuck on `future`."""
+        with self._lock:
+            generation.abandoned.add(future)
+            if not generation.retired:
+                generation.retired = True
+                self.restarts += 1
+                if self._generation is generation:
+                    self._generation = None
+        self._reap(generation)
+
+    def _drop(self, generation: _Generation) -> None:
+        """Stop using a pool that can no longer run tasks."""
+        with self._lock:
+            if not generation.retired:
+                generation.retired = True
+                self.restarts += 1
+            if self._generation is generation:
+                self._generation = None
+            generation.running.clear()
+            generation.closed = True
+        generation.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _reap(self, generation: _Generation) -> None:
+        """Terminate a retired pool once only abandoned files are left on it."""
+        with self._lock:
+            if generation.closed or not generation.retired or generation.running - generation.abandoned:
+                return
+            generation.closed = True
+        # ProcessPoolExecutor has no public way to stop a running task
+        for process in list((generation.executor._processes or {}).values()):
+            process.terminate()
+        generation.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def parse_each(self, files: List[Tuple[str, bytes]], **options) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Parse files in parallel, yielding (index, result) as each finishes.
+
+        Failures (an exception in the parser, a crashed worker, a file
+        still parsing `timeout` seconds after it started) are yielded as
+        {"success": False, "error": ...} results, so every file yields
+        exactly once.
+
+        Args:
+            files: (filename, file_content) pairs
+            options: Keyword arguments for the parse function (e.g. max_chars)
+        """
+        loop = asyncio.get_running_loop()
+        queued = deque(enumerate(files))
+        waiting: Dict[asyncio.Future, Tuple[int, str, _Generation, Future]] = {}
+        deadlines: Dict[asyncio.Future, float] = {}
+        try:
+            while queued or waiting:
+                # Files are only handed to free workers, so each starts
+                # running straight away and its timeout starts now
+                while queued:
+                    index, (filename, file_content) = queued[0]
+                    submitted = self._try_submit(file_content, filename, options)
+                    if submitted is None:
+                        break
+                    queued.popleft()
+                    generation, future = submitted
+                    wrapped = asyncio.wrap_future(future)
+                    waiting[wrapped] = (index, filename, generation, future)
+                    if self.timeout is not None:
+                        deadlines[wrapped] = loop.time() + self.timeout
+
+                wait = min(deadlines.values()) - loop.time() if deadlines else None
+                if queued:
+                    wait = QUEUE_POLL_INTERVAL if wait is None else min(wait, QUEUE_POLL_INTERVAL)
+                if wait is not None:
+                    wait = max(wait, 0)
+                if not waiting:
+                    await asyncio.sleep(wait)
+                    continue
+
+                done, _ = await asyncio.wait(waiting, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+
+                for wrapped in done:
+                    index, filename, generation, _ = waiting.pop(wrapped)
+                    deadlines.pop(wrapped, None)
+                    try:
+                        result = wrapped.result()
+                    except Exception as e:
+                        if isinstance(e, BrokenProcessPool):
+                            # A worker died (e.g. out of memory): start afresh
+                            self._drop(generation)
+                        result = {"success": False, "error": f"Parse error: {str(e)}"}
+                    with self._lock:
+                        if result.get("success"):
+                            self.parsed += 1
+                        else:
+                            self.failed += 1
+                    yield index, result
+
+                now = loop.time()
+                expired = [wrapped for wrapped, deadline in deadlines.items() if now >= deadline]
+                for wrapped in expired:
+                    index, filename, generation, future = waiting.pop(wrapped)
+                    del deadlines[wrapped]
+                    wrapped.cancel()
+                    with self._lock:
+                        self.timeouts += 1
+                    logger.warning("Parsing %s timed out after %gs", filename, self.timeout)
+                    self._retire(generation, future)
+                    yield index, {
+                        "success": False,
+                        "error": f"Parsing timed out after {self.timeout:g}s",
+                    }
+        finally:
+            # Caller stopped early: the remaining files are not needed
+            for wrapped in waiting:
+                wrapped.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size and outcome counters."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "timeout": self.timeout,
+                "parsed": self.parsed,
+                "failed": self.failed,
+                "timeouts": self.timeouts,
+                "restarts": self.restarts,
+            }
+
+
+# Shared by all document import requests in this worker process
+parse_pool = ParsePool()
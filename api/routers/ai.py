@@ -1,89 +1,143 @@
 """AI Coaching API endpoints."""
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
 import os
+import time
 
+from src.pyramid_builder.models.jargon import JARGON_MATCHER
+from ..ai_pool import ai_pool, run_in_ai_pool
+from ..lazy_imports import LazyImport
+from ..session_locks import session_locks
+from ..sse import sse_event
 from .pyramids import active_pyramids
 from .context import context_storage, scoring_storage, tension_storage, stakeholder_storage
 
-# Try to import AI coach
-try:
-    from src.pyramid_builder.ai.coach import AICoach
-    AI_COACH_AVAILABLE = True
-except ImportError:
-    AI_COACH_AVAILABLE = False
+# AI coach, imported on the first AI request
+AICoach = LazyImport("src.pyramid_builder.ai.coach", "AICoach")
 
 router = APIRouter()
 
 
+def _socc_context(socc_analysis) -> Optional[List[Dict[str, Any]]]:
+    if not socc_analysis.items:
+        return None
+    return [
+        {
+            "quadrant": item.quadrant,
+            "title": item.title,
+            "description": item.description,
+            "impact_level": item.impact_level
+        }
+        for item in socc_analysis.items
+    ]
+
+
+def _scoring_context(scoring_analysis) -> Optional[Dict[str, Dict[str, Any]]]:
+    if not scoring_analysis.scores:
+        return None
+    return {
+        score.opportunity_item_id: {
+            "strength_match": score.strength_match,
+            "consideration_risk": score.consideration_risk,
+            "constraint_impact": score.constraint_impact,
+            "rationale": score.rationale
+        }
+        for score in scoring_analysis.scores
+    }
+
+
+def _tension_context(tension_analysis) -> Optional[List[Dict[str, Any]]]:
+    if not tension_analysis.tensions:
+        return None
+    return [
+        {
+            "name": tension.name,
+            "left_pole": tension.left_pole,
+            "right_pole": tension.right_pole,
+            "current_position": tension.current_position,
+            "target_position": tension.target_position,
+            "rationale": tension.rationale
+        }
+        for tension in tension_analysis.tensions
+    ]
+
+
+def _stakeholder_context(stakeholder_analysis) -> Optional[List[Dict[str, Any]]]:
+    if not stakeholder_analysis.stakeholders:
+        return None
+    return [
+        {
+            "name": stakeholder.name,
+            "interest_level": stakeholder.interest_level,
+            "influence_level": stakeholder.influence_level,
+            "alignment": stakeholder.alignment,
+            "key_needs": stakeholder.key_needs
+        }
+        for stakeholder in stakeholder_analysis.stakeholders
+    ]
+
+
+# Context data key, session store, and how to build that part
+CONTEXT_SECTIONS = [
+    ("socc_items", context_storage, _socc_context),
+    ("opportunity_scores", scoring_storage, _scoring_context),
+    ("tensions", tension_storage, _tension_context),
+    ("stakeholders", stakeholder_storage, _stakeholder_context),
+]
+
+
 def build_context_data(session_id: str) -> Optional[Dict[str, Any]]:
-    """Build complete context data for AI coach including all Step 1 artifacts."""
-    context_data = {}
+    """
+    Build complete context data for AI coach including all Step 1 artifacts.
 
-    # SOCC Analysis
-    if session_id in context_storage:
-        socc_analysis = context_storage[session_id]
-        if socc_analysis.items:
-            context_data["socc_items"] = [
-                {
-                    "quadrant": item.quadrant,
-                    "title": item.title,
-                    "description": item.description,
-                    "impact_level": item.impact_level
-                }
-                for item in socc_analysis.items
-            ]
-
-    # Opportunity Scoring
-    if session_id in scoring_storage:
-        scoring_analysis = scoring_storage[session_id]
-        if scoring_analysis.scores:
-            context_data["opportunity_scores"] = {
-                score.opportunity_item_id: {
-                    "strength_match": score.strength_match,
-                    "consideration_risk": score.consideration_risk,
-                    "constraint_impact": score.constraint_impact,
-                    "rationale": score.rationale
-                }
-                for score in scoring_analysis.scores
-            }
-
-    # Strategic Tensions
-    if session_id in tension_storage:
-        tension_analysis = tension_storage[session_id]
-        if tension_analysis.tensions:
-            context_data["tensions"] = [
-                {
-                    "name": tension.name,
-                    "left_pole": tension.left_pole,
-                    "right_pole": tension.right_pole,
-                    "current_position": tension.current_position,
-                    "target_position": tension.target_position,
-                    "rationale": tension.rationale
-                }
-                for tension in tension_analysis.tensions
-            ]
-
-    # Stakeholder Mapping
-    if session_id in stakeholder_storage:
-        stakeholder_analysis = stakeholder_storage[session_id]
-        if stakeholder_analysis.stakeholders:
-            context_data["stakeholders"] = [
-                {
-                    "name": stakeholder.name,
-                    "interest_level": stakeholder.interest_level,
-                    "influence_level": stakeholder.influence_level,
-                    "alignment": stakeholder.alignment,
-                    "key_needs": stakeholder.key_needs
-                }
-                for stakeholder in stakeholder_analysis.stakeholders
-            ]
+    Each part is cached with its session store entry and rebuilt only after
+    that analysis is saved again, so the parts are shared and read-only.
+    """
+    context_data = {}
+    for key, storage, build in CONTEXT_SECTIONS:
+        section = storage.derive(session_id, "ai_context", build)
+        if section:
+            context_data[key] = section
 
     return context_data if context_data else None
 
 
+async def snapshot_session(session_id: str):
+    """
+    Copy a session's pyramid and build its context data under the read lock.
+
+    AI calls then work on the copies, so the session lock is not held for
+    the length of an LLM round trip.
+    """
+    async with session_locks.read(session_id):
+        pyramid = None
+        if session_id in active_pyramids:
+            pyramid = active_pyramids[session_id].pyramid
+            if pyramid:
+                pyramid = pyramid.model_copy(deep=True)
+        return pyramid, build_context_data(session_id)
+
+
+async def snapshot_chat_context(session_id: str, message: Optional[str] = None):
+    """
+    Render a session's pyramid state for the chat prompt under the read lock.
+
+    Uses the session's cached PromptContextRenderer, so only tiers changed
+    since the last message are re-rendered, and the pyramid is not copied.
+    With a message, detail sections are limited to the tiers it relates to.
+    """
+    async with session_locks.read(session_id):
+        pyramid_context = ""
+        if session_id in active_pyramids:
+            manager = active_pyramids[session_id]
+            if manager.pyramid:
+                pyramid_context = manager.get_prompt_context().render(question=message)
+        return pyramid_context, build_context_data(session_id)
+
+
 # Request/Response models
 class SuggestFieldRequest(BaseModel):
     session_id: str
@@ -107,11 +161,13 @@ class ChatRequest(BaseModel):
     session_id: str
     message: str
     chat_history: Optional[List[Dict[str, str]]] = None
+    # Describe every tier; False details only those the message relates to
+    full_context: bool = True
 
 
 def check_ai_available():
     """Check if AI coaching is available."""
-    if not AI_COACH_AVAILABLE:
+    if not AICoach.available:
         raise HTTPException(
             status_code=503,
             detail="AI coaching unavailable. Install anthropic package: pip install anthropic"
@@ -134,17 +190,13 @@ async def suggest_field_improvement(request: SuggestFieldRequest):
     """
     check_ai_available()
 
-    # Get pyramid for context (if exists)
-    pyramid = None
-    if request.session_id in active_pyramids:
-        pyramid = active_pyramids[request.session_id].pyramid
-
-    # Get complete Step 1 context
-    context_data = build_context_data(request.session_id)
+    # Get pyramid and complete Step 1 context
+    pyramid, context_data = await snapshot_session(request.session_id)
 
     try:
-        coach = AICoach(pyramid=pyramid, context=context_data)
-        suggestion = coach.suggest_field_improvement(
+        coach = AICoach(pyramid=pyramid, context=context_data, timeout=ai_pool.timeout)
+        suggestion = await run_in_ai_pool(
+            coach.suggest_field_improvement,
             tier=request.tier,
             field_name=request.field_name,
             current_content=request.current_content,
@@ -152,6 +204,8 @@ async def suggest_field_improvement(request: SuggestFieldRequest):
         )
         return suggestion
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -169,22 +223,20 @@ async def generate_draft(request: GenerateDraftRequest):
     """
     check_ai_available()
 
-    # Get pyramid for context (if exists)
-    pyramid = None
-    if request.session_id in active_pyramids:
-        pyramid = active_pyramids[request.session_id].pyramid
-
-    # Get complete Step 1 context
-    context_data = build_context_data(request.session_id)
+    # Get pyramid and complete Step 1 context
+    pyramid, context_data = await snapshot_session(request.session_id)
 
     try:
-        coach = AICoach(pyramid=pyramid, context=context_data)
-        draft = coach.generate_draft(
+        coach = AICoach(pyramid=pyramid, context=context_data, timeout=ai_pool.timeout)
+        draft = await run_in_ai_pool(
+            coach.generate_draft,
             tier=request.tier,
             context=request.context
         )
         return draft
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -198,14 +250,20 @@ async def detect_jargon(request: DetectJargonRequest):
     Detect jargon and weak language in text.
 
     Quick check for vanilla corporate speak and suggestions for alternatives.
+    Text without any known jargon is answered locally, without the AI.
     """
+    if len(request.text) < 5 or not JARGON_MATCHER.find(request.text):
+        return {"has_jargon": False}
+
     check_ai_available()
 
     try:
-        coach = AICoach()
-        result = coach.detect_jargon(text=request.text)
+        coach = AICoach(timeout=ai_pool.timeout)
+        result = await run_in_ai_pool(coach.detect_jargon, text=request.text)
         return result
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -220,27 +278,104 @@ async def chat_with_coach(request: ChatRequest):
 
     Context-aware conversation with the AI coach.
     Pyramid state and Context (SOCC) analysis are included for relevant advice.
+    Only the pyramid tiers the message relates to are described in detail
+    (all of them if it matches none) when full_context is false.
     """
     check_ai_available()
 
-    # Get pyramid for context (if exists)
-    pyramid = None
-    if request.session_id in active_pyramids:
-        pyramid = active_pyramids[request.session_id].pyramid
-
-    # Get complete Step 1 context
-    context_data = build_context_data(request.session_id)
+    # Rendered pyramid state and complete Step 1 context
+    pyramid_context, context_data = await snapshot_chat_context(
+        request.session_id, None if request.full_context else request.message
+    )
 
     try:
-        coach = AICoach(pyramid=pyramid, context=context_data)
-        response = coach.chat(
+        coach = AICoach(
+            context=context_data, timeout=ai_pool.timeout, pyramid_context=pyramid_context,
+            cache_pyramid_context=request.full_context,
+        )
+        response = await run_in_ai_pool(
+            coach.chat,
             message=request.message,
             chat_history=request.chat_history
         )
         return {"response": response}
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Chat failed: {str(e)}"
         )
+
+
+@router.post("/chat/stream")
+async def chat_with_coach_stream(request: ChatRequest):
+    """
+    Chat with AI coach, streaming the reply as Server-Sent Events.
+
+    Same conversation as /chat, but tokens are forwarded as the model
+    produces them instead of after the whole reply:
+
+        data: {"text": "..."}                          one per text fragment
+        event: done
+        data: {"ttft_ms": ..., "total_ms": ..., ...}   timings, then the stream ends
+        event: error
+        data: {"detail": "..."}                        instead of done on failure
+
+    ttft_ms is the time from receiving the request to sending the first
+    fragment. A busy AI pool is refused with 503 before the stream starts.
+    """
+    received = time.perf_counter()
+    check_ai_available()
+
+    # Rendered pyramid state and complete Step 1 context
+    pyramid_context, context_data = await snapshot_chat_context(
+        request.session_id, None if request.full_context else request.message
+    )
+
+    try:
+        coach = AICoach(
+            context=context_data, timeout=ai_pool.timeout, pyramid_context=pyramid_context,
+            cache_pyramid_context=request.full_context,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Chat failed: {str(e)}"
+        )
+
+    stream = ai_pool.open_stream(
+        coach.chat_stream,
+        message=request.message,
+        chat_history=request.chat_history
+    )
+
+    async def events():
+        ttft_ms = None
+        try:
+            async for text in stream:
+                if ttft_ms is None:
+                    ttft_ms = round((time.perf_counter() - received) * 1000, 1)
+                yield sse_event({"text": text})
+            yield sse_event(
+                {
+                    "ttft_ms": ttft_ms,
+                    "total_ms": round((time.perf_counter() - received) * 1000, 1),
+                    "chunks": stream.chunks,
+                },
+                event="done",
+            )
+        except HTTPException as e:
+            yield sse_event({"detail": e.detail}, event="error")
+        except Exception as e:
+            yield sse_event({"detail": f"Chat failed: {str(e)}"}, event="error")
+        finally:
+            # Also reached when the client disconnects mid-reply
+            await stream.aclose()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
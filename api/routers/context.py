@@ -26,14 +26,26 @@ from src.pyramid_builder.models.context import (
     COMMON_TENSIONS,
 )
 
+from ..session_locks import reads_session, writes_session
+from ..session_store import create_session_store
+
 router = APIRouter()
 
-# In-memory storage for context data (keyed by session ID)
-# In production, would use database like the pyramid data
-socc_storage: Dict[str, SOCCAnalysis] = {}
-scoring_storage: Dict[str, OpportunityScoringAnalysis] = {}
-tension_storage: Dict[str, TensionAnalysis] = {}
-stakeholder_storage: Dict[str, StakeholderAnalysis] = {}
+
+def _analysis_store(namespace: str, model):
+    """Create a session store for one kind of context analysis."""
+    return create_session_store(
+        namespace,
+        dump=lambda analysis: analysis.model_dump_json(),
+        load=model.model_validate_json,
+    )
+
+
+# Storage for context data (keyed by session ID), see api/session_store.py
+socc_storage = _analysis_store("socc", SOCCAnalysis)
+scoring_storage = _analysis_store("scoring", OpportunityScoringAnalysis)
+tension_storage = _analysis_store("tensions", TensionAnalysis)
+stakeholder_storage = _analysis_store("stakeholders", StakeholderAnalysis)
 
 # Export socc_storage as context_storage for use by other routers
 # SOCCAnalysis contains all context data (items, scores, tensions, stakeholders)
@@ -77,21 +89,25 @@ def get_or_create_stakeholders(session_id: str) -> StakeholderAnalysis:
 # ============================================================================
 
 @router.get("/{session_id}/socc")
+@reads_session
 async def get_socc_analysis(session_id: str):
     """Get complete SOCC analysis for a session."""
     return get_or_create_socc(session_id)
 
 
 @router.post("/{session_id}/socc/items", status_code=status.HTTP_201_CREATED)
+@writes_session
 async def add_socc_item(session_id: str, item: SOCCItem):
     """Add a new item to SOCC analysis."""
     analysis = get_or_create_socc(session_id)
     analysis.items.append(item)
     analysis.last_updated = datetime.now()
+    socc_storage.save(session_id, analysis)
     return item
 
 
 @router.put("/{session_id}/socc/items/{item_id}")
+@writes_session
 async def update_socc_item(session_id: str, item_id: str, item: SOCCItem):
     """Update an existing SOCC item."""
     analysis = get_or_create_socc(session_id)
@@ -103,6 +119,7 @@ async def update_socc_item(session_id: str, item_id: str, item: SOCCItem):
             item.created_at = existing_item.created_at
             analysis.items[i] = item
             analysis.last_updated = datetime.now()
+            socc_storage.save(session_id, analysis)
             return item
 
     raise HTTPException(
@@ -112,6 +129,7 @@ async def update_socc_item(session_id: str, item_id: str, item: SOCCItem):
 
 
 @router.delete("/{session_id}/socc/items/{item_id}")
+@writes_session
 async def delete_socc_item(session_id: str, item_id: str):
     """Delete a SOCC item."""
     analysis = get_or_create_socc(session_id)
@@ -126,10 +144,12 @@ async def delete_socc_item(session_id: str, item_id: str):
         )
 
     analysis.last_updated = datetime.now()
+    socc_storage.save(session_id, analysis)
     return {"success": True, "deleted_id": item_id}
 
 
 @router.post("/{session_id}/socc/connections", status_code=status.HTTP_201_CREATED)
+@writes_session
 async def add_socc_connection(session_id: str, connection: SOCCConnection):
     """Add a connection between SOCC items."""
     analysis = get_or_create_socc(session_id)
@@ -151,10 +171,12 @@ async def add_socc_connection(session_id: str, connection: SOCCConnection):
 
     analysis.connections.append(connection)
     analysis.last_updated = datetime.now()
+    socc_storage.save(session_id, analysis)
     return connection
 
 
 @router.delete("/{session_id}/socc/connections/{connection_id}")
+@writes_session
 async def delete_socc_connection(session_id: str, connection_id: str):
     """Delete a connection between SOCC items."""
     analysis = get_or_create_socc(session_id)
@@ -171,6 +193,7 @@ async def delete_socc_connection(session_id: str, connection_id: str):
         )
 
     analysis.last_updated = datetime.now()
+    socc_storage.save(session_id, analysis)
     return {"success": True, "deleted_id": connection_id}
 
 
@@ -179,12 +202,14 @@ async def delete_socc_connection(session_id: str, connection_id: str):
 # ============================================================================
 
 @router.get("/{session_id}/opportunities/scores")
+@reads_session
 async def get_opportunity_scores(session_id: str):
     """Get all opportunity scores for a session."""
     return get_or_create_scoring(session_id)
 
 
 @router.post("/{session_id}/opportunities/{opportunity_id}/score")
+@writes_session
 async def score_opportunity(session_id: str, opportunity_id: str, score: OpportunityScore):
     """Score an opportunity. If score exists, it will be updated."""
     # Validate that the opportunity exists in SOCC
@@ -222,10 +247,12 @@ async def score_opportunity(session_id: str, opportunity_id: str, score: Opportu
         scoring.scores.append(score)
 
     scoring.last_updated = datetime.now()
+    scoring_storage.save(session_id, scoring)
     return score
 
 
 @router.delete("/{session_id}/opportunities/{opportunity_id}/score")
+@writes_session
 async def delete_opportunity_score(session_id: str, opportunity_id: str):
     """Delete a score for an opportunity."""
     scoring = get_or_create_scoring(session_id)
@@ -242,10 +269,12 @@ async def delete_opportunity_score(session_id: str, opportunity_id: str):
         )
 
     scoring.last_updated = datetime.now()
+    scoring_storage.save(session_id, scoring)
     return {"success": True, "deleted_opportunity_id": opportunity_id}
 
 
 @router.get("/{session_id}/opportunities/sorted")
+@reads_session
 async def get_sorted_opportunities(session_id: str):
     """Get opportunities sorted by score (highest first)."""
     socc = get_or_create_socc(session_id)
@@ -277,6 +306,7 @@ async def get_sorted_opportunities(session_id: str):
 # ============================================================================
 
 @router.get("/{session_id}/tensions")
+@reads_session
 async def get_tensions(session_id: str):
     """Get all strategic tensions for a session."""
     return get_or_create_tensions(session_id)
@@ -294,15 +324,18 @@ async def get_common_tensions():
 
 
 @router.post("/{session_id}/tensions", status_code=status.HTTP_201_CREATED)
+@writes_session
 async def add_tension(session_id: str, tension: StrategicTension):
     """Add a new strategic tension."""
     analysis = get_or_create_tensions(session_id)
     analysis.tensions.append(tension)
     analysis.last_updated = datetime.now()
+    tension_storage.save(session_id, analysis)
     return tension
 
 
 @router.put("/{session_id}/tensions/{tension_id}")
+@writes_session
 async def update_tension(session_id: str, tension_id: str, tension: StrategicTension):
     """Update an existing strategic tension."""
     analysis = get_or_create_tensions(session_id)
@@ -313,6 +346,7 @@ async def update_tension(session_id: str, tension_id: str, tension: StrategicTen
             tension.created_at = existing_tension.created_at
             analysis.tensions[i] = tension
             analysis.last_updated = datetime.now()
+            tension_storage.save(session_id, analysis)
             return tension
 
     raise HTTPException(
@@ -322,6 +356,7 @@ async def update_tension(session_id: str, tension_id: str, tension: StrategicTen
 
 
 @router.delete("/{session_id}/tensions/{tension_id}")
+@writes_session
 async def delete_tension(session_id: str, tension_id: str):
     """Delete a strategic tension."""
     analysis = get_or_create_tensions(session_id)
@@ -336,6 +371,7 @@ async def delete_tension(session_id: str, tension_id: str):
         )
 
     analysis.last_updated = datetime.now()
+    tension_storage.save(session_id, analysis)
     return {"success": True, "deleted_id": tension_id}
 
 
@@ -344,21 +380,25 @@ async def delete_tension(session_id: str, tension_id: str):
 # ============================================================================
 
 @router.get("/{session_id}/stakeholders")
+@reads_session
 async def get_stakeholders(session_id: str):
     """Get all stakeholders for a session."""
     return get_or_create_stakeholders(session_id)
 
 
 @router.post("/{session_id}/stakeholders", status_code=status.HTTP_201_CREATED)
+@writes_session
 async def add_stakeholder(session_id: str, stakeholder: Stakeholder):
     """Add a new stakeholder."""
     analysis = get_or_create_stakeholders(session_id)
     analysis.stakeholders.append(stakeholder)
     analysis.last_updated = datetime.now()
+    stakeholder_storage.save(session_id, analysis)
     return stakeholder
 
 
 @router.put("/{session_id}/stakeholders/{stakeholder_id}")
+@writes_session
 async def update_stakeholder(session_id: str, stakeholder_id: str, stakeholder_update: Dict[str, Any]):
     """Update an existing stakeholder with partial data."""
     analysis = get_or_create_stakeholders(session_id)
@@ -377,6 +417,7 @@ async def update_stakeholder(session_id: str, stakeholder_id: str, stakeholder_u
             updated_stakeholder = Stakeholder(**existing_dict)
             analysis.stakeholders[i] = updated_stakeholder
             analysis.last_updated = datetime.now()
+            stakeholder_storage.save(session_id, analysis)
             return updated_stakeholder
 
     raise HTTPException(
@@ -386,6 +427,7 @@ async def update_stakeholder(session_id: str, stakeholder_id: str, stakeholder_u
 
 
 @router.delete("/{session_id}/stakeholders/{stakeholder_id}")
+@writes_session
 async def delete_stakeholder(session_id: str, stakeholder_id: str):
     """Delete a stakeholder."""
     analysis = get_or_create_stakeholders(session_id)
@@ -400,6 +442,7 @@ async def delete_stakeholder(session_id: str, stakeholder_id: str):
         )
 
     analysis.last_updated = datetime.now()
+    stakeholder_storage.save(session_id, analysis)
     return {"success": True, "deleted_id": stakeholder_id}
 
 
@@ -408,6 +451,7 @@ async def delete_stakeholder(session_id: str, stakeholder_id: str):
 # ============================================================================
 
 @router.get("/{session_id}/summary")
+@reads_session
 async def get_context_summary(session_id: str):
     """Get a summary of context analysis completion."""
     socc = get_or_create_socc(session_id)
@@ -459,6 +503,7 @@ async def get_context_summary(session_id: str):
 
 
 @router.get("/{session_id}/export")
+@reads_session
 async def export_context(session_id: str):
     """Export all context data for a session."""
     return {
@@ -472,6 +517,7 @@ async def export_context(session_id: str):
 
 
 @router.delete("/{session_id}/clear")
+@writes_session
 async def clear_context(session_id: str):
     """Clear all context data for a session (for testing/reset)."""
     if session_id in socc_storage:
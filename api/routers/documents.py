@@ -1,10 +1,18 @@
 """Document Import API endpoints."""
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+import asyncio
 import os
 
+from ..ai_pool import AI_EXTRACTION_TIMEOUT, BACKGROUND, run_in_ai_pool
+from ..lazy_imports import LazyImport
+from ..parse_pool import parse_pool
+from src.pyramid_builder.ai.document_cache import file_hash, get_document_cache
+from ..session_locks import writes_session
+from ..sse import sse_event
 from .pyramids import active_pyramids
 from .context import (
     socc_storage,
@@ -15,13 +23,9 @@ from .context import (
     get_or_create_stakeholders
 )
 
-# Try to import document processing modules
-try:
-    from src.pyramid_builder.ai.document_parser import DocumentParser
-    from src.pyramid_builder.ai.document_extractor import DocumentExtractor
-    DOCUMENT_PROCESSING_AVAILABLE = True
-except ImportError:
-    DOCUMENT_PROCESSING_AVAILABLE = False
+# Document processing modules, imported on the first import request
+DocumentParser = LazyImport("src.pyramid_builder.ai.document_parser", "DocumentParser")
+DocumentExtractor = LazyImport("src.pyramid_builder.ai.document_extractor", "DocumentExtractor")
 
 # Import pyramid types for batch import
 try:
@@ -65,7 +69,7 @@ class ImportDocumentsResponse(BaseModel):
 
 def check_document_processing_available():
     """Check if document processing is available."""
-    if not DOCUMENT_PROCESSING_AVAILABLE:
+    if not (DocumentParser.available and DocumentExtractor.available):
         raise HTTPException(
             status_code=503,
             detail="Document processing unavailable. Install required packages: pip install pypdf python-docx python-pptx anthropic"
@@ -83,26 +87,8 @@ MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_FILES = 5  # Limit number of files per upload
 
 
-@router.post("/import", response_model=ImportDocumentsResponse)
-async def import_documents(
-    files: List[UploadFile] = File(...),
-    organization_name: Optional[str] = Form(None)
-):
-    """
-    Import strategic pyramid elements from documents.
-
-    Accepts PDF, DOCX, and PPTX files.
-    Parses content and extracts strategic elements using AI.
-
-    Requirements:
-    - Empty pyramid only (checked by frontend)
-    - Max 5 files per upload
-    - Max 10MB per file
-    - Supported formats: PDF, DOCX, PPTX
-    """
-    check_document_processing_available()
-
-    # Validate file count
+def _check_file_count(files: List[UploadFile]) -> None:
+    """Reject uploads with no files or too many."""
     if len(files) > MAX_FILES:
         raise HTTPException(
             status_code=400,
@@ -115,141 +101,355 @@ async def import_documents(
             detail="No files provided. Please upload at least one document."
         )
 
-    parse_results = []
-    all_parsed_content = []
 
-    # Parse each document
-    for file in files:
+async def _read_uploads(
+    files: List[UploadFile]
+) -> Tuple[List[Optional[DocumentParseResult]], List[Tuple[int, str, bytes]]]:
+    """
+    Read uploaded files, rejecting unsupported or oversized ones.
+
+    Returns:
+        Parse results by upload position (set for rejected files, None for
+        the rest), and (position, filename, content) of the files to parse
+    """
+    parse_results: List[Optional[DocumentParseResult]] = []
+    uploads = []
+
+    for index, file in enumerate(files):
+        parse_results.append(None)
+
         # Validate file extension
-        file_ext = None
         if file.filename:
             file_ext = "." + file.filename.split(".")[-1].lower()
             if file_ext not in ALLOWED_EXTENSIONS:
-                parse_results.append(DocumentParseResult(
+                parse_results[index] = DocumentParseResult(
                     filename=file.filename,
                     success=False,
                     error=f"Unsupported file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
-                ))
+                )
                 continue
 
         # Read file content
         try:
             file_content = await file.read()
         except Exception as e:
-            parse_results.append(DocumentParseResult(
+            parse_results[index] = DocumentParseResult(
                 filename=file.filename or "unknown",
                 success=False,
                 error=f"Failed to read file: {str(e)}"
-            ))
+            )
             continue
 
         # Validate file size
         if len(file_content) > MAX_FILE_SIZE:
-            parse_results.append(DocumentParseResult(
+            parse_results[index] = DocumentParseResult(
                 filename=file.filename or "unknown",
                 success=False,
                 error=f"File too large. Maximum size: {MAX_FILE_SIZE / 1024 / 1024}MB"
-            ))
+            )
             continue
 
-        # Parse document
-        try:
-            parsed = DocumentParser.parse(file_content, file.filename or "unknown")
+        uploads.append((index, file.filename or "unknown", file_content))
 
-            parse_results.append(DocumentParseResult(
-                filename=file.filename or "unknown",
-                success=parsed.get("success", False),
-                format=parsed.get("format"),
-                error=parsed.get("error"),
-                num_pages=parsed.get("num_pages"),
-                num_slides=parsed.get("num_slides")
-            ))
-
-            if parsed.get("success"):
-                all_parsed_content.append({
-                    "filename": file.filename,
-                    "parsed": parsed
-                })
+    return parse_results, uploads
 
-        except Exception as e:
-            parse_results.append(DocumentParseResult(
-                filename=file.filename or "unknown",
-                success=False,
-                error=f"Parse error: {str(e)}"
-            ))
 
+async def _parse_uploads(
+    uploads: List[Tuple[int, str, bytes]],
+    refresh: bool = False
+) -> AsyncIterator[Tuple[int, DocumentParseResult, Dict[str, Any], str]]:
+    """
+    Parse files on the parse process pool, yielding each as it finishes.
+
+    Files parsed before (same bytes) come from the document cache, unless
+    refresh is set, and are yielded first.
+
+    Yields:
+        (upload position, parse result, parsed content, file hash)
+    """
+    cache = get_document_cache()
+    # PDF pages past what extraction can use are never read
+    options = {"max_chars": DocumentExtractor.MAX_TOTAL_LENGTH}
+
+    def result(filename: str, parsed: Dict[str, Any]) -> DocumentParseResult:
+        return DocumentParseResult(
+            filename=filename,
+            success=parsed.get("success", False),
+            format=parsed.get("format"),
+            error=parsed.get("error"),
+            num_pages=parsed.get("num_pages"),
+            num_slides=parsed.get("num_slides")
+        )
+
+    to_parse = []
+    for index, filename, content in uploads:
+        content_hash = file_hash(content)
+        parsed = None
+        if cache is not None and not refresh:
+            parsed = cache.get_parsed(content_hash, filename, **options)
+        if parsed is None:
+            to_parse.append((index, filename, content, content_hash))
+        else:
+            yield index, result(filename, parsed), parsed, content_hash
+
+    files = [(filename, content) for _, filename, content, _ in to_parse]
+    async for position, parsed in parse_pool.parse_each(files, **options):
+        index, filename, _, content_hash = to_parse[position]
+        if cache is not None:
+            cache.put_parsed(content_hash, filename, parsed, **options)
+        yield index, result(filename, parsed), parsed, content_hash
+
+
+async def _extract_in_ai_pool(
+    extractor,
+    parsed_content: Dict[str, Any],
+    organization_name: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Extract pyramid elements with one AI pool call per document chunk.
+
+    Each chunk is bounded by the pool's concurrency limit and by
+    AI_EXTRACTION_TIMEOUT on its own, so a long document neither runs more
+    calls than AI_MAX_CONCURRENCY nor has to finish all its chunks within
+    one timeout. A chunk that times out or is refused is reported as a
+    failed chunk and the others are kept. At most extractor.max_concurrent_chunks chunks of one
+    document wait on the pool at once.
+    """
+    plan = extractor.plan_extraction(parsed_content, organization_name=organization_name)
+    if not plan["success"]:
+        return plan
+
+    if len(plan["parts"]) == 1:
+        result = await run_in_ai_pool(
+            extractor.extract_part, plan, 0,
+            priority=BACKGROUND, timeout=AI_EXTRACTION_TIMEOUT,
+        )
+        return extractor.merge_parts(plan, [result])
+
+    slots = asyncio.Semaphore(extractor.max_concurrent_chunks)
+
+    async def extract_part(index: int) -> Dict[str, Any]:
+        async with slots:
+            try:
+                return await run_in_ai_pool(
+                    extractor.extract_part, plan, index,
+                    priority=BACKGROUND, timeout=AI_EXTRACTION_TIMEOUT,
+                )
+            except HTTPException as e:
+                return {"success": False, "error": e.detail, "elements": {}}
+
+    results = await asyncio.gather(*(extract_part(index) for index in range(len(plan["parts"]))))
+    return extractor.merge_parts(plan, list(results))
+
+
+async def _extract_documents(
+    documents_processed: int,
+    parse_results: List[DocumentParseResult],
+    all_parsed_content: List[Dict[str, Any]],
+    organization_name: Optional[str],
+    refresh: bool = False
+) -> ImportDocumentsResponse:
+    """
+    Extract pyramid elements from the successfully parsed documents.
+
+    The extraction for the same files (by hash, in order) and organization
+    name comes from the document cache unless refresh is set.
+    """
     # Check if any documents were successfully parsed
     if not all_parsed_content:
         return ImportDocumentsResponse(
             success=False,
-            documents_processed=len(files),
+            documents_processed=documents_processed,
             parse_results=parse_results,
             error="No documents were successfully parsed. Check individual parse results."
         )
 
     # Combine content from all documents for extraction
     try:
-        extractor = DocumentExtractor()
-
-        # If multiple documents, combine them
-        if len(all_parsed_content) == 1:
-            # Single document extraction
-            extraction_result = extractor.extract_pyramid_elements(
-                all_parsed_content[0]["parsed"],
-                organization_name=organization_name
+        extractor = DocumentExtractor(timeout=AI_EXTRACTION_TIMEOUT)
+        cache = get_document_cache()
+        content_hashes = [doc["hash"] for doc in all_parsed_content]
+
+        extraction_result = None
+        if cache is not None and not refresh:
+            extraction_result = cache.get_extracted(
+                content_hashes, organization_name, extractor.cache_fingerprint
             )
-        else:
-            # Multiple documents: combine text blocks
-            combined_blocks = []
-            for doc in all_parsed_content:
-                blocks = doc["parsed"].get("blocks", [])
-                # Add filename separator
-                combined_blocks.append({
-                    "content": f"\n{'='*60}\nDocument: {doc['filename']}\n{'='*60}\n",
-                    "type": "separator"
-                })
-                combined_blocks.extend(blocks)
-
-            # Create combined parsed content
-            combined_parsed = {
-                "success": True,
-                "format": "combined",
-                "blocks": combined_blocks
-            }
 
-            extraction_result = extractor.extract_pyramid_elements(
-                combined_parsed,
-                organization_name=organization_name
-            )
+        if extraction_result is None:
+            # If multiple documents, combine them
+            if len(all_parsed_content) == 1:
+                # Single document extraction
+                extraction_result = await _extract_in_ai_pool(
+                    extractor,
+                    all_parsed_content[0]["parsed"],
+                    organization_name
+                )
+            else:
+                # Multiple documents: combine text blocks
+                combined_blocks = []
+                for doc in all_parsed_content:
+                    blocks = doc["parsed"].get("blocks", [])
+                    # Add filename separator
+                    combined_blocks.append({
+                        "content": f"\n{'='*60}\nDocument: {doc['filename']}\n{'='*60}\n",
+                        "type": "separator"
+                    })
+                    combined_blocks.extend(blocks)
+
+                # Create combined parsed content
+                combined_parsed = {
+                    "success": True,
+                    "format": "combined",
+                    "blocks": combined_blocks
+                }
+
+                extraction_result = await _extract_in_ai_pool(
+                    extractor,
+                    combined_parsed,
+                    organization_name
+                )
 
         if not extraction_result.get("success"):
             return ImportDocumentsResponse(
                 success=False,
-                documents_processed=len(files),
+                documents_processed=documents_processed,
                 parse_results=parse_results,
                 error=extraction_result.get("error", "Extraction failed")
             )
 
+        # Chunks that failed (e.g. timed out) are worth another try next time
+        if cache is not None and not extraction_result.get("metadata", {}).get("failed_chunks"):
+            cache.put_extracted(content_hashes, organization_name, extractor.cache_fingerprint, extraction_result)
+
         # Validate extracted elements
         validation_result = extractor.validate_extracted_elements(extraction_result)
 
         return ImportDocumentsResponse(
             success=True,
-            documents_processed=len(files),
+            documents_processed=documents_processed,
             parse_results=parse_results,
             extracted_elements=extraction_result.get("elements"),
             validation=validation_result
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         return ImportDocumentsResponse(
             success=False,
-            documents_processed=len(files),
+            documents_processed=documents_processed,
             parse_results=parse_results,
             error=f"Extraction failed: {str(e)}"
         )
 
 
+@router.post("/import", response_model=ImportDocumentsResponse)
+async def import_documents(
+    files: List[UploadFile] = File(...),
+    organization_name: Optional[str] = Form(None),
+    refresh: bool = False
+):
+    """
+    Import strategic pyramid elements from documents.
+
+    Accepts PDF, DOCX, and PPTX files.
+    Parses content and extracts strategic elements using AI.
+    Files are parsed in parallel on a process pool, each within
+    PARSE_TIMEOUT seconds. Parse and extraction results are cached by
+    file content hash; pass ?refresh=true to parse and extract again.
+
+    Requirements:
+    - Empty pyramid only (checked by frontend)
+    - Max 5 files per upload
+    - Max 10MB per file
+    - Supported formats: PDF, DOCX, PPTX
+    """
+    check_document_processing_available()
+    _check_file_count(files)
+
+    parse_results, uploads = await _read_uploads(files)
+    parsed_by_index: Dict[int, Dict[str, Any]] = {}
+
+    async for index, parse_result, parsed, content_hash in _parse_uploads(uploads, refresh):
+        parse_results[index] = parse_result
+        if parsed.get("success"):
+            parsed_by_index[index] = {"filename": parse_result.filename, "parsed": parsed, "hash": content_hash}
+
+    # Documents are combined in upload order, whatever order they parsed in
+    return await _extract_documents(
+        len(files),
+        parse_results,
+        [parsed_by_index[index] for index in sorted(parsed_by_index)],
+        organization_name,
+        refresh
+    )
+
+
+@router.post("/import/stream")
+async def import_documents_stream(
+    files: List[UploadFile] = File(...),
+    organization_name: Optional[str] = Form(None),
+    refresh: bool = False
+):
+    """
+    Import documents, reporting progress as Server-Sent Events.
+
+    Same upload and result as /import, but each file's parse result is
+    sent as soon as that file is parsed, before extraction starts:
+
+        event: parsed
+        data: {"index": ..., "filename": ..., "success": ..., ...}   one per file
+        event: extracting
+        data: {"documents": ...}                                     AI extraction started
+        event: done
+        data: {ImportDocumentsResponse}                              then the stream ends
+        event: error
+        data: {"detail": "..."}                                      instead of done on failure
+    """
+    check_document_processing_available()
+    _check_file_count(files)
+
+    # Read before responding: uploads are closed once the handler returns
+    parse_results, uploads = await _read_uploads(files)
+
+    async def events():
+        parsed_by_index: Dict[int, Dict[str, Any]] = {}
+        try:
+            for index, parse_result in enumerate(parse_results):
+                if parse_result is not None:
+                    yield sse_event({"index": index, **parse_result.model_dump()}, event="parsed")
+
+            async for index, parse_result, parsed, content_hash in _parse_uploads(uploads, refresh):
+                parse_results[index] = parse_result
+                if parsed.get("success"):
+                    parsed_by_index[index] = {
+                        "filename": parse_result.filename, "parsed": parsed, "hash": content_hash
+                    }
+                yield sse_event({"index": index, **parse_result.model_dump()}, event="parsed")
+
+            if parsed_by_index:
+                yield sse_event({"documents": len(parsed_by_index)}, event="extracting")
+            response = await _extract_documents(
+                len(files),
+                parse_results,
+                [parsed_by_index[index] for index in sorted(parsed_by_index)],
+                organization_name,
+                refresh
+            )
+            yield sse_event(response.model_dump(), event="done")
+        except HTTPException as e:
+            yield sse_event({"detail": e.detail}, event="error")
+        except Exception as e:
+            yield sse_event({"detail": f"Import failed: {str(e)}"}, event="error")
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/supported-formats")
 async def get_supported_formats():
     """Get list of supported document formats and limits."""
@@ -257,8 +457,8 @@ async def get_supported_formats():
         "formats": list(ALLOWED_EXTENSIONS),
         "max_file_size_mb": MAX_FILE_SIZE / 1024 / 1024,
         "max_files_per_upload": MAX_FILES,
-        "max_pages_per_pdf": DocumentParser.MAX_PAGES if DOCUMENT_PROCESSING_AVAILABLE else 100,
-        "max_slides_per_pptx": DocumentParser.MAX_PAGES if DOCUMENT_PROCESSING_AVAILABLE else 100,
+        "max_pages_per_pdf": DocumentParser.MAX_PAGES if DocumentParser.available else 100,
+        "max_slides_per_pptx": DocumentParser.MAX_PAGES if DocumentParser.available else 100,
     }
 
 
@@ -300,6 +500,7 @@ def _ensure_list(value: Any) -> List[str]:
 
 
 @router.post("/batch-import")
+@writes_session
 async def batch_import_elements(request: BatchImportRequest):
     """
     Batch import extracted elements into an existing pyramid.
@@ -432,6 +633,10 @@ async def batch_import_elements(request: BatchImportRequest):
                 except Exception as e:
                     results["errors"].append(f"Tension import failed ({tension_data.get('name', '?')}): {str(e)}")
 
+            socc_storage.save(request.session_id, socc_analysis)
+            stakeholder_storage.save(request.session_id, stakeholder_analysis)
+            tension_storage.save(request.session_id, tension_analysis)
+
         # ============================================================
         # TIERS 1-9: PYRAMID STRUCTURE IMPORT
         # ============================================================
@@ -780,6 +985,8 @@ async def batch_import_elements(request: BatchImportRequest):
                 except Exception as e:
                     results["errors"].append(f"Individual objective import failed ({ind_obj_data.get('name')}): {str(e)}")
 
+        active_pyramids.save(request.session_id, manager)
+
         return {
             "success": True,
             "results": results,
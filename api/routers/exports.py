@@ -12,6 +12,7 @@ from src.pyramid_builder.exports.powerpoint_exporter import PowerPointExporter
 from src.pyramid_builder.exports.markdown_exporter import MarkdownExporter
 from src.pyramid_builder.exports.json_exporter import JSONExporter
 from src.pyramid_builder.exports.ai_guide_generator import AIGuideGenerator
+from ..session_locks import reads_session
 from .pyramids import active_pyramids
 from .context import context_storage, scoring_storage, tension_storage, stakeholder_storage
 import json
@@ -28,6 +29,7 @@ class ExportRequest(BaseModel):
 
 
 @router.post("/{session_id}/word")
+@reads_session
 async def export_word(session_id: str, request: ExportRequest):
     """Export pyramid to Word document (DOCX)."""
     if session_id not in active_pyramids:
@@ -64,6 +66,7 @@ async def export_word(session_id: str, request: ExportRequest):
 
 
 @router.post("/{session_id}/powerpoint")
+@reads_session
 async def export_powerpoint(session_id: str, request: ExportRequest):
     """Export pyramid to PowerPoint presentation (PPTX)."""
     if session_id not in active_pyramids:
@@ -100,6 +103,7 @@ async def export_powerpoint(session_id: str, request: ExportRequest):
 
 
 @router.post("/{session_id}/markdown")
+@reads_session
 async def export_markdown(session_id: str, request: ExportRequest):
     """Export pyramid to Markdown file."""
     if session_id not in active_pyramids:
@@ -137,6 +141,7 @@ async def export_markdown(session_id: str, request: ExportRequest):
 
 
 @router.post("/{session_id}/json")
+@reads_session
 async def export_json(session_id: str, request: ExportRequest):
     """Export pyramid to JSON file with Context data (Step 1 + Step 2)."""
     if session_id not in active_pyramids:
@@ -11,6 +11,7 @@ import tempfile
 
 from src.pyramid_builder.core.pyramid_manager import PyramidManager
 from src.pyramid_builder.models.pyramid import (
+    TRUSTED_CONTEXT,
     StrategyPyramid,
     StatementType,
     Horizon,
@@ -27,11 +28,30 @@ from src.pyramid_builder.models.context import (
     StakeholderAnalysis
 )
 
+from ..session_locks import reads_session, writes_session
+from ..session_store import create_session_store
+
 router = APIRouter()
 
-# In-memory storage for active pyramids (keyed by session ID)
-# In production, you might use Redis or a database
-active_pyramids: Dict[str, PyramidManager] = {}
+
+def dump_manager(manager: PyramidManager) -> str:
+    """Serialize a session's pyramid for the session store."""
+    return json.dumps(manager.pyramid.to_dict(), default=str)
+
+
+def load_manager(data: str) -> PyramidManager:
+    """
+    Restore a session's pyramid from the session store.
+
+    Updates don't re-run the model validators, so a stored session may hold
+    values they would reject; they are skipped here so every worker can
+    load what another one saved.
+    """
+    return PyramidManager(pyramid=StrategyPyramid.model_validate_json(data, context=TRUSTED_CONTEXT))
+
+
+# Storage for active pyramids (keyed by session ID), see api/session_store.py
+active_pyramids = create_session_store("pyramids", dump=dump_manager, load=load_manager)
 
 # Import context storages from context router
 from .context import context_storage, scoring_storage, tension_storage, stakeholder_storage
@@ -57,6 +77,7 @@ class LoadPyramidRequest(BaseModel):
 # ============================================================================
 
 @router.post("/create")
+@writes_session
 async def create_pyramid(request: CreatePyramidRequest):
     """Create a new strategic pyramid."""
     manager = PyramidManager()
@@ -77,6 +98,7 @@ async def create_pyramid(request: CreatePyramidRequest):
 
 
 @router.post("/load")
+@writes_session
 async def load_pyramid(request: LoadPyramidRequest):
     """Load a pyramid from JSON data, including Context data (Step 1) if present."""
     try:
@@ -161,6 +183,7 @@ async def load_pyramid(request: LoadPyramidRequest):
 
 
 @router.get("/{session_id}")
+@reads_session
 async def get_pyramid(session_id: str):
     """Get the current pyramid for a session."""
     if session_id not in active_pyramids:
@@ -174,6 +197,7 @@ async def get_pyramid(session_id: str):
 
 
 @router.get("/{session_id}/summary")
+@reads_session
 async def get_pyramid_summary(session_id: str):
     """Get a summary of the pyramid."""
     if session_id not in active_pyramids:
@@ -184,6 +208,7 @@ async def get_pyramid_summary(session_id: str):
 
 
 @router.delete("/{session_id}")
+@writes_session
 async def delete_pyramid(session_id: str):
     """Delete a pyramid session."""
     if session_id in active_pyramids:
@@ -211,6 +236,7 @@ class UpdateVisionStatementRequest(BaseModel):
 
 
 @router.post("/{session_id}/vision/statements")
+@writes_session
 async def add_vision_statement(session_id: str, request: AddVisionStatementRequest):
     """Add a vision/mission/belief/passion statement."""
     try:
@@ -224,6 +250,7 @@ async def add_vision_statement(session_id: str, request: AddVisionStatementReque
             order=request.order,
             created_by=request.created_by,
         )
+        active_pyramids.save(session_id, manager)
 
         return statement.model_dump(mode="json")
     except HTTPException:
@@ -244,6 +271,7 @@ async def add_vision_statement(session_id: str, request: AddVisionStatementReque
 
 
 @router.put("/{session_id}/vision/statements")
+@writes_session
 async def update_vision_statement(session_id: str, request: UpdateVisionStatementRequest):
     """Update a vision statement."""
     if session_id not in active_pyramids:
@@ -259,10 +287,13 @@ async def update_vision_statement(session_id: str, request: UpdateVisionStatemen
     if not success:
         raise HTTPException(status_code=404, detail="Vision statement not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
 @router.delete("/{session_id}/vision/statements/{statement_id}")
+@writes_session
 async def remove_vision_statement(session_id: str, statement_id: UUID):
     """Remove a vision statement."""
     if session_id not in active_pyramids:
@@ -274,6 +305,8 @@ async def remove_vision_statement(session_id: str, statement_id: UUID):
     if not success:
         raise HTTPException(status_code=404, detail="Vision statement not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
@@ -294,6 +327,7 @@ class UpdateValueRequest(BaseModel):
 
 
 @router.post("/{session_id}/values")
+@writes_session
 async def add_value(session_id: str, request: AddValueRequest):
     """Add a core value."""
     if session_id not in active_pyramids:
@@ -305,11 +339,13 @@ async def add_value(session_id: str, request: AddValueRequest):
         description=request.description,
         created_by=request.created_by,
     )
+    active_pyramids.save(session_id, manager)
 
     return value.model_dump(mode="json")
 
 
 @router.put("/{session_id}/values")
+@writes_session
 async def update_value(session_id: str, request: UpdateValueRequest):
     """Update a value."""
     if session_id not in active_pyramids:
@@ -325,10 +361,13 @@ async def update_value(session_id: str, request: UpdateValueRequest):
     if not success:
         raise HTTPException(status_code=404, detail="Value not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
 @router.delete("/{session_id}/values/{value_id}")
+@writes_session
 async def remove_value(session_id: str, value_id: UUID):
     """Remove a value."""
     if session_id not in active_pyramids:
@@ -340,6 +379,8 @@ async def remove_value(session_id: str, value_id: UUID):
     if not success:
         raise HTTPException(status_code=404, detail="Value not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
@@ -360,6 +401,7 @@ class UpdateBehaviourRequest(BaseModel):
 
 
 @router.post("/{session_id}/behaviours")
+@writes_session
 async def add_behaviour(session_id: str, request: AddBehaviourRequest):
     """Add a behaviour."""
     if session_id not in active_pyramids:
@@ -371,11 +413,13 @@ async def add_behaviour(session_id: str, request: AddBehaviourRequest):
         value_ids=request.value_ids,
         created_by=request.created_by,
     )
+    active_pyramids.save(session_id, manager)
 
     return behaviour.model_dump(mode="json")
 
 
 @router.put("/{session_id}/behaviours")
+@writes_session
 async def update_behaviour(session_id: str, request: UpdateBehaviourRequest):
     """Update a behaviour."""
     if session_id not in active_pyramids:
@@ -391,10 +435,13 @@ async def update_behaviour(session_id: str, request: UpdateBehaviourRequest):
     if not success:
         raise HTTPException(status_code=404, detail="Behaviour not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
 @router.delete("/{session_id}/behaviours/{behaviour_id}")
+@writes_session
 async def remove_behaviour(session_id: str, behaviour_id: UUID):
     """Remove a behaviour."""
     if session_id not in active_pyramids:
@@ -406,6 +453,8 @@ async def remove_behaviour(session_id: str, behaviour_id: UUID):
     if not success:
         raise HTTPException(status_code=404, detail="Behaviour not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
@@ -430,6 +479,7 @@ class UpdateDriverRequest(BaseModel):
 
 
 @router.post("/{session_id}/drivers")
+@writes_session
 async def add_strategic_driver(session_id: str, request: AddDriverRequest):
     """Add a strategic driver."""
     try:
@@ -444,6 +494,7 @@ async def add_strategic_driver(session_id: str, request: AddDriverRequest):
             addresses_opportunities=request.addresses_opportunities,
             created_by=request.created_by,
         )
+        active_pyramids.save(session_id, manager)
 
         return driver.model_dump(mode="json")
     except HTTPException:
@@ -464,6 +515,7 @@ async def add_strategic_driver(session_id: str, request: AddDriverRequest):
 
 
 @router.put("/{session_id}/drivers")
+@writes_session
 async def update_strategic_driver(session_id: str, request: UpdateDriverRequest):
     """Update a strategic driver."""
     if session_id not in active_pyramids:
@@ -481,10 +533,13 @@ async def update_strategic_driver(session_id: str, request: UpdateDriverRequest)
     if not success:
         raise HTTPException(status_code=404, detail="Driver not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
 @router.delete("/{session_id}/drivers/{driver_id}")
+@writes_session
 async def remove_strategic_driver(session_id: str, driver_id: UUID):
     """Remove a strategic driver."""
     if session_id not in active_pyramids:
@@ -496,6 +551,8 @@ async def remove_strategic_driver(session_id: str, driver_id: UUID):
     if not success:
         raise HTTPException(status_code=404, detail="Driver not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
@@ -518,6 +575,7 @@ class UpdateIntentRequest(BaseModel):
 
 
 @router.post("/{session_id}/intents")
+@writes_session
 async def add_strategic_intent(session_id: str, request: AddIntentRequest):
     """Add a strategic intent."""
     if session_id not in active_pyramids:
@@ -531,12 +589,14 @@ async def add_strategic_intent(session_id: str, request: AddIntentRequest):
             is_stakeholder_voice=request.is_stakeholder_voice,
             created_by=request.created_by,
         )
+        active_pyramids.save(session_id, manager)
         return intent.model_dump(mode="json")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.put("/{session_id}/intents")
+@writes_session
 async def update_strategic_intent(session_id: str, request: UpdateIntentRequest):
     """Update a strategic intent."""
     if session_id not in active_pyramids:
@@ -554,12 +614,15 @@ async def update_strategic_intent(session_id: str, request: UpdateIntentRequest)
         if not success:
             raise HTTPException(status_code=404, detail="Intent not found")
 
+        active_pyramids.save(session_id, manager)
+
         return {"success": True}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.delete("/{session_id}/intents/{intent_id}")
+@writes_session
 async def remove_strategic_intent(session_id: str, intent_id: UUID):
     """Remove a strategic intent."""
     if session_id not in active_pyramids:
@@ -571,6 +634,8 @@ async def remove_strategic_intent(session_id: str, intent_id: UUID):
     if not success:
         raise HTTPException(status_code=404, detail="Intent not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
@@ -595,6 +660,7 @@ class UpdateEnablerRequest(BaseModel):
 
 
 @router.post("/{session_id}/enablers")
+@writes_session
 async def add_enabler(session_id: str, request: AddEnablerRequest):
     """Add an enabler."""
     if session_id not in active_pyramids:
@@ -608,11 +674,13 @@ async def add_enabler(session_id: str, request: AddEnablerRequest):
         enabler_type=request.enabler_type,
         created_by=request.created_by,
     )
+    active_pyramids.save(session_id, manager)
 
     return enabler.model_dump(mode="json")
 
 
 @router.put("/{session_id}/enablers")
+@writes_session
 async def update_enabler(session_id: str, request: UpdateEnablerRequest):
     """Update an enabler."""
     if session_id not in active_pyramids:
@@ -630,10 +698,13 @@ async def update_enabler(session_id: str, request: UpdateEnablerRequest):
     if not success:
         raise HTTPException(status_code=404, detail="Enabler not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
 @router.delete("/{session_id}/enablers/{enabler_id}")
+@writes_session
 async def remove_enabler(session_id: str, enabler_id: UUID):
     """Remove an enabler."""
     if session_id not in active_pyramids:
@@ -645,6 +716,8 @@ async def remove_enabler(session_id: str, enabler_id: UUID):
     if not success:
         raise HTTPException(status_code=404, detail="Enabler not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
@@ -675,6 +748,7 @@ class UpdateCommitmentRequest(BaseModel):
 
 
 @router.post("/{session_id}/commitments")
+@writes_session
 async def add_iconic_commitment(session_id: str, request: AddCommitmentRequest):
     """Add an iconic commitment."""
     if session_id not in active_pyramids:
@@ -692,12 +766,14 @@ async def add_iconic_commitment(session_id: str, request: AddCommitmentRequest):
             owner=request.owner,
             created_by=request.created_by,
         )
+        active_pyramids.save(session_id, manager)
         return commitment.model_dump(mode="json")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.put("/{session_id}/commitments")
+@writes_session
 async def update_iconic_commitment(session_id: str, request: UpdateCommitmentRequest):
     """Update an iconic commitment."""
     if session_id not in active_pyramids:
@@ -719,12 +795,15 @@ async def update_iconic_commitment(session_id: str, request: UpdateCommitmentReq
         if not success:
             raise HTTPException(status_code=404, detail="Commitment not found")
 
+        active_pyramids.save(session_id, manager)
+
         return {"success": True}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.delete("/{session_id}/commitments/{commitment_id}")
+@writes_session
 async def remove_iconic_commitment(session_id: str, commitment_id: UUID):
     """Remove an iconic commitment."""
     if session_id not in active_pyramids:
@@ -736,6 +815,8 @@ async def remove_iconic_commitment(session_id: str, commitment_id: UUID):
     if not success:
         raise HTTPException(status_code=404, detail="Commitment not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
@@ -764,6 +845,7 @@ class UpdateTeamObjectiveRequest(BaseModel):
 
 
 @router.post("/{session_id}/team-objectives")
+@writes_session
 async def add_team_objective(session_id: str, request: AddTeamObjectiveRequest):
     """Add a team objective."""
     if session_id not in active_pyramids:
@@ -779,11 +861,13 @@ async def add_team_objective(session_id: str, request: AddTeamObjectiveRequest):
         owner=request.owner,
         created_by=request.created_by,
     )
+    active_pyramids.save(session_id, manager)
 
     return objective.model_dump(mode="json")
 
 
 @router.put("/{session_id}/team-objectives")
+@writes_session
 async def update_team_objective(session_id: str, request: UpdateTeamObjectiveRequest):
     """Update a team objective."""
     if session_id not in active_pyramids:
@@ -803,10 +887,13 @@ async def update_team_objective(session_id: str, request: UpdateTeamObjectiveReq
     if not success:
         raise HTTPException(status_code=404, detail="Team objective not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
 @router.delete("/{session_id}/team-objectives/{objective_id}")
+@writes_session
 async def remove_team_objective(session_id: str, objective_id: UUID):
     """Remove a team objective."""
     if session_id not in active_pyramids:
@@ -818,6 +905,8 @@ async def remove_team_objective(session_id: str, objective_id: UUID):
     if not success:
         raise HTTPException(status_code=404, detail="Team objective not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
@@ -844,6 +933,7 @@ class UpdateIndividualObjectiveRequest(BaseModel):
 
 
 @router.post("/{session_id}/individual-objectives")
+@writes_session
 async def add_individual_objective(session_id: str, request: AddIndividualObjectiveRequest):
     """Add an individual objective."""
     if session_id not in active_pyramids:
@@ -858,11 +948,13 @@ async def add_individual_objective(session_id: str, request: AddIndividualObject
         success_criteria=request.success_criteria,
         created_by=request.created_by,
     )
+    active_pyramids.save(session_id, manager)
 
     return objective.model_dump(mode="json")
 
 
 @router.put("/{session_id}/individual-objectives")
+@writes_session
 async def update_individual_objective(session_id: str, request: UpdateIndividualObjectiveRequest):
     """Update an individual objective."""
     if session_id not in active_pyramids:
@@ -881,10 +973,13 @@ async def update_individual_objective(session_id: str, request: UpdateIndividual
     if not success:
         raise HTTPException(status_code=404, detail="Individual objective not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
 
 
 @router.delete("/{session_id}/individual-objectives/{objective_id}")
+@writes_session
 async def remove_individual_objective(session_id: str, objective_id: UUID):
     """Remove an individual objective."""
     if session_id not in active_pyramids:
@@ -896,4 +991,6 @@ async def remove_individual_objective(session_id: str, objective_id: UUID):
     if not success:
         raise HTTPException(status_code=404, detail="Individual objective not found")
 
+    active_pyramids.save(session_id, manager)
+
     return {"success": True}
@@ -1,19 +1,19 @@
 """Validation API endpoints."""
 
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+import asyncio
 import os
 
-from src.pyramid_builder.validation.validator import PyramidValidator, ValidationLevel
+from src.pyramid_builder.validation.validator import ValidationLevel, ValidationResult
+from ..ai_pool import BACKGROUND, ai_pool, run_in_ai_pool
+from ..lazy_imports import LazyImport
+from ..session_locks import reads_session, session_locks
 from .pyramids import active_pyramids
 from .context import socc_storage, scoring_storage, tension_storage, stakeholder_storage
 
-# Try to import AI validator
-try:
-    from src.pyramid_builder.validation.ai_validator import AIValidator
-    AI_VALIDATOR_AVAILABLE = True
-except ImportError:
-    AI_VALIDATOR_AVAILABLE = False
+# AI validator, imported on the first AI validation request
+AIValidator = LazyImport("src.pyramid_builder.validation.ai_validator", "AIValidator")
 
 router = APIRouter()
 
@@ -93,6 +93,7 @@ def validate_context(session_id: str, result):
 
 
 @router.get("/{session_id}")
+@reads_session
 async def validate_pyramid(session_id: str):
     """Run all validation checks on a pyramid."""
     if session_id not in active_pyramids:
@@ -102,7 +103,7 @@ async def validate_pyramid(session_id: str):
     if not manager.pyramid:
         raise HTTPException(status_code=404, detail="No pyramid initialized")
 
-    validator = PyramidValidator(manager.pyramid)
+    validator = manager.get_validator()
     result = validator.validate_all()
 
     # Add context validation
@@ -112,6 +113,7 @@ async def validate_pyramid(session_id: str):
 
 
 @router.get("/{session_id}/quick")
+@reads_session
 async def quick_validate(session_id: str):
     """Quick validation - just check for critical errors."""
     if session_id not in active_pyramids:
@@ -121,7 +123,7 @@ async def quick_validate(session_id: str):
     if not manager.pyramid:
         raise HTTPException(status_code=404, detail="No pyramid initialized")
 
-    validator = PyramidValidator(manager.pyramid)
+    validator = manager.get_validator()
     result = validator.validate_all()
 
     # Return only errors
@@ -215,8 +217,39 @@ def _get_context_data(session_id: str) -> dict:
     return context_data
 
 
+async def _validate_in_ai_pool(ai_validator) -> Tuple[ValidationResult, List[Tuple[str, str]]]:
+    """
+    Run AI validation with one AI pool call per check.
+
+    Each check (and each commitment alignment batch) counts against
+    AI_MAX_CONCURRENCY and gets its own timeout, instead of one pool call
+    fanning out to threads the pool cannot see. A check that times out or
+    is refused is skipped and the others are kept. At most
+    ai_validator.max_concurrent_checks checks wait on the pool at once.
+
+    Returns:
+        The AI issues, and (check name, reason) for each skipped check
+    """
+    plan = ai_validator.plan_checks()
+    slots = asyncio.Semaphore(ai_validator.max_concurrent_checks)
+    skipped = []
+
+    async def run_check(index: int):
+        async with slots:
+            try:
+                return await run_in_ai_pool(ai_validator.run_check, plan, index, priority=BACKGROUND)
+            except HTTPException as e:
+                skipped.append((plan["checks"][index][0], e.detail))
+                return None
+
+    outcomes = await asyncio.gather(*(run_check(index) for index in range(len(plan["checks"]))))
+    # AI issues go to a fresh result, so a call abandoned on timeout
+    # cannot touch the one returned by the endpoint
+    return ai_validator.merge_checks(plan, list(outcomes), ValidationResult()), skipped
+
+
 @router.get("/{session_id}/ai")
-async def ai_validate_pyramid(session_id: str):
+async def ai_validate_pyramid(session_id: str, refresh: bool = False):
     """
     Run AI-enhanced validation checks on a pyramid.
 
@@ -227,9 +260,12 @@ async def ai_validate_pyramid(session_id: str):
     - Language boldness (inspiration quality)
     - Context grounding (SOCC, tensions, stakeholders)
 
+    Responses to unchanged prompts come from the AI response cache;
+    pass refresh=true to ask the model again.
+
     Requires ANTHROPIC_API_KEY environment variable.
     """
-    if not AI_VALIDATOR_AVAILABLE:
+    if not AIValidator.available:
         raise HTTPException(
             status_code=503,
             detail="AI validation unavailable. Install anthropic package: pip install anthropic"
@@ -241,27 +277,47 @@ async def ai_validate_pyramid(session_id: str):
             detail="AI validation unavailable. ANTHROPIC_API_KEY not configured."
         )
 
-    if session_id not in active_pyramids:
-        raise HTTPException(status_code=404, detail="Pyramid not found")
+    # Read the session under its lock, then run the AI checks on a copy
+    async with session_locks.read(session_id):
+        if session_id not in active_pyramids:
+            raise HTTPException(status_code=404, detail="Pyramid not found")
 
-    manager = active_pyramids[session_id]
-    if not manager.pyramid:
-        raise HTTPException(status_code=404, detail="No pyramid initialized")
+        manager = active_pyramids[session_id]
+        if not manager.pyramid:
+            raise HTTPException(status_code=404, detail="No pyramid initialized")
 
-    # Run standard validation first
-    validator = PyramidValidator(manager.pyramid)
-    result = validator.validate_all()
+        # Run standard validation first
+        validator = manager.get_validator()
+        result = validator.validate_all()
 
-    # Add context validation
-    result = validate_context(session_id, result)
+        # Add context validation
+        result = validate_context(session_id, result)
 
-    # Gather context data for AI validation
-    context_data = _get_context_data(session_id)
+        # Gather context data for AI validation
+        context_data = _get_context_data(session_id)
+        pyramid = manager.pyramid.model_copy(deep=True)
 
     # Enhance with AI validation (including context data)
     try:
-        ai_validator = AIValidator(manager.pyramid, context_data=context_data)
-        result = ai_validator.validate_with_ai(result)
+        ai_validator = AIValidator(
+            pyramid, context_data=context_data, timeout=ai_pool.timeout, bypass_cache=refresh
+        )
+        ai_result, skipped = await _validate_in_ai_pool(ai_validator)
+        result.add_issues(ai_result.issues)
+        result.summary["ai_check_timings_ms"] = ai_result.summary["ai_check_timings_ms"]
+        for name, reason in skipped:
+            result.add_issue(
+                level=ValidationLevel.INFO,
+                category="AI Validation",
+                message=f"AI check {name} skipped: {reason}",
+            )
+    except HTTPException as e:
+        # Pool saturated or timed out: still return the standard validation
+        result.add_issue(
+            level=ValidationLevel.INFO,
+            category="AI Validation",
+            message=f"AI validation skipped: {e.detail}",
+        )
     except Exception as e:
         # If AI validation fails, return standard validation with error note
         result.add_issue(
@@ -274,7 +330,7 @@ async def ai_validate_pyramid(session_id: str):
 
 
 @router.get("/{session_id}/ai-review")
-async def ai_review_pyramid(session_id: str):
+async def ai_review_pyramid(session_id: str, refresh: bool = False):
     """
     Get comprehensive AI narrative review of the pyramid.
 
@@ -285,9 +341,12 @@ async def ai_review_pyramid(session_id: str):
     - Top 3 prioritized recommendations
     - Context alignment (if Step 1 data available)
 
+    Responses to unchanged prompts come from the AI response cache;
+    pass refresh=true to ask the model again.
+
     Requires ANTHROPIC_API_KEY environment variable.
     """
-    if not AI_VALIDATOR_AVAILABLE:
+    if not AIValidator.available:
         raise HTTPException(
             status_code=503,
             detail="AI validation unavailable. Install anthropic package: pip install anthropic"
@@ -299,20 +358,26 @@ async def ai_review_pyramid(session_id: str):
             detail="AI validation unavailable. ANTHROPIC_API_KEY not configured."
         )
 
-    if session_id not in active_pyramids:
-        raise HTTPException(status_code=404, detail="Pyramid not found")
+    async with session_locks.read(session_id):
+        if session_id not in active_pyramids:
+            raise HTTPException(status_code=404, detail="Pyramid not found")
 
-    manager = active_pyramids[session_id]
-    if not manager.pyramid:
-        raise HTTPException(status_code=404, detail="No pyramid initialized")
+        manager = active_pyramids[session_id]
+        if not manager.pyramid:
+            raise HTTPException(status_code=404, detail="No pyramid initialized")
 
-    # Gather context data for AI review
-    context_data = _get_context_data(session_id)
+        # Gather context data for AI review
+        context_data = _get_context_data(session_id)
+        pyramid = manager.pyramid.model_copy(deep=True)
 
     try:
-        ai_validator = AIValidator(manager.pyramid, context_data=context_data)
-        review = ai_validator.get_narrative_review()
+        ai_validator = AIValidator(
+            pyramid, context_data=context_data, timeout=ai_pool.timeout, bypass_cache=refresh
+        )
+        review = await run_in_ai_pool(ai_validator.get_narrative_review, priority=BACKGROUND)
         return review
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
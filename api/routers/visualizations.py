@@ -4,12 +4,14 @@ from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 
 from src.pyramid_builder.visualization.pyramid_diagram import PyramidDiagram
+from ..session_locks import reads_session
 from .pyramids import active_pyramids
 
 router = APIRouter()
 
 
 @router.get("/{session_id}/pyramid-diagram")
+@reads_session
 async def get_pyramid_diagram(session_id: str, show_counts: bool = True) -> Dict[str, Any]:
     """Get pyramid diagram data for Plotly visualization."""
     if session_id not in active_pyramids:
@@ -31,6 +33,7 @@ async def get_pyramid_diagram(session_id: str, show_counts: bool = True) -> Dict
 
 
 @router.get("/{session_id}/distribution-sunburst")
+@reads_session
 async def get_distribution_sunburst(session_id: str) -> Dict[str, Any]:
     """Get distribution sunburst chart data."""
     if session_id not in active_pyramids:
@@ -51,6 +54,7 @@ async def get_distribution_sunburst(session_id: str) -> Dict[str, Any]:
 
 
 @router.get("/{session_id}/horizon-timeline")
+@reads_session
 async def get_horizon_timeline(session_id: str) -> Dict[str, Any]:
     """Get horizon timeline chart data."""
     if session_id not in active_pyramids:
@@ -71,6 +75,7 @@ async def get_horizon_timeline(session_id: str) -> Dict[str, Any]:
 
 
 @router.get("/{session_id}/network-diagram")
+@reads_session
 async def get_network_diagram(session_id: str) -> Dict[str, Any]:
     """Get network diagram showing intent-commitment relationships."""
     if session_id not in active_pyramids:
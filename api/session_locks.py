@@ -0,0 +1,169 @@
+"""
+Per-session locking for the API routers.
+
+Endpoints are `async def` and mutate shared session state (pyramid managers,
+context analyses) in place. A request that awaits midway through a change
+(or hands work to a thread) can otherwise interleave with another request on
+the same session. Each session gets an asyncio read/write lock:
+
+- readers (GETs, validation, exports, AI context snapshots) run together
+- a writer (any mutation plus its `save()`) runs alone
+- waiting writers block new readers, so a stream of reads cannot starve them
+
+Routers decorate endpoints with `@reads_session` or `@writes_session`, which
+take the session id from a `session_id` argument or from `request.session_id`.
+Locks are process-local: with several uvicorn workers, cross-worker
+consistency still comes from the session store (see session_store.py).
+"""
+
+import asyncio
+import functools
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, FrozenSet, Optional
+
+
+class AsyncReadWriteLock:
+    """An asyncio lock allowing many readers or a single writer."""
+
+    def __init__(self):
+        self._condition = asyncio.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[None]:
+        """Hold the lock shared with other readers."""
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: not self._writer and not self._waiting_writers
+            )
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[None]:
+        """Hold the lock exclusively."""
+        async with self._condition:
+            self._waiting_writers += 1
+            try:
+                await self._condition.wait_for(
+                    lambda: not self._writer and not self._readers
+                )
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+    @property
+    def locked(self) -> bool:
+        """Whether any reader or writer holds the lock."""
+        return self._writer or self._readers > 0
+
+
+# Session ids whose lock the current task already holds, and in which mode
+_held: ContextVar[FrozenSet[tuple]] = ContextVar("held_session_locks", default=frozenset())
+
+
+class SessionLockManager:
+    """
+    Hands out one AsyncReadWriteLock per session id.
+
+    Locks exist only while some request holds or waits for them, so the
+    table does not grow with the number of sessions ever seen. Acquiring a
+    session lock the current task already holds (e.g. an endpoint awaiting
+    another endpoint) is a no-op rather than a deadlock.
+    """
+
+    def __init__(self):
+        self._locks: Dict[str, AsyncReadWriteLock] = {}
+        self._users: Dict[str, int] = {}
+
+    def read(self, session_id: str):
+        """Async context manager holding the session's lock for reading."""
+        return self._acquire(session_id, write=False)
+
+    def write(self, session_id: str):
+        """Async context manager holding the session's lock for writing."""
+        return self._acquire(session_id, write=True)
+
+    @asynccontextmanager
+    async def _acquire(self, session_id: str, write: bool) -> AsyncIterator[None]:
+        held = _held.get()
+        if (session_id, True) in held or ((session_id, False) in held and not write):
+            yield
+            return
+        if (session_id, False) in held:
+            raise RuntimeError(
+                f"Cannot upgrade the read lock on session {session_id} to a write lock"
+            )
+
+        lock = self._locks.get(session_id)
+        if lock is None:
+            lock = self._locks[session_id] = AsyncReadWriteLock()
+        self._users[session_id] = self._users.get(session_id, 0) + 1
+        try:
+            async with (lock.write() if write else lock.read()):
+                token = _held.set(held | {(session_id, write)})
+                try:
+                    yield
+                finally:
+                    _held.reset(token)
+        finally:
+            self._users[session_id] -= 1
+            if not self._users[session_id]:
+                del self._users[session_id]
+                del self._locks[session_id]
+
+    def stats(self) -> Dict[str, int]:
+        """Number of sessions with a lock currently held or awaited."""
+        return {
+            "active_locks": len(self._locks),
+            "held_locks": sum(lock.locked for lock in self._locks.values()),
+        }
+
+
+# Shared by every router
+session_locks = SessionLockManager()
+
+
+def _session_id_from(kwargs: Dict[str, Any]) -> Optional[str]:
+    """Find the session id among an endpoint's arguments."""
+    if kwargs.get("session_id") is not None:
+        return str(kwargs["session_id"])
+    request = kwargs.get("request")
+    session_id = getattr(request, "session_id", None)
+    return str(session_id) if session_id is not None else None
+
+
+def _locked(write: bool) -> Callable:
+    def decorator(endpoint: Callable) -> Callable:
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            session_id = _session_id_from(kwargs)
+            if session_id is None:
+                return await endpoint(*args, **kwargs)
+            lock = session_locks.write if write else session_locks.read
+            async with lock(session_id):
+                return await endpoint(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Endpoint decorators; place them below the @router route decorator
+reads_session = _locked(write=False)
+writes_session = _locked(write=True)
@@ -0,0 +1,632 @@
+"""
+Session state storage for the API.
+
+Routers keep per-session state (pyramid managers, Step 1 context analyses)
+in SessionStore instances rather than module-level dicts. Two backends are
+available:
+
+- MemorySessionStore: process-local, lost on restart (the default)
+- SQLiteSessionStore: persisted in a SQLite database in WAL mode, so several
+  uvicorn workers on one host share state
+
+Writes are compare-and-swap on the session's revision. A value saved by a
+request carries the revision it was read at; if another worker wrote the
+session in between, save() raises SessionConflictError (HTTP 409) instead of
+silently overwriting that update, and the client reloads and retries.
+(Within one process the per-session locks of api/session_locks.py already
+serialize writers.)
+
+Each store keeps recently used sessions deserialized in a bounded LRU cache.
+Sessions leave the cache when idle for longer than the TTL, or when the
+session count or estimated byte size goes over its cap. For SQLite the
+database still holds them; for the in-memory backend they are spilled to
+disk and rehydrated on next access. Without a spill directory the cache is
+the only copy of a session, so the in-memory backend then has no caps and
+no TTL: sessions are kept until restart, as before caching.
+
+The stores created by create_session_store() hold the parts of one session
+(pyramid, context analyses) and form a group: a session used in any of them
+counts as used in all, and it leaves all their caches together.
+
+Configuration (environment variables):
+    SESSION_STORE_PATH    SQLite database file (unset = in-memory)
+    SESSION_SPILL_DIR     Directory for spilled in-memory sessions (unset = never evict)
+    SESSION_MAX_SESSIONS  Max cached sessions per store (default 1000)
+    SESSION_MAX_BYTES     Max estimated bytes cached per store (default: no cap)
+    SESSION_IDLE_TTL      Seconds before an idle session is evicted (default 86400)
+
+The caps and TTL apply to SQLite, and to the in-memory backend only when
+SESSION_SPILL_DIR is set.
+
+Stores support the dict idioms the routers already use (`in`, `[]`, `del`).
+Objects are mutated in place, so routers must call `save()` after changing
+one to write it through to the backend.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from fastapi import HTTPException
+
+from src.pyramid_builder.settings import env_number
+
+# All stores created by create_session_store(), by namespace
+SESSION_STORES: Dict[str, "SessionStore"] = {}
+
+
+class SessionConflictError(HTTPException):
+    """A session was changed by another worker since the value being saved was read."""
+
+    def __init__(self, session_id: str):
+        super().__init__(
+            status_code=409,
+            detail=f"Session {session_id} was changed by another request. Reload it and try again.",
+        )
+
+
+class _CacheEntry:
+    """A deserialized session held in a store's LRU cache."""
+
+    __slots__ = ("revision", "value", "size", "last_access", "derived")
+
+    def __init__(self, revision: str, value: Any, size: int):
+        self.revision = revision
+        self.value = value
+        self.size = size
+        self.last_access = time.monotonic()
+        # Values computed from this revision by derive(), by name
+        self.derived: Dict[str, Any] = {}
+
+
+class SessionStore(ABC):
+    """
+    Per-session key-value store with a bounded write-through LRU cache.
+
+    Every stored value carries a revision token that changes on each write.
+    Reads check the backend's current revision and only deserialize when
+    the cached copy is stale, e.g. after another worker wrote the session.
+    """
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = 1000,
+        max_bytes: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            max_sessions: Maximum number of cached sessions (None = no cap)
+            max_bytes: Maximum estimated size of cached sessions (None = no cap)
+            idle_ttl: Seconds a session may go unused before eviction (None = never)
+        """
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.idle_ttl = idle_ttl
+
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.RLock()
+        # Stores holding other parts of the same sessions (see join())
+        self._group: Optional[Dict[str, "SessionStore"]] = None
+        # id(value) -> (weak reference, revision it was read or written at)
+        # for values handed out; models aren't hashable, so no WeakKeyDictionary
+        self._base_revisions: Dict[int, Tuple[weakref.ref, str]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, session_id: str, default: Any = None) -> Any:
+        """Get a session's value, or default if it doesn't exist."""
+        with self._lock:
+            self._expire_idle()
+            revision = self._read_revision(session_id)
+            if revision is None:
+                self._uncache(session_id)
+                return default
+
+            entry = self._cache.get(session_id)
+            if entry is not None and entry.revision == revision:
+                self.hits += 1
+                self._touch(session_id)
+                return entry.value
+
+            stored = self._read(session_id)
+            if stored is None:
+                self._uncache(session_id)
+                return default
+            self.misses += 1
+            self._cache_put(session_id, *stored)
+            return stored[1]
+
+    def save(self, session_id: str, value: Any):
+        """
+        Write a session's value through to the backend.
+
+        Call after creating a value or mutating one in place.
+
+        Raises:
+            SessionConflictError: The value was read from this store and the
+                session has been written by someone else since
+        """
+        with self._lock:
+            self._expire_idle()
+            try:
+                revision, size = self._write(session_id, value, self._base_revision(value))
+            except SessionConflictError:
+                # Next read loads the other writer's version
+                self._uncache(session_id)
+                raise
+            self._cache_put(session_id, revision, value, size)
+
+    def derive(self, session_id: str, name: str, build: Callable[[Any], Any], default: Any = None) -> Any:
+        """
+        Get a value computed from a session's value, cached per revision.
+
+        build(value) runs on first use and again only after the session is
+        saved (or reloaded with a new revision). The result is shared between
+        callers and must not be mutated.
+
+        Args:
+            session_id: Session to derive from
+            name: Name of the derived value
+            build: Function computing it from the session's value
+            default: Returned if the session doesn't exist
+
+        Returns:
+            The derived value, or default
+        """
+        with self._lock:
+            value = self.get(session_id)
+            if value is None:
+                return default
+            entry = self._cache.get(session_id)
+            if entry is None or entry.value is not value:
+                return build(value)
+            if name not in entry.derived:
+                entry.derived[name] = build(value)
+            return entry.derived[name]
+
+    def join(self, stores: Dict[str, "SessionStore"], namespace: str):
+        """
+        Add this store to a group of stores holding parts of the same sessions.
+
+        Grouped stores share one lock. A session used in one of them counts
+        as used in all, and a session evicted from one is evicted from all,
+        so no part of a session outlives the others in the cache.
+
+        Args:
+            stores: The group, by namespace (joined stores are added to it)
+            namespace: Name of this store in the group
+        """
+        with self._lock:
+            if stores:
+                self._lock = next(iter(stores.values()))._lock
+            stores[namespace] = self
+            self._group = stores
+
+    def delete(self, session_id: str) -> bool:
+        """Delete a session. Returns True if it existed."""
+        with self._lock:
+            existed = self._delete(session_id)
+            self._uncache(session_id)
+            return existed
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache occupancy and hit/miss/eviction counters."""
+        with self._lock:
+            self._expire_idle()
+            return {
+                "backend": type(self).__name__,
+                "cached_sessions": len(self._cache),
+                "cached_bytes": self._cached_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            self._expire_idle()
+            return self._read_revision(session_id) is not None
+
+    def __getitem__(self, session_id: str) -> Any:
+        value = self.get(session_id)
+        if value is None:
+            raise KeyError(session_id)
+        return value
+
+    def __setitem__(self, session_id: str, value: Any):
+        self.save(session_id, value)
+
+    def __delitem__(self, session_id: str):
+        if not self.delete(session_id):
+            raise KeyError(session_id)
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _cache_put(self, session_id: str, revision: str, value: Any, size: int):
+        """Insert or refresh a cache entry, evicting over-cap entries."""
+        self._uncache(session_id)
+        self._cache[session_id] = _CacheEntry(revision, value, size)
+        self._cached_bytes += size
+        self._remember_revision(value, revision)
+        self._touch(session_id)
+
+        while len(self._cache) > 1 and (
+            (self.max_sessions is not None and len(self._cache) > self.max_sessions)
+            or (self.max_bytes is not None and self._cached_bytes > self.max_bytes)
+        ):
+            self._evict(next(iter(self._cache)))
+            self.evictions += 1
+
+    def _remember_revision(self, value: Any, revision: str):
+        """Record the revision a value handed out corresponds to."""
+        key = id(value)
+        revisions = self._base_revisions
+        revisions[key] = (weakref.ref(value, lambda _: revisions.pop(key, None)), revision)
+
+    def _base_revision(self, value: Any) -> Optional[str]:
+        """The revision a value was read or written at, if it came from this store."""
+        remembered = self._base_revisions.get(id(value))
+        if remembered is None or remembered[0]() is not value:
+            return None
+        return remembered[1]
+
+    def _expire_idle(self):
+        """Evict sessions idle for longer than the TTL."""
+        if self.idle_ttl is None:
+            return
+        cutoff = time.monotonic() - self.idle_ttl
+        # The cache is in access order, so expired entries are at the front
+        while self._cache:
+            session_id, entry = next(iter(self._cache.items()))
+            if entry.last_access > cutoff:
+                break
+            self._evict(session_id)
+            self.expirations += 1
+
+    def _peers(self) -> List["SessionStore"]:
+        """The other stores in this store's group."""
+        if self._group is None:
+            return []
+        return [store for store in self._group.values() if store is not self]
+
+    def _touch(self, session_id: str):
+        """Mark a session as just used, here and in the rest of the group."""
+        now = time.monotonic()
+        for store in [self, *self._peers()]:
+            entry = store._cache.get(session_id)
+            if entry is not None:
+                entry.last_access = now
+                store._cache.move_to_end(session_id)
+
+    def _evict(self, session_id: str):
+        """Remove a session from the cache, here and in the rest of the group."""
+        self._evict_one(session_id)
+        for store in self._peers():
+            if session_id in store._cache:
+                store._evict_one(session_id)
+                store.evictions += 1
+
+    def _evict_one(self, session_id: str):
+        """Remove a session from this store's cache and hand it to the backend."""
+        entry = self._cache[session_id]
+        self._uncache(session_id)
+        self._on_evict(session_id, entry)
+
+    def _uncache(self, session_id: str):
+        """Drop a cache entry, if any."""
+        entry = self._cache.pop(session_id, None)
+        if entry is not None:
+            self._cached_bytes -= entry.size
+
+    # ------------------------------------------------------------------
+    # Backend hooks
+    # ------------------------------------------------------------------
+
+    @abstractmethod
+    def _read_revision(self, session_id: str) -> Optional[str]:
+        """Get the current revision of a session, or None if missing."""
+
+    @abstractmethod
+    def _read(self, session_id: str) -> Optional[Tuple[str, Any, int]]:
+        """Load a session's (revision, value, size), or None if missing."""
+
+    @abstractmethod
+    def _write(self, session_id: str, value: Any, expected: Optional[str]) -> Tuple[str, int]:
+        """
+        Persist a session's value and return its (new revision, size).
+
+        If expected is set (the revision the value was read at), raise
+        SessionConflictError unless the session is still at that revision.
+        """
+
+    @abstractmethod
+    def _delete(self, session_id: str) -> bool:
+        """Remove a session. Returns True if it existed."""
+
+    def _on_evict(self, session_id: str, entry: _CacheEntry):
+        """Handle a session leaving the cache (persistent backends keep it)."""
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Process-local session store. State is lost on restart.
+
+    The cache is the only copy of each session, so eviction drops it unless
+    a spill directory is given, in which case it is written there and loaded
+    back transparently on next access.
+    """
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = 1000,
+        max_bytes: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        spill_dir: Optional[str] = None,
+        namespace: str = "sessions",
+        dump: Optional[Callable[[Any], str]] = None,
+        load: Optional[Callable[[str], Any]] = None,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            max_sessions: Maximum number of sessions held in memory
+            max_bytes: Maximum estimated size of sessions held in memory
+                (requires dump)
+            idle_ttl: Seconds a session may go unused before eviction
+            spill_dir: Directory for evicted sessions (None = drop them)
+                (requires dump and load)
+            namespace: Name separating this store's spill files from others
+            dump: Serializes a value to text
+            load: Deserializes text produced by dump
+        """
+        if (spill_dir or max_bytes is not None) and dump is None:
+            raise ValueError("dump is required for spill_dir or max_bytes")
+        if spill_dir and load is None:
+            raise ValueError("load is required for spill_dir")
+
+        super().__init__(max_sessions, max_bytes, idle_ttl)
+        self.namespace = namespace
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self._dump = dump
+        self._load = load
+
+        self.spills = 0
+        self.rehydrations = 0
+
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters, plus spill-to-disk counters."""
+        with self._lock:
+            stats = super().stats()
+            stats["spills"] = self.spills
+            stats["rehydrations"] = self.rehydrations
+            return stats
+
+    def _spill_path(self, session_id: str) -> Optional[Path]:
+        """File holding a spilled session, if spilling is enabled."""
+        if not self.spill_dir:
+            return None
+        digest = hashlib.sha256(session_id.encode("utf-8")).hexdigest()
+        return self.spill_dir / f"{self.namespace}-{digest}.json"
+
+    def _read_revision(self, session_id: str) -> Optional[str]:
+        entry = self._cache.get(session_id)
+        if entry is not None:
+            return entry.revision
+        path = self._spill_path(session_id)
+        if path and path.exists():
+            # Never matches a cache entry, so get() rehydrates via _read()
+            return "spilled"
+        return None
+
+    def _read(self, session_id: str) -> Optional[Tuple[str, Any, int]]:
+        path = self._spill_path(session_id)
+        if not path:
+            return None
+        try:
+            data = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        path.unlink(missing_ok=True)
+        self.rehydrations += 1
+        return uuid4().hex, self._load(data), len(data)
+
+    def _write(self, session_id: str, value: Any, expected: Optional[str]) -> Tuple[str, int]:
+        # One process, whose writers the session locks serialize
+        path = self._spill_path(session_id)
+        if path:
+            path.unlink(missing_ok=True)
+        size = len(self._dump(value)) if self.max_bytes is not None else 0
+        return uuid4().hex, size
+
+    def _delete(self, session_id: str) -> bool:
+        existed = session_id in self._cache
+        path = self._spill_path(session_id)
+        if path and path.exists():
+            path.unlink(missing_ok=True)
+            existed = True
+        return existed
+
+    def _on_evict(self, session_id: str, entry: _CacheEntry):
+        path = self._spill_path(session_id)
+        if not path:
+            return
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(self._dump(entry.value), encoding="utf-8")
+        os.replace(tmp_path, path)
+        self.spills += 1
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Session store persisted in SQLite.
+
+    Several stores (one per namespace) can share a database file. WAL mode
+    lets readers in other processes proceed while one process writes.
+    Evicting a session from the cache only frees memory; the database keeps it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str,
+        dump: Callable[[Any], str],
+        load: Callable[[str], Any],
+        max_sessions: Optional[int] = 1000,
+        max_bytes: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            path: SQLite database file
+            namespace: Name separating this store's sessions from others
+            dump: Serializes a value to text
+            load: Deserializes text produced by dump
+            max_sessions: Maximum number of cached sessions
+            max_bytes: Maximum serialized size of cached sessions
+            idle_ttl: Seconds a session may go unused before leaving the cache
+        """
+        super().__init__(max_sessions, max_bytes, idle_ttl)
+        self.path = path
+        self.namespace = namespace
+        self._dump = dump
+        self._load = load
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                namespace TEXT NOT NULL,
+                session_id TEXT NOT NULL,
+                revision TEXT NOT NULL,
+                data TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (namespace, session_id)
+            )
+            """
+        )
+
+    def _read_revision(self, session_id: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT revision FROM sessions WHERE namespace = ? AND session_id = ?",
+            (self.namespace, session_id),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _read(self, session_id: str) -> Optional[Tuple[str, Any, int]]:
+        row = self._conn.execute(
+            "SELECT revision, data FROM sessions WHERE namespace = ? AND session_id = ?",
+            (self.namespace, session_id),
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], self._load(row[1]), len(row[1])
+
+    def _write(self, session_id: str, value: Any, expected: Optional[str]) -> Tuple[str, int]:
+        revision = uuid4().hex
+        data = self._dump(value)
+        if expected is not None:
+            cursor = self._conn.execute(
+                """
+                UPDATE sessions SET revision = ?, data = ?, updated_at = ?
+                WHERE namespace = ? AND session_id = ? AND revision = ?
+                """,
+                (revision, data, time.time(), self.namespace, session_id, expected),
+            )
+            if cursor.rowcount == 0:
+                raise SessionConflictError(session_id)
+            return revision, len(data)
+
+        # A new value (not read from the store) replaces whatever is there
+        self._conn.execute(
+            """
+            INSERT INTO sessions (namespace, session_id, revision, data, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (namespace, session_id) DO UPDATE SET
+                revision = excluded.revision,
+                data = excluded.data,
+                updated_at = excluded.updated_at
+            """,
+            (self.namespace, session_id, revision, data, time.time()),
+        )
+        return revision, len(data)
+
+    def _delete(self, session_id: str) -> bool:
+        cursor = self._conn.execute(
+            "DELETE FROM sessions WHERE namespace = ? AND session_id = ?",
+            (self.namespace, session_id),
+        )
+        return cursor.rowcount > 0
+
+
+def create_session_store(
+    namespace: str,
+    dump: Callable[[Any], str],
+    load: Callable[[str], Any],
+) -> SessionStore:
+    """
+    Create the session store configured by environment variables.
+
+    Args:
+        namespace: Name of the store (e.g. "pyramids")
+        dump: Serializes a value to text
+        load: Deserializes text produced by dump
+
+    Returns:
+        SQLiteSessionStore if SESSION_STORE_PATH is set, else MemorySessionStore
+        (evicting only if SESSION_SPILL_DIR is set), in the SESSION_STORES group
+    """
+    limits = dict(
+        max_sessions=env_number("SESSION_MAX_SESSIONS", 1000),
+        max_bytes=env_number("SESSION_MAX_BYTES", None),
+        idle_ttl=env_number("SESSION_IDLE_TTL", 86400.0, cast=float),
+    )
+
+    path = os.getenv("SESSION_STORE_PATH")
+    spill_dir = os.getenv("SESSION_SPILL_DIR") or None
+    if path:
+        store = SQLiteSessionStore(path, namespace, dump, load, **limits)
+    else:
+        if spill_dir is None:
+            # The cache is the only copy: evicting would lose the session
+            limits = dict(max_sessions=None, max_bytes=None, idle_ttl=None)
+        store = MemorySessionStore(
+            spill_dir=spill_dir,
+            namespace=namespace,
+            dump=dump,
+            load=load,
+            **limits,
+        )
+
+    store.join(SESSION_STORES, namespace)
+    return store
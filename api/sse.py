@@ -0,0 +1,16 @@
+"""
+Server-Sent Events formatting for the streaming endpoints.
+
+Chat (/api/ai/chat/stream) and document import (/api/documents/import/stream)
+both stream JSON payloads as named events; the frontend reads them with
+`readServerSentEvents` in lib/api-client.ts.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+
+def sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Format one Server-Sent Event with a JSON payload."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
@@ -0,0 +1,250 @@
+"""
+Offline benchmark for the API's AI endpoints against a mock Anthropic API.
+
+Starts benchmarks/mock_anthropic.py in-process, points the Anthropic SDK
+at it (ANTHROPIC_BASE_URL) and drives the FastAPI app through an in-process
+ASGI client with a fixed number of concurrent clients per scenario:
+
+    ai/suggest-field     POST /api/ai/suggest-field
+    ai/generate-draft    POST /api/ai/generate-draft
+    ai/detect-jargon     POST /api/ai/detect-jargon
+    ai/chat              POST /api/ai/chat
+    ai/chat-stream       POST /api/ai/chat/stream (whole stream)
+    validation/ai        GET  /api/validation/{session_id}/ai
+    documents/import     POST /api/documents/import (a generated DOCX)
+
+For each scenario it reports throughput, p50/p99 end-to-end latency,
+failed requests (error status, or an error reported in the body) and mock
+API calls per request. No API key, network or spend is involved; the
+numbers measure this app's overhead and concurrency limits (AI pool, AI
+gateway, session locks, parse pool) around a model of given latency.
+
+The response and document caches are off by default so every request
+reaches the mock, as does the AI gateway's rate limit (see --rpm).
+
+Usage:
+    python benchmarks/ai_benchmark.py
+    python benchmarks/ai_benchmark.py --latency lognormal:0.8,0.5 --concurrency 16 --requests 200
+    python benchmarks/ai_benchmark.py --scenarios ai/chat validation/ai --error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import io
+import itertools
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.mock_anthropic import MockAnthropicServer
+from benchmarks.validation_benchmark import build_pyramid
+
+SCENARIOS = [
+    "ai/suggest-field",
+    "ai/generate-draft",
+    "ai/detect-jargon",
+    "ai/chat",
+    "ai/chat-stream",
+    "validation/ai",
+    "documents/import",
+]
+
+# (method, path, request keyword arguments) for one request
+Request = Tuple[str, str, Dict[str, Any]]
+
+
+def build_docx(paragraphs: int) -> Optional[bytes]:
+    """A strategy-like DOCX to upload, or None without python-docx."""
+    try:
+        from docx import Document
+    except ImportError:
+        return None
+
+    document = Document()
+    document.add_heading("Strategy 2026", level=1)
+    document.add_paragraph("Vision: Every customer tells a friend about us.")
+    for i in range(paragraphs):
+        document.add_heading(f"Initiative {i}", level=2)
+        document.add_paragraph(
+            f"We will launch initiative {i} to cut onboarding time for segment {i % 7}, "
+            f"measured by time to first value, owned by the customer team."
+        )
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def scenario_requests(sessions: List[str], document: Optional[bytes]) -> Dict[str, Callable[[int], Request]]:
+    """Request builders by scenario, given the request's number."""
+
+    def session(n: int) -> str:
+        return sessions[n % len(sessions)]
+
+    builders = {
+        "ai/suggest-field": lambda n: ("POST", "/api/ai/suggest-field", {"json": {
+            "session_id": session(n), "tier": "strategic_intent", "field_name": "statement",
+            "current_content": f"Improve customer onboarding {n}",
+        }}),
+        "ai/generate-draft": lambda n: ("POST", "/api/ai/generate-draft", {"json": {
+            "session_id": session(n), "tier": "strategic_driver", "context": {"focus": "customers"},
+        }}),
+        "ai/detect-jargon": lambda n: ("POST", "/api/ai/detect-jargon", {"json": {
+            "text": f"We will leverage synergies to drive excellence in region {n}",
+        }}),
+        "ai/chat": lambda n: ("POST", "/api/ai/chat", {"json": {
+            "session_id": session(n), "message": f"Are my H1 commitments realistic? ({n})",
+        }}),
+        "ai/chat-stream": lambda n: ("POST", "/api/ai/chat/stream", {"json": {
+            "session_id": session(n), "message": f"How bold are my strategic intents? ({n})",
+        }}),
+        "validation/ai": lambda n: ("GET", f"/api/validation/{session(n)}/ai", {}),
+    }
+    if document is not None:
+        builders["documents/import"] = lambda n: ("POST", "/api/documents/import", {
+            "files": [("files", (f"strategy-{n}.docx", document, "application/octet-stream"))],
+            "data": {"organization_name": f"Org {n}"},
+        })
+    return builders
+
+
+def failed(scenario: str, response) -> bool:
+    """Whether a response is an error, including errors reported in a 200 body."""
+    if response.status_code >= 400:
+        return True
+    if scenario == "ai/chat-stream":
+        return "event: done" not in response.text
+    body = response.json()
+    if scenario == "validation/ai":
+        return any("skipped" in issue.get("message", "") for issue in body.get("issues", []))
+    if scenario == "documents/import":
+        return not body.get("success")
+    return isinstance(body, dict) and bool(body.get("error"))
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+
+async def run_scenario(client, scenario: str, build: Callable[[int], Request], total: int, concurrency: int) -> Dict[str, Any]:
+    """Send `total` requests from `concurrency` clients; latency and failures."""
+    numbers = itertools.count()
+    latencies: List[float] = []
+    failures: Dict[str, int] = {}
+
+    async def worker():
+        while True:
+            n = next(numbers)
+            if n >= total:
+                return
+            method, path, kwargs = build(n)
+            started = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            if failed(scenario, response):
+                key = str(response.status_code)
+                failures[key] = failures.get(key, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "requests": total,
+        "failures": failures,
+        "throughput": total / elapsed,
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+async def benchmark(args, mock: MockAnthropicServer) -> None:
+    import httpx
+
+    from api.main import app
+    from src.pyramid_builder.ai.gateway import ai_gateway
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        pyramid = build_pyramid(args.size).pyramid.model_dump(mode="json")
+        sessions = [f"benchmark-{i}" for i in range(args.sessions)]
+        for session_id in sessions:
+            response = await client.post("/api/pyramids/load", json={"session_id": session_id, "pyramid_data": pyramid})
+            response.raise_for_status()
+
+        document = build_docx(args.doc_paragraphs)
+        builders = scenario_requests(sessions, document)
+
+        print(f"mock latency {mock.latency.spec}, {args.concurrency} concurrent clients, "
+              f"{args.requests} requests per scenario, pyramid of {args.size} items")
+        print(f"{'scenario':<18} {'req/s':>8} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9} "
+              f"{'failed':>7} {'API calls/req':>14}")
+        for scenario in args.scenarios:
+            if scenario not in builders:
+                print(f"{scenario:<18} skipped (install python-docx to generate the upload)")
+                continue
+            build = builders[scenario]
+            # Warm up: worker processes, lazy imports, connection pool
+            for n in range(args.warmup):
+                method, path, kwargs = build(n)
+                await client.request(method, path, **kwargs)
+
+            calls_before = mock.stats()["requests"]
+            result = await run_scenario(client, scenario, build, args.requests, args.concurrency)
+            calls = (mock.stats()["requests"] - calls_before) / args.requests
+            failures = sum(result["failures"].values())
+            print(
+                f"{scenario:<18} {result['throughput']:>8.1f} {result['p50_ms']:>9.0f} "
+                f"{result['p99_ms']:>9.0f} {result['max_ms']:>9.0f} {failures:>7} {calls:>14.1f}"
+            )
+            if failures:
+                print(f"{'':<18} failures by status: {result['failures']}")
+
+    gateway = ai_gateway.stats()
+    print(f"\nmock API: {mock.stats()['requests']} requests, {mock.stats()['errors']} injected errors; "
+          f"gateway retries: {sum(lane['retries'] for lane in gateway['lanes'].values())}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--scenarios", nargs="+", default=SCENARIOS, choices=SCENARIOS)
+    parser.add_argument("--latency", default="lognormal:0.3,0.4", help="Mock reply latency (see mock_anthropic.py)")
+    parser.add_argument("--chunk-interval", type=float, default=0.01, help="Seconds between streamed fragments")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of mock requests answered with 429")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=48, help="Requests per scenario")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured requests per scenario")
+    parser.add_argument("--sessions", type=int, default=4, help="Pyramid sessions the requests are spread over")
+    parser.add_argument("--size", type=int, default=200, help="Items in each pyramid")
+    parser.add_argument("--doc-paragraphs", type=int, default=200, help="Initiatives in the uploaded DOCX")
+    parser.add_argument("--rpm", default="none", help="AI gateway requests per minute (default: no limit)")
+    parser.add_argument("--cache", action="store_true", help="Keep the AI response and document caches on")
+    args = parser.parse_args()
+
+    mock = MockAnthropicServer(latency=args.latency, chunk_interval=args.chunk_interval, error_rate=args.error_rate)
+    mock.start()
+
+    # Read when the app's modules are imported, so set before that
+    os.environ["ANTHROPIC_BASE_URL"] = mock.url
+    os.environ["ANTHROPIC_API_KEY"] = "mock-key"
+    os.environ["AI_RATE_LIMIT_RPM"] = args.rpm
+    if not args.cache:
+        os.environ["AI_CACHE_DISABLED"] = "1"
+        os.environ["DOCUMENT_CACHE_DISABLED"] = "1"
+
+    try:
+        asyncio.run(benchmark(args, mock))
+    finally:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,464 @@
+"""
+Local stand-in for the Anthropic Messages API, for offline load tests.
+
+Serves POST /v1/messages, plain and streamed (stream=true, Server-Sent
+Events), on a local port. Replies are canned JSON chosen by the prompt, in
+the shapes AICoach, AIValidator and DocumentExtractor expect, and are sent
+after a latency drawn from a configurable distribution:
+
+    fixed:0.5               always 0.5s
+    uniform:0.2,1.5         between 0.2s and 1.5s
+    lognormal:0.8,0.5       median 0.8s, sigma 0.5 (long right tail, like the API)
+
+Streamed replies wait the latency before the first text, then send the
+text in fragments every --chunk-interval seconds. A share of requests can
+be answered with an error status (e.g. 429 with retry-after) to exercise
+the AI gateway's retries.
+
+Point the app at it with ANTHROPIC_BASE_URL (the SDK reads it):
+
+    python benchmarks/mock_anthropic.py --port 8765 --latency lognormal:0.8,0.5
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=mock python api/main.py
+
+benchmarks/ai_benchmark.py starts one in-process. Extra or replacement
+canned replies can be loaded with --responses: a JSON object mapping a
+marker (text the prompt contains) to the reply (a string, or JSON that is
+sent serialized).
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+
+class LatencyModel:
+    """A latency distribution parsed from "kind:params" (see module docstring)."""
+
+    def __init__(self, spec: str = "fixed:0"):
+        kind, _, params = spec.partition(":")
+        values = [float(value) for value in params.split(",") if value.strip()]
+        samplers = {
+            "fixed": (1, lambda: values[0]),
+            "uniform": (2, lambda: random.uniform(values[0], values[1])),
+            "lognormal": (2, lambda: random.lognormvariate(math.log(values[0]), values[1])),
+        }
+        if kind not in samplers or len(values) != samplers[kind][0]:
+            raise ValueError(
+                f"Bad latency spec {spec!r}: use fixed:S, uniform:LO,HI or lognormal:MEDIAN,SIGMA"
+            )
+        self.spec = spec
+        self._sample = samplers[kind][1]
+
+    def sample(self) -> float:
+        """Seconds to wait for one reply."""
+        return max(0.0, self._sample())
+
+
+# ---------------------------------------------------------------------------
+# Canned replies
+# ---------------------------------------------------------------------------
+
+def _alignment_batch(prompt: str) -> List[Dict[str, Any]]:
+    items = sorted({int(number) for number in re.findall(r"^\[(\d+)\] Iconic Commitment:", prompt, re.M)})
+    return [
+        {
+            "item": number,
+            "is_aligned": number % 4 != 0,
+            "confidence": "medium",
+            "explanation": "The commitment moves the linked intent forward.",
+            "suggestion": None if number % 4 else "Tie the deliverable to the intent's outcome.",
+        }
+        for number in items or [1]
+    ]
+
+
+EXTRACTION = {
+    "context": {
+        "socc_items": [
+            {
+                "quadrant": "strength",
+                "title": "Loyal customer base",
+                "description": "Customers renew at high rates.",
+                "impact_level": "high",
+                "tags": ["customers"],
+                "confidence": "HIGH",
+                "source_quote": "Renewals reached 94%",
+            }
+        ],
+        "stakeholders": [],
+        "tensions": [],
+    },
+    "vision": {
+        "statement_type": "VISION",
+        "statement": "Every customer tells a friend about us",
+        "confidence": "HIGH",
+        "source_quote": "Our vision",
+    },
+    "values": [
+        {"name": "Trust", "description": "We do what we say", "confidence": "HIGH", "source_quote": "Values"},
+        {"name": "Curiosity", "description": "We ask why", "confidence": "MEDIUM", "source_quote": "Values"},
+    ],
+    "behaviours": [],
+    "strategic_intents": [
+        {
+            "statement": "Customers rave about onboarding",
+            "linked_driver": "Customer Obsession",
+            "is_stakeholder_voice": True,
+            "confidence": "MEDIUM",
+            "source_quote": "Onboarding",
+        }
+    ],
+    "strategic_drivers": [
+        {
+            "name": "Customer Obsession",
+            "description": "Start from the customer",
+            "rationale": "Retention drives growth",
+            "addresses_opportunities": [],
+            "confidence": "HIGH",
+            "source_quote": "Pillars",
+        }
+    ],
+    "enablers": [],
+    "iconic_commitments": [
+        {
+            "name": "Launch self-serve onboarding",
+            "description": "New customers live within a day",
+            "linked_driver": "Customer Obsession",
+            "horizon": "H1",
+            "target_date": "Q4 2026",
+            "owner": None,
+            "is_tangible": True,
+            "is_measurable": True,
+            "confidence": "MEDIUM",
+            "source_quote": "Initiatives",
+        }
+    ],
+    "team_objectives": [],
+    "individual_objectives": [],
+    "extraction_summary": {
+        "document_type": "Strategy document",
+        "primary_focus": "Customer growth",
+        "extraction_completeness": "MEDIUM",
+        "missing_elements": ["behaviours"],
+        "notes": "Canned reply from the mock Anthropic server",
+    },
+}
+
+Reply = Union[str, Dict[str, Any], List[Any], Callable[[str], Any]]
+
+# (marker, reply): the first marker found in the prompt picks the reply
+CANNED_RESPONSES: List[Tuple[str, Reply]] = [
+    ("JSON array holding one object per commitment", _alignment_batch),
+    ('"is_aligned"', {
+        "is_aligned": True, "confidence": "high",
+        "explanation": "Delivers the linked intent.", "suggestion": None,
+    }),
+    ('"is_coherent"', {
+        "is_coherent": True, "confidence": "high", "issues": [],
+        "strengths": ["Drivers trace cleanly to the vision"],
+        "suggestion": "Keep intents outcome-focused",
+    }),
+    ('"is_realistic"', {
+        "is_realistic": False, "concern": "overloaded",
+        "message": "H1 carries most commitments", "suggestion": "Move two commitments to H2",
+    }),
+    ('"overall_boldness"', {
+        "overall_boldness": "moderate", "assessment": "Some intents read like activities",
+        "weak_intents": [{"number": 1, "issue": "Describes an activity", "alternative": "Customers choose us first"}],
+        "strong_intents": [2], "suggestion": "Describe the outcome, not the work",
+    }),
+    ('"overall_impression"', {
+        "overall_impression": "A coherent strategy with a crowded first horizon.",
+        "strengths": ["Clear vision", "Traceable drivers", "Measurable commitments"],
+        "concerns": ["H1 overload", "Few enablers", "Generic values"],
+        "recommendations": [
+            {"priority": 1, "title": "Rebalance horizons", "description": "Move work to H2"},
+            {"priority": 2, "title": "Name enablers", "description": "List the capabilities needed"},
+            {"priority": 3, "title": "Sharpen values", "description": "Define them in practice"},
+        ],
+        "values_behaviours_assessment": "Behaviours mostly demonstrate the values",
+    }),
+    ('"extraction_summary"', EXTRACTION),
+    ('"has_suggestion"', {
+        "has_suggestion": True, "severity": "warning", "message": "Too vague to act on",
+        "suggestion": "Cut onboarding time to one day for every new customer",
+        "examples": ["Every customer live within a day"], "reasoning": "TT-014: outcome-focused",
+    }),
+    ('"has_jargon"', {
+        "has_jargon": True, "jargon_words": ["leverage", "synergy"], "severity": "medium",
+        "message": "Jargon hides the outcome", "alternative": "Combine both teams' customer data",
+    }),
+    ("Respond in JSON format with ONLY these fields", {
+        "statement": "Every customer tells a friend about us",
+        "name": "Customer Obsession",
+        "description": "Start every decision from the customer",
+        "rationale": "Retention drives growth",
+    }),
+]
+
+DEFAULT_REPLY = (
+    "Good question. Your strategic intents describe outcomes well; consider "
+    "moving two H1 commitments to H2 so the first year stays deliverable, "
+    "and name the enablers the customer drivers depend on."
+)
+
+
+def _prompt_text(request: Dict[str, Any]) -> str:
+    """All text in a Messages request (system and messages), for marker matching."""
+    def text(content: Any) -> str:
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            return "\n".join(block.get("text", "") for block in content if isinstance(block, dict))
+        return ""
+
+    parts = [text(request.get("system"))]
+    parts.extend(text(message.get("content")) for message in request.get("messages", []))
+    return "\n".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+class MockAnthropicServer:
+    """Threaded HTTP server answering Messages API requests with canned replies."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Union[str, LatencyModel] = "fixed:0",
+        chunk_interval: float = 0.02,
+        error_rate: float = 0.0,
+        error_status: int = 429,
+        responses: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize server (call start() to serve).
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 = any free port)
+            latency: Reply latency, a LatencyModel or its spec
+            chunk_interval: Seconds between streamed text fragments
+            error_rate: Share of requests answered with error_status
+            error_status: Status of injected errors (429 adds retry-after: 1)
+            responses: Extra {marker: reply} canned replies, tried first
+        """
+        self.latency = latency if isinstance(latency, LatencyModel) else LatencyModel(latency)
+        self.chunk_interval = chunk_interval
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.responses: List[Tuple[str, Reply]] = list((responses or {}).items()) + CANNED_RESPONSES
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.streams = 0
+        self.errors = 0
+        self.by_marker: Dict[str, int] = {}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockAnthropicServer":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-anthropic", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockAnthropicServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def reply_for(self, request: Dict[str, Any]) -> Tuple[str, str]:
+        """The canned reply text for a request, and the marker that chose it."""
+        prompt = _prompt_text(request)
+        for marker, reply in self.responses:
+            if marker in prompt:
+                break
+        else:
+            marker, reply = "default", DEFAULT_REPLY
+        if callable(reply):
+            reply = reply(prompt)
+        return (reply if isinstance(reply, str) else json.dumps(reply)), marker
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests served, streams, injected errors and replies by marker."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "streams": self.streams,
+                "errors": self.errors,
+                "by_marker": dict(self.by_marker),
+            }
+
+    def _record(self, marker: Optional[str], stream: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            if marker is None:
+                self.errors += 1
+                return
+            self.streams += 1 if stream else 0
+            self.by_marker[marker] = self.by_marker.get(marker, 0) + 1
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if self.path.split("?")[0] != "/v1/messages":
+                    return self._json(404, _error("not_found_error", f"No route {self.path}"))
+                try:
+                    request = json.loads(body or b"{}")
+                except ValueError:
+                    return self._json(400, _error("invalid_request_error", "Body is not JSON"))
+
+                if server.error_rate and random.random() < server.error_rate:
+                    server._record(None)
+                    status = server.error_status
+                    headers = {"retry-after": "1"} if status == 429 else {}
+                    kind = "rate_limit_error" if status == 429 else "overloaded_error" if status == 529 else "api_error"
+                    return self._json(status, _error(kind, "Injected by the mock server"), headers)
+
+                text, marker = server.reply_for(request)
+                delay = server.latency.sample()
+                if request.get("stream"):
+                    server._record(marker, stream=True)
+                    return self._stream(request, text, delay)
+                time.sleep(delay)
+                server._record(marker)
+                self._json(200, _message(request, text))
+
+            def _json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _stream(self, request: Dict[str, Any], text: str, delay: float):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                # No length known up front: the connection ends the stream
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+
+                message = _message(request, "")
+                message["stop_reason"] = None
+                fragments = [text[i:i + 24] for i in range(0, len(text), 24)] or [""]
+                self._event("message_start", {"type": "message_start", "message": message})
+                self._event("content_block_start", {
+                    "type": "content_block_start", "index": 0,
+                    "content_block": {"type": "text", "text": ""},
+                })
+                time.sleep(delay)
+                for number, fragment in enumerate(fragments):
+                    if number:
+                        time.sleep(server.chunk_interval)
+                    self._event("content_block_delta", {
+                        "type": "content_block_delta", "index": 0,
+                        "delta": {"type": "text_delta", "text": fragment},
+                    })
+                self._event("content_block_stop", {"type": "content_block_stop", "index": 0})
+                self._event("message_delta", {
+                    "type": "message_delta",
+                    "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                    "usage": {"output_tokens": _tokens(text)},
+                })
+                self._event("message_stop", {"type": "message_stop"})
+
+            def _event(self, event: str, data: Dict[str, Any]):
+                self.wfile.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+
+        return Handler
+
+
+def _tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def _message(request: Dict[str, Any], text: str) -> Dict[str, Any]:
+    return {
+        "id": f"msg_mock_{uuid.uuid4().hex[:20]}",
+        "type": "message",
+        "role": "assistant",
+        "model": request.get("model", "mock"),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {
+            "input_tokens": _tokens(_prompt_text(request)),
+            "output_tokens": _tokens(text),
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+        },
+    }
+
+
+def _error(kind: str, message: str) -> Dict[str, Any]:
+    return {"type": "error", "error": {"type": kind, "message": message}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="lognormal:0.8,0.5", help="fixed:S | uniform:LO,HI | lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--chunk-interval", type=float, default=0.02, help="Seconds between streamed fragments")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with --error-status")
+    parser.add_argument("--error-status", type=int, default=429)
+    parser.add_argument("--responses", help="JSON file of extra {marker: reply} canned replies")
+    args = parser.parse_args()
+
+    responses = None
+    if args.responses:
+        with open(args.responses, encoding="utf-8") as f:
+            responses = json.load(f)
+
+    server = MockAnthropicServer(
+        args.host, args.port, args.latency, args.chunk_interval, args.error_rate, args.error_status, responses
+    )
+    print(f"Mock Anthropic API on {server.url} (latency {server.latency.spec}); Ctrl+C to stop")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(json.dumps(server.stats(), indent=2))
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark for PyramidValidator.validate_all on large pyramids.
+
+Builds synthetic pyramids of increasing size (drivers scale with the
+pyramid, as in enterprise roll-outs) and reports validation time per item.
+A flat time-per-item column shows validation is linear in pyramid size.
+The last column is the incremental re-validation time after a single edit,
+using the manager's change-tracked validator.
+
+Usage:
+    python benchmarks/validation_benchmark.py
+    python benchmarks/validation_benchmark.py --sizes 1000 5000 10000 --repeat 5
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add repo root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pyramid_builder.core.pyramid_manager import PyramidManager
+from src.pyramid_builder.models.pyramid import Horizon, StatementType
+from src.pyramid_builder.validation.validator import PyramidValidator
+
+
+def build_pyramid(total_items: int) -> PyramidManager:
+    """
+    Build a synthetic pyramid with roughly `total_items` items.
+
+    Mix: 2% drivers, 20% intents, 20% commitments, 30% team objectives,
+    28% individual objectives, plus vision and values.
+    """
+    manager = PyramidManager()
+    manager.create_new_pyramid("Benchmark", "Benchmark Org", "Benchmark")
+    manager.add_vision_statement(StatementType.VISION, "Every customer is a fan for life")
+    for name in ["Trust", "Bold", "Curious", "Kind"]:
+        manager.add_value(name)
+
+    n_drivers = max(1, total_items * 2 // 100)
+    n_intents = total_items * 20 // 100
+    n_commitments = total_items * 20 // 100
+    n_teams = total_items * 30 // 100
+    n_individuals = total_items * 28 // 100
+
+    drivers = [
+        manager.add_strategic_driver(f"Driver {i}", f"Strategic focus area number {i}")
+        for i in range(n_drivers)
+    ]
+    intents = [
+        manager.add_strategic_intent(
+            f"Customers in segment {i} rave about us to their peers",
+            drivers[i % n_drivers].id,
+        )
+        for i in range(n_intents)
+    ]
+    commitments = []
+    for i in range(n_commitments):
+        commitment = manager.add_iconic_commitment(
+            f"Launch initiative {i}",
+            f"Deliver initiative {i} to every region",
+            [Horizon.H1, Horizon.H2, Horizon.H3][i % 3],
+            drivers[i % n_drivers].id,
+            [intents[i % n_intents].id] if n_intents and i % 4 else [],
+            target_date="Q4 2026" if i % 5 else None,
+        )
+        if n_drivers > 1 and i % 7 == 0:
+            manager.add_secondary_alignment_to_commitment(
+                commitment.id, drivers[(i + 1) % n_drivers].id, weighting=0.5
+            )
+        commitments.append(commitment)
+    teams = [
+        manager.add_team_objective(
+            f"Team objective {i}",
+            f"Team contribution number {i}",
+            f"Team {i % 50}",
+            primary_commitment_id=commitments[i % n_commitments].id if n_commitments else None,
+        )
+        for i in range(n_teams)
+    ]
+    for i in range(n_individuals):
+        manager.add_individual_objective(
+            f"Individual objective {i}",
+            f"Personal contribution number {i}",
+            f"Person {i}",
+            team_objective_ids=[teams[i % n_teams].id],
+        )
+    return manager
+
+
+def time_validation(manager: PyramidManager, repeat: int) -> float:
+    """Median wall-clock seconds for one full validation."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        PyramidValidator(manager.pyramid).validate_all()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def time_revalidation(manager: PyramidManager, repeat: int) -> float:
+    """Median wall-clock seconds to re-validate after editing one intent."""
+    validator = manager.get_validator()
+    validator.validate_all()
+    intent = manager.pyramid.strategic_intents[len(manager.pyramid.strategic_intents) // 2]
+    timings = []
+    for i in range(repeat):
+        manager.update_strategic_intent(intent.id, statement=f"Customers in segment {i} choose us first")
+        start = time.perf_counter()
+        validator.validate_all()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2500, 5000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'validate (ms)':>14} {'us/item':>9} {'1 edit (ms)':>12}")
+    for size in args.sizes:
+        manager = build_pyramid(size)
+        seconds = time_validation(manager, args.repeat)
+        incremental = time_revalidation(manager, args.repeat)
+        print(
+            f"{size:>8} {seconds * 1000:>14.1f} {seconds * 1e6 / size:>9.2f} "
+            f"{incremental * 1000:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -281,6 +281,7 @@ def main():
         )
         # Link to intents
         commitment.primary_intent_ids = [i.id for i in driver_intents]
+        builder.pyramid.reindex_item("iconic_commitments", commitment)
 
         created_commitments.append(commitment)
     print(f"✓ Added {len(created_commitments)} iconic commitments")
@@ -353,17 +353,20 @@ export function AICoachSidebar({ onApplySuggestion }: AICoachSidebarProps) {
     setIsLoading(true);
 
     try {
-      // Get AI response
-      const response = await aiApi.chat(
+      // Stream the AI response into the chat as it arrives
+      let streamed = "";
+      await aiApi.chatStream(
         sessionId,
         userMessage,
-        newMessages.slice(0, -1) // Send history without the just-added user message
+        newMessages.slice(0, -1), // Send history without the just-added user message
+        (text) => {
+          streamed += text;
+          setMessages([
+            ...newMessages,
+            { role: "assistant", content: streamed },
+          ]);
+        }
       );
-
-      setMessages([
-        ...newMessages,
-        { role: "assistant", content: response.response },
-      ]);
     } catch (err) {
       console.error("Chat error:", err);
       setMessages([
@@ -573,7 +576,7 @@ Use ✓ for strengths and ⚠ for suggestions. Keep it brief and actionable.`;
           </div>
         ))}
 
-        {isLoading && (
+        {isLoading && messages[messages.length - 1]?.role !== "assistant" && (
           <div className="flex justify-start">
             <div className="bg-gray-100 rounded-lg p-3">
               <div className="flex gap-1">
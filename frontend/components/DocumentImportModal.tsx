@@ -13,6 +13,7 @@ import {
 } from "lucide-react";
 import {
   documentsApi,
+  type DocumentParseResult,
   type ImportDocumentsResponse,
   type ExtractedElements,
 } from "@/lib/api-client";
@@ -34,6 +35,9 @@ export function DocumentImportModal({
   const [importing, setImporting] = useState(false);
   const [accepting, setAccepting] = useState(false);
   const [importResult, setImportResult] = useState<ImportDocumentsResponse | null>(null);
+  // Parse results as each file finishes, while importing
+  const [parseProgress, setParseProgress] = useState<Record<number, DocumentParseResult>>({});
+  const [extracting, setExtracting] = useState(false);
   const [dragActive, setDragActive] = useState(false);
 
   const handleFileSelect = useCallback((files: FileList | null) => {
@@ -80,11 +84,16 @@ export function DocumentImportModal({
 
     setImporting(true);
     setImportResult(null);
+    setParseProgress({});
+    setExtracting(false);
 
     try {
-      const result = await documentsApi.importDocuments(
+      const result = await documentsApi.importDocumentsStream(
         selectedFiles,
-        organizationName
+        organizationName,
+        (index, parsed) =>
+          setParseProgress((prev) => ({ ...prev, [index]: parsed })),
+        () => setExtracting(true)
       );
       setImportResult(result);
     } catch (error: any) {
@@ -96,6 +105,7 @@ export function DocumentImportModal({
       });
     } finally {
       setImporting(false);
+      setExtracting(false);
     }
   };
 
@@ -214,12 +224,22 @@ export function DocumentImportModal({
                           </p>
                         </div>
                       </div>
-                      <button
-                        onClick={() => removeFile(index)}
-                        className="text-gray-400 hover:text-red-600 transition-colors"
-                      >
-                        <X className="w-5 h-5" />
-                      </button>
+                      {importing ? (
+                        !parseProgress[index] ? (
+                          <Loader2 className="w-5 h-5 text-blue-600 animate-spin" />
+                        ) : parseProgress[index].success ? (
+                          <CheckCircle2 className="w-5 h-5 text-green-600" />
+                        ) : (
+                          <FileWarning className="w-5 h-5 text-red-600" />
+                        )
+                      ) : (
+                        <button
+                          onClick={() => removeFile(index)}
+                          className="text-gray-400 hover:text-red-600 transition-colors"
+                        >
+                          <X className="w-5 h-5" />
+                        </button>
+                      )}
                     </div>
                   ))}
                 </div>
@@ -432,7 +452,7 @@ export function DocumentImportModal({
                 {importing ? (
                   <>
                     <Loader2 className="w-4 h-4 animate-spin" />
-                    Processing...
+                    {extracting ? "Extracting elements..." : "Reading documents..."}
                   </>
                 ) : (
                   <>
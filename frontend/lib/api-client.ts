@@ -32,6 +32,49 @@ const api = axios.create({
   },
 });
 
+/**
+ * Read a server-sent event stream, calling onEvent with each event's name
+ * and parsed JSON payload. Stops early when onEvent returns true.
+ */
+async function readServerSentEvents(
+  res: Response,
+  onEvent: (event: string, payload: any) => boolean | void
+): Promise<void> {
+  const reader = res.body!.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) return;
+    buffer += decoder.decode(value, { stream: true });
+
+    // Events are separated by a blank line
+    let boundary;
+    while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+      const raw = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let event = "message";
+      let data = "";
+      for (const line of raw.split("\n")) {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      }
+      if (!data) continue;
+      const payload = JSON.parse(data);
+
+      if (event === "error") {
+        throw new Error(payload.detail);
+      }
+      if (onEvent(event, payload)) {
+        await reader.cancel();
+        return;
+      }
+    }
+  }
+}
+
 // ============================================================================
 // PYRAMID OPERATIONS
 // ============================================================================
@@ -651,6 +694,47 @@ export const aiApi = {
     });
     return data;
   },
+
+  /**
+   * Chat with the AI coach, receiving the reply as it is generated.
+   * Calls onText for each fragment and resolves with the full reply.
+   */
+  async chatStream(
+    sessionId: string,
+    message: string,
+    chatHistory: Array<{ role: string; content: string }> | undefined,
+    onText: (text: string) => void
+  ): Promise<{
+    response: string;
+    ttft_ms?: number;
+  }> {
+    const res = await fetch(`${API_BASE_URL}/api/ai/chat/stream`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({
+        session_id: sessionId,
+        message,
+        chat_history: chatHistory,
+      }),
+    });
+    if (!res.ok || !res.body) {
+      throw new Error(`Chat failed: ${res.status}`);
+    }
+
+    let response = "";
+    let ttftMs: number | undefined;
+
+    await readServerSentEvents(res, (event, payload) => {
+      if (event === "done") {
+        ttftMs = payload.ttft_ms;
+      } else {
+        response += payload.text;
+        onText(payload.text);
+      }
+    });
+
+    return { response, ttft_ms: ttftMs };
+  },
 };
 
 // ============================================================================
@@ -886,6 +970,52 @@ export const documentsApi = {
     return data;
   },
 
+  async importDocumentsStream(
+    files: File[],
+    organizationName: string | undefined,
+    onParsed: (index: number, result: DocumentParseResult) => void,
+    onExtracting?: () => void
+  ): Promise<ImportDocumentsResponse> {
+    const formData = new FormData();
+    files.forEach((file) => {
+      formData.append("files", file);
+    });
+    if (organizationName) {
+      formData.append("organization_name", organizationName);
+    }
+
+    const res = await fetch(`${API_BASE_URL}/api/documents/import/stream`, {
+      method: "POST",
+      body: formData,
+    });
+    if (!res.ok || !res.body) {
+      let detail = `Import failed: ${res.status}`;
+      try {
+        detail = (await res.json()).detail || detail;
+      } catch {}
+      throw new Error(detail);
+    }
+
+    let response: ImportDocumentsResponse | undefined;
+
+    await readServerSentEvents(res, (event, payload) => {
+      if (event === "parsed") {
+        const { index, ...result } = payload;
+        onParsed(index, result);
+      } else if (event === "extracting") {
+        onExtracting?.();
+      } else if (event === "done") {
+        response = payload;
+        return true;
+      }
+    });
+
+    if (!response) {
+      throw new Error("Import stream ended unexpectedly");
+    }
+    return response;
+  },
+
   async batchImportElements(
     sessionId: string,
     extractedElements: ExtractedElements,
@@ -1178,6 +1178,7 @@ def show_team_objectives():
                     # Manually set primary_intent_id since add_team_objective doesn't support it yet
                     if intent_id:
                         pyramid.team_objectives[-1].primary_intent_id = intent_id
+                        pyramid.reindex_item("team_objectives", pyramid.team_objectives[-1])
 
                     st.success("✓ Team objective added")
                     st.rerun()
@@ -1,5 +1,13 @@
 """AI-powered coaching and assistance for pyramid building."""
 
-from .coach import AICoach
-
 __all__ = ["AICoach"]
+
+
+def __getattr__(name: str):
+    # Imported on first use, so importing a submodule (e.g. the response
+    # cache) doesn't load the coach and its prompts
+    if name == "AICoach":
+        from .coach import AICoach
+
+        return AICoach
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
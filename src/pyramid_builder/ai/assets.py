@@ -0,0 +1,86 @@
+"""
+Static prompt assets, loaded once per process.
+
+AI services are created per request, but the files and long prompt texts
+they use never change while the process runs. Each is registered here with
+a loader and `static_assets.get(name)` runs it on first use only, so
+creating a service reads nothing from disk:
+
+    product_definition   PRODUCT_DEFINITION.md (AI validation context)
+
+Services can also register text they build themselves (e.g. the document
+extraction instructions) by passing a builder to get().
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+# Repository root (src/pyramid_builder/ai/assets.py -> ../../..)
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+
+class StaticAssets:
+    """Thread-safe registry of text loaded on first use and kept."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaders: Dict[str, Callable[[], str]] = {}
+        self._values: Dict[str, str] = {}
+        self.loads = 0
+
+    def register(self, name: str, loader: Callable[[], str]) -> None:
+        """Register how to load an asset; it is loaded on first get()."""
+        with self._lock:
+            self._loaders[name] = loader
+            self._values.pop(name, None)
+
+    def register_file(self, name: str, path: Path) -> None:
+        """Register a UTF-8 text file; a missing file loads as ""."""
+        def load() -> str:
+            return path.read_text(encoding="utf-8") if path.exists() else ""
+
+        self.register(name, load)
+
+    def get(self, name: str, build: Optional[Callable[[], str]] = None) -> str:
+        """
+        An asset's text, loaded the first time it is asked for.
+
+        Args:
+            name: Asset name
+            build: Loader to register if `name` isn't registered yet
+
+        Raises:
+            KeyError: Unknown asset and no builder given
+        """
+        value = self._values.get(name)
+        if value is not None:
+            return value
+        with self._lock:
+            if name not in self._values:
+                if name not in self._loaders:
+                    if build is None:
+                        raise KeyError(f"Unknown static asset: {name}")
+                    self._loaders[name] = build
+                self._values[name] = self._loaders[name]()
+                self.loads += 1
+            return self._values[name]
+
+    def clear(self) -> None:
+        """Forget loaded text (e.g. after editing a file); reloaded on next get()."""
+        with self._lock:
+            self._values.clear()
+
+    def stats(self) -> Dict[str, object]:
+        """Registered assets, loaded ones with their size, and loads so far."""
+        with self._lock:
+            return {
+                "registered": sorted(self._loaders),
+                "loaded": {name: len(value) for name, value in self._values.items()},
+                "loads": self.loads,
+            }
+
+
+# Shared by every AI service in the process
+static_assets = StaticAssets()
+static_assets.register_file("product_definition", PROJECT_ROOT / "PRODUCT_DEFINITION.md")
@@ -7,16 +7,16 @@ and contextual chat support during pyramid building.
 
 import os
 import json
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-
+from ..models.jargon import JARGON_MATCHER
 from ..models.pyramid import StrategyPyramid
+from .gateway import ANTHROPIC_AVAILABLE, INTERACTIVE, gateway_client
+from .json_stream import parse_json_response
+from .prompt_cache import UsageTrackingClient, cached_system
+from .prompt_context import PromptContextRenderer
+from .response_cache import CachingClient, get_response_cache
 
 
 class AICoach:
@@ -25,7 +25,10 @@ class AICoach:
     Provides real-time suggestions, draft generation, and contextual help.
     """
 
-    def __init__(self, pyramid: Optional[StrategyPyramid] = None, context: Optional[Dict[str, Any]] = None, api_key: Optional[str] = None):
+    # AI gateway lane: a user is waiting on every coaching call
+    GATEWAY_PRIORITY = INTERACTIVE
+
+    def __init__(self, pyramid: Optional[StrategyPyramid] = None, context: Optional[Dict[str, Any]] = None, api_key: Optional[str] = None, timeout: Optional[float] = None, bypass_cache: bool = False, pyramid_context: Optional[str] = None, cache_pyramid_context: bool = True):
         """
         Initialize AI coach.
 
@@ -33,9 +36,19 @@ class AICoach:
             pyramid: Optional current pyramid state (for context)
             context: Optional SOCC context data (Tier 0)
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            timeout: Optional per-request timeout in seconds for API calls
+            bypass_cache: Skip cached responses (fresh ones are still stored)
+            pyramid_context: Optional pre-rendered pyramid state for chat (see
+                PromptContextRenderer); rendered from pyramid when omitted
+            cache_pyramid_context: Mark the pyramid state in chat prompts for
+                prompt caching; turn off for state pruned to each question,
+                which is rarely the same twice and would pay a cache write
+                on every turn
         """
         self.pyramid = pyramid
         self.context = context
+        self.pyramid_context = pyramid_context
+        self.cache_pyramid_context = cache_pyramid_context
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
 
         if not ANTHROPIC_AVAILABLE:
@@ -50,7 +63,13 @@ class AICoach:
                 "Set ANTHROPIC_API_KEY environment variable or pass api_key parameter."
             )
 
-        self.client = Anthropic(api_key=self.api_key)
+        # The process-wide pooled client, rate limited and retried by the AI gateway
+        self.client = UsageTrackingClient(gateway_client(self.api_key, timeout, self.GATEWAY_PRIORITY))
+        # Deterministic checks (not chat or drafting) reuse cached responses
+        cache = get_response_cache()
+        self.cached_client = (
+            CachingClient(self.client, cache, bypass=bypass_cache) if cache is not None else self.client
+        )
 
         # Load thought leadership context
         self.tooltips_guidance = self._load_tooltips_summary()
@@ -122,11 +141,8 @@ class AICoach:
             statement_type = context["statement_type"].upper()
             statement_type_str = f"\n**CRITICAL**: The user has selected '{statement_type}' as the statement type. You MUST evaluate this content as a {statement_type} statement, NOT as any other type. Do not suggest it should be more like a Vision, Mission, Belief, or Passion unless it fails to meet {statement_type} best practices."
 
-        prompt = f"""You are a strategic planning coach. A user is building a strategic pyramid and typing in the {field_name} field for a {tier}.
-
-Current content: "{current_content}"
-{context_str}
-{statement_type_str}
+        # Static per tier (and statement type): cached across keystrokes
+        instructions = f"""You are a strategic planning coach. A user is building a strategic pyramid and typing in a field; their current content is given in their message.
 
 {self.tooltips_guidance}
 
@@ -153,22 +169,23 @@ Respond in JSON format:
 
 If content is good and follows best practices, set has_suggestion: false."""
 
+        prompt = f"""I am typing in the {field_name} field for a {tier}.
+
+Current content: "{current_content}"
+{context_str}
+{statement_type_str}"""
+
         try:
             response = self.client.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=512,
+                system=cached_system(instructions),
                 messages=[{"role": "user", "content": prompt}]
             )
 
             content = response.content[0].text
 
-            # Extract JSON
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            result = json.loads(content)
+            result = parse_json_response(content)
             return result
 
         except Exception as e:
@@ -261,17 +278,8 @@ IMPORTANT: Focus your draft on this specific request while following best practi
             statement_type = context["statement_type"].upper()
             statement_type_str = f"\n**CRITICAL**: The user has selected '{statement_type}' as the statement type. You MUST generate a {statement_type} statement following {statement_type} best practices, NOT any other type."
 
-        prompt = f"""You are a strategic planning expert helping someone build a {tier}.
-
-Current Pyramid Context (REAL-TIME STATE):
-{pyramid_context}
-(Note: This context reflects the pyramid's current state including any recent additions, edits, or removals)
-
-User Context:
-{json.dumps({k: v for k, v in context.items() if k != 'user_guidance'}, indent=2)}
-{statement_type_str}
-
-{user_guidance_section}
+        # Static per tier (and statement type): cached across drafts
+        instructions = f"""You are a strategic planning expert helping someone build a {tier}. Their pyramid and context are given in their message.
 
 {self.tooltips_guidance}
 
@@ -284,26 +292,33 @@ Generate a high-quality draft {tier} that:
 2. Is specific and actionable (not vague or generic)
 3. Contains ZERO jargon (no "improve", "enhance", "drive", "leverage", "synergy")
 4. Fits the current pyramid context
-{"5. ADDRESSES THE USER'S SPECIFIC REQUEST ABOVE" if user_guidance else ""}
+5. Addresses the user's specific request, if they make one
 
 {self._get_tier_json_schema(tier)}"""
 
+        prompt = f"""Current Pyramid Context (REAL-TIME STATE):
+{pyramid_context}
+(Note: This context reflects the pyramid's current state including any recent additions, edits, or removals)
+
+User Context:
+{json.dumps({k: v for k, v in context.items() if k != 'user_guidance'}, indent=2)}
+{statement_type_str}
+
+{user_guidance_section}
+
+Generate the draft {tier}."""
+
         try:
             response = self.client.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=1024,
+                system=cached_system(instructions),
                 messages=[{"role": "user", "content": prompt}]
             )
 
             content = response.content[0].text
 
-            # Extract JSON
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            draft = json.loads(content)
+            draft = parse_json_response(content)
             return draft
 
         except Exception as e:
@@ -327,14 +342,7 @@ Generate a high-quality draft {tier} that:
             return {"has_jargon": False}
 
         # Quick local check for common jargon
-        jargon_keywords = [
-            "synergy", "leverage", "utilize", "drive", "enhance",
-            "improve", "optimize", "strategic", "innovative",
-            "best in class", "world-class", "cutting-edge",
-            "thought leadership", "paradigm", "disruptive"
-        ]
-
-        found_jargon = [word for word in jargon_keywords if word.lower() in text.lower()]
+        found_jargon = JARGON_MATCHER.find(text)
 
         if not found_jargon:
             return {"has_jargon": False}
@@ -354,7 +362,7 @@ Suggest specific, measurable alternatives. Respond in JSON:
 }}"""
 
         try:
-            response = self.client.messages.create(
+            response = self.cached_client.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=256,
                 messages=[{"role": "user", "content": prompt}]
@@ -362,13 +370,7 @@ Suggest specific, measurable alternatives. Respond in JSON:
 
             content = response.content[0].text
 
-            # Extract JSON
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            result = json.loads(content)
+            result = parse_json_response(content)
             return result
 
         except Exception as e:
@@ -396,110 +398,62 @@ Suggest specific, measurable alternatives. Respond in JSON:
         Returns:
             AI's response as string
         """
-        pyramid_context = ""
-        if self.pyramid:
-            sections = []
-            summary = []
-
-            # Tier 1: Vision/Mission/Belief/Passion (with type labels and IDs)
-            if self.pyramid.vision and self.pyramid.vision.statements:
-                tier1_lines = ["### PURPOSE STATEMENTS (Tier 1):"]
-                for stmt in self.pyramid.vision.get_statements_ordered():
-                    stmt_type = stmt.statement_type.value.upper()
-                    tier1_lines.append(f"  [{stmt_type}] (id: {stmt.id}): {stmt.statement}")
-                tier1_lines.append("")
-                tier1_lines.append("Note: Each statement type has different criteria:")
-                tier1_lines.append("  - VISION: Future-focused, paints a picture of what could be")
-                tier1_lines.append("  - MISSION: Purpose-focused, explains why the organization exists")
-                tier1_lines.append("  - BELIEF: Conviction-focused, articulates core beliefs that guide decisions")
-                tier1_lines.append("  - PASSION: Energy-focused, expresses what drives and motivates")
-                sections.append("\n".join(tier1_lines))
-                summary.append(f"Purpose Statements: {len(self.pyramid.vision.statements)}")
-
-            # Tier 2: Values
-            if self.pyramid.values:
-                tier2_lines = [f"### VALUES (Tier 2) - {len(self.pyramid.values)} core values:"]
-                for value in self.pyramid.values:
-                    desc = f": {value.description[:80]}" if value.description else ""
-                    tier2_lines.append(f"  - {value.name} (id: {value.id}){desc}")
-                sections.append("\n".join(tier2_lines))
-                summary.append(f"Values: {len(self.pyramid.values)}")
-
-            # Tier 3: Behaviours
-            if self.pyramid.behaviours:
-                tier3_lines = [f"### BEHAVIOURS (Tier 3) - {len(self.pyramid.behaviours)} observable behaviours:"]
-                for behaviour in self.pyramid.behaviours[:5]:
-                    tier3_lines.append(f"  - (id: {behaviour.id}) {behaviour.statement}")
-                if len(self.pyramid.behaviours) > 5:
-                    tier3_lines.append(f"  ... and {len(self.pyramid.behaviours) - 5} more")
-                sections.append("\n".join(tier3_lines))
-                summary.append(f"Behaviours: {len(self.pyramid.behaviours)}")
-
-            # Tier 5: Strategic Drivers
-            if self.pyramid.strategic_drivers:
-                tier5_lines = [f"### STRATEGIC DRIVERS (Tier 5) - {len(self.pyramid.strategic_drivers)} drivers:"]
-                for driver in self.pyramid.strategic_drivers:
-                    tier5_lines.append(f"  - {driver.name} (id: {driver.id}): {driver.description[:80]}")
-                sections.append("\n".join(tier5_lines))
-                summary.append(f"Drivers: {len(self.pyramid.strategic_drivers)}")
-
-            # Tier 4: Strategic Intents
-            if self.pyramid.strategic_intents:
-                tier4_lines = [f"### STRATEGIC INTENTS (Tier 4) - {len(self.pyramid.strategic_intents)} intents:"]
-                for intent in self.pyramid.strategic_intents[:5]:
-                    driver_name = self._get_driver_name(str(intent.driver_id))
-                    tier4_lines.append(f"  - (id: {intent.id}) {intent.statement[:100]} (Driver: {driver_name})")
-                if len(self.pyramid.strategic_intents) > 5:
-                    tier4_lines.append(f"  ... and {len(self.pyramid.strategic_intents) - 5} more")
-                sections.append("\n".join(tier4_lines))
-                summary.append(f"Intents: {len(self.pyramid.strategic_intents)}")
+        system_prompt, messages = self._build_chat_request(message, chat_history)
 
-            # Tier 6: Enablers
-            if self.pyramid.enablers:
-                tier6_lines = [f"### ENABLERS (Tier 6) - {len(self.pyramid.enablers)} enablers:"]
-                for enabler in self.pyramid.enablers[:5]:
-                    enabler_type = f" [{enabler.enabler_type}]" if enabler.enabler_type else ""
-                    tier6_lines.append(f"  - {enabler.name} (id: {enabler.id}){enabler_type}: {enabler.description[:60]}")
-                if len(self.pyramid.enablers) > 5:
-                    tier6_lines.append(f"  ... and {len(self.pyramid.enablers) - 5} more")
-                sections.append("\n".join(tier6_lines))
-                summary.append(f"Enablers: {len(self.pyramid.enablers)}")
-
-            # Tier 7: Iconic Commitments
-            if self.pyramid.iconic_commitments:
-                commitments_by_horizon = {}
-                for c in self.pyramid.iconic_commitments:
-                    horizon = c.horizon.value
-                    commitments_by_horizon.setdefault(horizon, []).append(c)
-                horizon_summary = [f"{h}:{len(cs)}" for h, cs in sorted(commitments_by_horizon.items())]
-                tier7_lines = [f"### ICONIC COMMITMENTS (Tier 7) - {len(self.pyramid.iconic_commitments)} commitments ({', '.join(horizon_summary)}):"]
-                for c in self.pyramid.iconic_commitments[:5]:
-                    driver_name = self._get_driver_name(str(c.primary_driver_id))
-                    tier7_lines.append(f"  - {c.name} (id: {c.id}) [{c.horizon.value}] (Driver: {driver_name})")
-                if len(self.pyramid.iconic_commitments) > 5:
-                    tier7_lines.append(f"  ... and {len(self.pyramid.iconic_commitments) - 5} more")
-                sections.append("\n".join(tier7_lines))
-                summary.append(f"Commitments: {','.join(horizon_summary)}")
-
-            # Tier 8: Team Objectives
-            if self.pyramid.team_objectives:
-                summary.append(f"Team Objectives: {len(self.pyramid.team_objectives)}")
+        try:
+            response = self.client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=512,
+                system=system_prompt,
+                messages=messages
+            )
 
-            # Tier 9: Individual Objectives
-            if self.pyramid.individual_objectives:
-                summary.append(f"Individual Objectives: {len(self.pyramid.individual_objectives)}")
+            return response.content[0].text
 
-            pyramid_details = "\n\n".join(sections) if sections else ""
+        except Exception as e:
+            return f"Sorry, I encountered an error: {str(e)}"
 
-            pyramid_context = f"""
-## CURRENT PYRAMID STATE (ALWAYS FRESH - TRUST THIS OVER CHAT HISTORY)
-Summary: {' | '.join(summary)}
+    def chat_stream(
+        self,
+        message: str,
+        chat_history: List[Dict[str, str]] = None
+    ) -> Iterator[str]:
+        """
+        Chat with AI coach, yielding the reply as it is generated.
 
-{pyramid_details}
+        Same prompt as chat(), sent with the streaming Messages API. Unlike
+        chat(), API errors are raised rather than returned as text, so the
+        caller can tell them apart from a partial reply. Closing the
+        generator early closes the underlying HTTP stream.
 
-IMPORTANT: This pyramid state is updated in real-time. If the user just added, edited, or removed elements, the counts and details above reflect those changes. Always refer to this fresh state, not previous mentions in our conversation.
+        Args:
+            message: User's message
+            chat_history: Optional previous chat messages
 
-When evaluating purpose statements, assess each against its specific type (VISION, MISSION, BELIEF, PASSION) - do not evaluate a MISSION using VISION criteria."""
+        Yields:
+            Text fragments of the AI's response
+        """
+        system_prompt, messages = self._build_chat_request(message, chat_history)
+
+        with self.client.messages.stream(
+            model="claude-sonnet-4-20250514",
+            max_tokens=512,
+            system=system_prompt,
+            messages=messages
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+            self.client.stats.record(stream.get_final_message().usage)
+
+    def _build_chat_request(
+        self,
+        message: str,
+        chat_history: Optional[List[Dict[str, str]]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+        """Build the system prompt blocks and message list for a chat turn."""
+        pyramid_context = self.pyramid_context
+        if pyramid_context is None:
+            pyramid_context = PromptContextRenderer(self.pyramid).render() if self.pyramid else ""
 
         # Build Context (SOCC) summary
         context_summary = ""
@@ -610,14 +564,13 @@ When evaluating purpose statements, assess each against its specific type (VISIO
 
             context_summary = "\n".join(context_lines)
 
-        system_prompt = f"""You are a strategic planning coach helping someone build a strategic pyramid.
+        # Static coaching instructions first, so they form a cacheable prefix;
+        # the context and pyramid state follow as a second cached block,
+        # reused while the pyramid is unchanged between messages
+        instructions = f"""You are a strategic planning coach helping someone build a strategic pyramid.
 
 {self.tooltips_guidance}
 
-{context_summary}
-
-{pyramid_context}
-
 Be conversational, encouraging, and specific. Reference best practices naturally without using reference codes.
 Keep responses concise (2-3 sentences) unless user asks for detail.
 
@@ -661,7 +614,11 @@ Example for adding: "Consider adding this strategic intent:
 Customers actively recommend us to peers without prompting, becoming our primary growth engine
 [[/ADD]]"
 
-IMPORTANT: Only use this format when you have a SPECIFIC text suggestion. Don't use it for general advice. The entry_id must match an actual ID from the pyramid state above."""
+IMPORTANT: Only use this format when you have a SPECIFIC text suggestion. Don't use it for general advice. The entry_id must match an actual ID from the pyramid state below."""
+
+        system_prompt = cached_system(
+            instructions, context_summary, pyramid_context, cache_variable=self.cache_pyramid_context
+        )
 
         # Build message history
         messages = []
@@ -671,18 +628,7 @@ IMPORTANT: Only use this format when you have a SPECIFIC text suggestion. Don't
 
         messages.append({"role": "user", "content": message})
 
-        try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=512,
-                system=system_prompt,
-                messages=messages
-            )
-
-            return response.content[0].text
-
-        except Exception as e:
-            return f"Sorry, I encountered an error: {str(e)}"
+        return system_prompt, messages
 
     def _get_tier_guidance(self, tier: str, context: Optional[Dict[str, Any]] = None) -> str:
         """Get specific guidance for a tier type."""
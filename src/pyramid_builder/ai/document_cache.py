@@ -0,0 +1,157 @@
+"""
+Content-hash cache for parsed documents and extraction results.
+
+Users often upload the same strategy deck several times in a row, e.g.
+while trying another organization name or confidence filter. Both layers of
+document import are keyed by the SHA-256 of the uploaded bytes, so a repeat
+upload skips the work already done:
+
+- parsed: DocumentParser output for one file (plus the parse options)
+- extracted: DocumentExtractor output for a set of files (in upload order),
+  the organization name and the extractor's prompt fingerprint
+
+Entries are JSON in a ResponseCache, so they live in a SQLite file shared
+between processes, expire after a TTL and are evicted least recently used
+first once the total size goes over its cap. Only successful results are
+stored.
+
+Configuration (environment variables) for the shared cache:
+    DOCUMENT_CACHE_PATH       SQLite database file (default: in the temp directory)
+    DOCUMENT_CACHE_TTL        Seconds an entry stays valid (default 604800)
+    DOCUMENT_CACHE_MAX_BYTES  Max total size of cached entries (default 256MB)
+    DOCUMENT_CACHE_DISABLED   Set to 1 to turn the shared cache off
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional
+
+from ..settings import env_number
+from .response_cache import ResponseCache
+
+# Bump when the shape of cached parse or extraction results changes
+CACHE_VERSION = "v1"
+
+PARSED = "parsed"
+EXTRACTED = "extracted"
+
+
+def file_hash(file_content: bytes) -> str:
+    """SHA-256 of a file's bytes, the cache's content key."""
+    return hashlib.sha256(file_content).hexdigest()
+
+
+class DocumentCache:
+    """Two-layer (parsed, extracted) document cache keyed by file content hash."""
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        ttl: Optional[float] = 7 * 24 * 3600,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite database file, or ":memory:" for a private cache
+            ttl: Seconds an entry stays valid (None = forever)
+            max_bytes: Maximum total size of cached entries (None = no cap)
+        """
+        self.store = ResponseCache(path, ttl=ttl, max_entries=None, max_bytes=max_bytes)
+        self._lock = threading.Lock()
+        self.hits = {PARSED: 0, EXTRACTED: 0}
+        self.misses = {PARSED: 0, EXTRACTED: 0}
+
+    @staticmethod
+    def parsed_key(content_hash: str, filename: str, **options) -> str:
+        """Key of one file's parse result; the extension picks the parser."""
+        extension = os.path.splitext(filename)[1].lower()
+        settings = json.dumps(options, sort_keys=True)
+        return f"{PARSED}:{CACHE_VERSION}:{content_hash}:{extension}:{settings}"
+
+    @staticmethod
+    def extracted_key(content_hashes: List[str], organization_name: Optional[str], fingerprint: str) -> str:
+        """Key of the extraction from a set of files, in upload order."""
+        inputs = json.dumps([content_hashes, organization_name or "", fingerprint])
+        return f"{EXTRACTED}:{CACHE_VERSION}:{hashlib.sha256(inputs.encode('utf-8')).hexdigest()}"
+
+    def _get(self, layer: str, key: str) -> Optional[Dict[str, Any]]:
+        text = self.store.get(key)
+        with self._lock:
+            if text is None:
+                self.misses[layer] += 1
+                return None
+            self.hits[layer] += 1
+        return json.loads(text)
+
+    def _put(self, layer: str, key: str, value: Dict[str, Any]) -> None:
+        if value.get("success"):
+            self.store.put(key, layer, json.dumps(value))
+
+    def get_parsed(self, content_hash: str, filename: str, **options) -> Optional[Dict[str, Any]]:
+        """Cached DocumentParser.parse result for a file, or None."""
+        return self._get(PARSED, self.parsed_key(content_hash, filename, **options))
+
+    def put_parsed(self, content_hash: str, filename: str, parsed: Dict[str, Any], **options) -> None:
+        """Store a successful parse result."""
+        self._put(PARSED, self.parsed_key(content_hash, filename, **options), parsed)
+
+    def get_extracted(
+        self, content_hashes: List[str], organization_name: Optional[str], fingerprint: str
+    ) -> Optional[Dict[str, Any]]:
+        """Cached extraction result for a set of files, or None."""
+        return self._get(EXTRACTED, self.extracted_key(content_hashes, organization_name, fingerprint))
+
+    def put_extracted(
+        self,
+        content_hashes: List[str],
+        organization_name: Optional[str],
+        fingerprint: str,
+        extraction: Dict[str, Any],
+    ) -> None:
+        """Store a successful extraction result."""
+        self._put(EXTRACTED, self.extracted_key(content_hashes, organization_name, fingerprint), extraction)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        self.store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Occupancy, per-layer hit/miss counters and evictions."""
+        store = self.store.stats()
+        with self._lock:
+            return {
+                "path": self.store.path,
+                "entries": store["entries"],
+                "bytes": store["bytes"],
+                "max_bytes": self.store.max_bytes,
+                "parsed": {"hits": self.hits[PARSED], "misses": self.misses[PARSED]},
+                "extracted": {"hits": self.hits[EXTRACTED], "misses": self.misses[EXTRACTED]},
+                "expirations": store["expirations"],
+                "evictions": store["evictions"],
+            }
+
+
+_shared_cache: Optional[DocumentCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_document_cache() -> Optional[DocumentCache]:
+    """The process-wide cache configured from the environment, or None if disabled."""
+    global _shared_cache
+    if os.getenv("DOCUMENT_CACHE_DISABLED", "").strip().lower() in ("1", "true", "yes"):
+        return None
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = DocumentCache(
+                path=os.getenv("DOCUMENT_CACHE_PATH")
+                or os.path.join(tempfile.gettempdir(), "pyramid_builder_documents.db"),
+                ttl=env_number("DOCUMENT_CACHE_TTL", 7 * 24 * 3600.0, cast=float),
+                max_bytes=env_number("DOCUMENT_CACHE_MAX_BYTES", 256 * 1024 * 1024),
+            )
+        return _shared_cache
@@ -6,14 +6,57 @@ including Tier 0 (Context) and Tiers 1-9 (Pyramid Structure).
 """
 
 import os
+import re
 import json
-from typing import List, Dict, Any, Optional
-
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, List, Dict, Any, Optional, Union
+
+from .assets import static_assets
+from .document_parser import DocumentParser
+from .gateway import ANTHROPIC_AVAILABLE, BACKGROUND, gateway_client
+from .json_stream import IncrementalJSONParser
+from .prompt_cache import UsageTrackingClient, cached_system
+
+# Lines where _combine_text_blocks starts a page, slide, heading or document
+SECTION_BOUNDARY = re.compile(r"^(?:\[Page [^\]]*\]$|=== Slide .* ===$|## |={60}\nDocument: )", re.MULTILINE)
+
+# Fields identifying the same element across chunks, per element list
+MERGE_KEYS = {
+    "socc_items": ("quadrant", "title"),
+    "stakeholders": ("name",),
+    "tensions": ("name",),
+    "values": ("name",),
+    "behaviours": ("statement",),
+    "strategic_intents": ("statement",),
+    "strategic_drivers": ("name",),
+    "enablers": ("name",),
+    "iconic_commitments": ("name",),
+    "team_objectives": ("name",),
+    "individual_objectives": ("name",),
+}
+CONTEXT_SECTIONS = {"socc_items", "stakeholders", "tensions"}
+CONFIDENCE_RANK = {"LOW": 1, "MEDIUM": 2, "HIGH": 3}
+
+
+def _normalize(value: Any) -> str:
+    """Lowercase words of a text field, for matching duplicates."""
+    return " ".join(re.findall(r"[a-z0-9]+", str(value or "").lower()))
+
+
+def _merge_items(first: Dict[str, Any], second: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine two extractions of the same element."""
+    if CONFIDENCE_RANK.get(second.get("confidence"), 0) > CONFIDENCE_RANK.get(first.get("confidence"), 0):
+        first, second = second, first
+    merged = dict(first)
+    for field, value in second.items():
+        current = merged.get(field)
+        if isinstance(current, list) and isinstance(value, list):
+            merged[field] = current + [v for v in value if v not in current]
+        elif current in (None, "", []):
+            merged[field] = value
+    return merged
 
 
 class DocumentExtractor:
@@ -24,16 +67,37 @@ class DocumentExtractor:
     - Tiers 1-9: Pyramid elements (Vision through Individual Objectives)
     """
 
-    # Increased limit for better extraction (Claude can handle much more)
+    MODEL = "claude-sonnet-4-20250514"
+
+    # AI gateway lane: chunked extractions yield to interactive coaching calls
+    GATEWAY_PRIORITY = BACKGROUND
+
+    # Characters sent in one request; longer documents are extracted in chunks
     MAX_DOCUMENT_LENGTH = 50000
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Chunk requests in flight at once, and the most chunks per document
+    MAX_CONCURRENT_CHUNKS = 4
+    MAX_CHUNKS = 24
+
+    # Most document text extracted at all; parsers can stop reading here
+    MAX_TOTAL_LENGTH = MAX_DOCUMENT_LENGTH * MAX_CHUNKS
+
+    # Output tokens per request, and follow-up requests continuing a
+    # response cut off at that limit
+    MAX_OUTPUT_TOKENS = 16384
+    MAX_CONTINUATIONS = 2
+
+    def __init__(self, api_key: Optional[str] = None, timeout: Optional[float] = None, max_concurrent_chunks: Optional[int] = None):
         """
         Initialize document extractor.
 
         Args:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            timeout: Optional per-request timeout in seconds for API calls
+            max_concurrent_chunks: Chunks of a long document extracted in
+                parallel (defaults to MAX_CONCURRENT_CHUNKS)
         """
+        self.max_concurrent_chunks = max_concurrent_chunks or self.MAX_CONCURRENT_CHUNKS
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
 
         if not ANTHROPIC_AVAILABLE:
@@ -48,10 +112,28 @@ class DocumentExtractor:
                 "Set ANTHROPIC_API_KEY environment variable or pass api_key parameter."
             )
 
-        self.client = Anthropic(api_key=self.api_key)
+        # The process-wide pooled client, rate limited and retried by the AI gateway
+        self.client = UsageTrackingClient(gateway_client(self.api_key, timeout, self.GATEWAY_PRIORITY))
 
-        # Load thought leadership guidance
+        # Load thought leadership guidance; the instructions are built once per process
         self.tooltips_guidance = self._load_tooltips_summary()
+        self.extraction_instructions = static_assets.get(
+            "extraction_instructions", self._get_extraction_instructions
+        )
+
+    @property
+    def cache_fingerprint(self) -> str:
+        """
+        Hash of everything besides the documents that shapes an extraction.
+
+        Cached extraction results are keyed by it, so changing the model,
+        the instructions, the chunking or the output limits invalidates them.
+        """
+        settings = json.dumps([
+            self.MODEL, self.MAX_DOCUMENT_LENGTH, self.MAX_CHUNKS,
+            self.MAX_OUTPUT_TOKENS, self.MAX_CONTINUATIONS, self.extraction_instructions,
+        ])
+        return hashlib.sha256(settings.encode("utf-8")).hexdigest()
 
     def _load_tooltips_summary(self) -> str:
         """Load key tooltip guidance for extraction context."""
@@ -85,60 +167,14 @@ class DocumentExtractor:
         - Vision → Drivers → Intents → Commitments → Team → Individual
         """
 
-    def extract_pyramid_elements(
-        self,
-        parsed_content: Dict[str, Any],
-        organization_name: Optional[str] = None
-    ) -> Dict[str, Any]:
+    def _get_extraction_instructions(self) -> str:
         """
-        Extract strategic pyramid elements from parsed document.
-
-        Args:
-            parsed_content: Output from DocumentParser.parse()
-            organization_name: Optional organization name for context
+        Instructions and JSON schema for extraction, identical for every document.
 
-        Returns:
-            Dict with extracted elements by tier and metadata
+        Sent as a cached system prompt prefix, so extracting several
+        documents in a row only pays for these once every few minutes.
         """
-        if not parsed_content.get("success"):
-            return {
-                "success": False,
-                "error": parsed_content.get("error", "Failed to parse document"),
-                "elements": {}
-            }
-
-        # Combine all text blocks into a single document text
-        document_text = self._combine_text_blocks(parsed_content)
-
-        if not document_text or len(document_text) < 100:
-            return {
-                "success": False,
-                "error": "Document content too short for extraction (minimum 100 characters)",
-                "elements": {}
-            }
-
-        # Prepare organization context
-        org_context = ""
-        if organization_name:
-            org_context = f"Organization: {organization_name}\n"
-
-        # Use larger document limit for comprehensive extraction
-        doc_text_limited = document_text[:self.MAX_DOCUMENT_LENGTH]
-        truncation_note = ""
-        if len(document_text) > self.MAX_DOCUMENT_LENGTH:
-            truncation_note = f"\n[NOTE: Document truncated from {len(document_text)} to {self.MAX_DOCUMENT_LENGTH} characters]\n"
-
-        # Create comprehensive extraction prompt
-        prompt = f"""You are a strategic planning expert analyzing a document to extract ALL strategic elements comprehensively.
-
-{org_context}
-Document Format: {parsed_content.get('format', 'unknown')}
-Document Length: {len(document_text)} characters
-{truncation_note}
-
-=== DOCUMENT CONTENT ===
-{doc_text_limited}
-=== END DOCUMENT ===
+        return f"""You are a strategic planning expert analyzing a document to extract ALL strategic elements comprehensively. The document is given in the user's message.
 
 {self.tooltips_guidance}
 
@@ -377,50 +413,273 @@ Look for: Personal goals, individual KPIs, role-specific targets
 
 **IMPORTANT:** Return ONLY the JSON object. No markdown formatting, no code blocks, just pure JSON."""
 
-        try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=16384,  # Increased from 4096 to handle complex documents
-                messages=[{"role": "user", "content": prompt}]
-            )
+    def extract_pyramid_elements(
+        self,
+        parsed_content: Dict[str, Any],
+        organization_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract strategic pyramid elements from parsed document.
 
-            content = response.content[0].text.strip()
+        Documents longer than MAX_DOCUMENT_LENGTH are split into chunks on
+        page, slide, heading or document boundaries; the chunks are
+        extracted concurrently and their elements merged and deduplicated.
 
-            # Check if response was truncated due to max_tokens
-            if response.stop_reason == "max_tokens":
-                return {
-                    "success": False,
-                    "error": "AI response was truncated due to length limits. The document may be too complex. Try with a shorter document or contact support.",
-                    "raw_response": content[:500] + "..." if len(content) > 500 else content,
-                    "elements": {}
-                }
+        Args:
+            parsed_content: Output from DocumentParser.parse()
+            organization_name: Optional organization name for context
+
+        Returns:
+            Dict with extracted elements by tier and metadata
+        """
+        plan = self.plan_extraction(parsed_content, organization_name)
+        if not plan["success"]:
+            return plan
 
-            # Clean up any markdown formatting if present
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
+        parts = range(len(plan["parts"]))
+        if len(parts) == 1:
+            return self.merge_parts(plan, [self.extract_part(plan, 0)])
 
-            # Parse JSON
-            extracted = json.loads(content)
+        workers = min(self.max_concurrent_chunks, len(parts))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai-extract") as executor:
+            results = list(executor.map(lambda index: self.extract_part(plan, index), parts))
+        return self.merge_parts(plan, results)
 
+    def plan_extraction(
+        self,
+        parsed_content: Dict[str, Any],
+        organization_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Prepare the requests extracting a parsed document, without sending them.
+
+        extract_pyramid_elements is plan_extraction, extract_part for every
+        part, then merge_parts; callers that schedule the API calls
+        themselves (the API runs each part on its AI pool) use the steps.
+
+        Args:
+            parsed_content: Output from DocumentParser.parse()
+            organization_name: Optional organization name for context
+
+        Returns:
+            Dict with success and the parts to extract, or a failed result
+            (as extract_pyramid_elements) if there is nothing to extract
+        """
+        if not parsed_content.get("success"):
             return {
-                "success": True,
-                "elements": extracted,
-                "metadata": {
-                    "document_format": parsed_content.get("format"),
-                    "document_length": len(document_text),
-                    "organization_name": organization_name
-                }
+                "success": False,
+                "error": parsed_content.get("error", "Failed to parse document"),
+                "elements": {}
             }
 
-        except json.JSONDecodeError as e:
+        # Combine all text blocks into a single document text
+        document_text = self._combine_text_blocks(parsed_content)
+
+        if not document_text or len(document_text) < 100:
             return {
                 "success": False,
-                "error": f"Failed to parse AI response as JSON: {str(e)}",
-                "raw_response": content if 'content' in locals() else None,
+                "error": "Document content too short for extraction (minimum 100 characters)",
+                "elements": {}
+            }
+
+        metadata = {
+            "document_format": parsed_content.get("format"),
+            "document_length": len(document_text),
+            "organization_name": organization_name
+        }
+
+        # Pages where a parser stopped reading at its text budget
+        budget_pages = [block.get("page") for block in parsed_content.get("blocks", []) if block.get("truncated")]
+        notes = [f"Text after page {page} was not read (text budget reached)" for page in budget_pages]
+        if budget_pages:
+            metadata["truncated"] = True
+
+        plan = {
+            "success": True,
+            "format": parsed_content.get("format"),
+            "organization_name": organization_name,
+            "metadata": metadata,
+            "notes": notes,
+            "chunked": len(document_text) > self.MAX_DOCUMENT_LENGTH,
+            "omitted": 0,
+        }
+        if not plan["chunked"]:
+            plan["parts"] = [(document_text, None)]
+            return plan
+
+        chunks = self._split_into_chunks(document_text)
+        if len(chunks) > self.MAX_CHUNKS:
+            plan["omitted"] = sum(len(chunk) for chunk in chunks[self.MAX_CHUNKS:])
+            chunks = chunks[:self.MAX_CHUNKS]
+
+        plan["parts"] = [
+            (chunk, (
+                f"[NOTE: This is part {index + 1} of {len(chunks)} of a {len(document_text)} character document. "
+                f"Extract the elements found in this part; other parts are extracted separately.]"
+            ))
+            for index, chunk in enumerate(chunks)
+        ]
+        return plan
+
+    def extract_part(self, plan: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """Extract one part of a plan from plan_extraction (one request plus continuations)."""
+        text, note = plan["parts"][index]
+        return self._extract_from_text(text, plan["format"], plan["organization_name"], note=note)
+
+    def merge_parts(self, plan: Dict[str, Any], results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine the extract_part results of a plan into one extraction result.
+
+        Failed chunks of a long document are listed in the metadata and
+        noted in the summary; the elements of the others are kept.
+        """
+        notes = list(plan["notes"])
+        metadata = dict(plan["metadata"])
+
+        if not plan["chunked"]:
+            result = results[0]
+            if result["success"]:
+                self._add_summary_notes(result["elements"], notes)
+                result["metadata"] = metadata
+            return result
+
+        chunks = len(plan["parts"])
+        extracted = [result["elements"] for result in results if result["success"]]
+        failed = [
+            {"chunk": index + 1, "error": result.get("error")}
+            for index, result in enumerate(results) if not result["success"]
+        ]
+        if not extracted:
+            return {
+                "success": False,
+                "error": f"Extraction failed for all {chunks} parts of the document: {failed[0]['error']}",
                 "elements": {}
             }
+
+        elements = self._merge_chunk_elements(extracted)
+        omitted = plan["omitted"]
+        if failed:
+            notes.append(f"{len(failed)} of {chunks} document parts could not be extracted")
+        if omitted:
+            notes.append(f"The last {omitted} characters were not extracted (over {self.MAX_CHUNKS} parts)")
+        self._add_summary_notes(elements, notes)
+
+        metadata.update({"chunks": chunks, "failed_chunks": failed, "omitted_characters": omitted})
+        return {
+            "success": True,
+            "elements": elements,
+            "metadata": metadata
+        }
+
+    @staticmethod
+    def _add_summary_notes(elements: Dict[str, Any], notes: List[str]) -> None:
+        """Append notes about unread content to the extraction summary."""
+        if notes:
+            summary = elements.setdefault("extraction_summary", {})
+            summary["notes"] = "; ".join(filter(None, [summary.get("notes"), *notes]))
+
+    def extract_from_pdf(
+        self,
+        source: Union[bytes, str, Path, BinaryIO],
+        organization_name: Optional[str] = None,
+        max_chars: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract strategic pyramid elements from a PDF, reading only what is used.
+
+        Pages are parsed lazily with DocumentParser.iter_pdf_pages and
+        reading stops at the text budget, so pages beyond it are never
+        extracted.
+
+        Args:
+            source: PDF file content, a path to a PDF, or a binary file object
+            organization_name: Optional organization name for context
+            max_chars: Text budget (defaults to MAX_TOTAL_LENGTH)
+
+        Returns:
+            Dict with extracted elements by tier and metadata, as
+            extract_pyramid_elements
+        """
+        try:
+            blocks = list(DocumentParser.iter_pdf_pages(source, max_chars=max_chars or self.MAX_TOTAL_LENGTH))
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Failed to parse document: {str(e)}",
+                "elements": {}
+            }
+
+        return self.extract_pyramid_elements(
+            {"success": True, "format": "pdf", "blocks": blocks},
+            organization_name=organization_name
+        )
+
+    def _extract_from_text(
+        self,
+        text: str,
+        document_format: Optional[str],
+        organization_name: Optional[str] = None,
+        note: str = ""
+    ) -> Dict[str, Any]:
+        """
+        Run one extraction over document text.
+
+        A response cut off at MAX_OUTPUT_TOKENS is continued by up to
+        MAX_CONTINUATIONS follow-up requests; if it is still incomplete,
+        the elements read completely are returned with a summary note.
+
+        Args:
+            text: Document text, or one chunk of it
+            document_format: Format reported by the parser
+            organization_name: Optional organization name for context
+            note: Optional note placed before the document content
+
+        Returns:
+            Dict with success and the extracted elements, or an error
+        """
+        # Prepare organization context
+        org_context = ""
+        if organization_name:
+            org_context = f"Organization: {organization_name}\n"
+
+        # Document-specific part; the instructions are a cached system prefix
+        prompt = f"""{org_context}
+Document Format: {document_format or 'unknown'}
+Document Length: {len(text)} characters
+{note}
+
+=== DOCUMENT CONTENT ===
+{text}
+=== END DOCUMENT ===
+
+Extract ALL strategic elements from this document as instructed. Return ONLY the JSON object."""
+
+        # The response is parsed as it streams in. One cut off at the output
+        # limit is continued by sending it back as the start of the reply.
+        parser = IncrementalJSONParser()
+        request = {
+            "model": self.MODEL,
+            "max_tokens": self.MAX_OUTPUT_TOKENS,
+            "system": cached_system(self.extraction_instructions),
+        }
+        messages = [{"role": "user", "content": prompt}]
+        continuations = 0
+
+        try:
+            while True:
+                stop_reason = self._stream_response(parser, messages=messages, **request)
+                if stop_reason != "max_tokens" or parser.complete or continuations == self.MAX_CONTINUATIONS:
+                    break
+                continuations += 1
+                messages = [messages[0], {"role": "assistant", "content": parser.prefill()}]
+
+            extracted = parser.value()
+            if not isinstance(extracted, dict):
+                raise json.JSONDecodeError("Expected a JSON object", parser.text, 0)
+
+        except json.JSONDecodeError as e:
+            extracted = None
+            error = f"Failed to parse AI response as JSON: {str(e)}"
         except Exception as e:
             return {
                 "success": False,
@@ -428,6 +687,130 @@ Look for: Personal goals, individual KPIs, role-specific targets
                 "elements": {}
             }
 
+        if not extracted:
+            content = parser.text
+            if not parser.complete and stop_reason == "max_tokens":
+                return {
+                    "success": False,
+                    "error": "AI response was truncated due to length limits. The document may be too complex. Try with a shorter document or contact support.",
+                    "raw_response": content[:500] + "..." if len(content) > 500 else content,
+                    "elements": {}
+                }
+            if extracted is None:
+                return {
+                    "success": False,
+                    "error": error,
+                    "raw_response": content,
+                    "elements": {}
+                }
+
+        if not parser.complete:
+            # Out of continuations: keep the elements read completely
+            self._add_summary_notes(extracted, [
+                f"The AI response was cut off after {continuations + 1} requests; "
+                f"elements after the last complete one were not extracted"
+            ])
+
+        return {
+            "success": True,
+            "elements": extracted
+        }
+
+    def _stream_response(self, parser: IncrementalJSONParser, **request) -> Optional[str]:
+        """Stream one response into the parser; returns its stop reason."""
+        with self.client.messages.stream(**request) as stream:
+            for text in stream.text_stream:
+                parser.feed(text)
+            message = stream.get_final_message()
+        self.client.stats.record(message.usage)
+        return message.stop_reason
+
+    def _split_into_chunks(self, document_text: str) -> List[str]:
+        """
+        Split document text into chunks of at most MAX_DOCUMENT_LENGTH characters.
+
+        Cuts fall on the page, slide, heading and document markers written
+        by _combine_text_blocks; a single section longer than a chunk is cut
+        at paragraph or line breaks instead.
+
+        Args:
+            document_text: Output from _combine_text_blocks
+
+        Returns:
+            Chunks in document order
+        """
+        limit = self.MAX_DOCUMENT_LENGTH
+        starts = [0] + [m.start() for m in SECTION_BOUNDARY.finditer(document_text) if m.start() > 0]
+        sections = [document_text[a:b] for a, b in zip(starts, starts[1:] + [len(document_text)])]
+
+        pieces = []
+        for section in sections:
+            while len(section) > limit:
+                cut = max(section.rfind("\n\n", 0, limit), section.rfind("\n", 0, limit))
+                cut = cut + 1 if cut > limit // 2 else limit
+                pieces.append(section[:cut])
+                section = section[cut:]
+            pieces.append(section)
+
+        chunks = []
+        current = ""
+        for piece in pieces:
+            if current and len(current) + len(piece) > limit:
+                chunks.append(current)
+                current = ""
+            current += piece
+        if current.strip():
+            chunks.append(current)
+        return chunks
+
+    def _merge_chunk_elements(self, chunk_elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Merge elements extracted from the chunks of one document.
+
+        Items naming the same element (same name, statement or title after
+        normalizing case and punctuation) are combined: the higher
+        confidence item wins, gaps are filled from the other and list
+        fields are unioned. The vision with the highest confidence is kept,
+        the earliest on a tie.
+
+        Args:
+            chunk_elements: Extracted elements per chunk, in document order
+
+        Returns:
+            Elements in the same shape as a single extraction
+        """
+        merged: Dict[str, Any] = {"context": {}}
+        for section, key_fields in MERGE_KEYS.items():
+            target = merged["context"] if section in CONTEXT_SECTIONS else merged
+            items: Dict[Any, Dict[str, Any]] = {}
+            for elements in chunk_elements:
+                source = (elements.get("context") or {}) if section in CONTEXT_SECTIONS else elements
+                for item in source.get(section) or []:
+                    if not isinstance(item, dict):
+                        continue
+                    key = tuple(_normalize(item.get(field)) for field in key_fields)
+                    if not any(key):
+                        continue
+                    items[key] = _merge_items(items[key], item) if key in items else dict(item)
+            target[section] = list(items.values())
+
+        visions = [elements["vision"] for elements in chunk_elements if (elements.get("vision") or {}).get("statement")]
+        merged["vision"] = max(
+            visions, key=lambda vision: CONFIDENCE_RANK.get(vision.get("confidence"), 0), default=None
+        )
+
+        summaries = [elements.get("extraction_summary") or {} for elements in chunk_elements]
+        summary = dict(summaries[0])
+        missing = [set(s.get("missing_elements") or []) for s in summaries]
+        summary["missing_elements"] = [m for m in summaries[0].get("missing_elements") or [] if all(m in s for s in missing)]
+        notes = []
+        for s in summaries:
+            if s.get("notes") and s["notes"] not in notes:
+                notes.append(s["notes"])
+        summary["notes"] = " ".join(notes)
+        merged["extraction_summary"] = summary
+        return merged
+
     def _combine_text_blocks(self, parsed_content: Dict[str, Any]) -> str:
         """
         Combine text blocks from parsed document into single text.
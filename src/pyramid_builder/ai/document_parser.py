@@ -5,7 +5,7 @@ Parses PDF, DOCX, and PPTX files to extract text content.
 """
 
 import io
-from typing import Dict, List, Any
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Union
 from pathlib import Path
 
 try:
@@ -36,13 +36,91 @@ class DocumentParser:
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB per file
     MAX_PAGES = 100
 
+    # Rough characters per token, for token budgets
+    CHARS_PER_TOKEN = 4
+
+    @staticmethod
+    def iter_pdf_pages(
+        source: Union[bytes, str, Path, BinaryIO],
+        max_chars: Optional[int] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the text of a PDF page by page, stopping at a budget.
+
+        Pages are read and their text extracted only as the caller asks for
+        them, so a consumer that stops early (or a budget that is reached)
+        leaves the remaining pages unparsed. A path or file object is read
+        from disk as needed rather than loaded whole.
+
+        Args:
+            source: PDF file content, a path to a PDF, or a binary file object
+            max_chars: Stop once this many characters of text have been yielded
+            max_tokens: Same, as an estimated token count (CHARS_PER_TOKEN each)
+
+        Yields:
+            {"page", "content", "type": "page"} for each page with text; the
+            page that reaches the budget is cut to fit and, if anything was
+            left unread, marked "truncated"
+        """
+        if not PDF_AVAILABLE:
+            raise ImportError("pypdf not installed. Install with: pip install pypdf")
+
+        stream = open(source, "rb") if isinstance(source, (str, Path)) else source
+        try:
+            if isinstance(stream, bytes):
+                if len(stream) > DocumentParser.MAX_FILE_SIZE:
+                    raise ValueError(f"File size exceeds {DocumentParser.MAX_FILE_SIZE / 1024 / 1024}MB limit")
+                stream = io.BytesIO(stream)
+
+            reader = PdfReader(stream)
+            num_pages = len(reader.pages)
+            if num_pages > DocumentParser.MAX_PAGES:
+                raise ValueError(f"PDF has {num_pages} pages, exceeds {DocumentParser.MAX_PAGES} page limit")
+
+            yield from DocumentParser._pages_within_budget(
+                reader.pages, DocumentParser._char_budget(max_chars, max_tokens)
+            )
+        finally:
+            if stream is not source:
+                stream.close()
+
+    @staticmethod
+    def _char_budget(max_chars: Optional[int], max_tokens: Optional[int]) -> Optional[int]:
+        """The tighter of a character and a token budget, in characters."""
+        budgets = [b for b in (max_chars, max_tokens and max_tokens * DocumentParser.CHARS_PER_TOKEN) if b]
+        return min(budgets) if budgets else None
+
+    @staticmethod
+    def _pages_within_budget(pages: Sequence[Any], max_chars: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """Extract page text lazily until max_chars characters have been yielded."""
+        remaining = max_chars
+        for page_num, page in enumerate(pages, 1):
+            text = (page.extract_text() or "").strip()
+            if not text:
+                continue
+
+            block = {"page": page_num, "content": text, "type": "page"}
+            if remaining is not None and len(text) >= remaining:
+                # Budget reached: later pages are never extracted
+                if len(text) > remaining or page_num < len(pages):
+                    block["content"] = text[:remaining]
+                    block["truncated"] = True
+                yield block
+                return
+            yield block
+            if remaining is not None:
+                remaining -= len(text)
+
     @staticmethod
-    def parse_pdf(file_content: bytes) -> Dict[str, Any]:
+    def parse_pdf(file_content: bytes, max_chars: Optional[int] = None) -> Dict[str, Any]:
         """
         Parse PDF file and extract text content.
 
         Args:
             file_content: PDF file content as bytes
+            max_chars: Optional text budget; pages after it is reached are
+                not extracted (see iter_pdf_pages)
 
         Returns:
             Dict with extracted content
@@ -61,22 +139,15 @@ class DocumentParser:
             if num_pages > DocumentParser.MAX_PAGES:
                 raise ValueError(f"PDF has {num_pages} pages, exceeds {DocumentParser.MAX_PAGES} page limit")
 
-            # Extract text from all pages
-            text_blocks = []
-            for page_num, page in enumerate(reader.pages, 1):
-                text = page.extract_text()
-                if text.strip():
-                    text_blocks.append({
-                        "page": page_num,
-                        "content": text.strip(),
-                        "type": "page"
-                    })
+            # Extract text page by page, up to the budget
+            text_blocks = list(DocumentParser._pages_within_budget(reader.pages, max_chars))
 
             return {
                 "success": True,
                 "format": "pdf",
                 "num_pages": num_pages,
                 "blocks": text_blocks,
+                "truncated": bool(text_blocks) and text_blocks[-1].get("truncated", False),
                 "metadata": {
                     "title": reader.metadata.get("/Title", "") if reader.metadata else "",
                     "author": reader.metadata.get("/Author", "") if reader.metadata else "",
@@ -216,13 +287,14 @@ class DocumentParser:
             }
 
     @classmethod
-    def parse(cls, file_content: bytes, filename: str) -> Dict[str, Any]:
+    def parse(cls, file_content: bytes, filename: str, max_chars: Optional[int] = None) -> Dict[str, Any]:
         """
         Parse document based on file extension.
 
         Args:
             file_content: File content as bytes
             filename: Original filename (used to determine format)
+            max_chars: Optional text budget for PDFs; later pages are skipped
 
         Returns:
             Dict with extracted content
@@ -230,7 +302,7 @@ class DocumentParser:
         ext = Path(filename).suffix.lower()
 
         if ext == ".pdf":
-            return cls.parse_pdf(file_content)
+            return cls.parse_pdf(file_content, max_chars=max_chars)
         elif ext == ".docx":
             return cls.parse_docx(file_content)
         elif ext == ".pptx":
@@ -0,0 +1,575 @@
+"""
+Shared gateway for Anthropic API calls: one client, rate limit, retries.
+
+AICoach, AIValidator and DocumentExtractor send every request through the
+process-wide `ai_gateway`, via `gateway_client()`:
+
+- one Anthropic client per API key with a keep-alive connection pool,
+  shared by every service instance (per-call timeouts use with_options,
+  which keeps the same pool)
+- at most AI_GATEWAY_CONCURRENCY requests in flight, started in priority
+  order: INTERACTIVE calls (chat, coaching) ahead of BACKGROUND ones (AI
+  validation, document extraction), first come first served within a lane
+- a token bucket admitting AI_RATE_LIMIT_RPM requests per minute, in bursts
+  of up to AI_RATE_LIMIT_BURST
+- 429, 529 and 5xx responses and connection errors are retried up to
+  AI_MAX_RETRIES times with jittered exponential backoff, waiting at least
+  as long as the response's retry-after header; a 429 also pauses the
+  bucket, so other calls back off too instead of hitting the limit again
+
+The SDK's own retries are turned off, so attempts are counted once. The
+SDK itself is imported when the first client is created, not with this
+module. A call waiting longer than AI_QUEUE_TIMEOUT seconds for its turn
+raises AIGatewayTimeout. `stats()` reports per-lane queue depth, retries
+and queue-wait and latency percentiles.
+
+A caller that gives up on a call running on another thread (the API's AI
+pool, on timeout or disconnect) cancels the CancelScope that thread runs
+in: the thread's open response streams are closed and its queued, retried
+or follow-up requests raise AICallCancelled instead of being sent.
+
+Configuration (environment variables):
+    AI_GATEWAY_CONCURRENCY   Requests in flight at once (default 8)
+    AI_RATE_LIMIT_RPM        Requests started per minute (default 50)
+    AI_RATE_LIMIT_BURST      Requests that may start back to back (default 10)
+    AI_MAX_RETRIES           Retries of a failed request (default 4)
+    AI_RETRY_BASE_DELAY      Seconds before the first retry (default 1)
+    AI_RETRY_MAX_DELAY       Cap on the backoff in seconds (default 30)
+    AI_QUEUE_TIMEOUT         Seconds a call may wait for its turn (default 60)
+    AI_HTTP_MAX_CONNECTIONS  Pooled HTTP connections per client (default 20)
+"""
+
+import contextvars
+import heapq
+import importlib.util
+import itertools
+import logging
+import random
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..settings import env_number
+
+# The SDK (and httpx) take about a second to import, so they are only
+# imported when the first client is created
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
+
+# Priority lanes, lowest value first
+INTERACTIVE = 0
+BACKGROUND = 1
+LANES = {INTERACTIVE: "interactive", BACKGROUND: "background"}
+
+# Recent calls kept per lane for the latency percentiles
+LATENCY_SAMPLES = 500
+
+logger = logging.getLogger(__name__)
+
+
+class AIGatewayTimeout(Exception):
+    """A call waited longer than the gateway's queue timeout for its turn."""
+
+
+class AICallCancelled(Exception):
+    """The caller gave up on the call, e.g. its API request timed out."""
+
+
+class CancelScope:
+    """
+    Lets a caller abandon the API requests made by a call on another thread.
+
+    The thread running the call enters the scope (`with scope:`). Requests
+    sent through the gateway inside it give up when the scope is cancelled,
+    and `cancel()` closes any response stream they have open.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._closers: Dict[int, Callable[[], None]] = {}
+        self._keys = itertools.count()
+        self._token = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Cancel the scope, closing everything registered with on_cancel."""
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self._cancelled.set()
+            closers = list(self._closers.values())
+            self._closers.clear()
+        for close in closers:
+            try:
+                close()
+            except Exception:
+                logger.debug("Closing a cancelled AI request failed", exc_info=True)
+
+    def on_cancel(self, close: Callable[[], None]) -> Callable[[], None]:
+        """Call `close` when the scope is cancelled (now, if it already is); returns an unregister function."""
+        with self._lock:
+            if not self._cancelled.is_set():
+                key = next(self._keys)
+                self._closers[key] = close
+                return lambda: self._closers.pop(key, None)
+        close()
+        return lambda: None
+
+    def check(self) -> None:
+        """Raise AICallCancelled if the scope was cancelled."""
+        if self._cancelled.is_set():
+            raise AICallCancelled("AI call abandoned by its caller")
+
+    def wait(self, seconds: float) -> None:
+        """Sleep for `seconds`, waking early (and raising) on cancellation."""
+        self._cancelled.wait(seconds)
+        self.check()
+
+    def __enter__(self) -> "CancelScope":
+        self._token = _current_scope.set(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _current_scope.reset(self._token)
+
+
+_current_scope: contextvars.ContextVar = contextvars.ContextVar("ai_cancel_scope", default=None)
+
+
+def current_cancel_scope() -> Optional[CancelScope]:
+    """The CancelScope the current thread's call runs in, if any."""
+    return _current_scope.get()
+
+
+class TokenBucket:
+    """
+    Token bucket: `rate` tokens per second, holding at most `capacity`.
+
+    Not thread-safe on its own; AIGateway only uses it under its lock.
+    """
+
+    def __init__(self, rate: Optional[float], capacity: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize bucket (full).
+
+        Args:
+            rate: Tokens added per second (None = unlimited)
+            capacity: Maximum tokens held, i.e. the largest burst
+            clock: Monotonic time source
+        """
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def take(self) -> float:
+        """Take a token if one is available; else return seconds to wait."""
+        now = self._clock()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.rate is None:
+            return 0.0
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for `seconds` (e.g. after a 429)."""
+        now = self._clock()
+        self._paused_until = max(self._paused_until, now + seconds)
+        # The server just refused us: one request when the pause ends, no burst
+        self._tokens = 1
+        self._updated = max(self._updated, self._paused_until)
+
+
+class _LaneStats:
+    def __init__(self):
+        self.queued = 0
+        self.calls = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.failures = 0
+        self.queue_wait_ms: deque = deque(maxlen=LATENCY_SAMPLES)
+        self.latency_ms: deque = deque(maxlen=LATENCY_SAMPLES)
+
+
+class AIGateway:
+    """Priority scheduler with rate limiting and retries for blocking API calls."""
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = 8,
+        requests_per_minute: Optional[float] = 50,
+        burst: float = 10,
+        max_retries: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        queue_timeout: Optional[float] = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize gateway.
+
+        Args:
+            max_concurrency: Requests in flight at once (None = unlimited)
+            requests_per_minute: Token bucket refill rate (None = unlimited)
+            burst: Token bucket capacity
+            max_retries: Retries of a retryable failure
+            base_delay: Backoff before the first retry, doubled for each next one
+            max_delay: Cap on the backoff
+            queue_timeout: Seconds a call may wait for its turn (None = forever)
+            clock: Monotonic time source
+            sleep: Sleep function used between retries
+        """
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.queue_timeout = queue_timeout
+        self._clock = clock
+        self._sleep = sleep
+        self.bucket = TokenBucket(
+            requests_per_minute / 60 if requests_per_minute else None, burst, clock
+        )
+        self._cond = threading.Condition()
+        self._waiting: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._lanes = {priority: _LaneStats() for priority in LANES}
+
+    def _acquire(self, ticket: Tuple[int, int]) -> None:
+        """Wait until `ticket` is first in line, a slot is free and the bucket has a token."""
+        lane = self._lanes[ticket[0]]
+        started = self._clock()
+        deadline = None if self.queue_timeout is None else started + self.queue_timeout
+        scope = current_cancel_scope()
+        unregister = scope.on_cancel(self._wake) if scope is not None else None
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            lane.queued += 1
+            try:
+                while True:
+                    if scope is not None:
+                        scope.check()
+                    wait = None
+                    free = self.max_concurrency is None or self._in_flight < self.max_concurrency
+                    if self._waiting[0] == ticket and free:
+                        wait = self.bucket.take()
+                        if wait == 0:
+                            heapq.heappop(self._waiting)
+                            self._in_flight += 1
+                            break
+                    if deadline is not None:
+                        remaining = deadline - self._clock()
+                        if remaining <= 0:
+                            raise AIGatewayTimeout(
+                                f"AI request waited over {self.queue_timeout:g}s for its turn"
+                            )
+                        wait = remaining if wait is None else min(wait, remaining)
+                    self._cond.wait(wait)
+            except BaseException:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                raise
+            finally:
+                lane.queued -= 1
+                # The next caller in line may now be able to start
+                self._cond.notify_all()
+                if unregister is not None:
+                    unregister()
+            lane.queue_wait_ms.append((self._clock() - started) * 1000)
+
+    def _release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def _wake(self) -> None:
+        """Wake waiting callers so a cancelled one leaves the queue."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def _backoff(self, seconds: float) -> None:
+        """Sleep before a retry; a cancelled call stops waiting."""
+        scope = current_cancel_scope()
+        if scope is not None:
+            scope.wait(seconds)
+        else:
+            self._sleep(seconds)
+
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """Jittered exponential backoff, at least the server's retry-after."""
+        backoff = min(self.max_delay, self.base_delay * 2 ** attempt)
+        delay = backoff / 2 + random.uniform(0, backoff / 2)
+        retry_after = _retry_after(error)
+        return max(delay, retry_after) if retry_after is not None else delay
+
+    def _handle_failure(self, ticket: Tuple[int, int], attempt: int, error: Exception) -> float:
+        """Record a failed attempt; return the delay before retrying, or re-raise."""
+        lane = self._lanes[ticket[0]]
+        if attempt >= self.max_retries or not is_retryable(error):
+            with self._cond:
+                lane.failures += 1
+            raise error
+        delay = self._retry_delay(attempt, error)
+        with self._cond:
+            lane.retries += 1
+            if getattr(error, "status_code", None) == 429:
+                lane.rate_limited += 1
+                self.bucket.pause(delay)
+        logger.warning(
+            "AI request failed (%s), retry %d/%d in %.1fs",
+            error.__class__.__name__, attempt + 1, self.max_retries, delay,
+        )
+        return delay
+
+    def call(self, func: Callable[..., Any], *args, priority: int = INTERACTIVE, **kwargs) -> Any:
+        """
+        Run a blocking API call when its turn comes, retrying transient failures.
+
+        Raises:
+            AIGatewayTimeout: The call waited too long for its turn
+            AICallCancelled: The caller gave up on the call
+            Exception: The call's last error once retries are used up
+        """
+        # A retry keeps its place in line ahead of later arrivals
+        ticket = (priority, next(self._sequence))
+        lane = self._lanes[priority]
+        for attempt in itertools.count():
+            self._acquire(ticket)
+            started = self._clock()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._release()
+                self._backoff(self._handle_failure(ticket, attempt, e))
+                continue
+            self._release()
+            with self._cond:
+                lane.calls += 1
+                lane.latency_ms.append((self._clock() - started) * 1000)
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Limits, requests in flight, and per-lane queue depth, outcomes and latency."""
+        with self._cond:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "requests_per_minute": self.requests_per_minute,
+                "max_retries": self.max_retries,
+                "in_flight": self._in_flight,
+                "queued": len(self._waiting),
+                "lanes": {
+                    name: {
+                        "queued": lane.queued,
+                        "calls": lane.calls,
+                        "retries": lane.retries,
+                        "rate_limited": lane.rate_limited,
+                        "failures": lane.failures,
+                        "queue_wait_ms": _percentiles(lane.queue_wait_ms),
+                        "latency_ms": _percentiles(lane.latency_ms),
+                    }
+                    for priority, name in LANES.items()
+                    for lane in [self._lanes[priority]]
+                },
+            }
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a failed API call may succeed if sent again."""
+    if ANTHROPIC_AVAILABLE:
+        import anthropic
+
+        # A timed-out call already used its whole allowance
+        if isinstance(error, anthropic.APITimeoutError):
+            return False
+        if isinstance(error, anthropic.APIConnectionError):
+            return True
+    status = getattr(error, "status_code", None)
+    return status is not None and (status in (408, 409, 429) or status >= 500)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds from an error response's retry-after header, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after") is not None:
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return None
+
+
+def _percentiles(samples) -> Optional[Dict[str, float]]:
+    """p50/p95/p99/max of recent samples, or None before the first one."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+
+    def rank(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))], 1)
+
+    return {
+        "p50": round(statistics.median(ordered), 1),
+        "p95": rank(0.95),
+        "p99": rank(0.99),
+        "max": round(ordered[-1], 1),
+        "samples": len(ordered),
+    }
+
+
+class _GatewayStream:
+    """
+    messages.stream() context manager holding a gateway slot until it exits.
+
+    Cancelling the CancelScope it was opened in closes the response, so an
+    abandoned call stops receiving (and paying for) output.
+    """
+
+    def __init__(self, gateway: AIGateway, open_stream: Callable[[], Any], priority: int):
+        self._gateway = gateway
+        self._open_stream = open_stream
+        self._priority = priority
+        self._manager = None
+        self._unregister = None
+
+    def __enter__(self):
+        # The request is sent on entering, so failures to start are retried
+        def enter():
+            manager = self._open_stream()
+            stream = manager.__enter__()
+            return manager, stream
+
+        gateway = self._gateway
+        ticket = (self._priority, next(gateway._sequence))
+        for attempt in itertools.count():
+            gateway._acquire(ticket)
+            self._started = gateway._clock()
+            try:
+                self._manager, stream = enter()
+            except Exception as e:
+                gateway._release()
+                gateway._backoff(gateway._handle_failure(ticket, attempt, e))
+                continue
+            scope = current_cancel_scope()
+            close = getattr(stream, "close", None)
+            if scope is not None and close is not None:
+                self._unregister = scope.on_cancel(close)
+            return stream
+
+    def __exit__(self, *exc_info):
+        try:
+            return self._manager.__exit__(*exc_info)
+        finally:
+            if self._unregister is not None:
+                self._unregister()
+            gateway = self._gateway
+            gateway._release()
+            with gateway._cond:
+                lane = gateway._lanes[self._priority]
+                lane.calls += 1
+                lane.latency_ms.append((gateway._clock() - self._started) * 1000)
+
+
+class _GatewayMessages:
+    """Drop-in for client.messages sending each request through the gateway."""
+
+    def __init__(self, messages: Any, gateway: AIGateway, priority: int):
+        self._messages = messages
+        self._gateway = gateway
+        self._priority = priority
+
+    def create(self, **request):
+        return self._gateway.call(self._messages.create, priority=self._priority, **request)
+
+    def stream(self, **request) -> _GatewayStream:
+        return _GatewayStream(self._gateway, lambda: self._messages.stream(**request), self._priority)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._messages, name)
+
+
+class GatewayClient:
+    """Anthropic client wrapper scheduling messages.create/stream on a gateway lane."""
+
+    def __init__(self, client: Any, gateway: Optional[AIGateway] = None, priority: int = INTERACTIVE):
+        self._client = client
+        self.gateway = gateway if gateway is not None else ai_gateway
+        self.priority = priority
+        self.messages = _GatewayMessages(client.messages, self.gateway, priority)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+# One pooled client per API key, shared by every service in the process
+_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def shared_client(api_key: str) -> "anthropic.Anthropic":
+    """The process-wide Anthropic client for an API key, created on first use."""
+    import anthropic
+    import httpx
+
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            connections = env_number("AI_HTTP_MAX_CONNECTIONS", 20)
+            client = anthropic.Anthropic(
+                api_key=api_key,
+                # Retries are the gateway's job
+                max_retries=0,
+                http_client=anthropic.DefaultHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=connections,
+                        max_keepalive_connections=connections,
+                    )
+                ),
+            )
+            _clients[api_key] = client
+        return client
+
+
+def gateway_client(api_key: str, timeout: Optional[float] = None, priority: int = INTERACTIVE) -> GatewayClient:
+    """
+    A client for one service instance: the shared client, sent through `ai_gateway`.
+
+    Args:
+        api_key: Anthropic API key
+        timeout: Optional per-request timeout in seconds
+        priority: Gateway lane (INTERACTIVE or BACKGROUND)
+    """
+    client = shared_client(api_key)
+    if timeout:
+        client = client.with_options(timeout=timeout)
+    return GatewayClient(client, ai_gateway, priority)
+
+
+# Shared by every AI service in the process
+ai_gateway = AIGateway(
+    max_concurrency=env_number("AI_GATEWAY_CONCURRENCY", 8),
+    requests_per_minute=env_number("AI_RATE_LIMIT_RPM", 50, cast=float),
+    burst=env_number("AI_RATE_LIMIT_BURST", 10, cast=float) or 1,
+    max_retries=env_number("AI_MAX_RETRIES", 4) or 0,
+    base_delay=env_number("AI_RETRY_BASE_DELAY", 1.0, cast=float) or 0,
+    max_delay=env_number("AI_RETRY_MAX_DELAY", 30.0, cast=float) or 0,
+    queue_timeout=env_number("AI_QUEUE_TIMEOUT", 60.0, cast=float),
+)
@@ -0,0 +1,168 @@
+"""
+Tolerant, incremental parsing of JSON in model responses.
+
+Models are asked for "ONLY the JSON object" but sometimes wrap it in a
+markdown fence or a sentence, and a response cut off at max_tokens ends
+mid-value. IncrementalJSONParser takes the response text as it streams in,
+skips anything before the first `{` or `[` and after the value ends, and
+remembers the last point where everything read so far forms complete
+elements. A truncated response therefore still yields those elements:
+
+    {"values": [{"name": "Trust"}, {"name": "Curio
+    -> {"values": [{"name": "Trust"}]}
+
+Objects inside arrays (the extracted elements, the verdicts of a batch)
+are kept whole or dropped, never cut short; other objects keep their
+complete members.
+
+The parser's text can be sent back as an assistant prefill so the model
+continues where it stopped; feeding the continuation to the same parser
+completes the value (see DocumentExtractor._extract_from_text).
+"""
+
+import json
+from typing import Any, List, Optional, Tuple
+
+_OPENERS = {"{": "}", "[": "]"}
+
+
+class IncrementalJSONParser:
+    """Finds one JSON object or array in streamed text and salvages truncated ones."""
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._text: Optional[str] = ""
+        self._length = 0
+        self._start: Optional[int] = None
+        self._end: Optional[int] = None
+        # Open containers: (closing character, kept whole)
+        self._stack: List[Tuple[str, bool]] = []
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        # Last truncation point: (end index, closing characters to append)
+        self._safe: Optional[Tuple[int, str]] = None
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next piece of the response text."""
+        offset = self._length
+        self._chunks.append(chunk)
+        self._text = None
+        self._length += len(chunk)
+        if self._end is not None:
+            return
+
+        stack = self._stack
+        for i, char in enumerate(chunk):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    # A value string (not a key) completes a member or element
+                    if not self._expect_key:
+                        self._mark_safe(offset + i + 1)
+                continue
+
+            if self._start is None:
+                if char not in _OPENERS:
+                    continue
+                self._start = offset + i
+
+            if char == '"':
+                self._in_string = True
+            elif char in _OPENERS:
+                whole = bool(stack) and (stack[-1][1] or (stack[-1][0] == "]" and char == "{"))
+                stack.append((_OPENERS[char], whole))
+                self._expect_key = char == "{"
+                if char == "[" or len(stack) == 1:
+                    self._mark_safe(offset + i + 1)
+            elif char in "}]":
+                if not stack or stack[-1][0] != char:
+                    # Malformed; value() reports it
+                    self._end = offset + i + 1
+                    return
+                stack.pop()
+                self._expect_key = False
+                if not stack:
+                    self._end = offset + i + 1
+                    return
+                self._mark_safe(offset + i + 1)
+            elif char == ",":
+                self._expect_key = stack[-1][0] == "}"
+                self._mark_safe(offset + i)
+            elif char == ":":
+                self._expect_key = False
+
+    def _mark_safe(self, end: int) -> None:
+        if not self._stack[-1][1]:
+            self._safe = (end, "".join(closer for closer, _ in reversed(self._stack)))
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        if self._text is None:
+            self._text = "".join(self._chunks)
+            self._chunks = [self._text]
+        return self._text
+
+    def prefill(self) -> str:
+        """
+        The text so far as an assistant prefill for a continuation request.
+
+        Trailing whitespace is dropped, here too: the API rejects it at the
+        end of a prefill and the continuation starts by repeating it.
+        Whitespace never changes the parser's state, so it can resume.
+        """
+        text = self.text.rstrip()
+        self._chunks = [text]
+        self._text = text
+        self._length = len(text)
+        return text
+
+    @property
+    def started(self) -> bool:
+        """Whether the start of a JSON object or array has been seen."""
+        return self._start is not None
+
+    @property
+    def complete(self) -> bool:
+        """Whether the JSON value has been read to its end."""
+        return self._end is not None
+
+    def value(self) -> Any:
+        """
+        The parsed value, or the complete elements of a truncated one.
+
+        Raises:
+            json.JSONDecodeError: No JSON found, nothing complete yet, or
+                a complete value that isn't valid JSON
+        """
+        text = self.text
+        if self._end is not None:
+            return json.loads(text[self._start:self._end])
+        if self._safe is None:
+            raise json.JSONDecodeError(
+                "No complete JSON element in response" if self.started else "No JSON object in response",
+                text,
+                len(text),
+            )
+        end, closers = self._safe
+        return json.loads(text[self._start:end] + closers)
+
+
+def parse_json_response(text: str) -> Any:
+    """
+    Parse the JSON object or array in a model response.
+
+    Tolerates markdown fences and surrounding prose, and returns the
+    complete elements of a truncated response.
+
+    Raises:
+        json.JSONDecodeError: No usable JSON in the response
+    """
+    parser = IncrementalJSONParser()
+    parser.feed(text)
+    return parser.value()
@@ -0,0 +1,133 @@
+"""
+Anthropic prompt caching helpers and usage accounting.
+
+Prompts are split into a static prefix (role, methodology guidance, output
+schema) and a variable suffix (the user's text, the pyramid, the document).
+The prefix is sent as a system block marked with cache_control, so repeated
+calls within the cache lifetime (5 minutes, refreshed on each hit) read it
+from Anthropic's prompt cache instead of processing it again. Prefixes
+shorter than the model's minimum (1024 tokens for Sonnet) are sent as
+usual and simply not cached.
+
+UsageTrackingClient wraps an Anthropic client and records the token usage
+of every messages.create response, including cache writes and reads, in a
+PromptCacheStats; the shared `prompt_cache_stats` is reported by the API's
+/health/ai endpoint.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+# Marks the end of a cacheable prompt prefix
+EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+
+def cached_system(static: str, *variable: Optional[str], cache_variable: bool = False) -> List[Dict[str, Any]]:
+    """
+    Build a system prompt with its static prefix marked for caching.
+
+    Args:
+        static: Text identical across calls (cached)
+        variable: Text that changes between calls, appended after the prefix
+        cache_variable: Also mark the end of the variable text, for content
+            that repeats over a few calls (e.g. the pyramid during a chat)
+
+    Returns:
+        System prompt content blocks
+    """
+    blocks = [{"type": "text", "text": static, "cache_control": EPHEMERAL_CACHE}]
+    text = "\n\n".join(part for part in variable if part and part.strip())
+    if text:
+        block = {"type": "text", "text": text}
+        if cache_variable:
+            block["cache_control"] = EPHEMERAL_CACHE
+        blocks.append(block)
+    return blocks
+
+
+class PromptCacheStats:
+    """Thread-safe totals of API token usage, split by prompt cache outcome."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.cache_hits = 0
+        self.cache_writes = 0
+        self.input_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self.output_tokens = 0
+
+    def record(self, usage: Any) -> None:
+        """Add one response's usage (anything with Anthropic Usage attributes)."""
+        if usage is None:
+            return
+        read = getattr(usage, "cache_read_input_tokens", None) or 0
+        written = getattr(usage, "cache_creation_input_tokens", None) or 0
+        with self._lock:
+            self.calls += 1
+            self.cache_hits += 1 if read else 0
+            self.cache_writes += 1 if written else 0
+            self.input_tokens += getattr(usage, "input_tokens", None) or 0
+            self.cache_read_tokens += read
+            self.cache_write_tokens += written
+            self.output_tokens += getattr(usage, "output_tokens", None) or 0
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        with self._lock:
+            self.__init__()
+
+    def stats(self) -> Dict[str, Any]:
+        """Call and token counters, and the share of input tokens read from cache."""
+        with self._lock:
+            prompt_tokens = self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+            return {
+                "calls": self.calls,
+                "cache_hits": self.cache_hits,
+                "cache_writes": self.cache_writes,
+                "input_tokens": self.input_tokens,
+                "cache_read_tokens": self.cache_read_tokens,
+                "cache_write_tokens": self.cache_write_tokens,
+                "output_tokens": self.output_tokens,
+                "cached_input_ratio": (
+                    round(self.cache_read_tokens / prompt_tokens, 3) if prompt_tokens else None
+                ),
+            }
+
+
+# Shared by every AI service in the process
+prompt_cache_stats = PromptCacheStats()
+
+
+class _TrackedMessages:
+    """Drop-in for client.messages recording the usage of each response."""
+
+    def __init__(self, messages: Any, stats: PromptCacheStats):
+        self._messages = messages
+        self._stats = stats
+
+    def create(self, **request):
+        response = self._messages.create(**request)
+        self._stats.record(getattr(response, "usage", None))
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._messages, name)
+
+
+class UsageTrackingClient:
+    """
+    Anthropic client wrapper recording token usage of messages.create calls.
+
+    Streaming calls pass through untouched; record their final message's
+    usage with `stats.record(...)` once the stream completes.
+    """
+
+    def __init__(self, client: Any, stats: Optional[PromptCacheStats] = None):
+        self._client = client
+        self.stats = stats if stats is not None else prompt_cache_stats
+        self.messages = _TrackedMessages(client.messages, self.stats)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
@@ -0,0 +1,328 @@
+"""
+Prompt context rendering for the AI coach.
+
+AICoach.chat describes the current pyramid to the model on every message.
+PromptContextRenderer builds that description from one fragment per tier.
+When bound to a PyramidManager's ChangeTracker, each fragment is cached
+with the versions of the tiers it reads, and is only re-rendered after one
+of those tiers changes; the assembled text is cached per tracker version.
+
+With a question, render() can also prune the detail sections down to the
+tiers the question is about (by tier keywords or item names mentioned),
+keeping the one-line summary of every tier. Questions that match no tier
+get the full context.
+"""
+
+import re
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from ..models.pyramid import StrategyPyramid
+
+if TYPE_CHECKING:
+    from ..core.change_tracker import ChangeTracker
+
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+class Fragment(NamedTuple):
+    """Rendered text for one tier."""
+
+    section: Optional[str]  # Detail section, or None if the tier is empty
+    summary: Optional[str]  # Entry for the summary line
+    names: FrozenSet[str]  # Normalized item names, for relevance matching
+
+
+class TierSection(NamedTuple):
+    """How to render one tier and when it is relevant."""
+
+    name: str
+    tiers: Tuple[str, ...]  # ChangeTracker tiers the fragment reads
+    render: Callable[[StrategyPyramid], Fragment]
+    keywords: Tuple[str, ...]  # Word prefixes that make the tier relevant
+    related: Tuple[str, ...] = ()  # Sections included alongside this one
+
+
+def _driver_names(pyramid: StrategyPyramid) -> Dict[str, str]:
+    return {str(driver.id): driver.name for driver in pyramid.strategic_drivers}
+
+
+def _normalize(text: str) -> str:
+    """Lowercase words separated by single spaces, padded for whole-word search."""
+    return " " + " ".join(_WORD.findall(text.lower())) + " "
+
+
+def _names(items, attr: str = "name") -> FrozenSet[str]:
+    return frozenset(_normalize(getattr(item, attr)) for item in items if getattr(item, attr, None))
+
+
+def _render_vision(pyramid: StrategyPyramid) -> Fragment:
+    if not (pyramid.vision and pyramid.vision.statements):
+        return Fragment(None, None, frozenset())
+    lines = ["### PURPOSE STATEMENTS (Tier 1):"]
+    for stmt in pyramid.vision.get_statements_ordered():
+        stmt_type = stmt.statement_type.value.upper()
+        lines.append(f"  [{stmt_type}] (id: {stmt.id}): {stmt.statement}")
+    lines.append("")
+    lines.append("Note: Each statement type has different criteria:")
+    lines.append("  - VISION: Future-focused, paints a picture of what could be")
+    lines.append("  - MISSION: Purpose-focused, explains why the organization exists")
+    lines.append("  - BELIEF: Conviction-focused, articulates core beliefs that guide decisions")
+    lines.append("  - PASSION: Energy-focused, expresses what drives and motivates")
+    return Fragment(
+        "\n".join(lines),
+        f"Purpose Statements: {len(pyramid.vision.statements)}",
+        frozenset(),
+    )
+
+
+def _render_values(pyramid: StrategyPyramid) -> Fragment:
+    if not pyramid.values:
+        return Fragment(None, None, frozenset())
+    lines = [f"### VALUES (Tier 2) - {len(pyramid.values)} core values:"]
+    for value in pyramid.values:
+        desc = f": {value.description[:80]}" if value.description else ""
+        lines.append(f"  - {value.name} (id: {value.id}){desc}")
+    return Fragment("\n".join(lines), f"Values: {len(pyramid.values)}", _names(pyramid.values))
+
+
+def _render_behaviours(pyramid: StrategyPyramid) -> Fragment:
+    if not pyramid.behaviours:
+        return Fragment(None, None, frozenset())
+    lines = [f"### BEHAVIOURS (Tier 3) - {len(pyramid.behaviours)} observable behaviours:"]
+    for behaviour in pyramid.behaviours[:5]:
+        lines.append(f"  - (id: {behaviour.id}) {behaviour.statement}")
+    if len(pyramid.behaviours) > 5:
+        lines.append(f"  ... and {len(pyramid.behaviours) - 5} more")
+    return Fragment("\n".join(lines), f"Behaviours: {len(pyramid.behaviours)}", frozenset())
+
+
+def _render_drivers(pyramid: StrategyPyramid) -> Fragment:
+    if not pyramid.strategic_drivers:
+        return Fragment(None, None, frozenset())
+    lines = [f"### STRATEGIC DRIVERS (Tier 5) - {len(pyramid.strategic_drivers)} drivers:"]
+    for driver in pyramid.strategic_drivers:
+        lines.append(f"  - {driver.name} (id: {driver.id}): {driver.description[:80]}")
+    return Fragment(
+        "\n".join(lines),
+        f"Drivers: {len(pyramid.strategic_drivers)}",
+        _names(pyramid.strategic_drivers),
+    )
+
+
+def _render_intents(pyramid: StrategyPyramid) -> Fragment:
+    if not pyramid.strategic_intents:
+        return Fragment(None, None, frozenset())
+    driver_names = _driver_names(pyramid)
+    lines = [f"### STRATEGIC INTENTS (Tier 4) - {len(pyramid.strategic_intents)} intents:"]
+    for intent in pyramid.strategic_intents[:5]:
+        driver_name = driver_names.get(str(intent.driver_id), "Unknown")
+        lines.append(f"  - (id: {intent.id}) {intent.statement[:100]} (Driver: {driver_name})")
+    if len(pyramid.strategic_intents) > 5:
+        lines.append(f"  ... and {len(pyramid.strategic_intents) - 5} more")
+    return Fragment("\n".join(lines), f"Intents: {len(pyramid.strategic_intents)}", frozenset())
+
+
+def _render_enablers(pyramid: StrategyPyramid) -> Fragment:
+    if not pyramid.enablers:
+        return Fragment(None, None, frozenset())
+    lines = [f"### ENABLERS (Tier 6) - {len(pyramid.enablers)} enablers:"]
+    for enabler in pyramid.enablers[:5]:
+        enabler_type = f" [{enabler.enabler_type}]" if enabler.enabler_type else ""
+        lines.append(f"  - {enabler.name} (id: {enabler.id}){enabler_type}: {enabler.description[:60]}")
+    if len(pyramid.enablers) > 5:
+        lines.append(f"  ... and {len(pyramid.enablers) - 5} more")
+    return Fragment("\n".join(lines), f"Enablers: {len(pyramid.enablers)}", _names(pyramid.enablers))
+
+
+def _render_commitments(pyramid: StrategyPyramid) -> Fragment:
+    if not pyramid.iconic_commitments:
+        return Fragment(None, None, frozenset())
+    driver_names = _driver_names(pyramid)
+    commitments_by_horizon: Dict[str, List[Any]] = {}
+    for c in pyramid.iconic_commitments:
+        commitments_by_horizon.setdefault(c.horizon.value, []).append(c)
+    horizon_summary = [f"{h}:{len(cs)}" for h, cs in sorted(commitments_by_horizon.items())]
+    lines = [f"### ICONIC COMMITMENTS (Tier 7) - {len(pyramid.iconic_commitments)} commitments ({', '.join(horizon_summary)}):"]
+    for c in pyramid.iconic_commitments[:5]:
+        driver_name = driver_names.get(str(c.primary_driver_id), "Unknown")
+        lines.append(f"  - {c.name} (id: {c.id}) [{c.horizon.value}] (Driver: {driver_name})")
+    if len(pyramid.iconic_commitments) > 5:
+        lines.append(f"  ... and {len(pyramid.iconic_commitments) - 5} more")
+    return Fragment(
+        "\n".join(lines),
+        f"Commitments: {','.join(horizon_summary)}",
+        _names(pyramid.iconic_commitments),
+    )
+
+
+def _render_team_objectives(pyramid: StrategyPyramid) -> Fragment:
+    if not pyramid.team_objectives:
+        return Fragment(None, None, frozenset())
+    return Fragment(None, f"Team Objectives: {len(pyramid.team_objectives)}", frozenset())
+
+
+def _render_individual_objectives(pyramid: StrategyPyramid) -> Fragment:
+    if not pyramid.individual_objectives:
+        return Fragment(None, None, frozenset())
+    return Fragment(None, f"Individual Objectives: {len(pyramid.individual_objectives)}", frozenset())
+
+
+# In prompt order
+TIER_SECTIONS: Tuple[TierSection, ...] = (
+    TierSection(
+        "vision", ("vision",), _render_vision,
+        ("vision", "mission", "belief", "passion", "purpose", "why"),
+    ),
+    TierSection("values", ("values",), _render_values, ("value", "culture"), ("behaviours",)),
+    TierSection("behaviours", ("behaviours",), _render_behaviours, ("behaviour", "behavior"), ("values",)),
+    TierSection(
+        "drivers", ("strategic_drivers",), _render_drivers,
+        ("driver", "priorit", "focus", "pillar"),
+    ),
+    TierSection(
+        "intents", ("strategic_intents", "strategic_drivers"), _render_intents,
+        ("intent", "outcome", "ambition", "aspiration", "bold"), ("drivers",),
+    ),
+    TierSection(
+        "enablers", ("enablers",), _render_enablers,
+        ("enabler", "capabilit", "system", "resource", "infrastructure"),
+    ),
+    TierSection(
+        "commitments", ("iconic_commitments", "strategic_drivers"), _render_commitments,
+        ("commitment", "initiative", "horizon", "h1", "h2", "h3", "roadmap", "project"),
+        ("drivers", "intents"),
+    ),
+    TierSection(
+        "team_objectives", ("team_objectives",), _render_team_objectives,
+        ("team", "objective", "okr"),
+    ),
+    TierSection(
+        "individual_objectives", ("individual_objectives",), _render_individual_objectives,
+        ("individual", "objective", "okr"),
+    ),
+)
+
+
+class PromptContextRenderer:
+    """
+    Renders the pyramid-state block of the AI coach's system prompt.
+
+    Without a change tracker every render() starts from scratch; with one,
+    fragments are reused until a tier they read changes.
+    """
+
+    def __init__(self, pyramid: StrategyPyramid, change_tracker: Optional["ChangeTracker"] = None):
+        """
+        Initialize renderer.
+
+        Args:
+            pyramid: Pyramid to describe
+            change_tracker: Optional tracker from the owning PyramidManager,
+                enabling fragment caching
+        """
+        self.pyramid = pyramid
+        self.change_tracker = change_tracker
+        self._fragments: Dict[str, Tuple[Tuple[int, ...], Fragment]] = {}
+        # (tracker version, sections included) -> assembled text
+        self._rendered: Dict[Tuple[int, Optional[Tuple[str, ...]]], str] = {}
+        self._rendered_version: Optional[int] = None
+        self.fragment_renders = 0
+
+    def render(self, question: Optional[str] = None) -> str:
+        """
+        Render the pyramid state for the system prompt.
+
+        Args:
+            question: Optional user message; detail sections are then limited
+                to the tiers it relates to
+
+        Returns:
+            Prompt text, or "" if there is no pyramid
+        """
+        if not self.pyramid:
+            return ""
+
+        fragments = self._get_fragments()
+        included = self._relevant_sections(question, fragments) if question else None
+
+        if self.change_tracker is None:
+            return self._assemble(fragments, included)
+
+        version = self.change_tracker.version
+        if version != self._rendered_version:
+            self._rendered.clear()
+            self._rendered_version = version
+        key = (version, included)
+        if key not in self._rendered:
+            self._rendered[key] = self._assemble(fragments, included)
+        return self._rendered[key]
+
+    def _get_fragments(self) -> Dict[str, Fragment]:
+        """Fragments for every tier, re-rendering only changed ones."""
+        fragments = {}
+        for section in TIER_SECTIONS:
+            if self.change_tracker is None:
+                fragments[section.name] = self._render_fragment(section)
+                continue
+            stamp = tuple(self.change_tracker.get_tier_version(tier) for tier in section.tiers)
+            cached = self._fragments.get(section.name)
+            if cached is None or cached[0] != stamp:
+                cached = (stamp, self._render_fragment(section))
+                self._fragments[section.name] = cached
+            fragments[section.name] = cached[1]
+        return fragments
+
+    def _render_fragment(self, section: TierSection) -> Fragment:
+        self.fragment_renders += 1
+        return section.render(self.pyramid)
+
+    def _relevant_sections(self, question: str, fragments: Dict[str, Fragment]) -> Optional[Tuple[str, ...]]:
+        """
+        Sections a question relates to, plus their related sections.
+
+        Returns None (everything) when the question matches no tier.
+        """
+        text = _normalize(question)
+        words = text.split()
+        matched = set()
+        for section in TIER_SECTIONS:
+            if any(word.startswith(keyword) for word in words for keyword in section.keywords):
+                matched.add(section.name)
+            elif any(name in text for name in fragments[section.name].names):
+                matched.add(section.name)
+
+        if not matched:
+            return None
+        for section in TIER_SECTIONS:
+            if section.name in matched:
+                matched.update(section.related)
+        return tuple(section.name for section in TIER_SECTIONS if section.name in matched)
+
+    def _assemble(self, fragments: Dict[str, Fragment], included: Optional[Tuple[str, ...]]) -> str:
+        summary = [f.summary for f in fragments.values() if f.summary]
+        sections = [
+            fragments[s.name].section for s in TIER_SECTIONS
+            if fragments[s.name].section and (included is None or s.name in included)
+        ]
+        omitted = [
+            s.name.replace("_", " ") for s in TIER_SECTIONS
+            if fragments[s.name].section and included is not None and s.name not in included
+        ]
+
+        pyramid_details = "\n\n".join(sections) if sections else ""
+        if omitted:
+            pyramid_details += (
+                f"\n\n(Details of other tiers omitted as not relevant to this message: {', '.join(omitted)}. "
+                "Counts for every tier are in the summary above.)"
+            )
+
+        return f"""
+## CURRENT PYRAMID STATE (ALWAYS FRESH - TRUST THIS OVER CHAT HISTORY)
+Summary: {' | '.join(summary)}
+
+{pyramid_details}
+
+IMPORTANT: This pyramid state is updated in real-time. If the user just added, edited, or removed elements, the counts and details above reflect those changes. Always refer to this fresh state, not previous mentions in our conversation.
+
+When evaluating purpose statements, assess each against its specific type (VISION, MISSION, BELIEF, PASSION) - do not evaluate a MISSION using VISION criteria."""
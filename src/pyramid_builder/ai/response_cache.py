@@ -0,0 +1,269 @@
+"""
+Content-addressed cache for Anthropic Messages API responses.
+
+AI validation and jargon checks send the same prompt again whenever the
+user reopens a page without changing the pyramid. ResponseCache stores the
+response text under a SHA-256 of the full request (model, messages,
+max_tokens, system, ...), so an unchanged prompt is answered locally and a
+changed one is, by construction, a different key.
+
+Entries live in SQLite (a file shared between processes, or in memory), are
+dropped after a TTL, and the least recently used ones are evicted once the
+entry count or total size goes over its cap.
+
+CachingClient wraps an Anthropic client so `client.messages.create(...)`
+goes through a cache; everything else is passed to the wrapped client.
+
+Configuration (environment variables) for the shared cache:
+    AI_CACHE_PATH         SQLite database file (unset = in-memory)
+    AI_CACHE_TTL          Seconds a response stays valid (default 604800)
+    AI_CACHE_MAX_ENTRIES  Max cached responses (default 5000)
+    AI_CACHE_MAX_BYTES    Max total size of cached responses (default: no cap)
+    AI_CACHE_DISABLED     Set to 1 to turn the shared cache off
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ..settings import env_number
+
+
+class ResponseCache:
+    """SQLite-backed LRU cache of response texts keyed by request hash."""
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        ttl: Optional[float] = 7 * 24 * 3600,
+        max_entries: Optional[int] = 5000,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite database file, or ":memory:" for a private cache
+            ttl: Seconds a response stays valid (None = forever)
+            max_entries: Maximum number of cached responses (None = no cap)
+            max_bytes: Maximum total size of cached responses (None = no cap)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.bypasses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+        # AIValidator calls the cache from several threads at once
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)"
+        )
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Hash the arguments of a messages.create call."""
+        canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text for key, or None."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.expirations += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """Store a response text and evict down to the caps."""
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO responses (key, model, response, size, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    response = excluded.response,
+                    size = excluded.size,
+                    created_at = excluded.created_at,
+                    last_access = excluded.last_access
+                """,
+                (key, model, response, size, now, now),
+            )
+            self.writes += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries while over a cap."""
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        while count > 1 and (
+            (self.max_entries is not None and count > self.max_entries)
+            or (self.max_bytes is not None and total > self.max_bytes)
+        ):
+            key, size = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.evictions += 1
+            count -= 1
+            total -= size
+
+    def record_bypass(self) -> None:
+        """Count a lookup skipped at the caller's request."""
+        with self._lock:
+            self.bypasses += 1
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        """Occupancy and hit/miss counters."""
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "entries": entries,
+                "bytes": total,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "writes": self.writes,
+                "bypasses": self.bypasses,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+            }
+
+
+class _CachedText:
+    """A text content block rebuilt from the cache."""
+
+    type = "text"
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class CachedResponse:
+    """The parts of a Message callers read, served from the cache."""
+
+    stop_reason = "end_turn"
+    cached = True
+
+    def __init__(self, text: str):
+        self.content = [_CachedText(text)]
+
+
+class _CachedMessages:
+    """Drop-in for client.messages with a cached create()."""
+
+    def __init__(self, messages: Any, cache: ResponseCache, bypass: bool):
+        self._messages = messages
+        self._cache = cache
+        self._bypass = bypass
+
+    def create(self, **request):
+        key = ResponseCache.make_key(request)
+        if self._bypass:
+            self._cache.record_bypass()
+        else:
+            text = self._cache.get(key)
+            if text is not None:
+                return CachedResponse(text)
+
+        response = self._messages.create(**request)
+        # Only complete single-text replies: a truncated one would be
+        # replayed as the same parse failure every time
+        content = getattr(response, "content", None) or []
+        if (
+            len(content) == 1
+            and getattr(content[0], "type", None) == "text"
+            and getattr(response, "stop_reason", None) != "max_tokens"
+        ):
+            self._cache.put(key, str(request.get("model", "")), content[0].text)
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._messages, name)
+
+
+class CachingClient:
+    """
+    Anthropic client wrapper answering repeated messages.create calls from a cache.
+
+    With bypass=True the cache is not read but fresh responses are still
+    stored, so a forced refresh also updates what later calls will see.
+    """
+
+    def __init__(self, client: Any, cache: ResponseCache, bypass: bool = False):
+        self._client = client
+        self.cache = cache
+        self.messages = _CachedMessages(client.messages, cache, bypass)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """The process-wide cache configured from the environment, or None if disabled."""
+    global _shared_cache
+    if os.getenv("AI_CACHE_DISABLED", "").strip().lower() in ("1", "true", "yes"):
+        return None
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache(
+                path=os.getenv("AI_CACHE_PATH") or ":memory:",
+                ttl=env_number("AI_CACHE_TTL", 7 * 24 * 3600.0, cast=float),
+                max_entries=env_number("AI_CACHE_MAX_ENTRIES", 5000),
+                max_bytes=env_number("AI_CACHE_MAX_BYTES", None),
+            )
+        return _shared_cache
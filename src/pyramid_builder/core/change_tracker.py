@@ -0,0 +1,104 @@
+"""
+Change tracking for pyramid mutations.
+
+PyramidManager records every item it adds, updates or removes here, so that
+consumers such as the validator can refresh only what changed instead of
+recomputing everything after each edit.
+"""
+
+from bisect import bisect_right
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional
+from uuid import UUID
+
+
+class Change(NamedTuple):
+    """A single recorded mutation."""
+
+    version: int
+    tier: str                      # Tier field name, or "vision" for vision statements
+    item_id: Optional[UUID]        # None means the whole tier changed
+    related_ids: FrozenSet[UUID]   # IDs the item referenced before the change
+
+
+class ChangeTracker:
+    """
+    Versioned log of pyramid mutations.
+
+    Each recorded change bumps a global version and the version of its tier.
+    Consumers remember the version they last synced at and replay
+    changes_since() to find what is dirty. When the pyramid is replaced
+    wholesale, or the bounded log no longer reaches back far enough,
+    changes_since() returns None and the consumer must do a full refresh.
+    """
+
+    def __init__(self, max_log: int = 10000):
+        """
+        Initialize tracker.
+
+        Args:
+            max_log: Maximum number of changes retained for replay
+        """
+        self.max_log = max_log
+        self.version = 0
+        self.tier_versions: Dict[str, int] = {}
+        self._log: List[Change] = []
+        self._versions: List[int] = []
+        # Changes at or before this version can no longer be replayed
+        self._baseline = 0
+
+    def record(
+        self,
+        tier: str,
+        item_id: Optional[UUID] = None,
+        related_ids: Iterable[UUID] = (),
+    ) -> int:
+        """
+        Record a mutation.
+
+        Args:
+            tier: Tier field name (e.g. "strategic_intents") or "vision"
+            item_id: ID of the changed item (None = whole tier)
+            related_ids: IDs the item referenced before the change
+
+        Returns:
+            The new version number
+        """
+        self.version += 1
+        self.tier_versions[tier] = self.version
+        self._log.append(Change(self.version, tier, item_id, frozenset(related_ids)))
+        self._versions.append(self.version)
+
+        if len(self._log) > self.max_log:
+            drop = len(self._log) - self.max_log // 2
+            self._baseline = self._versions[drop - 1]
+            del self._log[:drop]
+            del self._versions[:drop]
+
+        return self.version
+
+    def reset(self):
+        """Mark the whole pyramid as changed (e.g. after create or load)."""
+        self.version += 1
+        self._baseline = self.version
+        self._log.clear()
+        self._versions.clear()
+        for tier in list(self.tier_versions):
+            self.tier_versions[tier] = self.version
+
+    def get_tier_version(self, tier: str) -> int:
+        """Get the version at which a tier last changed."""
+        return max(self.tier_versions.get(tier, 0), self._baseline)
+
+    def changes_since(self, version: int) -> Optional[List[Change]]:
+        """
+        Get the changes recorded after a version.
+
+        Args:
+            version: Version the caller last synced at
+
+        Returns:
+            List of changes in order, or None if a full refresh is required
+        """
+        if version < self._baseline:
+            return None
+        return self._log[bisect_right(self._versions, version):]
@@ -9,6 +9,8 @@ from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
 
+from .change_tracker import ChangeTracker
+from ..models.index import referenced_ids
 from ..models.pyramid import (
     StrategyPyramid,
     ProjectMetadata,
@@ -26,6 +28,8 @@ from ..models.pyramid import (
     Alignment,
     Horizon,
 )
+from ..models.snapshot import SNAPSHOT_SUFFIX, is_snapshot, load_snapshot, save_snapshot
+from ..validation.validator import PyramidValidator
 
 
 class PyramidManager:
@@ -44,6 +48,9 @@ class PyramidManager:
             pyramid: Existing StrategyPyramid or None to create new
         """
         self.pyramid = pyramid
+        self.changes = ChangeTracker()
+        self._validator: Optional[PyramidValidator] = None
+        self._prompt_context = None
 
     def create_new_pyramid(
         self,
@@ -72,20 +79,99 @@ class PyramidManager:
         )
 
         self.pyramid = StrategyPyramid(metadata=metadata)
+        self.changes.reset()
         return self.pyramid
 
-    def save_pyramid(self, filepath: str):
-        """Save pyramid to JSON file."""
+    def save_pyramid(self, filepath: str, format: Optional[str] = None, compression: Optional[str] = None):
+        """
+        Save pyramid to file.
+
+        Args:
+            filepath: File to write
+            format: "json" (pretty-printed) or "snapshot" (compact binary,
+                see models/snapshot.py); by default a snapshot for files
+                ending in SNAPSHOT_SUFFIX (.pyrsnap), JSON otherwise
+            compression: Snapshot compression: None, "zlib" or "zstd"
+        """
         if not self.pyramid:
             raise ValueError("No pyramid to save")
+        if format is None:
+            format = "snapshot" if str(filepath).endswith(SNAPSHOT_SUFFIX) else "json"
+        if format not in ("json", "snapshot"):
+            raise ValueError(f"Unknown pyramid file format: {format}. Use 'json' or 'snapshot'")
+        if compression is not None and format != "snapshot":
+            raise ValueError("Compression is only supported for snapshots")
+
         self.pyramid.metadata.last_modified = datetime.now()
-        self.pyramid.save_to_file(filepath)
+        if format == "snapshot":
+            save_snapshot(self.pyramid, filepath, compression=compression)
+        else:
+            self.pyramid.save_to_file(filepath)
+
+    def load_pyramid(self, filepath: str, trusted: bool = True) -> StrategyPyramid:
+        """
+        Load pyramid from a JSON or snapshot file (detected from its content).
 
-    def load_pyramid(self, filepath: str) -> StrategyPyramid:
-        """Load pyramid from JSON file."""
-        self.pyramid = StrategyPyramid.load_from_file(filepath)
+        Args:
+            filepath: File to read
+            trusted: For snapshots saved with the current models, skip
+                re-running the model validators (see models/snapshot.py)
+        """
+        if is_snapshot(filepath):
+            self.pyramid = load_snapshot(filepath, trusted=trusted)
+        else:
+            self.pyramid = StrategyPyramid.load_from_file(filepath)
+        self.changes.reset()
         return self.pyramid
 
+    def get_validator(self) -> PyramidValidator:
+        """
+        Get the incremental validator for the current pyramid.
+
+        The validator is bound to this manager's change tracker, so repeated
+        validate_all() calls only re-check items changed since the last run.
+
+        Returns:
+            PyramidValidator instance
+        """
+        if not self.pyramid:
+            raise ValueError("No pyramid initialized")
+
+        if self._validator is None or self._validator.pyramid is not self.pyramid:
+            self._validator = PyramidValidator(self.pyramid, change_tracker=self.changes)
+        return self._validator
+
+    def get_prompt_context(self):
+        """
+        Get the AI coach prompt context renderer for the current pyramid.
+
+        The renderer is bound to this manager's change tracker, so it only
+        re-renders the tiers changed since the last render.
+
+        Returns:
+            PromptContextRenderer instance
+        """
+        # Imported here so the core does not load the AI package
+        from ..ai.prompt_context import PromptContextRenderer
+
+        if not self.pyramid:
+            raise ValueError("No pyramid initialized")
+
+        if self._prompt_context is None or self._prompt_context.pyramid is not self.pyramid:
+            self._prompt_context = PromptContextRenderer(self.pyramid, change_tracker=self.changes)
+        return self._prompt_context
+
+    def _record_change(self, tier: str, item_id: UUID):
+        """
+        Record a mutation of an item with the change tracker.
+
+        Called before updates and removals so the references the item held
+        beforehand are captured, and after additions.
+        """
+        item = self.pyramid.get_item_by_id(tier, item_id)
+        if item is not None:
+            self.changes.record(tier, item_id, referenced_ids(tier, item))
+
     # ========================================================================
     # SECTION 1: PURPOSE (The Why)
     # ========================================================================
@@ -105,6 +191,7 @@ class PyramidManager:
 
         if not self.pyramid.vision:
             self.pyramid.vision = Vision(created_by=created_by)
+            self.changes.record("vision")
 
         return self.pyramid.vision
 
@@ -136,6 +223,7 @@ class PyramidManager:
         if created_by:
             new_statement.created_by = created_by
 
+        self.changes.record("vision", new_statement.id)
         return new_statement
 
     def update_vision_statement(
@@ -158,6 +246,7 @@ class PyramidManager:
         if not self.pyramid or not self.pyramid.vision:
             return False
 
+        self.changes.record("vision", statement_id)
         return self.pyramid.vision.update_statement(
             statement_id, statement_type, statement
         )
@@ -175,6 +264,7 @@ class PyramidManager:
         if not self.pyramid or not self.pyramid.vision:
             return False
 
+        self.changes.record("vision", statement_id)
         return self.pyramid.vision.remove_statement(statement_id)
 
     def reorder_vision_statement(self, statement_id: UUID, new_order: int) -> bool:
@@ -191,6 +281,7 @@ class PyramidManager:
         if not self.pyramid or not self.pyramid.vision:
             return False
 
+        self.changes.record("vision", statement_id)
         return self.pyramid.vision.reorder_statement(statement_id, new_order)
 
     def set_vision(self, statement: str, created_by: Optional[str] = None) -> Vision:
@@ -211,6 +302,7 @@ class PyramidManager:
         # Clear existing and create new
         self.pyramid.vision = Vision(created_by=created_by)
         self.pyramid.vision.add_statement(StatementType.VISION, statement)
+        self.changes.record("vision")
 
         return self.pyramid.vision
 
@@ -239,7 +331,8 @@ class PyramidManager:
             description=description,
             created_by=created_by,
         )
-        self.pyramid.values.append(value)
+        self.pyramid.add_item("values", value)
+        self._record_change("values", value.id)
         return value
 
     def update_value(
@@ -262,25 +355,26 @@ class PyramidManager:
         if not self.pyramid:
             return False
 
-        for value in self.pyramid.values:
-            if value.id == value_id:
-                if name is not None:
-                    value.name = name
-                if description is not None:
-                    value.description = description
-                value.update_timestamp()
-                return True
+        value = self.pyramid.get_value_by_id(value_id)
+        if not value:
+            return False
+
+        self._record_change("values", value_id)
 
-        return False
+        if name is not None:
+            value.name = name
+        if description is not None:
+            value.description = description
+        value.update_timestamp()
+        return True
 
     def remove_value(self, value_id: UUID) -> bool:
         """Remove a value by ID."""
         if not self.pyramid:
             return False
 
-        initial_count = len(self.pyramid.values)
-        self.pyramid.values = [v for v in self.pyramid.values if v.id != value_id]
-        return len(self.pyramid.values) < initial_count
+        self._record_change("values", value_id)
+        return self.pyramid.remove_item("values", value_id)
 
     # ========================================================================
     # SECTION 2: STRATEGY (The How)
@@ -311,7 +405,8 @@ class PyramidManager:
             value_ids=value_ids or [],
             created_by=created_by,
         )
-        self.pyramid.behaviours.append(behaviour)
+        self.pyramid.add_item("behaviours", behaviour)
+        self._record_change("behaviours", behaviour.id)
         return behaviour
 
     def update_behaviour(
@@ -334,25 +429,27 @@ class PyramidManager:
         if not self.pyramid:
             return False
 
-        for behaviour in self.pyramid.behaviours:
-            if behaviour.id == behaviour_id:
-                if statement is not None:
-                    behaviour.statement = statement
-                if value_ids is not None:
-                    behaviour.value_ids = value_ids
-                behaviour.update_timestamp()
-                return True
+        behaviour = self.pyramid.get_behaviour_by_id(behaviour_id)
+        if not behaviour:
+            return False
+
+        self._record_change("behaviours", behaviour_id)
 
-        return False
+        if statement is not None:
+            behaviour.statement = statement
+        if value_ids is not None:
+            behaviour.value_ids = value_ids
+        self.pyramid.reindex_item("behaviours", behaviour)
+        behaviour.update_timestamp()
+        return True
 
     def remove_behaviour(self, behaviour_id: UUID) -> bool:
         """Remove a behaviour by ID."""
         if not self.pyramid:
             return False
 
-        initial_count = len(self.pyramid.behaviours)
-        self.pyramid.behaviours = [b for b in self.pyramid.behaviours if b.id != behaviour_id]
-        return len(self.pyramid.behaviours) < initial_count
+        self._record_change("behaviours", behaviour_id)
+        return self.pyramid.remove_item("behaviours", behaviour_id)
 
     def add_strategic_driver(
         self,
@@ -385,7 +482,8 @@ class PyramidManager:
             addresses_opportunities=addresses_opportunities or [],
             created_by=created_by,
         )
-        self.pyramid.strategic_drivers.append(driver)
+        self.pyramid.add_item("strategic_drivers", driver)
+        self._record_change("strategic_drivers", driver.id)
         return driver
 
     def update_strategic_driver(
@@ -412,29 +510,30 @@ class PyramidManager:
         if not self.pyramid:
             return False
 
-        for driver in self.pyramid.strategic_drivers:
-            if driver.id == driver_id:
-                if name is not None:
-                    driver.name = name
-                if description is not None:
-                    driver.description = description
-                if rationale is not None:
-                    driver.rationale = rationale
-                if addresses_opportunities is not None:
-                    driver.addresses_opportunities = addresses_opportunities
-                driver.update_timestamp()
-                return True
-
-        return False
+        driver = self.pyramid.get_driver_by_id(driver_id)
+        if not driver:
+            return False
+
+        self._record_change("strategic_drivers", driver_id)
+
+        if name is not None:
+            driver.name = name
+        if description is not None:
+            driver.description = description
+        if rationale is not None:
+            driver.rationale = rationale
+        if addresses_opportunities is not None:
+            driver.addresses_opportunities = addresses_opportunities
+        driver.update_timestamp()
+        return True
 
     def remove_strategic_driver(self, driver_id: UUID) -> bool:
         """Remove a strategic driver by ID."""
         if not self.pyramid:
             return False
 
-        initial_count = len(self.pyramid.strategic_drivers)
-        self.pyramid.strategic_drivers = [d for d in self.pyramid.strategic_drivers if d.id != driver_id]
-        return len(self.pyramid.strategic_drivers) < initial_count
+        self._record_change("strategic_drivers", driver_id)
+        return self.pyramid.remove_item("strategic_drivers", driver_id)
 
     def add_strategic_intent(
         self,
@@ -469,7 +568,8 @@ class PyramidManager:
             is_stakeholder_voice=is_stakeholder_voice,
             created_by=created_by,
         )
-        self.pyramid.strategic_intents.append(intent)
+        self.pyramid.add_item("strategic_intents", intent)
+        self._record_change("strategic_intents", intent.id)
         return intent
 
     def update_strategic_intent(
@@ -494,31 +594,33 @@ class PyramidManager:
         if not self.pyramid:
             return False
 
-        for intent in self.pyramid.strategic_intents:
-            if intent.id == intent_id:
-                if statement is not None:
-                    intent.statement = statement
-                if driver_id is not None:
-                    # Validate driver exists
-                    driver = self.pyramid.get_driver_by_id(driver_id)
-                    if not driver:
-                        raise ValueError(f"Strategic driver {driver_id} not found")
-                    intent.driver_id = driver_id
-                if is_stakeholder_voice is not None:
-                    intent.is_stakeholder_voice = is_stakeholder_voice
-                intent.update_timestamp()
-                return True
-
-        return False
+        intent = self.pyramid.get_intent_by_id(intent_id)
+        if not intent:
+            return False
+
+        self._record_change("strategic_intents", intent_id)
+
+        if statement is not None:
+            intent.statement = statement
+        if driver_id is not None:
+            # Validate driver exists
+            driver = self.pyramid.get_driver_by_id(driver_id)
+            if not driver:
+                raise ValueError(f"Strategic driver {driver_id} not found")
+            intent.driver_id = driver_id
+        if is_stakeholder_voice is not None:
+            intent.is_stakeholder_voice = is_stakeholder_voice
+        self.pyramid.reindex_item("strategic_intents", intent)
+        intent.update_timestamp()
+        return True
 
     def remove_strategic_intent(self, intent_id: UUID) -> bool:
         """Remove a strategic intent by ID."""
         if not self.pyramid:
             return False
 
-        initial_count = len(self.pyramid.strategic_intents)
-        self.pyramid.strategic_intents = [i for i in self.pyramid.strategic_intents if i.id != intent_id]
-        return len(self.pyramid.strategic_intents) < initial_count
+        self._record_change("strategic_intents", intent_id)
+        return self.pyramid.remove_item("strategic_intents", intent_id)
 
     def add_enabler(
         self,
@@ -551,7 +653,8 @@ class PyramidManager:
             enabler_type=enabler_type,
             created_by=created_by,
         )
-        self.pyramid.enablers.append(enabler)
+        self.pyramid.add_item("enablers", enabler)
+        self._record_change("enablers", enabler.id)
         return enabler
 
     # ========================================================================
@@ -603,7 +706,8 @@ class PyramidManager:
             owner=owner,
             created_by=created_by,
         )
-        self.pyramid.iconic_commitments.append(commitment)
+        self.pyramid.add_item("iconic_commitments", commitment)
+        self._record_change("iconic_commitments", commitment.id)
         return commitment
 
     def add_secondary_alignment_to_commitment(
@@ -632,6 +736,8 @@ class PyramidManager:
         if not commitment:
             raise ValueError(f"Commitment {commitment_id} not found")
 
+        self._record_change("iconic_commitments", commitment_id)
+
         # Validate driver exists and isn't primary
         driver = self.pyramid.get_driver_by_id(secondary_driver_id)
         if not driver:
@@ -648,6 +754,7 @@ class PyramidManager:
             rationale=rationale,
         )
         commitment.secondary_alignments.append(alignment)
+        self.pyramid.reindex_item("iconic_commitments", commitment)
         commitment.update_timestamp()
 
         return commitment
@@ -689,7 +796,8 @@ class PyramidManager:
             owner=owner,
             created_by=created_by,
         )
-        self.pyramid.team_objectives.append(objective)
+        self.pyramid.add_item("team_objectives", objective)
+        self._record_change("team_objectives", objective.id)
         return objective
 
     def add_individual_objective(
@@ -726,7 +834,8 @@ class PyramidManager:
             success_criteria=success_criteria or [],
             created_by=created_by,
         )
-        self.pyramid.individual_objectives.append(objective)
+        self.pyramid.add_item("individual_objectives", objective)
+        self._record_change("individual_objectives", objective.id)
         return objective
 
     # ========================================================================
@@ -757,29 +866,31 @@ class PyramidManager:
         if not self.pyramid:
             return False
 
-        for enabler in self.pyramid.enablers:
-            if enabler.id == enabler_id:
-                if name is not None:
-                    enabler.name = name
-                if description is not None:
-                    enabler.description = description
-                if driver_ids is not None:
-                    enabler.driver_ids = driver_ids
-                if enabler_type is not None:
-                    enabler.enabler_type = enabler_type
-                enabler.update_timestamp()
-                return True
-
-        return False
+        enabler = self.pyramid.get_enabler_by_id(enabler_id)
+        if not enabler:
+            return False
+
+        self._record_change("enablers", enabler_id)
+
+        if name is not None:
+            enabler.name = name
+        if description is not None:
+            enabler.description = description
+        if driver_ids is not None:
+            enabler.driver_ids = driver_ids
+        if enabler_type is not None:
+            enabler.enabler_type = enabler_type
+        self.pyramid.reindex_item("enablers", enabler)
+        enabler.update_timestamp()
+        return True
 
     def remove_enabler(self, enabler_id: UUID) -> bool:
         """Remove an enabler by ID."""
         if not self.pyramid:
             return False
 
-        initial_count = len(self.pyramid.enablers)
-        self.pyramid.enablers = [e for e in self.pyramid.enablers if e.id != enabler_id]
-        return len(self.pyramid.enablers) < initial_count
+        self._record_change("enablers", enabler_id)
+        return self.pyramid.remove_item("enablers", enabler_id)
 
     def update_iconic_commitment(
         self,
@@ -811,39 +922,41 @@ class PyramidManager:
         if not self.pyramid:
             return False
 
-        for commitment in self.pyramid.iconic_commitments:
-            if commitment.id == commitment_id:
-                if name is not None:
-                    commitment.name = name
-                if description is not None:
-                    commitment.description = description
-                if horizon is not None:
-                    commitment.horizon = horizon
-                if target_date is not None:
-                    commitment.target_date = target_date
-                if primary_driver_id is not None:
-                    # Validate driver exists
-                    driver = self.pyramid.get_driver_by_id(primary_driver_id)
-                    if not driver:
-                        raise ValueError(f"Strategic driver {primary_driver_id} not found")
-                    commitment.primary_driver_id = primary_driver_id
-                if primary_intent_ids is not None:
-                    commitment.primary_intent_ids = primary_intent_ids
-                if owner is not None:
-                    commitment.owner = owner
-                commitment.update_timestamp()
-                return True
-
-        return False
+        commitment = self.pyramid.get_commitment_by_id(commitment_id)
+        if not commitment:
+            return False
+
+        self._record_change("iconic_commitments", commitment_id)
+
+        if name is not None:
+            commitment.name = name
+        if description is not None:
+            commitment.description = description
+        if horizon is not None:
+            commitment.horizon = horizon
+        if target_date is not None:
+            commitment.target_date = target_date
+        if primary_driver_id is not None:
+            # Validate driver exists
+            driver = self.pyramid.get_driver_by_id(primary_driver_id)
+            if not driver:
+                raise ValueError(f"Strategic driver {primary_driver_id} not found")
+            commitment.primary_driver_id = primary_driver_id
+        if primary_intent_ids is not None:
+            commitment.primary_intent_ids = primary_intent_ids
+        if owner is not None:
+            commitment.owner = owner
+        self.pyramid.reindex_item("iconic_commitments", commitment)
+        commitment.update_timestamp()
+        return True
 
     def remove_iconic_commitment(self, commitment_id: UUID) -> bool:
         """Remove an iconic commitment by ID."""
         if not self.pyramid:
             return False
 
-        initial_count = len(self.pyramid.iconic_commitments)
-        self.pyramid.iconic_commitments = [c for c in self.pyramid.iconic_commitments if c.id != commitment_id]
-        return len(self.pyramid.iconic_commitments) < initial_count
+        self._record_change("iconic_commitments", commitment_id)
+        return self.pyramid.remove_item("iconic_commitments", commitment_id)
 
     def update_team_objective(
         self,
@@ -875,35 +988,37 @@ class PyramidManager:
         if not self.pyramid:
             return False
 
-        for objective in self.pyramid.team_objectives:
-            if objective.id == objective_id:
-                if name is not None:
-                    objective.name = name
-                if description is not None:
-                    objective.description = description
-                if team_name is not None:
-                    objective.team_name = team_name
-                if primary_commitment_id is not None:
-                    objective.primary_commitment_id = primary_commitment_id
-                if primary_intent_id is not None:
-                    objective.primary_intent_id = primary_intent_id
-                if metrics is not None:
-                    objective.metrics = metrics
-                if owner is not None:
-                    objective.owner = owner
-                objective.update_timestamp()
-                return True
-
-        return False
+        objective = self.pyramid.get_team_objective_by_id(objective_id)
+        if not objective:
+            return False
+
+        self._record_change("team_objectives", objective_id)
+
+        if name is not None:
+            objective.name = name
+        if description is not None:
+            objective.description = description
+        if team_name is not None:
+            objective.team_name = team_name
+        if primary_commitment_id is not None:
+            objective.primary_commitment_id = primary_commitment_id
+        if primary_intent_id is not None:
+            objective.primary_intent_id = primary_intent_id
+        if metrics is not None:
+            objective.metrics = metrics
+        if owner is not None:
+            objective.owner = owner
+        self.pyramid.reindex_item("team_objectives", objective)
+        objective.update_timestamp()
+        return True
 
     def remove_team_objective(self, objective_id: UUID) -> bool:
         """Remove a team objective by ID."""
         if not self.pyramid:
             return False
 
-        initial_count = len(self.pyramid.team_objectives)
-        self.pyramid.team_objectives = [o for o in self.pyramid.team_objectives if o.id != objective_id]
-        return len(self.pyramid.team_objectives) < initial_count
+        self._record_change("team_objectives", objective_id)
+        return self.pyramid.remove_item("team_objectives", objective_id)
 
     def update_individual_objective(
         self,
@@ -931,31 +1046,33 @@ class PyramidManager:
         if not self.pyramid:
             return False
 
-        for objective in self.pyramid.individual_objectives:
-            if objective.id == objective_id:
-                if name is not None:
-                    objective.name = name
-                if description is not None:
-                    objective.description = description
-                if individual_name is not None:
-                    objective.individual_name = individual_name
-                if team_objective_ids is not None:
-                    objective.team_objective_ids = team_objective_ids
-                if success_criteria is not None:
-                    objective.success_criteria = success_criteria
-                objective.update_timestamp()
-                return True
-
-        return False
+        objective = self.pyramid.get_individual_objective_by_id(objective_id)
+        if not objective:
+            return False
+
+        self._record_change("individual_objectives", objective_id)
+
+        if name is not None:
+            objective.name = name
+        if description is not None:
+            objective.description = description
+        if individual_name is not None:
+            objective.individual_name = individual_name
+        if team_objective_ids is not None:
+            objective.team_objective_ids = team_objective_ids
+        if success_criteria is not None:
+            objective.success_criteria = success_criteria
+        self.pyramid.reindex_item("individual_objectives", objective)
+        objective.update_timestamp()
+        return True
 
     def remove_individual_objective(self, objective_id: UUID) -> bool:
         """Remove an individual objective by ID."""
         if not self.pyramid:
             return False
 
-        initial_count = len(self.pyramid.individual_objectives)
-        self.pyramid.individual_objectives = [o for o in self.pyramid.individual_objectives if o.id != objective_id]
-        return len(self.pyramid.individual_objectives) < initial_count
+        self._record_change("individual_objectives", objective_id)
+        return self.pyramid.remove_item("individual_objectives", objective_id)
 
     # ========================================================================
     # QUERY METHODS
@@ -1000,26 +1117,17 @@ class PyramidManager:
         """Get all strategic intents for a specific driver."""
         if not self.pyramid:
             return []
-        return [
-            intent for intent in self.pyramid.strategic_intents
-            if intent.driver_id == driver_id
-        ]
+        return self.pyramid.get_intents_by_driver(driver_id)
 
     def find_orphaned_intents(self) -> List[StrategicIntent]:
         """Find strategic intents with no iconic commitments."""
         if not self.pyramid:
             return []
 
-        orphaned = []
-        for intent in self.pyramid.strategic_intents:
-            has_commitment = any(
-                intent.id in commitment.primary_intent_ids
-                for commitment in self.pyramid.iconic_commitments
-            )
-            if not has_commitment:
-                orphaned.append(intent)
-
-        return orphaned
+        return [
+            intent for intent in self.pyramid.strategic_intents
+            if not self.pyramid.count_children("commitment_intent", intent.id)
+        ]
 
     def find_commitments_without_intents(self) -> List[IconicCommitment]:
         """Find commitments not connected to any strategic intent."""
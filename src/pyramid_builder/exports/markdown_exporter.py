@@ -385,7 +385,7 @@ class MarkdownExporter:
                     if obj.team_objective_ids:
                         team_objs = []
                         for team_id in obj.team_objective_ids:
-                            team_obj = next((to for to in self.pyramid.team_objectives if to.id == team_id), None)
+                            team_obj = self.pyramid.get_team_objective_by_id(team_id)
                             if team_obj:
                                 team_objs.append(f"**{team_obj.team_name}: {team_obj.name}**")
 
@@ -0,0 +1,294 @@
+"""
+In-memory lookup index for strategic pyramids.
+
+The pyramid stores each tier as an ordered list, which keeps JSON exports and
+display order simple but makes every by-ID lookup a linear scan. PyramidIndex
+keeps a per-tier UUID -> item map alongside those lists so reads and writes by
+ID are constant time, even for pyramids with thousands of objectives.
+
+It also keeps a bidirectional adjacency map for every cross-tier reference
+(driver -> intents -> commitments -> team -> individual objectives, plus
+values and enablers), so "children of X" and "parents of Y" queries are a
+single dictionary hit instead of nested scans.
+
+The index is derived state: it is never serialised and is rebuilt whenever the
+pyramid is constructed or validated from data. Indexed tier lists are
+TierLists, which count their own changes, so the index can tell whether a
+tier was edited behind its back without looking at the items.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from .pyramid import BaseItem, StrategyPyramid
+
+
+# Pyramid fields that hold lists of ID-bearing items, in pyramid order.
+TIER_FIELDS: Tuple[str, ...] = (
+    "values",
+    "behaviours",
+    "strategic_drivers",
+    "strategic_intents",
+    "enablers",
+    "iconic_commitments",
+    "team_objectives",
+    "individual_objectives",
+)
+
+# Relationship name -> (child tier, parent tier, parent IDs referenced by a child)
+RELATIONS: Dict[str, Tuple[str, str, Callable[[Any], Iterable[Optional[UUID]]]]] = {
+    "behaviour_value": (
+        "behaviours", "values", lambda b: b.value_ids),
+    "intent_driver": (
+        "strategic_intents", "strategic_drivers", lambda i: [i.driver_id]),
+    "enabler_driver": (
+        "enablers", "strategic_drivers", lambda e: e.driver_ids),
+    "commitment_primary_driver": (
+        "iconic_commitments", "strategic_drivers", lambda c: [c.primary_driver_id]),
+    "commitment_secondary_driver": (
+        "iconic_commitments", "strategic_drivers",
+        lambda c: [a.target_id for a in c.secondary_alignments]),
+    "commitment_intent": (
+        "iconic_commitments", "strategic_intents", lambda c: c.primary_intent_ids),
+    "team_primary_commitment": (
+        "team_objectives", "iconic_commitments", lambda t: [t.primary_commitment_id]),
+    "team_secondary_commitment": (
+        "team_objectives", "iconic_commitments", lambda t: t.secondary_commitment_ids),
+    "team_primary_intent": (
+        "team_objectives", "strategic_intents", lambda t: [t.primary_intent_id]),
+    "team_secondary_intent": (
+        "team_objectives", "strategic_intents", lambda t: t.secondary_intent_ids),
+    "individual_team_objective": (
+        "individual_objectives", "team_objectives", lambda o: o.team_objective_ids),
+}
+
+# Tier -> relationship names where items of that tier are the child
+CHILD_RELATIONS: Dict[str, Tuple[str, ...]] = {
+    tier: tuple(name for name, (child, _, _) in RELATIONS.items() if child == tier)
+    for tier in TIER_FIELDS
+}
+
+# Tier -> relationship names where items of that tier are the parent
+PARENT_RELATIONS: Dict[str, Tuple[str, ...]] = {
+    tier: tuple(name for name, (_, parent, _) in RELATIONS.items() if parent == tier)
+    for tier in TIER_FIELDS
+}
+
+
+class TierList(list):
+    """
+    A pyramid tier list that counts the changes made to it in place.
+
+    PyramidIndex compares `version` with the one it indexed, so an append,
+    `del`, sort or `tier[i] = item` done directly on the list is noticed by
+    a single comparison instead of a scan of the items.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), version: int = 0):
+        super().__init__(items)
+        self.version = version
+
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles keep the version, so the copied index stays valid
+        return TierList, (list(self), self.version)
+
+
+def _counted(name: str):
+    method = getattr(list, name)
+
+    def mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    mutate.__name__ = name
+    return mutate
+
+
+# Every list method that changes the list in place bumps its version
+for _name in (
+    "__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend",
+    "insert", "pop", "remove", "clear", "sort", "reverse",
+):
+    setattr(TierList, _name, _counted(_name))
+
+
+def referenced_ids(tier: str, item: Any) -> Set[UUID]:
+    """Get every ID an item references through its relationship fields."""
+    return {
+        parent_id
+        for relation in CHILD_RELATIONS.get(tier, ())
+        for parent_id in RELATIONS[relation][2](item)
+        if parent_id is not None
+    }
+
+
+class PyramidIndex:
+    """
+    Per-tier UUID -> item index and relationship adjacency for a StrategyPyramid.
+
+    Mutations made through PyramidManager keep the index up to date
+    incrementally. Code that changes a tier directly (e.g. the Streamlit
+    pages) is detected on the next lookup, which rebuilds the index: a tier
+    list assigned anew by list identity, and an append, removal or in-place
+    replacement (`tier[i] = new_item`) by the TierList's version. Indexing
+    swaps an assigned plain list for a TierList copy, so keep using
+    `pyramid.<tier>` rather than a reference to the list that was assigned.
+    Code that edits a relationship field on an existing item directly must
+    call StrategyPyramid.reindex_item.
+    """
+
+    def __init__(self):
+        self._items: Dict[str, Dict[UUID, "BaseItem"]] = {tier: {} for tier in TIER_FIELDS}
+        # Snapshot of (list object, version) each tier was indexed from
+        self._sources: Dict[str, Tuple[TierList, int]] = {}
+        # Insertion sequence per item, used to return children in list order
+        self._order: Dict[str, Dict[UUID, int]] = {tier: {} for tier in TIER_FIELDS}
+        self._next_seq = 0
+        # relation -> child ID -> parent IDs, and relation -> parent ID -> child IDs
+        self._parents: Dict[str, Dict[UUID, Tuple[UUID, ...]]] = {name: {} for name in RELATIONS}
+        self._children: Dict[str, Dict[UUID, Dict[UUID, None]]] = {name: {} for name in RELATIONS}
+
+    def __eq__(self, other: object) -> bool:
+        # Derived state must never make two otherwise equal pyramids unequal
+        return isinstance(other, PyramidIndex)
+
+    __hash__ = None
+
+    def rebuild(self, pyramid: "StrategyPyramid"):
+        """Rebuild the whole index from the pyramid's tier lists."""
+        self._parents = {name: {} for name in RELATIONS}
+        self._children = {name: {} for name in RELATIONS}
+        self._next_seq = 0
+        for tier in TIER_FIELDS:
+            items = getattr(pyramid, tier)
+            if not isinstance(items, TierList):
+                items = TierList(items)
+                setattr(pyramid, tier, items)
+            self._items[tier] = {item.id: item for item in items}
+            self._sources[tier] = (items, items.version)
+            self._order[tier] = {}
+            for item in items:
+                self._link(tier, item)
+
+    def _tier_is_fresh(self, pyramid: "StrategyPyramid", tier: str, pending: int = 0) -> bool:
+        """Check a tier list is the one indexed, allowing `pending` unregistered changes."""
+        source = self._sources.get(tier)
+        items = getattr(pyramid, tier)
+        return source is not None and source[0] is items and source[1] + pending == items.version
+
+    def is_fresh(self, pyramid: "StrategyPyramid") -> bool:
+        """Check whether every tier list is still the one that was indexed."""
+        return all(self._tier_is_fresh(pyramid, tier) for tier in TIER_FIELDS)
+
+    def ensure_fresh(self, pyramid: "StrategyPyramid"):
+        """Rebuild the index if any tier list was changed outside the index."""
+        if not self.is_fresh(pyramid):
+            self.rebuild(pyramid)
+
+    def get(self, pyramid: "StrategyPyramid", tier: str, item_id: UUID) -> Optional["BaseItem"]:
+        """Look up an item by ID within a tier."""
+        self.ensure_fresh(pyramid)
+        return self._items[tier].get(item_id)
+
+    def items(self, pyramid: "StrategyPyramid", tier: str) -> Dict[UUID, "BaseItem"]:
+        """Get the UUID -> item map for a tier (do not mutate)."""
+        self.ensure_fresh(pyramid)
+        return self._items[tier]
+
+    def add(self, pyramid: "StrategyPyramid", tier: str, item: "BaseItem"):
+        """Register an item that has just been appended to its tier list."""
+        if not self._is_fresh_after_change(pyramid, tier, pending=1):
+            self.rebuild(pyramid)
+            return
+        self._items[tier][item.id] = item
+        self._sources[tier] = (getattr(pyramid, tier), self._sources[tier][1] + 1)
+        self._link(tier, item)
+
+    def discard(self, pyramid: "StrategyPyramid", tier: str, item: "BaseItem"):
+        """Unregister an item that has just been removed from its tier list."""
+        if not self._is_fresh_after_change(pyramid, tier, pending=1):
+            self.rebuild(pyramid)
+            return
+        self._items[tier].pop(item.id, None)
+        self._sources[tier] = (getattr(pyramid, tier), self._sources[tier][1] + 1)
+        self._unlink(tier, item.id)
+        self._order[tier].pop(item.id, None)
+
+    def reindex(self, pyramid: "StrategyPyramid", tier: str, item: "BaseItem"):
+        """Refresh the relationships of an item whose reference fields changed."""
+        if not self.is_fresh(pyramid):
+            self.rebuild(pyramid)
+            return
+        self._unlink(tier, item.id)
+        self._link(tier, item)
+
+    def children(self, pyramid: "StrategyPyramid", relation: str, parent_id: UUID) -> List["BaseItem"]:
+        """Get the items that reference a parent through a relationship, in list order."""
+        self.ensure_fresh(pyramid)
+        tier = RELATIONS[relation][0]
+        child_ids = self._children[relation].get(parent_id)
+        if not child_ids:
+            return []
+        order = self._order[tier]
+        items = self._items[tier]
+        return [items[child_id] for child_id in sorted(child_ids, key=order.__getitem__)]
+
+    def count_children(self, pyramid: "StrategyPyramid", relation: str, parent_id: UUID) -> int:
+        """Count the items that reference a parent through a relationship."""
+        self.ensure_fresh(pyramid)
+        return len(self._children[relation].get(parent_id, ()))
+
+    def parents(self, pyramid: "StrategyPyramid", relation: str, child_id: UUID) -> List["BaseItem"]:
+        """Get the existing items a child references through a relationship."""
+        self.ensure_fresh(pyramid)
+        parent_items = self._items[RELATIONS[relation][1]]
+        return [
+            parent_items[parent_id]
+            for parent_id in self._parents[relation].get(child_id, ())
+            if parent_id in parent_items
+        ]
+
+    def _link(self, tier: str, item: "BaseItem"):
+        """Record the item's position and its outgoing relationship edges."""
+        if item.id not in self._order[tier]:
+            self._order[tier][item.id] = self._next_seq
+            self._next_seq += 1
+        for relation in CHILD_RELATIONS[tier]:
+            parent_ids = tuple(dict.fromkeys(
+                parent_id for parent_id in RELATIONS[relation][2](item) if parent_id is not None
+            ))
+            if not parent_ids:
+                continue
+            self._parents[relation][item.id] = parent_ids
+            children = self._children[relation]
+            for parent_id in parent_ids:
+                children.setdefault(parent_id, {})[item.id] = None
+
+    def _unlink(self, tier: str, item_id: UUID):
+        """Drop the item's outgoing relationship edges."""
+        for relation in CHILD_RELATIONS[tier]:
+            children = self._children[relation]
+            for parent_id in self._parents[relation].pop(item_id, ()):
+                siblings = children.get(parent_id)
+                if siblings is not None:
+                    siblings.pop(item_id, None)
+                    if not siblings:
+                        del children[parent_id]
+
+    def _is_fresh_after_change(self, pyramid: "StrategyPyramid", tier: str, pending: int) -> bool:
+        """Freshness check that tolerates the single change being registered."""
+        return all(
+            self._tier_is_fresh(pyramid, other, pending if other == tier else 0)
+            for other in TIER_FIELDS
+        )
+
+
+def position_of(items: List[Any], item: Any) -> int:
+    """
+    Find the position of an item in a list by identity.
+
+    Comparing ids avoids calling Pydantic's field-by-field __eq__ for every
+    element, so this stays a fast C-level scan.
+    """
+    return list(map(id, items)).index(id(item))
@@ -0,0 +1,123 @@
+"""
+Corporate jargon phrase lists and a compiled multi-phrase matcher.
+
+The phrase lists used by the model validators, PyramidValidator and the AI
+coach's local jargon pre-check live here, each with a shared PhraseMatcher,
+so every caller scans a text once instead of once per phrase.
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+
+class PhraseMatcher:
+    """
+    Find which of a fixed set of phrases occur in a text.
+
+    Phrases match case-insensitively as substrings, the same as
+    `phrase in text.lower()`, so overlapping and nested phrases (e.g.
+    "align" and "alignment") are all reported. All phrases are compiled into
+    one prefix-trie regex that is scanned once per text.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        """
+        Initialize matcher.
+
+        Args:
+            phrases: Phrases to look for (order is kept in results)
+        """
+        self.phrases: Tuple[str, ...] = tuple(
+            dict.fromkeys(phrase.lower() for phrase in phrases if phrase)
+        )
+        self._rank: Dict[str, int] = {phrase: i for i, phrase in enumerate(self.phrases)}
+
+        # The regex reports the longest phrase starting at a position; any
+        # shorter phrase matching there is necessarily one of its prefixes
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            phrase: tuple(other for other in self.phrases if phrase.startswith(other))
+            for phrase in self.phrases
+        }
+        self._search = re.compile(_trie_pattern(self.phrases)).search if self.phrases else None
+
+    def find(self, text: str) -> List[str]:
+        """
+        Find the phrases occurring in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Matched phrases, each once, in the order they were given
+        """
+        if not self._search or not text:
+            return []
+
+        text_lower = text.lower()
+        found = set()
+        match = self._search(text_lower)
+        while match:
+            found.update(self._prefixes[match.group()])
+            # Resume one character on so phrases starting inside this match
+            # are still found
+            match = self._search(text_lower, match.start() + 1)
+
+        return sorted(found, key=self._rank.__getitem__)
+
+    def count(self, text: str) -> int:
+        """Count the distinct phrases occurring in text."""
+        return len(self.find(text))
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """Build a regex matching any phrase, factored by common prefixes."""
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Optional (greedy) continuation when a phrase also ends here
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+# Vanilla corporate speak flagged by PyramidValidator
+VANILLA_PHRASES = [
+    "aim to", "work towards", "strive to", "endeavour to",
+    "seek to", "aspire to", "look to", "plan to",
+    "enhance", "improve", "optimise", "optimize", "leverage",
+    "synergy", "synergies", "align", "alignment", "engage with",
+    "partner with", "collaborate with", "best practice", "best practices",
+    "world-class", "excellence", "innovative", "innovation",
+    "strategic partnership", "value-add", "value added",
+    "going forward", "moving forward", "drive", "driving",
+    "empower", "empowerment", "enable", "enabling",
+]
+
+# Warning signs of vanilla language in strategic intent statements
+INTENT_VANILLA_PHRASES = [
+    "aim to", "work towards", "strive to", "endeavour",
+    "enhance", "improve", "optimise", "leverage",
+    "synergy", "align", "engage with", "partner with",
+    "best practice", "world-class", "excellence",
+]
+
+# Common jargon checked locally before asking the AI coach for alternatives
+JARGON_KEYWORDS = [
+    "synergy", "leverage", "utilize", "drive", "enhance",
+    "improve", "optimize", "strategic", "innovative",
+    "best in class", "world-class", "cutting-edge",
+    "thought leadership", "paradigm", "disruptive",
+]
+
+VANILLA_MATCHER = PhraseMatcher(VANILLA_PHRASES)
+INTENT_VANILLA_MATCHER = PhraseMatcher(INTENT_VANILLA_PHRASES)
+JARGON_MATCHER = PhraseMatcher(JARGON_KEYWORDS)
@@ -10,7 +10,19 @@ from enum import Enum
 from typing import List, Optional, Dict, Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, ValidationInfo, field_validator, model_validator
+
+from .index import PyramidIndex, position_of
+from .jargon import INTENT_VANILLA_MATCHER
+
+# Validation context for data this code saved and validated before (pyramid
+# snapshots); the checks below are skipped for it
+TRUSTED_CONTEXT = {"trusted": True}
+
+
+def is_trusted(info: ValidationInfo) -> bool:
+    """Whether the data being validated comes from a trusted snapshot."""
+    return bool(info.context) and info.context.get("trusted", False)
 
 
 class StatementType(str, Enum):
@@ -90,8 +102,10 @@ class VisionStatement(BaseItem):
 
     @field_validator('statement')
     @classmethod
-    def validate_statement(cls, v: str) -> str:
+    def validate_statement(cls, v: str, info: ValidationInfo) -> str:
         """Ensure the statement is substantive."""
+        if is_trusted(info):
+            return v
         if v.strip().lower() in ["tbd", "to be determined", "n/a", ""]:
             raise ValueError("Statement must be meaningful, not a placeholder")
         return v.strip()
@@ -196,8 +210,10 @@ class Value(BaseItem):
 
     @field_validator('name')
     @classmethod
-    def validate_name(cls, v: str) -> str:
+    def validate_name(cls, v: str, info: ValidationInfo) -> str:
         """Keep values concise."""
+        if is_trusted(info):
+            return v
         v = v.strip()
         if len(v.split()) > 3:
             raise ValueError("Values should be 1-3 words maximum")
@@ -253,8 +269,10 @@ class StrategicDriver(BaseItem):
 
     @field_validator('name')
     @classmethod
-    def validate_name(cls, v: str) -> str:
+    def validate_name(cls, v: str, info: ValidationInfo) -> str:
         """Encourage concise naming."""
+        if is_trusted(info):
+            return v
         v = v.strip()
         words = v.split()
         if len(words) > 3:
@@ -293,20 +311,14 @@ class StrategicIntent(BaseItem):
 
     @field_validator('statement')
     @classmethod
-    def validate_boldness(cls, v: str) -> str:
+    def validate_boldness(cls, v: str, info: ValidationInfo) -> str:
         """Check for vanilla corporate speak."""
+        if is_trusted(info):
+            return v
         v = v.strip()
 
         # Warning signs of vanilla language
-        vanilla_phrases = [
-            "aim to", "work towards", "strive to", "endeavour",
-            "enhance", "improve", "optimise", "leverage",
-            "synergy", "align", "engage with", "partner with",
-            "best practice", "world-class", "excellence",
-        ]
-
-        lower_statement = v.lower()
-        found_vanilla = [phrase for phrase in vanilla_phrases if phrase in lower_statement]
+        found_vanilla = INTENT_VANILLA_MATCHER.find(v)
 
         if len(found_vanilla) > 2:
             # Don't block, but add warning to notes
@@ -409,8 +421,10 @@ class IconicCommitment(BaseItem):
     )
 
     @model_validator(mode='after')
-    def validate_alignment(self):
+    def validate_alignment(self, info: ValidationInfo):
         """Ensure proper alignment structure."""
+        if is_trusted(info):
+            return self
         # Check for secondary alignment to primary driver
         for secondary in self.secondary_alignments:
             if secondary.target_id == self.primary_driver_id:
@@ -490,8 +504,10 @@ class TeamObjective(BaseItem):
     owner: Optional[str] = Field(default=None)
 
     @model_validator(mode='after')
-    def validate_alignment(self):
+    def validate_alignment(self, info: ValidationInfo):
         """Ensure the objective aligns to at least one commitment OR intent."""
+        if is_trusted(info):
+            return self
         has_commitment = self.primary_commitment_id or self.secondary_commitment_ids
         has_intent = self.primary_intent_id or self.secondary_intent_ids
 
@@ -538,8 +554,10 @@ class IndividualObjective(BaseItem):
     )
 
     @model_validator(mode='after')
-    def validate_team_alignment(self):
+    def validate_team_alignment(self, info: ValidationInfo):
         """Ensure the individual objective links to at least one team objective."""
+        if is_trusted(info):
+            return self
         if not self.team_objective_ids:
             raise ValueError(
                 "Individual objective must support at least one Team Objective "
@@ -613,9 +631,18 @@ class StrategyPyramid(BaseModel):
         description="Results from validation checks"
     )
 
+    # Derived by-ID lookup index (not serialised)
+    _index: PyramidIndex = PrivateAttr(default_factory=PyramidIndex)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the lookup index once the tier lists are populated."""
+        self._index.rebuild(self)
+
     @model_validator(mode='after')
-    def validate_structure(self):
+    def validate_structure(self, info: ValidationInfo):
         """Validate overall pyramid structure."""
+        if is_trusted(info):
+            return self
         # Recommended: 3-5 values
         if len(self.values) > 0 and (len(self.values) < 3 or len(self.values) > 5):
             print(f"⚠️  Warning: You have {len(self.values)} values. Recommended: 3-5")
@@ -626,37 +653,143 @@ class StrategyPyramid(BaseModel):
 
         return self
 
+    def get_item_by_id(self, tier: str, item_id: UUID) -> Optional[BaseItem]:
+        """
+        Find an item by ID within a tier.
+
+        Args:
+            tier: Tier field name (e.g. "strategic_drivers", "team_objectives")
+            item_id: ID of the item
+
+        Returns:
+            The item, or None if not found
+        """
+        return self._index.get(self, tier, item_id)
+
+    def add_item(self, tier: str, item: BaseItem) -> BaseItem:
+        """Append an item to a tier and register it in the lookup index."""
+        getattr(self, tier).append(item)
+        self._index.add(self, tier, item)
+        return item
+
+    def remove_item(self, tier: str, item_id: UUID) -> bool:
+        """Remove an item from a tier by ID. Returns True if it was found."""
+        item = self._index.get(self, tier, item_id)
+        if item is None:
+            return False
+        items = getattr(self, tier)
+        del items[position_of(items, item)]
+        self._index.discard(self, tier, item)
+        return True
+
+    def reindex_item(self, tier: str, item: BaseItem):
+        """Refresh relationship lookups after editing an item's reference fields."""
+        self._index.reindex(self, tier, item)
+
+    def rebuild_index(self):
+        """Rebuild the lookup index after bulk edits to the tier lists."""
+        self._index.rebuild(self)
+
+    def get_children(self, relation: str, parent_id: UUID) -> List[BaseItem]:
+        """
+        Get the items that reference a parent item, in tier order.
+
+        Args:
+            relation: Relationship name from models.index.RELATIONS
+                (e.g. "intent_driver", "commitment_intent")
+            parent_id: ID of the referenced item
+
+        Returns:
+            Child items (empty list if none)
+        """
+        return self._index.children(self, relation, parent_id)
+
+    def get_parents(self, relation: str, child_id: UUID) -> List[BaseItem]:
+        """Get the existing items a child references through a relationship."""
+        return self._index.parents(self, relation, child_id)
+
+    def count_children(self, relation: str, parent_id: UUID) -> int:
+        """Count the items that reference a parent item."""
+        return self._index.count_children(self, relation, parent_id)
+
+    def get_value_by_id(self, value_id: UUID) -> Optional[Value]:
+        """Find a value by ID."""
+        return self.get_item_by_id("values", value_id)
+
+    def get_behaviour_by_id(self, behaviour_id: UUID) -> Optional[Behaviour]:
+        """Find a behaviour by ID."""
+        return self.get_item_by_id("behaviours", behaviour_id)
+
     def get_driver_by_id(self, driver_id: UUID) -> Optional[StrategicDriver]:
         """Find a strategic driver by ID."""
-        return next((d for d in self.strategic_drivers if d.id == driver_id), None)
+        return self.get_item_by_id("strategic_drivers", driver_id)
 
     def get_intent_by_id(self, intent_id: UUID) -> Optional[StrategicIntent]:
         """Find a strategic intent by ID."""
-        return next((i for i in self.strategic_intents if i.id == intent_id), None)
+        return self.get_item_by_id("strategic_intents", intent_id)
+
+    def get_enabler_by_id(self, enabler_id: UUID) -> Optional[Enabler]:
+        """Find an enabler by ID."""
+        return self.get_item_by_id("enablers", enabler_id)
 
     def get_commitment_by_id(self, commitment_id: UUID) -> Optional[IconicCommitment]:
         """Find an iconic commitment by ID."""
-        return next((c for c in self.iconic_commitments if c.id == commitment_id), None)
+        return self.get_item_by_id("iconic_commitments", commitment_id)
+
+    def get_team_objective_by_id(self, objective_id: UUID) -> Optional[TeamObjective]:
+        """Find a team objective by ID."""
+        return self.get_item_by_id("team_objectives", objective_id)
+
+    def get_individual_objective_by_id(self, objective_id: UUID) -> Optional[IndividualObjective]:
+        """Find an individual objective by ID."""
+        return self.get_item_by_id("individual_objectives", objective_id)
 
     def get_commitments_by_driver(self, driver_id: UUID, primary_only: bool = True) -> List[IconicCommitment]:
         """Get all commitments for a specific driver."""
+        result = self.get_children("commitment_primary_driver", driver_id)
+        if primary_only:
+            return result
+        # Include secondary alignments
+        primary_ids = {c.id for c in result}
+        result.extend(
+            c for c in self.get_children("commitment_secondary_driver", driver_id)
+            if c.id not in primary_ids
+        )
+        return result
+
+    def get_intents_by_driver(self, driver_id: UUID) -> List[StrategicIntent]:
+        """Get all strategic intents for a specific driver."""
+        return self.get_children("intent_driver", driver_id)
+
+    def get_commitments_by_intent(self, intent_id: UUID) -> List[IconicCommitment]:
+        """Get all commitments that primarily support a strategic intent."""
+        return self.get_children("commitment_intent", intent_id)
+
+    def get_enablers_by_driver(self, driver_id: UUID) -> List[Enabler]:
+        """Get all enablers supporting a specific driver."""
+        return self.get_children("enabler_driver", driver_id)
+
+    def get_team_objectives_by_commitment(self, commitment_id: UUID, primary_only: bool = True) -> List[TeamObjective]:
+        """Get all team objectives supporting an iconic commitment."""
+        result = self.get_children("team_primary_commitment", commitment_id)
         if primary_only:
-            return [c for c in self.iconic_commitments if c.primary_driver_id == driver_id]
-        else:
-            # Include secondary alignments
-            result = [c for c in self.iconic_commitments if c.primary_driver_id == driver_id]
-            for commitment in self.iconic_commitments:
-                for alignment in commitment.secondary_alignments:
-                    if alignment.target_id == driver_id and commitment not in result:
-                        result.append(commitment)
             return result
+        primary_ids = {o.id for o in result}
+        result.extend(
+            o for o in self.get_children("team_secondary_commitment", commitment_id)
+            if o.id not in primary_ids
+        )
+        return result
+
+    def get_individual_objectives_by_team_objective(self, objective_id: UUID) -> List[IndividualObjective]:
+        """Get all individual objectives supporting a team objective."""
+        return self.get_children("individual_team_objective", objective_id)
 
     def get_distribution_by_driver(self) -> Dict[str, int]:
         """Get count of primary commitments per driver."""
         distribution = {}
         for driver in self.strategic_drivers:
-            count = len(self.get_commitments_by_driver(driver.id, primary_only=True))
-            distribution[driver.name] = count
+            distribution[driver.name] = self.count_children("commitment_primary_driver", driver.id)
         return distribution
 
     def to_dict(self) -> Dict[str, Any]:
@@ -0,0 +1,183 @@
+"""
+Compact binary snapshots of strategic pyramids.
+
+Pyramid JSON files are pretty-printed by Python's json module (its slow
+path, as indent disables the C encoder) and loaded through json.load and
+full Pydantic validation of the resulting dicts. A snapshot instead holds
+compact JSON written and read by pydantic-core in one pass, optionally
+compressed, behind a small binary preamble:
+
+    magic      8 bytes   SNAPSHOT_MAGIC
+    version    1 byte
+    codec      1 byte    0 = none, 1 = zlib, 2 = zstd
+    checksum   4 bytes   CRC-32 of the uncompressed body
+    body                 compressed with the codec
+
+The body holds two length-prefixed sections: a JSON header (the schema
+fingerprint and item counts per tier) and the pyramid itself.
+
+Snapshots whose schema fingerprint matches the current models are
+trusted: they were validated when saved, so loading skips the models'
+own validators (see TRUSTED_CONTEXT) and only checks types. Snapshots
+saved by other versions of the models, or loaded with trusted=False, are
+fully validated.
+
+zstd compression needs the optional `zstandard` package; zlib is always
+available.
+"""
+
+import hashlib
+import importlib.util
+import json
+import struct
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .index import TIER_FIELDS
+from .pyramid import TRUSTED_CONTEXT, StrategyPyramid
+
+SNAPSHOT_MAGIC = b"\x89PYRSNP\n"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".pyrsnap"
+
+CODECS = {None: 0, "zlib": 1, "zstd": 2}
+ZSTD_AVAILABLE = importlib.util.find_spec("zstandard") is not None
+
+_PREAMBLE = struct.Struct(">8sBBI")
+_LENGTH = struct.Struct(">I")
+
+
+class SnapshotError(ValueError):
+    """A file is not a readable pyramid snapshot."""
+
+
+@lru_cache(maxsize=1)
+def schema_fingerprint() -> str:
+    """Hash of the pyramid models' JSON schema; changes with any field."""
+    schema = json.dumps(StrategyPyramid.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()[:16]
+
+
+def _zstandard():
+    if not ZSTD_AVAILABLE:
+        raise ImportError(
+            "zstandard package not installed. "
+            "Install with: pip install zstandard"
+        )
+    import zstandard
+
+    return zstandard
+
+
+def dumps_snapshot(pyramid: StrategyPyramid, compression: Optional[str] = None) -> bytes:
+    """
+    Serialize a pyramid to snapshot bytes.
+
+    Args:
+        pyramid: Pyramid to serialize
+        compression: None, "zlib" or "zstd"
+
+    Raises:
+        ValueError: Unknown compression
+        ImportError: zstd requested without the zstandard package
+    """
+    if compression not in CODECS:
+        raise ValueError(f"Unknown snapshot compression: {compression!r}. Use one of: zstd, zlib, None")
+
+    header = json.dumps({
+        "schema": schema_fingerprint(),
+        "counts": {tier: len(getattr(pyramid, tier)) for tier in TIER_FIELDS},
+    }).encode("utf-8")
+    data = pyramid.__pydantic_serializer__.to_json(pyramid)
+    body = b"".join([_LENGTH.pack(len(header)), header, _LENGTH.pack(len(data)), data])
+
+    if compression == "zlib":
+        payload = zlib.compress(body, 6)
+    elif compression == "zstd":
+        payload = _zstandard().ZstdCompressor(level=3).compress(body)
+    else:
+        payload = body
+    return _PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, CODECS[compression], zlib.crc32(body)) + payload
+
+
+def _read_sections(data: bytes) -> List[bytes]:
+    """Check the preamble, decompress, and split the body into its sections."""
+    if len(data) < _PREAMBLE.size or not data.startswith(SNAPSHOT_MAGIC):
+        raise SnapshotError("Not a pyramid snapshot")
+    _, version, codec, checksum = _PREAMBLE.unpack_from(data)
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version}")
+    if codec not in CODECS.values():
+        raise SnapshotError(f"Unknown snapshot compression codec {codec}")
+
+    payload = data[_PREAMBLE.size:]
+    if codec == CODECS["zlib"]:
+        try:
+            body = zlib.decompress(payload)
+        except zlib.error as e:
+            raise SnapshotError(f"Snapshot is corrupt: {e}") from e
+    elif codec == CODECS["zstd"]:
+        zstandard = _zstandard()
+        try:
+            body = zstandard.ZstdDecompressor().decompress(payload)
+        except zstandard.ZstdError as e:
+            raise SnapshotError(f"Snapshot is corrupt: {e}") from e
+    else:
+        body = payload
+    if zlib.crc32(body) != checksum:
+        raise SnapshotError("Snapshot is corrupt (checksum mismatch)")
+
+    sections = []
+    offset = 0
+    while offset + _LENGTH.size <= len(body):
+        (length,) = _LENGTH.unpack_from(body, offset)
+        offset += _LENGTH.size
+        sections.append(body[offset:offset + length])
+        offset += length
+    if len(sections) != 2 or offset != len(body):
+        raise SnapshotError("Snapshot is corrupt (bad section lengths)")
+    return sections
+
+
+def snapshot_header(data: bytes) -> Dict[str, Any]:
+    """The header of snapshot bytes: schema fingerprint and item counts per tier."""
+    return json.loads(_read_sections(data)[0])
+
+
+def loads_snapshot(data: bytes, trusted: bool = True) -> StrategyPyramid:
+    """
+    Load a pyramid from snapshot bytes.
+
+    Args:
+        data: Bytes written by dumps_snapshot
+        trusted: Skip the models' validators if the snapshot was saved with
+            the current models (they ran when it was saved)
+
+    Raises:
+        SnapshotError: Not a snapshot, an unsupported version, or corrupt
+        ImportError: zstd-compressed without the zstandard package
+        pydantic.ValidationError: The pyramid in the snapshot is invalid
+    """
+    header, pyramid = _read_sections(data)
+    trusted = trusted and json.loads(header).get("schema") == schema_fingerprint()
+    return StrategyPyramid.model_validate_json(pyramid, context=TRUSTED_CONTEXT if trusted else None)
+
+
+def save_snapshot(pyramid: StrategyPyramid, filepath: Union[str, Path], compression: Optional[str] = None) -> None:
+    """Write a pyramid to a snapshot file (see dumps_snapshot)."""
+    with open(filepath, "wb") as f:
+        f.write(dumps_snapshot(pyramid, compression))
+
+
+def load_snapshot(filepath: Union[str, Path], trusted: bool = True) -> StrategyPyramid:
+    """Load a pyramid from a snapshot file (see loads_snapshot)."""
+    with open(filepath, "rb") as f:
+        return loads_snapshot(f.read(), trusted=trusted)
+
+
+def is_snapshot(filepath: Union[str, Path]) -> bool:
+    """Whether a file starts with the snapshot magic bytes."""
+    with open(filepath, "rb") as f:
+        return f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
@@ -0,0 +1,29 @@
+"""
+Reading settings from environment variables.
+
+Shared by the API (session store, AI and parse pools) and the AI services
+(gateway, response and document caches).
+"""
+
+import os
+from typing import Optional
+
+
+def env_number(name: str, default: Optional[float], cast=int) -> Optional[float]:
+    """
+    Read a numeric setting; empty or "none" means no limit.
+
+    Args:
+        name: Environment variable
+        default: Value when the variable is unset
+        cast: Type to convert the value to (int or float)
+
+    Returns:
+        The number, the default, or None for no limit
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    if value.strip().lower() in ("", "none"):
+        return None
+    return cast(value)
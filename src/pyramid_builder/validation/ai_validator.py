@@ -10,15 +10,17 @@ This module provides semantic validation checks that go beyond rule-based valida
 
 import os
 import json
-from typing import List, Dict, Any, Optional
-from pathlib import Path
-
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Any, Optional, Tuple
+
+from ..ai.assets import static_assets
+from ..ai.gateway import ANTHROPIC_AVAILABLE, BACKGROUND, gateway_client
+from ..ai.json_stream import parse_json_response
+from ..ai.prompt_cache import UsageTrackingClient
+from ..ai.response_cache import CachingClient, ResponseCache, get_response_cache
 from ..models.pyramid import StrategyPyramid
 from .validator import ValidationResult, ValidationLevel
 
@@ -29,7 +31,21 @@ class AIValidator:
     Uses Claude API to provide deep strategic insights.
     """
 
-    def __init__(self, pyramid: StrategyPyramid, api_key: Optional[str] = None, context_data: Optional[Dict[str, Any]] = None):
+    # AI checks allowed in flight at once during validate_with_ai
+    MAX_CONCURRENT_CHECKS = 4
+
+    # AI gateway lane: batches of checks yield to interactive coaching calls
+    GATEWAY_PRIORITY = BACKGROUND
+
+    # Response cache key prefix for per-commitment alignment verdicts
+    ALIGNMENT_VERDICT_PREFIX = "verdict:commitment_intent_alignment:v1:"
+
+    # Token budgets used to size batched alignment prompts automatically
+    ALIGNMENT_BATCH_INPUT_TOKENS = 8000
+    ALIGNMENT_BATCH_OUTPUT_TOKENS = 4096
+    ALIGNMENT_TOKENS_PER_VERDICT = 150
+
+    def __init__(self, pyramid: StrategyPyramid, api_key: Optional[str] = None, context_data: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None, max_concurrent_checks: Optional[int] = None, bypass_cache: bool = False, cache: Optional[ResponseCache] = None, alignment_batch_size: Optional[int] = None):
         """
         Initialize AI validator.
 
@@ -37,8 +53,18 @@ class AIValidator:
             pyramid: StrategyPyramid to validate
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
             context_data: Optional Step 1 context data (SOCC, tensions, stakeholders, scores)
+            timeout: Optional per-request timeout in seconds for API calls
+            max_concurrent_checks: AI checks run in parallel (defaults to MAX_CONCURRENT_CHECKS)
+            bypass_cache: Skip cached responses (fresh ones are still stored)
+            cache: Response cache (defaults to the shared one from get_response_cache)
+            alignment_batch_size: Commitments per alignment prompt (None = sized
+                automatically from token estimates, 1 = one call per commitment)
         """
         self.pyramid = pyramid
+        self.max_concurrent_checks = max_concurrent_checks or self.MAX_CONCURRENT_CHECKS
+        self.alignment_batch_size = alignment_batch_size
+        # Wall-clock milliseconds per check from the last validate_with_ai run
+        self.check_timings: Dict[str, float] = {}
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.context_data = context_data or {}
 
@@ -54,20 +80,22 @@ class AIValidator:
                 "Set ANTHROPIC_API_KEY environment variable or pass api_key parameter."
             )
 
-        self.client = Anthropic(api_key=self.api_key)
+        # The process-wide pooled client, rate limited and retried by the AI gateway
+        self.client = UsageTrackingClient(gateway_client(self.api_key, timeout, self.GATEWAY_PRIORITY))
+        # Unchanged prompts are answered from the shared response cache, and
+        # per-item verdicts are kept there too
+        self.cache = cache if cache is not None else get_response_cache()
+        self.bypass_cache = bypass_cache
+        if self.cache is not None:
+            self.client = CachingClient(self.client, self.cache, bypass=bypass_cache)
 
         # Load thought leadership context
-        self.product_definition = self._load_product_definition()
         self.tooltips_guidance = self._load_tooltips_guidance()
 
-    def _load_product_definition(self) -> str:
-        """Load PRODUCT_DEFINITION.md for context."""
-        project_root = Path(__file__).parent.parent.parent.parent
-        product_def_path = project_root / "PRODUCT_DEFINITION.md"
-
-        if product_def_path.exists():
-            return product_def_path.read_text(encoding="utf-8")
-        return ""
+    @property
+    def product_definition(self) -> str:
+        """PRODUCT_DEFINITION.md for context, read once per process on first use."""
+        return static_assets.get("product_definition")
 
     def _load_tooltips_guidance(self) -> str:
         """Load key tooltip guidance for context."""
@@ -207,12 +235,77 @@ class AIValidator:
 
         Returns:
             Enhanced ValidationResult with AI insights
+
+        The checks are independent LLM calls, so they run concurrently (at
+        most max_concurrent_checks at a time). Commitment alignment verdicts
+        already stored are reused, and the rest are fetched in batches
+        alongside the other checks. Each check writes to its own result and
+        the issues are merged in check order (alignment issues in commitment
+        order), so the output does not depend on which call returns first.
+        Per-check timings are kept in check_timings and
+        result.summary["ai_check_timings_ms"].
+
+        Callers with their own thread pool (the API) can instead run the
+        steps themselves: plan_checks, run_check for each check, merge_checks.
+        """
+        plan = self.plan_checks()
+        workers = min(self.max_concurrent_checks, len(plan["checks"]))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai-check") as executor:
+            outcomes = list(executor.map(partial(self.run_check, plan), range(len(plan["checks"]))))
+        return self.merge_checks(plan, outcomes, result)
+
+    def plan_checks(self) -> Dict[str, Any]:
+        """
+        List the AI checks of validate_with_ai as independent calls.
+
+        Returns:
+            Dict with targets (commitments to align), verdicts (alignment
+            verdicts by commitment id, the stored ones so far; the alignment
+            checks add theirs) and checks, a list of (name, check) pairs
+        """
+        targets = self._get_commitments_to_align()
+        verdicts = self._get_stored_alignment_verdicts(targets)
+        pending = [target for target in targets if target[0].id not in verdicts]
+
+        checks = [("strategic_coherence", self._check_strategic_coherence)]
+        for name, batch in self._plan_alignment_batches(pending):
+            checks.append((name, partial(self._fetch_alignment_verdicts, batch, verdicts)))
+        checks.append(("horizon_realism", self._check_horizon_realism))
+        checks.append(("language_boldness", self._check_language_boldness))
+
+        return {"targets": targets, "verdicts": verdicts, "checks": checks}
+
+    def run_check(self, plan: Dict[str, Any], index: int) -> Tuple[ValidationResult, float]:
+        """Run one planned check into its own result; returns it and its wall-clock milliseconds."""
+        _, check = plan["checks"][index]
+        check_result = ValidationResult()
+        started = time.perf_counter()
+        check(check_result)
+        return check_result, round((time.perf_counter() - started) * 1000, 1)
+
+    def merge_checks(self, plan: Dict[str, Any], outcomes: List[Optional[Tuple[ValidationResult, float]]], result: ValidationResult) -> ValidationResult:
         """
-        # Run AI validation checks
-        self._check_strategic_coherence(result)
-        self._check_commitment_intent_alignment(result)
-        self._check_horizon_realism(result)
-        self._check_language_boldness(result)
+        Add the planned checks' issues to result in check order.
+
+        Args:
+            plan: From plan_checks
+            outcomes: run_check's return value per check, or None for a
+                check that did not run (it adds no issues or timing)
+            result: ValidationResult to add the issues to
+        """
+        check_results = [outcome[0] if outcome else ValidationResult() for outcome in outcomes]
+
+        # Alignment fetches report nothing themselves; their verdicts become
+        # issues here, right after the coherence check
+        alignment_result = ValidationResult()
+        self._add_alignment_issues(plan["targets"], dict(plan["verdicts"]), alignment_result)
+        for check_result in [check_results[0], alignment_result, *check_results[1:]]:
+            result.add_issues(check_result.issues)
+
+        self.check_timings = {
+            name: outcome[1] for (name, _), outcome in zip(plan["checks"], outcomes) if outcome
+        }
+        result.summary["ai_check_timings_ms"] = dict(self.check_timings)
 
         return result
 
@@ -344,13 +437,7 @@ Respond in JSON format:
             content = response.content[0].text
             print(f"AI Response: {content[:200]}")  # Debug logging
 
-            # Try to extract JSON if it's wrapped in markdown code blocks
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            analysis = json.loads(content)
+            analysis = parse_json_response(content)
 
             if not analysis.get("is_coherent", True):
                 for issue in analysis.get("issues", []):
@@ -382,26 +469,203 @@ Respond in JSON format:
         Check 10: Commitment-Intent Alignment
         Validates semantic fit between commitments and their linked intents.
         """
+        targets = self._get_commitments_to_align()
+        verdicts = self._get_stored_alignment_verdicts(targets)
+        pending = [target for target in targets if target[0].id not in verdicts]
+        for _, batch in self._plan_alignment_batches(pending):
+            self._fetch_alignment_verdicts(batch, verdicts)
+        self._add_alignment_issues(targets, verdicts, result)
+
+    def _get_commitments_to_align(self) -> List[Tuple[Any, List[Any]]]:
+        """Commitments to check for intent alignment, with their linked intents."""
         if not self.pyramid.iconic_commitments or not self.pyramid.strategic_intents:
-            return
+            return []
 
-        # Check first few commitments for alignment
-        for commitment in self.pyramid.iconic_commitments[:3]:
+        intents_by_id = {intent.id: intent for intent in self.pyramid.strategic_intents}
+        targets = []
+        for commitment in self.pyramid.iconic_commitments:
             if not commitment.primary_intent_ids:
                 continue  # Already flagged by orphaned items check
 
             # Get linked intents
             linked_intents = [
-                intent for intent in self.pyramid.strategic_intents
-                if intent.id in commitment.primary_intent_ids
+                intents_by_id[intent_id] for intent_id in commitment.primary_intent_ids
+                if intent_id in intents_by_id
             ]
 
-            if not linked_intents:
+            if linked_intents:
+                targets.append((commitment, linked_intents))
+
+        return targets
+
+    def _alignment_verdict_key(self, commitment, linked_intents: List[Any]) -> str:
+        """Cache key for a commitment's verdict: a hash of the text it is judged on."""
+        content = json.dumps(
+            [commitment.name, commitment.description, [intent.statement for intent in linked_intents]],
+            separators=(",", ":"),
+        )
+        return self.ALIGNMENT_VERDICT_PREFIX + hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _get_alignment_verdict(self, commitment, linked_intents: List[Any]) -> Optional[Dict[str, Any]]:
+        """The stored verdict for an unchanged commitment, if any."""
+        if self.cache is None or self.bypass_cache:
+            return None
+        stored = self.cache.get(self._alignment_verdict_key(commitment, linked_intents))
+        return json.loads(stored) if stored is not None else None
+
+    def _get_stored_alignment_verdicts(self, targets: List[Tuple[Any, List[Any]]]) -> Dict[Any, Dict[str, Any]]:
+        """Stored verdicts for unchanged commitments, by commitment id."""
+        verdicts = {}
+        for commitment, linked_intents in targets:
+            verdict = self._get_alignment_verdict(commitment, linked_intents)
+            if verdict is not None:
+                verdicts[commitment.id] = verdict
+        return verdicts
+
+    def _store_alignment_verdict(self, commitment, linked_intents: List[Any], verdict: Dict[str, Any]):
+        if self.cache is not None:
+            self.cache.put(
+                self._alignment_verdict_key(commitment, linked_intents),
+                "claude-sonnet-4-20250514",
+                json.dumps(verdict),
+            )
+
+    def _plan_alignment_batches(self, targets: List[Tuple[Any, List[Any]]]) -> List[Tuple[str, List[Tuple[Any, List[Any]]]]]:
+        """
+        Group commitments into alignment prompts, named for check timings.
+
+        With no fixed alignment_batch_size, commitments are packed in order
+        until the estimated prompt or reply size would exceed its budget.
+        """
+        if self.alignment_batch_size:
+            size = self.alignment_batch_size
+            batches = [targets[i:i + size] for i in range(0, len(targets), size)]
+        else:
+            max_items = max(1, self.ALIGNMENT_BATCH_OUTPUT_TOKENS // self.ALIGNMENT_TOKENS_PER_VERDICT)
+            batches = []
+            batch, batch_tokens = [], 0
+            for target in targets:
+                tokens = _estimate_tokens(self._format_alignment_item(1, *target))
+                if batch and (
+                    batch_tokens + tokens > self.ALIGNMENT_BATCH_INPUT_TOKENS or len(batch) >= max_items
+                ):
+                    batches.append(batch)
+                    batch, batch_tokens = [], 0
+                batch.append(target)
+                batch_tokens += tokens
+            if batch:
+                batches.append(batch)
+
+        return [
+            (
+                f"commitment_intent_alignment:{batch[0][0].id}" if len(batch) == 1
+                else f"commitment_intent_alignment:batch{number}",
+                batch,
+            )
+            for number, batch in enumerate(batches, 1)
+        ]
+
+    def _fetch_alignment_verdicts(self, batch: List[Tuple[Any, List[Any]]], verdicts: Dict[Any, Dict[str, Any]], result: Optional[ValidationResult] = None):
+        """
+        Get verdicts for a batch of commitments from the API and store them.
+
+        Commitments the batched reply leaves out are asked about one by one;
+        ones that still fail are skipped. If the batched call itself fails
+        (rate limited, overloaded, timed out) the whole batch is skipped
+        rather than retried item by item, which would multiply the calls
+        when the API is already struggling; the gateway has retried it.
+        """
+        if len(batch) > 1:
+            answered = self._ask_commitment_alignment_batch(batch)
+            if answered is None:
+                return  # Silently skip on API errors
+        else:
+            answered = {}
+
+        for index, (commitment, linked_intents) in enumerate(batch):
+            analysis = answered.get(index)
+            if analysis is None:
+                analysis = self._ask_commitment_alignment(commitment, linked_intents)
+            if analysis is None:
+                continue  # Silently skip on API errors
+            self._store_alignment_verdict(commitment, linked_intents, analysis)
+            verdicts[commitment.id] = analysis
+
+    @staticmethod
+    def _format_alignment_item(number: int, commitment, linked_intents: List[Any]) -> str:
+        intents_text = "\n".join([f"- {i.statement}" for i in linked_intents])
+        return f"""[{number}] Iconic Commitment:
+Name: {commitment.name}
+Description: {commitment.description}
+Linked Strategic Intents:
+{intents_text}
+"""
+
+    def _ask_commitment_alignment_batch(self, batch: List[Tuple[Any, List[Any]]]) -> Optional[Dict[int, Dict[str, Any]]]:
+        """
+        Ask for several commitments' verdicts in one call, by batch index.
+
+        Returns None if the API call fails; an unreadable reply answers
+        nothing ({}).
+        """
+        items_text = "\n".join(
+            self._format_alignment_item(number, commitment, linked_intents)
+            for number, (commitment, linked_intents) in enumerate(batch, 1)
+        )
+
+        prompt = f"""You are a strategic planning expert reviewing commitment-to-intent alignment.
+
+For each numbered iconic commitment below, decide whether it genuinely delivers on its linked strategic intents.
+
+{items_text}
+Respond with a JSON array holding one object per commitment, in the same order:
+[
+  {{
+    "item": 1,
+    "is_aligned": true/false,
+    "confidence": "high/medium/low",
+    "explanation": "Brief explanation",
+    "suggestion": "Suggestion if misaligned (or null if aligned)"
+  }}
+]"""
+
+        max_tokens = min(
+            self.ALIGNMENT_BATCH_OUTPUT_TOKENS,
+            256 + self.ALIGNMENT_TOKENS_PER_VERDICT * len(batch),
+        )
+
+        try:
+            response = self.client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}]
+            )
+        except Exception:
+            return None
+
+        try:
+            analyses = parse_json_response(response.content[0].text)
+        except (IndexError, AttributeError, ValueError):
+            return {}
+        if isinstance(analyses, dict):
+            analyses = analyses.get("results", [])
+        if not isinstance(analyses, list):
+            return {}
+
+        answered = {}
+        for analysis in analyses:
+            if not isinstance(analysis, dict):
                 continue
+            number = analysis.pop("item", None)
+            if isinstance(number, int) and 1 <= number <= len(batch):
+                answered[number - 1] = analysis
+        return answered
 
-            intents_text = "\n".join([f"- {i.statement}" for i in linked_intents])
+    def _ask_commitment_alignment(self, commitment, linked_intents: List[Any]) -> Optional[Dict[str, Any]]:
+        """Ask the API for one commitment's alignment verdict."""
+        intents_text = "\n".join([f"- {i.statement}" for i in linked_intents])
 
-            prompt = f"""You are a strategic planning expert reviewing commitment-to-intent alignment.
+        prompt = f"""You are a strategic planning expert reviewing commitment-to-intent alignment.
 
 Iconic Commitment:
 Name: {commitment.name}
@@ -420,37 +684,38 @@ Respond in JSON format:
   "suggestion": "Suggestion if misaligned (or null if aligned)"
 }}"""
 
-            try:
-                response = self.client.messages.create(
-                    model="claude-sonnet-4-20250514",
-                    max_tokens=512,
-                    messages=[{"role": "user", "content": prompt}]
-                )
+        try:
+            response = self.client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=512,
+                messages=[{"role": "user", "content": prompt}]
+            )
 
-                content = response.content[0].text
-                print(f"AI Response: {content[:200]}")  # Debug logging
+            content = response.content[0].text
+            print(f"AI Response: {content[:200]}")  # Debug logging
 
-                # Try to extract JSON if it's wrapped in markdown code blocks
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
+            return parse_json_response(content)
 
-                analysis = json.loads(content)
+        except Exception as e:
+            return None
 
-                if not analysis.get("is_aligned", True) and analysis.get("confidence") in ["high", "medium"]:
-                    result.add_issue(
-                        ValidationLevel.WARNING,
-                        "AI: Commitment-Intent Alignment",
-                        f"Commitment '{commitment.name}' may not deliver on linked intents: {analysis.get('explanation', '')}",
-                        item_id=str(commitment.id),
-                        item_type="IconicCommitment",
-                        suggestion=analysis.get("suggestion", "")
-                    )
+    def _add_alignment_issues(self, targets: List[Tuple[Any, List[Any]]], verdicts: Dict[Any, Dict[str, Any]], result: ValidationResult):
+        """Report misaligned commitments in pyramid order."""
+        for commitment, _ in targets:
+            if commitment.id in verdicts:
+                self._add_alignment_issue(commitment, verdicts[commitment.id], result)
 
-            except Exception as e:
-                # Silently skip on API errors
-                pass
+    def _add_alignment_issue(self, commitment, analysis: Dict[str, Any], result: ValidationResult):
+        """Report a commitment the verdict says is misaligned."""
+        if not analysis.get("is_aligned", True) and analysis.get("confidence") in ["high", "medium"]:
+            result.add_issue(
+                ValidationLevel.WARNING,
+                "AI: Commitment-Intent Alignment",
+                f"Commitment '{commitment.name}' may not deliver on linked intents: {analysis.get('explanation', '')}",
+                item_id=str(commitment.id),
+                item_type="IconicCommitment",
+                suggestion=analysis.get("suggestion", "")
+            )
 
     def _check_horizon_realism(self, result: ValidationResult):
         """
@@ -503,13 +768,7 @@ Respond in JSON format:
             content = response.content[0].text
             print(f"AI Response (Horizon): {content[:200]}")  # Debug logging
 
-            # Try to extract JSON if it's wrapped in markdown code blocks
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            analysis = json.loads(content)
+            analysis = parse_json_response(content)
 
             if not analysis.get("is_realistic", True):
                 result.add_issue(
@@ -577,13 +836,7 @@ Respond in JSON format:
             content = response.content[0].text
             print(f"AI Response: {content[:200]}")  # Debug logging
 
-            # Try to extract JSON if it's wrapped in markdown code blocks
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            analysis = json.loads(content)
+            analysis = parse_json_response(content)
 
             if analysis.get("overall_boldness") == "weak":
                 result.add_issue(
@@ -704,13 +957,7 @@ Respond in JSON format:
             content = response.content[0].text
             print(f"AI Review Response: {content[:200]}")  # Debug logging
 
-            # Try to extract JSON if it's wrapped in markdown code blocks
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            review = json.loads(content)
+            review = parse_json_response(content)
             return review
 
         except Exception as e:
@@ -728,3 +975,8 @@ Respond in JSON format:
             if str(driver.id) == driver_id:
                 return driver.name
         return "Unknown"
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting prompts (about 4 characters per token)."""
+    return len(text) // 4 + 1
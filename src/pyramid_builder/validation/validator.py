@@ -10,11 +10,27 @@ Checks for:
 - Cascade alignment
 """
 
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Set
+from uuid import UUID
 from enum import Enum
 import re
 
-from ..models.pyramid import StrategyPyramid, IconicCommitment, StrategicIntent
+from ..models.index import PARENT_RELATIONS, TIER_FIELDS, referenced_ids
+from ..models.jargon import VANILLA_MATCHER, VANILLA_PHRASES
+from ..models.pyramid import (
+    StrategyPyramid,
+    IconicCommitment,
+    StrategicDriver,
+    StrategicIntent,
+    TeamObjective,
+    VisionStatement,
+)
+
+if TYPE_CHECKING:
+    from ..core.change_tracker import Change, ChangeTracker
+
+# Shared empty tier so a missing vision keeps a stable identity
+_NO_ITEMS: tuple = ()
 
 
 class ValidationLevel(str, Enum):
@@ -77,10 +93,14 @@ class ValidationResult:
     ):
         """Add a validation issue."""
         issue = ValidationIssue(level, category, message, item_id, item_type, suggestion)
-        self.issues.append(issue)
+        self.add_issues([issue])
 
-        if level == ValidationLevel.ERROR:
-            self.passed = False
+    def add_issues(self, issues: List[ValidationIssue]):
+        """Add already-built validation issues."""
+        for issue in issues:
+            self.issues.append(issue)
+            if issue.level == ValidationLevel.ERROR:
+                self.passed = False
 
     def get_errors(self) -> List[ValidationIssue]:
         """Get only error-level issues."""
@@ -116,34 +136,147 @@ class ValidationResult:
         )
 
 
+class ValidationSnapshot:
+    """
+    Indexes and counts shared by all validation rules.
+
+    Collected in a single traversal of the pyramid so that no rule needs to
+    rescan another tier, keeping validation linear in the number of items.
+    """
+
+    def __init__(self, pyramid: StrategyPyramid):
+        self.vision_statement_count = len(pyramid.vision.statements) if pyramid.vision else 0
+        self.value_count = len(pyramid.values)
+        self.driver_count = len(pyramid.strategic_drivers)
+        self.intent_count = len(pyramid.strategic_intents)
+        self.commitment_count = len(pyramid.iconic_commitments)
+        self.team_objective_count = len(pyramid.team_objectives)
+        self.individual_objective_count = len(pyramid.individual_objectives)
+
+        self.driver_ids: Set[UUID] = set()
+        self.intent_count_by_driver: Dict[UUID, int] = {}
+        self.commitment_count_by_driver: Dict[UUID, int] = {}
+        self.intent_ids_with_commitments: Set[UUID] = set()
+
+        for driver in pyramid.strategic_drivers:
+            self.driver_ids.add(driver.id)
+
+        for intent in pyramid.strategic_intents:
+            self.intent_count_by_driver[intent.driver_id] = (
+                self.intent_count_by_driver.get(intent.driver_id, 0) + 1
+            )
+
+        for commitment in pyramid.iconic_commitments:
+            self.commitment_count_by_driver[commitment.primary_driver_id] = (
+                self.commitment_count_by_driver.get(commitment.primary_driver_id, 0) + 1
+            )
+            self.intent_ids_with_commitments.update(commitment.primary_intent_ids)
+
+        # Same shape as StrategyPyramid.get_distribution_by_driver()
+        self.distribution: Dict[str, int] = {
+            driver.name: self.commitment_count_by_driver.get(driver.id, 0)
+            for driver in pyramid.strategic_drivers
+        }
+
+    def has_driver(self, driver_id: UUID) -> bool:
+        """Check whether a strategic driver exists."""
+        return driver_id in self.driver_ids
+
+    def intents_for_driver(self, driver_id: UUID) -> int:
+        """Count strategic intents under a driver."""
+        return self.intent_count_by_driver.get(driver_id, 0)
+
+    def intent_has_commitments(self, intent_id: UUID) -> bool:
+        """Check whether any commitment primarily supports an intent."""
+        return intent_id in self.intent_ids_with_commitments
+
+
+class IndexedSnapshot(ValidationSnapshot):
+    """
+    Snapshot answered from the pyramid's lookup index.
+
+    Used by incremental validation, where a full traversal would defeat the
+    purpose. Every query is O(1) except the distribution, which is O(drivers).
+    """
+
+    def __init__(self, pyramid: StrategyPyramid):
+        self._pyramid = pyramid
+        self.vision_statement_count = len(pyramid.vision.statements) if pyramid.vision else 0
+        self.value_count = len(pyramid.values)
+        self.driver_count = len(pyramid.strategic_drivers)
+        self.intent_count = len(pyramid.strategic_intents)
+        self.commitment_count = len(pyramid.iconic_commitments)
+        self.team_objective_count = len(pyramid.team_objectives)
+        self.individual_objective_count = len(pyramid.individual_objectives)
+        self.distribution = pyramid.get_distribution_by_driver()
+
+    def has_driver(self, driver_id: UUID) -> bool:
+        """Check whether a strategic driver exists."""
+        return self._pyramid.get_driver_by_id(driver_id) is not None
+
+    def intents_for_driver(self, driver_id: UUID) -> int:
+        """Count strategic intents under a driver."""
+        return self._pyramid.count_children("intent_driver", driver_id)
+
+    def intent_has_commitments(self, intent_id: UUID) -> bool:
+        """Check whether any commitment primarily supports an intent."""
+        return self._pyramid.count_children("commitment_intent", intent_id) > 0
+
+
 class PyramidValidator:
     """
     Comprehensive validator for strategic pyramids.
 
     Runs multiple validation checks and returns detailed results.
+
+    When constructed with the ChangeTracker of the PyramidManager that owns
+    the pyramid, repeated validate_all() calls only re-evaluate the items
+    affected by changes since the previous call and reuse cached issues for
+    everything else. Results are identical to a full run.
     """
 
     # Vanilla corporate speak patterns to detect
-    VANILLA_PHRASES = [
-        "aim to", "work towards", "strive to", "endeavour to",
-        "seek to", "aspire to", "look to", "plan to",
-        "enhance", "improve", "optimise", "optimize", "leverage",
-        "synergy", "synergies", "align", "alignment", "engage with",
-        "partner with", "collaborate with", "best practice", "best practices",
-        "world-class", "excellence", "innovative", "innovation",
-        "strategic partnership", "value-add", "value added",
-        "going forward", "moving forward", "drive", "driving",
-        "empower", "empowerment", "enable", "enabling",
+    VANILLA_PHRASES = VANILLA_PHRASES
+    _vanilla_matcher = VANILLA_MATCHER
+
+    # Validation rules in reporting order: (tier, rule method).
+    # Tier None marks a pyramid-wide rule, which is always re-evaluated;
+    # otherwise the rule runs once per item of that tier ("vision" means
+    # vision statements).
+    RULES = [
+        (None, "_check_completeness"),
+        ("strategic_intents", "_check_intent_structure"),
+        ("iconic_commitments", "_check_commitment_structure"),
+        ("strategic_drivers", "_check_orphaned_driver"),
+        ("strategic_intents", "_check_orphaned_intent"),
+        ("iconic_commitments", "_check_orphaned_commitment"),
+        (None, "_check_balance"),
+        ("strategic_intents", "_check_intent_language"),
+        ("vision", "_check_vision_language"),
+        ("iconic_commitments", "_check_weighting"),
+        ("team_objectives", "_check_cascade_alignment"),
+        ("iconic_commitments", "_check_commitment_quality"),
     ]
 
-    def __init__(self, pyramid: StrategyPyramid):
+    def __init__(self, pyramid: StrategyPyramid, change_tracker: Optional["ChangeTracker"] = None):
         """
         Initialize validator.
 
         Args:
             pyramid: StrategyPyramid to validate
+            change_tracker: Optional tracker from the owning PyramidManager,
+                enabling incremental re-validation
         """
         self.pyramid = pyramid
+        self.change_tracker = change_tracker
+
+        # Incremental mode caches: item ID -> rule method -> issues, the tier
+        # each cached item belongs to, and each per-item rule's combined issues
+        self._item_issues: Dict[UUID, Dict[str, List[ValidationIssue]]] = {}
+        self._item_tiers: Dict[UUID, str] = {}
+        self._rule_issues: Dict[str, List[ValidationIssue]] = {}
+        self._synced_version: Optional[int] = None
+        self._tier_signatures: Dict[str, tuple] = {}
 
     def validate_all(self) -> ValidationResult:
         """
@@ -152,194 +285,314 @@ class PyramidValidator:
         Returns:
             ValidationResult with all issues found
         """
+        if self.change_tracker is not None:
+            return self._validate_incremental()
+
         result = ValidationResult()
+        snapshot = ValidationSnapshot(self.pyramid)
 
         # Run all validation checks
-        self._check_completeness(result)
-        self._check_structure(result)
-        self._check_orphaned_items(result)
-        self._check_balance(result)
-        self._check_language_quality(result)
-        self._check_weighting(result)
-        self._check_cascade_alignment(result)
-        self._check_commitment_quality(result)
+        for tier, rule in self.RULES:
+            check = getattr(self, rule)
+            if tier is None:
+                result.add_issues(check(snapshot))
+                continue
+            for item in self._get_tier_items(tier):
+                result.add_issues(check(item, snapshot))
 
         # Generate summary
-        result.summary = self._generate_summary()
+        result.summary = self._generate_summary(snapshot)
 
         return result
 
-    def _check_completeness(self, result: ValidationResult):
+    def _validate_incremental(self) -> ValidationResult:
+        """Re-run only the rules affected by tracked changes."""
+        changes = None
+        if self._synced_version is not None:
+            changes = self.change_tracker.changes_since(self._synced_version)
+
+        signatures = self._get_tier_signatures()
+        if changes is not None and self._has_untracked_edits(changes, signatures):
+            changes = None
+
+        if changes is None:
+            self._item_issues = {}
+            self._item_tiers = {}
+            self._rule_issues = {}
+            stale_tiers = set(signatures)
+        else:
+            stale_tiers = {change.tier for change in changes}
+            for item_id in self._get_dirty_item_ids(changes):
+                self._item_issues.pop(item_id, None)
+                tier = self._item_tiers.pop(item_id, None)
+                if tier is not None:
+                    stale_tiers.add(tier)
+        self._synced_version = self.change_tracker.version
+        self._tier_signatures = signatures
+
+        result = ValidationResult()
+        snapshot = IndexedSnapshot(self.pyramid)
+
+        for tier, rule in self.RULES:
+            check = getattr(self, rule)
+            if tier is None:
+                result.add_issues(check(snapshot))
+                continue
+            if tier in stale_tiers or rule not in self._rule_issues:
+                issues = []
+                for item in self._get_tier_items(tier):
+                    cached = self._item_issues.setdefault(item.id, {})
+                    if rule not in cached:
+                        cached[rule] = check(item, snapshot)
+                        self._item_tiers[item.id] = tier
+                    issues.extend(cached[rule])
+                self._rule_issues[rule] = issues
+            result.add_issues(self._rule_issues[rule])
+
+        result.summary = self._generate_summary(snapshot)
+
+        return result
+
+    def _get_tier_signatures(self) -> Dict[str, tuple]:
+        """Identity and length of every validated tier list."""
+        tiers = {tier for tier, _ in self.RULES if tier is not None}
+        signatures = {}
+        for tier in tiers:
+            items = self._get_tier_items(tier)
+            signatures[tier] = (id(items), len(items))
+        return signatures
+
+    def _has_untracked_edits(self, changes: List["Change"], signatures: Dict[str, tuple]) -> bool:
+        """
+        Detect edits that bypassed the PyramidManager.
+
+        A replaced tier list, or a tier whose length changed without any
+        recorded change, can't be replayed and forces a full refresh.
+        """
+        changed_tiers = {change.tier for change in changes}
+        for tier, (list_id, length) in signatures.items():
+            previous = self._tier_signatures.get(tier)
+            if previous is None or previous[0] != list_id:
+                return True
+            if tier not in changed_tiers and previous[1] != length:
+                return True
+        return False
+
+    def _get_dirty_item_ids(self, changes: List["Change"]) -> Set[UUID]:
+        """
+        Work out which items need re-validation after a set of changes.
+
+        A changed item can affect the rules of the items it references (e.g.
+        a driver's intent count) and of the items referencing it (e.g. an
+        intent pointing at a removed driver), so both neighbourhoods are
+        included along with the item itself.
+        """
+        dirty: Set[UUID] = set()
+        for change in changes:
+            if change.item_id is None:
+                dirty.update(item.id for item in self._get_tier_items(change.tier))
+                continue
+
+            dirty.add(change.item_id)
+            dirty.update(change.related_ids)
+            if change.tier not in TIER_FIELDS:
+                continue
+
+            item = self.pyramid.get_item_by_id(change.tier, change.item_id)
+            if item is not None:
+                dirty.update(referenced_ids(change.tier, item))
+            for relation in PARENT_RELATIONS[change.tier]:
+                dirty.update(child.id for child in self.pyramid.get_children(relation, change.item_id))
+
+        return dirty
+
+    def _get_tier_items(self, tier: str) -> List[Any]:
+        """Get the items a per-item rule runs over."""
+        if tier == "vision":
+            return self.pyramid.vision.statements if self.pyramid.vision else _NO_ITEMS
+        return getattr(self.pyramid, tier)
+
+    def _check_completeness(self, snapshot: ValidationSnapshot) -> List[ValidationIssue]:
         """Check if all required sections are populated."""
+        issues = []
 
         # Vision check
-        if not self.pyramid.vision or len(self.pyramid.vision.statements) == 0:
-            result.add_issue(
+        if snapshot.vision_statement_count == 0:
+            issues.append(ValidationIssue(
                 ValidationLevel.ERROR,
                 "Completeness",
                 "Vision/mission/belief statement is missing",
                 suggestion="Add your vision statement in Tier 1"
-            )
+            ))
 
         # Values check
-        if len(self.pyramid.values) == 0:
-            result.add_issue(
+        if snapshot.value_count == 0:
+            issues.append(ValidationIssue(
                 ValidationLevel.ERROR,
                 "Completeness",
                 "No values defined",
                 suggestion="Add 3-5 core values in Tier 2"
-            )
-        elif len(self.pyramid.values) < 3:
-            result.add_issue(
+            ))
+        elif snapshot.value_count < 3:
+            issues.append(ValidationIssue(
                 ValidationLevel.WARNING,
                 "Completeness",
-                f"Only {len(self.pyramid.values)} values defined. Recommended: 3-5",
+                f"Only {snapshot.value_count} values defined. Recommended: 3-5",
                 suggestion="Consider adding more values to represent what truly matters"
-            )
-        elif len(self.pyramid.values) > 5:
-            result.add_issue(
+            ))
+        elif snapshot.value_count > 5:
+            issues.append(ValidationIssue(
                 ValidationLevel.WARNING,
                 "Completeness",
-                f"{len(self.pyramid.values)} values defined. Recommended: 3-5",
+                f"{snapshot.value_count} values defined. Recommended: 3-5",
                 suggestion="Too many values can dilute focus. Consider consolidating."
-            )
+            ))
 
         # Strategic drivers check
-        if len(self.pyramid.strategic_drivers) == 0:
-            result.add_issue(
+        if snapshot.driver_count == 0:
+            issues.append(ValidationIssue(
                 ValidationLevel.ERROR,
                 "Completeness",
                 "No strategic drivers defined",
                 suggestion="Define 3-5 strategic themes/pillars in Tier 5"
-            )
-        elif len(self.pyramid.strategic_drivers) < 3:
-            result.add_issue(
+            ))
+        elif snapshot.driver_count < 3:
+            issues.append(ValidationIssue(
                 ValidationLevel.WARNING,
                 "Completeness",
-                f"Only {len(self.pyramid.strategic_drivers)} strategic drivers. Recommended: 3-5"
-            )
-        elif len(self.pyramid.strategic_drivers) > 5:
-            result.add_issue(
+                f"Only {snapshot.driver_count} strategic drivers. Recommended: 3-5"
+            ))
+        elif snapshot.driver_count > 5:
+            issues.append(ValidationIssue(
                 ValidationLevel.WARNING,
                 "Completeness",
-                f"{len(self.pyramid.strategic_drivers)} strategic drivers. Recommended: 3-5",
+                f"{snapshot.driver_count} strategic drivers. Recommended: 3-5",
                 suggestion="Too many drivers can fragment focus"
-            )
+            ))
 
         # Strategic intents check
-        if len(self.pyramid.strategic_intents) == 0:
-            result.add_issue(
+        if snapshot.intent_count == 0:
+            issues.append(ValidationIssue(
                 ValidationLevel.ERROR,
                 "Completeness",
                 "No strategic intents defined",
                 suggestion="Add aspirational statements of what success looks like in Tier 4"
-            )
+            ))
 
         # Iconic commitments check
-        if len(self.pyramid.iconic_commitments) == 0:
-            result.add_issue(
+        if snapshot.commitment_count == 0:
+            issues.append(ValidationIssue(
                 ValidationLevel.WARNING,
                 "Completeness",
                 "No iconic commitments defined",
                 suggestion="Add tangible, time-bound milestones in Tier 7"
-            )
-
-    def _check_structure(self, result: ValidationResult):
-        """Check structural integrity."""
-
-        # Check that strategic intents reference valid drivers
-        driver_ids = {d.id for d in self.pyramid.strategic_drivers}
-        for intent in self.pyramid.strategic_intents:
-            if intent.driver_id not in driver_ids:
-                result.add_issue(
-                    ValidationLevel.ERROR,
-                    "Structure",
-                    f"Strategic intent '{intent.statement[:50]}...' references non-existent driver",
-                    item_id=str(intent.id),
-                    item_type="StrategicIntent",
-                    suggestion="Update or remove this intent, or add the missing driver"
-                )
-
-        # Check that commitments reference valid drivers
-        for commitment in self.pyramid.iconic_commitments:
-            if commitment.primary_driver_id not in driver_ids:
-                result.add_issue(
-                    ValidationLevel.ERROR,
-                    "Structure",
-                    f"Iconic commitment '{commitment.name}' references non-existent primary driver",
-                    item_id=str(commitment.id),
-                    item_type="IconicCommitment",
-                    suggestion="Update the primary driver for this commitment"
-                )
-
-            # Check secondary alignments
-            for alignment in commitment.secondary_alignments:
-                if alignment.target_id not in driver_ids:
-                    result.add_issue(
-                        ValidationLevel.WARNING,
-                        "Structure",
-                        f"Iconic commitment '{commitment.name}' has secondary alignment to non-existent driver",
-                        item_id=str(commitment.id),
-                        item_type="IconicCommitment"
-                    )
-
-    def _check_orphaned_items(self, result: ValidationResult):
-        """Check for items with no connections."""
-
-        # Find drivers with no strategic intents
-        for driver in self.pyramid.strategic_drivers:
-            intents = [i for i in self.pyramid.strategic_intents if i.driver_id == driver.id]
-            if not intents:
-                result.add_issue(
-                    ValidationLevel.WARNING,
-                    "Orphaned Items",
-                    f"Strategic driver '{driver.name}' has no strategic intents",
-                    item_id=str(driver.id),
-                    item_type="StrategicDriver",
-                    suggestion="Add strategic intent statements for this driver"
-                )
-
-        # Find intents with no commitments
-        intent_ids_with_commitments = set()
-        for commitment in self.pyramid.iconic_commitments:
-            intent_ids_with_commitments.update(commitment.primary_intent_ids)
-
-        for intent in self.pyramid.strategic_intents:
-            if intent.id not in intent_ids_with_commitments:
-                result.add_issue(
-                    ValidationLevel.WARNING,
-                    "Orphaned Items",
-                    f"Strategic intent has no iconic commitments: '{intent.statement[:50]}...'",
-                    item_id=str(intent.id),
-                    item_type="StrategicIntent",
-                    suggestion="Add a tangible commitment that delivers this intent, or remove it"
-                )
-
-        # Find commitments not linked to intents
-        for commitment in self.pyramid.iconic_commitments:
-            if not commitment.primary_intent_ids:
-                result.add_issue(
+            ))
+
+        return issues
+
+    def _check_intent_structure(
+        self, intent: StrategicIntent, snapshot: ValidationSnapshot
+    ) -> List[ValidationIssue]:
+        """Check that a strategic intent references a valid driver."""
+        if snapshot.has_driver(intent.driver_id):
+            return []
+        return [ValidationIssue(
+            ValidationLevel.ERROR,
+            "Structure",
+            f"Strategic intent '{intent.statement[:50]}...' references non-existent driver",
+            item_id=str(intent.id),
+            item_type="StrategicIntent",
+            suggestion="Update or remove this intent, or add the missing driver"
+        )]
+
+    def _check_commitment_structure(
+        self, commitment: IconicCommitment, snapshot: ValidationSnapshot
+    ) -> List[ValidationIssue]:
+        """Check that a commitment references valid drivers."""
+        issues = []
+
+        if not snapshot.has_driver(commitment.primary_driver_id):
+            issues.append(ValidationIssue(
+                ValidationLevel.ERROR,
+                "Structure",
+                f"Iconic commitment '{commitment.name}' references non-existent primary driver",
+                item_id=str(commitment.id),
+                item_type="IconicCommitment",
+                suggestion="Update the primary driver for this commitment"
+            ))
+
+        # Check secondary alignments
+        for alignment in commitment.secondary_alignments:
+            if not snapshot.has_driver(alignment.target_id):
+                issues.append(ValidationIssue(
                     ValidationLevel.WARNING,
-                    "Orphaned Items",
-                    f"Iconic commitment '{commitment.name}' not linked to any strategic intent",
+                    "Structure",
+                    f"Iconic commitment '{commitment.name}' has secondary alignment to non-existent driver",
                     item_id=str(commitment.id),
-                    item_type="IconicCommitment",
-                    suggestion="Link this to the strategic intent(s) it supports"
-                )
-
-    def _check_balance(self, result: ValidationResult):
+                    item_type="IconicCommitment"
+                ))
+
+        return issues
+
+    def _check_orphaned_driver(
+        self, driver: StrategicDriver, snapshot: ValidationSnapshot
+    ) -> List[ValidationIssue]:
+        """Check for a driver with no strategic intents."""
+        if snapshot.intents_for_driver(driver.id):
+            return []
+        return [ValidationIssue(
+            ValidationLevel.WARNING,
+            "Orphaned Items",
+            f"Strategic driver '{driver.name}' has no strategic intents",
+            item_id=str(driver.id),
+            item_type="StrategicDriver",
+            suggestion="Add strategic intent statements for this driver"
+        )]
+
+    def _check_orphaned_intent(
+        self, intent: StrategicIntent, snapshot: ValidationSnapshot
+    ) -> List[ValidationIssue]:
+        """Check for an intent with no commitments."""
+        if snapshot.intent_has_commitments(intent.id):
+            return []
+        return [ValidationIssue(
+            ValidationLevel.WARNING,
+            "Orphaned Items",
+            f"Strategic intent has no iconic commitments: '{intent.statement[:50]}...'",
+            item_id=str(intent.id),
+            item_type="StrategicIntent",
+            suggestion="Add a tangible commitment that delivers this intent, or remove it"
+        )]
+
+    def _check_orphaned_commitment(
+        self, commitment: IconicCommitment, snapshot: ValidationSnapshot
+    ) -> List[ValidationIssue]:
+        """Check for a commitment not linked to intents."""
+        if commitment.primary_intent_ids:
+            return []
+        return [ValidationIssue(
+            ValidationLevel.WARNING,
+            "Orphaned Items",
+            f"Iconic commitment '{commitment.name}' not linked to any strategic intent",
+            item_id=str(commitment.id),
+            item_type="IconicCommitment",
+            suggestion="Link this to the strategic intent(s) it supports"
+        )]
+
+    def _check_balance(self, snapshot: ValidationSnapshot) -> List[ValidationIssue]:
         """Check if commitments are balanced across drivers."""
+        issues = []
 
-        if not self.pyramid.iconic_commitments or not self.pyramid.strategic_drivers:
-            return
+        if not snapshot.commitment_count or not snapshot.driver_count:
+            return issues
 
-        distribution = self.pyramid.get_distribution_by_driver()
+        distribution = snapshot.distribution
         total = sum(distribution.values())
 
         if total == 0:
-            return
+            return issues
 
-        num_drivers = len(self.pyramid.strategic_drivers)
+        num_drivers = snapshot.driver_count
         expected_percentage = 100 / num_drivers
 
         for driver_name, count in distribution.items():
@@ -347,28 +600,28 @@ class PyramidValidator:
 
             # Flag over-concentration (>50%)
             if percentage > 50:
-                result.add_issue(
+                issues.append(ValidationIssue(
                     ValidationLevel.WARNING,
                     "Balance",
                     f"Driver '{driver_name}' has {percentage:.0f}% of commitments (over-concentrated)",
                     suggestion=f"Expected roughly {expected_percentage:.0f}% per driver. "
                               f"Consider if this truly reflects your strategic priorities."
-                )
+                ))
 
             # Flag under-representation (<10% when they have some)
             elif percentage < 10 and count > 0:
-                result.add_issue(
+                issues.append(ValidationIssue(
                     ValidationLevel.INFO,
                     "Balance",
                     f"Driver '{driver_name}' has only {percentage:.0f}% of commitments (under-represented)",
                     suggestion=f"Expected roughly {expected_percentage:.0f}% per driver. "
                               f"Is this driver truly strategic, or should it have more commitments?"
-                )
+                ))
 
         # Check for drivers with zero commitments
         for driver in self.pyramid.strategic_drivers:
             if distribution.get(driver.name, 0) == 0:
-                result.add_issue(
+                issues.append(ValidationIssue(
                     ValidationLevel.WARNING,
                     "Balance",
                     f"Strategic driver '{driver.name}' has NO iconic commitments",
@@ -376,157 +629,165 @@ class PyramidValidator:
                     item_type="StrategicDriver",
                     suggestion="If this is truly strategic, add commitments. "
                               "Otherwise, consider removing this driver."
-                )
+                ))
 
-    def _check_language_quality(self, result: ValidationResult):
-        """Check for vanilla corporate speak."""
+        return issues
 
-        # Check strategic intents
-        for intent in self.pyramid.strategic_intents:
-            vanilla_count = self._count_vanilla_phrases(intent.statement)
+    def _check_intent_language(
+        self, intent: StrategicIntent, snapshot: ValidationSnapshot
+    ) -> List[ValidationIssue]:
+        """Check a strategic intent for vanilla corporate speak."""
+        issues = []
 
-            if vanilla_count > 2:
-                found_phrases = self._find_vanilla_phrases(intent.statement)
-                result.add_issue(
-                    ValidationLevel.WARNING,
+        found_phrases = self._find_vanilla_phrases(intent.statement)
+        vanilla_count = len(found_phrases)
+
+        if vanilla_count > 2:
+            issues.append(ValidationIssue(
+                ValidationLevel.WARNING,
+                "Language Quality",
+                f"Strategic intent contains {vanilla_count} corporate jargon phrases: "
+                f"'{intent.statement[:50]}...'",
+                item_id=str(intent.id),
+                item_type="StrategicIntent",
+                suggestion=f"Consider bolder language. Found: {', '.join(found_phrases[:3])}"
+            ))
+
+        # Check if it's written from stakeholder perspective
+        if not intent.is_stakeholder_voice:
+            # Look for signs it might be internal-facing
+            internal_indicators = ["we will", "we aim", "our goal", "we strive"]
+            if any(indicator in intent.statement.lower() for indicator in internal_indicators):
+                issues.append(ValidationIssue(
+                    ValidationLevel.INFO,
                     "Language Quality",
-                    f"Strategic intent contains {vanilla_count} corporate jargon phrases: "
+                    f"Strategic intent may be internal-facing rather than stakeholder voice: "
                     f"'{intent.statement[:50]}...'",
                     item_id=str(intent.id),
                     item_type="StrategicIntent",
-                    suggestion=f"Consider bolder language. Found: {', '.join(found_phrases[:3])}"
-                )
-
-            # Check if it's written from stakeholder perspective
-            if not intent.is_stakeholder_voice:
-                # Look for signs it might be internal-facing
-                internal_indicators = ["we will", "we aim", "our goal", "we strive"]
-                if any(indicator in intent.statement.lower() for indicator in internal_indicators):
-                    result.add_issue(
-                        ValidationLevel.INFO,
-                        "Language Quality",
-                        f"Strategic intent may be internal-facing rather than stakeholder voice: "
-                        f"'{intent.statement[:50]}...'",
-                        item_id=str(intent.id),
-                        item_type="StrategicIntent",
-                        suggestion="Try writing from stakeholder perspective: what will THEY experience?"
-                    )
-
-        # Check vision statements
-        if self.pyramid.vision and self.pyramid.vision.statements:
-            for stmt in self.pyramid.vision.statements:
-                vanilla_count = self._count_vanilla_phrases(stmt.statement)
-                if vanilla_count > 1:
-                    result.add_issue(
-                        ValidationLevel.INFO,
-                        "Language Quality",
-                        f"{stmt.statement_type.value.capitalize()} statement contains corporate jargon",
-                        item_id=str(stmt.id),
-                        item_type="VisionStatement",
-                        suggestion="Vision/mission/purpose should be inspiring and memorable, not corporate-speak"
-                    )
-
-    def _check_weighting(self, result: ValidationResult):
+                    suggestion="Try writing from stakeholder perspective: what will THEY experience?"
+                ))
+
+        return issues
+
+    def _check_vision_language(
+        self, stmt: VisionStatement, snapshot: ValidationSnapshot
+    ) -> List[ValidationIssue]:
+        """Check a vision statement for vanilla corporate speak."""
+        vanilla_count = self._count_vanilla_phrases(stmt.statement)
+        if vanilla_count <= 1:
+            return []
+        return [ValidationIssue(
+            ValidationLevel.INFO,
+            "Language Quality",
+            f"{stmt.statement_type.value.capitalize()} statement contains corporate jargon",
+            item_id=str(stmt.id),
+            item_type="VisionStatement",
+            suggestion="Vision/mission/purpose should be inspiring and memorable, not corporate-speak"
+        )]
+
+    def _check_weighting(
+        self, commitment: IconicCommitment, snapshot: ValidationSnapshot
+    ) -> List[ValidationIssue]:
         """Check commitment weighting for genuine strategic choice."""
-
-        for commitment in self.pyramid.iconic_commitments:
-            if not commitment.secondary_alignments:
-                # No secondary alignments - primary is 100%, all good
-                continue
-
-            # Calculate if primary is genuinely primary
-            is_valid = commitment.is_balanced_weighting(threshold=0.4)
-            if not is_valid:
-                total = commitment.get_total_weighting()
-                primary_pct = (1.0 / total) * 100
-
-                result.add_issue(
-                    ValidationLevel.WARNING,
-                    "Weighting",
-                    f"Commitment '{commitment.name}' has weak primary alignment "
-                    f"({primary_pct:.0f}% to primary driver)",
-                    item_id=str(commitment.id),
-                    item_type="IconicCommitment",
-                    suggestion="If this commitment is evenly split across drivers, "
-                              "you haven't made a strategic choice. Ask: "
-                              "Which driver would lose MOST if this failed?"
-                )
-
-    def _check_cascade_alignment(self, result: ValidationResult):
-        """Check that items properly cascade from top to bottom."""
-
-        # This is mostly covered by orphaned items check
-        # Additional check: ensure team objectives link to commitments
-        for team_obj in self.pyramid.team_objectives:
-            if not team_obj.primary_commitment_id and not team_obj.secondary_commitment_ids:
-                result.add_issue(
-                    ValidationLevel.INFO,
-                    "Cascade Alignment",
-                    f"Team objective '{team_obj.name}' not linked to any iconic commitment",
-                    item_id=str(team_obj.id),
-                    item_type="TeamObjective",
-                    suggestion="Link this to the commitment(s) it supports for clear line of sight"
-                )
-
-    def _check_commitment_quality(self, result: ValidationResult):
-        """Check quality of iconic commitments."""
-
-        for commitment in self.pyramid.iconic_commitments:
-            issues = []
-
-            # Check if time-bound
-            if not commitment.target_date:
-                issues.append("no target date")
-
-            # Check if tangible (look for action words)
-            tangible_words = [
-                "deploy", "launch", "implement", "complete", "deliver",
-                "build", "create", "establish", "achieve", "reach"
-            ]
-            has_action = any(
-                word in commitment.name.lower() or word in commitment.description.lower()
-                for word in tangible_words
-            )
-            if not has_action:
-                issues.append("may not be tangible/measurable")
-
-            # Check for vanilla language in commitment name
-            vanilla_in_name = self._count_vanilla_phrases(commitment.name)
-            if vanilla_in_name > 0:
-                issues.append("contains corporate jargon")
-
-            if issues:
-                result.add_issue(
-                    ValidationLevel.INFO,
-                    "Commitment Quality",
-                    f"Iconic commitment '{commitment.name}' quality issues: {', '.join(issues)}",
-                    item_id=str(commitment.id),
-                    item_type="IconicCommitment",
-                    suggestion="Iconic commitments should be tangible, time-bound, and measurable"
-                )
+        if not commitment.secondary_alignments:
+            # No secondary alignments - primary is 100%, all good
+            return []
+
+        # Calculate if primary is genuinely primary
+        is_valid = commitment.is_balanced_weighting(threshold=0.4)
+        if is_valid:
+            return []
+
+        total = commitment.get_total_weighting()
+        primary_pct = (1.0 / total) * 100
+
+        return [ValidationIssue(
+            ValidationLevel.WARNING,
+            "Weighting",
+            f"Commitment '{commitment.name}' has weak primary alignment "
+            f"({primary_pct:.0f}% to primary driver)",
+            item_id=str(commitment.id),
+            item_type="IconicCommitment",
+            suggestion="If this commitment is evenly split across drivers, "
+                      "you haven't made a strategic choice. Ask: "
+                      "Which driver would lose MOST if this failed?"
+        )]
+
+    def _check_cascade_alignment(
+        self, team_obj: TeamObjective, snapshot: ValidationSnapshot
+    ) -> List[ValidationIssue]:
+        """Check that a team objective cascades from a commitment."""
+        # Orphaned intents/commitments are covered by the orphaned checks
+        if team_obj.primary_commitment_id or team_obj.secondary_commitment_ids:
+            return []
+        return [ValidationIssue(
+            ValidationLevel.INFO,
+            "Cascade Alignment",
+            f"Team objective '{team_obj.name}' not linked to any iconic commitment",
+            item_id=str(team_obj.id),
+            item_type="TeamObjective",
+            suggestion="Link this to the commitment(s) it supports for clear line of sight"
+        )]
+
+    def _check_commitment_quality(
+        self, commitment: IconicCommitment, snapshot: ValidationSnapshot
+    ) -> List[ValidationIssue]:
+        """Check quality of an iconic commitment."""
+        issues = []
+
+        # Check if time-bound
+        if not commitment.target_date:
+            issues.append("no target date")
+
+        # Check if tangible (look for action words)
+        tangible_words = [
+            "deploy", "launch", "implement", "complete", "deliver",
+            "build", "create", "establish", "achieve", "reach"
+        ]
+        has_action = any(
+            word in commitment.name.lower() or word in commitment.description.lower()
+            for word in tangible_words
+        )
+        if not has_action:
+            issues.append("may not be tangible/measurable")
+
+        # Check for vanilla language in commitment name
+        vanilla_in_name = self._count_vanilla_phrases(commitment.name)
+        if vanilla_in_name > 0:
+            issues.append("contains corporate jargon")
+
+        if not issues:
+            return []
+        return [ValidationIssue(
+            ValidationLevel.INFO,
+            "Commitment Quality",
+            f"Iconic commitment '{commitment.name}' quality issues: {', '.join(issues)}",
+            item_id=str(commitment.id),
+            item_type="IconicCommitment",
+            suggestion="Iconic commitments should be tangible, time-bound, and measurable"
+        )]
 
     def _count_vanilla_phrases(self, text: str) -> int:
         """Count vanilla corporate phrases in text."""
-        text_lower = text.lower()
-        return sum(1 for phrase in self.VANILLA_PHRASES if phrase in text_lower)
+        return self._vanilla_matcher.count(text)
 
     def _find_vanilla_phrases(self, text: str) -> List[str]:
         """Find which vanilla phrases appear in text."""
-        text_lower = text.lower()
-        return [phrase for phrase in self.VANILLA_PHRASES if phrase in text_lower]
+        return self._vanilla_matcher.find(text)
 
-    def _generate_summary(self) -> Dict[str, Any]:
+    def _generate_summary(self, snapshot: ValidationSnapshot) -> Dict[str, Any]:
         """Generate validation summary."""
         return {
             "pyramid_name": self.pyramid.metadata.project_name,
             "total_items": (
-                len(self.pyramid.values) +
-                len(self.pyramid.strategic_drivers) +
-                len(self.pyramid.strategic_intents) +
-                len(self.pyramid.iconic_commitments) +
-                len(self.pyramid.team_objectives) +
-                len(self.pyramid.individual_objectives)
+                snapshot.value_count +
+                snapshot.driver_count +
+                snapshot.intent_count +
+                snapshot.commitment_count +
+                snapshot.team_objective_count +
+                snapshot.individual_objective_count
             ),
             "has_vision": self.pyramid.vision is not None,
-            "distribution": self.pyramid.get_distribution_by_driver(),
+            "distribution": dict(snapshot.distribution),
         }
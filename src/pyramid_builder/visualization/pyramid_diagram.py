@@ -205,7 +205,7 @@ class PyramidDiagram:
             parents.append("Strategic Pyramid")
 
             # Count commitments for this driver
-            commitment_count = len(self.pyramid.get_commitments_by_driver(driver.id, primary_only=True))
+            commitment_count = self.pyramid.count_children("commitment_primary_driver", driver.id)
             values.append(commitment_count if commitment_count > 0 else 0.1)  # Minimum value for visibility
             colors_list.append(driver_colors[idx % len(driver_colors)])
 
@@ -342,10 +342,8 @@ class PyramidDiagram:
 
         for driver in self.pyramid.strategic_drivers:
             driver_names.append(driver.name)
-            commitment_counts.append(len(self.pyramid.get_commitments_by_driver(driver.id, primary_only=True)))
-
-            intents = [i for i in self.pyramid.strategic_intents if i.driver_id == driver.id]
-            intent_counts.append(len(intents))
+            commitment_counts.append(self.pyramid.count_children("commitment_primary_driver", driver.id))
+            intent_counts.append(self.pyramid.count_children("intent_driver", driver.id))
 
         fig = go.Figure()
 
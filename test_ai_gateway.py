@@ -0,0 +1,256 @@
+"""
+Quick test script to verify the shared AI gateway.
+Tests that interactive calls start ahead of queued background calls, that
+the token bucket limits the request rate, that 429/5xx and connection
+errors are retried with backoff (honouring retry-after) while other errors
+are not, that a call waiting too long for its turn gives up, and that all
+AI services share one pooled client. No API calls are made.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import anthropic
+import httpx
+
+from src.pyramid_builder.ai.coach import AICoach
+from src.pyramid_builder.ai.document_extractor import DocumentExtractor
+from src.pyramid_builder.ai.gateway import (
+    BACKGROUND,
+    INTERACTIVE,
+    AIGateway,
+    AIGatewayTimeout,
+    GatewayClient,
+    TokenBucket,
+    ai_gateway,
+    gateway_client,
+    is_retryable,
+)
+
+
+class StatusError(Exception):
+    """An API error response stand-in."""
+
+    def __init__(self, status_code: int, retry_after: str = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers={"retry-after": retry_after} if retry_after else {})
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
+def test_priority_lanes():
+    """Test that interactive calls jump the background queue"""
+    print("Testing priority lanes...")
+
+    gateway = AIGateway(max_concurrency=1, requests_per_minute=None)
+    release = threading.Event()
+    started = []
+
+    def call(name, priority):
+        def work():
+            started.append(name)
+            if name == "blocker":
+                release.wait(2)
+        return threading.Thread(target=gateway.call, args=(work,), kwargs={"priority": priority})
+
+    threads = [call("blocker", BACKGROUND)]
+    threads[0].start()
+    wait_until(lambda: started == ["blocker"])
+
+    for name, priority in [("check-1", BACKGROUND), ("check-2", BACKGROUND), ("chat", INTERACTIVE)]:
+        thread = call(name, priority)
+        thread.start()
+        threads.append(thread)
+        wait_until(lambda: gateway.stats()["queued"] == len(threads) - 1)
+
+    stats = gateway.stats()
+    assert stats["in_flight"] == 1
+    assert stats["lanes"]["background"]["queued"] == 2 and stats["lanes"]["interactive"]["queued"] == 1
+
+    release.set()
+    for thread in threads:
+        thread.join(2)
+    assert started == ["blocker", "chat", "check-1", "check-2"]
+
+    stats = gateway.stats()
+    assert stats["lanes"]["background"]["calls"] == 3 and stats["lanes"]["interactive"]["calls"] == 1
+    assert stats["lanes"]["interactive"]["queue_wait_ms"]["p99"] > 0
+    assert stats["queued"] == 0 and stats["in_flight"] == 0
+
+    print("✓ Queued chat started before earlier background checks")
+
+
+def test_rate_limit():
+    """Test the token bucket"""
+    print("\nTesting token bucket...")
+
+    now = [0.0]
+    bucket = TokenBucket(rate=1.0, capacity=2, clock=lambda: now[0])
+    assert bucket.take() == 0 and bucket.take() == 0
+    assert bucket.take() == 1.0
+    now[0] = 0.5
+    assert bucket.take() == 0.5
+    now[0] = 1.0
+    assert bucket.take() == 0
+
+    # A 429 pauses the bucket, then it restarts without a burst
+    bucket.pause(10)
+    now[0] = 5.0
+    assert bucket.take() == 6.0
+    now[0] = 11.0
+    assert bucket.take() == 0 and bucket.take() > 0
+
+    # 10 requests per second with bursts of 2: 6 calls need 0.4s
+    gateway = AIGateway(max_concurrency=None, requests_per_minute=600, burst=2)
+    started = time.monotonic()
+    for _ in range(6):
+        gateway.call(lambda: None)
+    elapsed = time.monotonic() - started
+    assert 0.35 < elapsed < 1.0, f"took {elapsed:.2f}s"
+
+    print(f"✓ 6 calls at 10/s (burst 2) took {elapsed:.2f}s")
+
+
+def test_retries():
+    """Test jittered backoff and which errors are retried"""
+    print("\nTesting retries...")
+
+    sleeps = []
+    gateway = AIGateway(requests_per_minute=None, max_retries=3, base_delay=1.0, max_delay=8.0, sleep=sleeps.append)
+    failures = [StatusError(529), StatusError(429, retry_after="5"), StatusError(500)]
+
+    def flaky():
+        if failures:
+            raise failures.pop(0)
+        return "ok"
+
+    assert gateway.call(flaky, priority=BACKGROUND) == "ok"
+    # Backoff doubles with jitter; retry-after is a floor
+    assert 0.5 <= sleeps[0] <= 1.0
+    assert sleeps[1] == 5.0
+    assert 2.0 <= sleeps[2] <= 4.0
+    lane = gateway.stats()["lanes"]["background"]
+    assert lane["retries"] == 3 and lane["rate_limited"] == 1 and lane["calls"] == 1
+
+    # Out of retries: the last error is raised
+    sleeps.clear()
+    try:
+        gateway.call(lambda: (_ for _ in ()).throw(StatusError(429)))
+        assert False, "expected StatusError"
+    except StatusError:
+        pass
+    assert len(sleeps) == 3
+    assert gateway.stats()["lanes"]["interactive"]["failures"] == 1
+
+    # Client errors are not retried
+    sleeps.clear()
+    try:
+        gateway.call(lambda: (_ for _ in ()).throw(StatusError(400)))
+        assert False, "expected StatusError"
+    except StatusError:
+        pass
+    assert sleeps == []
+
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    assert is_retryable(anthropic.APIConnectionError(request=request))
+    assert not is_retryable(anthropic.APITimeoutError(request=request))
+    assert not is_retryable(ValueError("bad JSON"))
+
+    print("✓ 429/5xx retried with backoff, client errors raised at once")
+
+
+def test_queue_timeout():
+    """Test that a call gives up after waiting too long for its turn"""
+    print("\nTesting queue timeout...")
+
+    gateway = AIGateway(max_concurrency=1, requests_per_minute=None, queue_timeout=0.1)
+    release = threading.Event()
+    holder = threading.Thread(target=gateway.call, args=(lambda: release.wait(2),))
+    holder.start()
+    wait_until(lambda: gateway.stats()["in_flight"] == 1)
+
+    try:
+        gateway.call(lambda: "never")
+        assert False, "expected AIGatewayTimeout"
+    except AIGatewayTimeout:
+        pass
+    assert gateway.stats()["queued"] == 0
+
+    release.set()
+    holder.join(2)
+    assert gateway.call(lambda: "next") == "next"
+
+    print("✓ Waiting call timed out, gateway still usable")
+
+
+def test_shared_client():
+    """Test that services share one pooled client through the gateway"""
+    print("\nTesting shared client...")
+
+    first = gateway_client("test-key")
+    second = gateway_client("test-key", timeout=30)
+    assert first._client._client is second._client._client
+    assert first._client.max_retries == 0
+
+    coach = AICoach(api_key="test-key")
+    extractor = DocumentExtractor(api_key="test-key")
+    assert coach.client._client.priority == INTERACTIVE
+    assert extractor.client._client.priority == BACKGROUND
+    assert coach.client._client.gateway is ai_gateway
+
+    # Streams hold a slot until they exit; failures to open are retried
+    gateway = AIGateway(requests_per_minute=None, sleep=lambda seconds: None)
+    attempts = []
+
+    class Stream:
+        def __enter__(self):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise StatusError(529)
+            return SimpleNamespace(text_stream=iter(["Hello", " there"]))
+
+        def __exit__(self, *exc_info):
+            return False
+
+    client = GatewayClient(SimpleNamespace(messages=SimpleNamespace(stream=lambda **request: Stream())), gateway)
+    with client.messages.stream(model="m", messages=[]) as stream:
+        assert gateway.stats()["in_flight"] == 1
+        assert "".join(stream.text_stream) == "Hello there"
+    assert gateway.stats()["in_flight"] == 0 and len(attempts) == 2
+
+    print("✓ One pooled client, lanes per service, streams scheduled")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("AI GATEWAY TEST")
+    print("=" * 60)
+
+    try:
+        test_priority_lanes()
+        test_rate_limit()
+        test_retries()
+        test_queue_timeout()
+        test_shared_client()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
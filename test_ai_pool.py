@@ -0,0 +1,369 @@
+"""
+Quick test script to verify the AI call thread pool.
+Tests that blocking calls leave the event loop responsive, that concurrency
+and queue limits hold, that chat gets a thread ahead of background work,
+that slow calls time out and free their slot, that
+the timeout starts when a call gets a thread, that an abandoned call's
+response stream is closed, and that streamed calls deliver chunks as they
+are produced.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fastapi import HTTPException
+
+from api.ai_pool import BACKGROUND, AIPool
+from src.pyramid_builder.ai.gateway import AIGateway, GatewayClient
+
+
+def test_event_loop_stays_responsive():
+    """Test that blocking calls run off the event loop"""
+    print("Testing event loop responsiveness during blocking calls...")
+
+    async def run():
+        pool = AIPool(max_concurrency=2, max_queued=None, timeout=5)
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        beat = asyncio.create_task(heartbeat())
+        started = time.monotonic()
+        results = await asyncio.gather(*(pool.run(time.sleep, 0.2) for _ in range(4)))
+        elapsed = time.monotonic() - started
+        beat.cancel()
+
+        assert results == [None] * 4
+        # Two at a time: about 0.4s, not 0.2s (unbounded) or 0.8s (serial)
+        assert 0.35 < elapsed < 0.7, elapsed
+        assert ticks > 20, "Event loop was blocked"
+        assert pool.stats()["completed"] == 4
+
+    asyncio.run(run())
+
+    print("✓ Loop kept running while calls ran two at a time")
+
+
+def test_concurrency_and_queue_limits():
+    """Test the concurrency cap and rejection when saturated"""
+    print("\nTesting concurrency and queue limits...")
+
+    async def run():
+        pool = AIPool(max_concurrency=2, max_queued=1, timeout=5)
+        release = threading.Event()
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def call(value):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            release.wait()
+            with lock:
+                running -= 1
+            return value
+
+        tasks = [asyncio.create_task(pool.run(call, i)) for i in range(3)]
+        await asyncio.sleep(0.05)
+        assert pool.stats()["in_flight"] == 3
+
+        try:
+            await pool.run(call, 99)
+            raise AssertionError("Expected 503")
+        except HTTPException as e:
+            assert e.status_code == 503
+
+        release.set()
+        assert await asyncio.gather(*tasks) == [0, 1, 2]
+        assert peak == 2
+        stats = pool.stats()
+        assert stats["rejected"] == 1 and stats["in_flight"] == 0
+
+    asyncio.run(run())
+
+    print("✓ At most 2 calls ran, 1 waited, the 4th was refused")
+
+
+def test_chat_ahead_of_background_work():
+    """Test that chat submitted while background work fills the pool starts first"""
+    print("\nTesting priority admission...")
+
+    async def run():
+        started = []
+        release = threading.Event()
+
+        def call(name):
+            started.append(name)
+            if name.startswith("background"):
+                release.wait(2)
+            return name
+
+        # Background calls leave one thread free for chat
+        pool = AIPool(max_concurrency=2, max_queued=None, timeout=5)
+        assert pool.max_background == 1
+        background = [
+            asyncio.create_task(pool.run(call, f"background{i}", priority=BACKGROUND))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0.05)
+        assert started == ["background0"]
+        assert pool.stats()["queued"] == {"interactive": 0, "background": 3}
+        assert await asyncio.wait_for(pool.run(call, "chat"), 0.5) == "chat"
+        release.set()
+        await asyncio.gather(*background)
+        assert started == ["background0", "chat", "background1", "background2", "background3"]
+
+        # With every thread running background work, chat takes the next free one
+        started.clear()
+        release.clear()
+        pool = AIPool(max_concurrency=2, max_queued=None, timeout=5, reserved_interactive=0)
+        background = [
+            asyncio.create_task(pool.run(call, f"background{i}", priority=BACKGROUND))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0.05)
+        chat = asyncio.create_task(pool.run(call, "chat"))
+        await asyncio.sleep(0.05)
+        assert started == ["background0", "background1"]
+        release.set()
+        await asyncio.gather(chat, *background)
+        assert started[2] == "chat"
+
+    asyncio.run(run())
+
+    print("✓ Chat ran on the reserved thread, then ahead of queued background calls")
+
+
+def test_timeout_frees_slot():
+    """Test that a slow call gets 504 and its thread is released after"""
+    print("\nTesting call timeout...")
+
+    async def run():
+        pool = AIPool(max_concurrency=1, max_queued=0, timeout=0.05)
+        try:
+            await pool.run(time.sleep, 0.2)
+            raise AssertionError("Expected 504")
+        except HTTPException as e:
+            assert e.status_code == 504
+        assert pool.stats()["timeouts"] == 1
+
+        # The abandoned call still occupies the only thread until it ends
+        assert pool.stats()["in_flight"] == 1
+        await asyncio.sleep(0.25)
+        assert pool.stats()["in_flight"] == 0
+        assert await pool.run(lambda: "ok") == "ok"
+
+        # Errors from the call propagate unchanged
+        try:
+            await pool.run(int, "not a number")
+            raise AssertionError("Expected ValueError")
+        except ValueError:
+            pass
+
+    asyncio.run(run())
+
+    print("✓ Slow calls answered with 504 and the slot freed when done")
+
+
+def test_deadline_starts_when_running():
+    """Test that time spent waiting for a thread is not part of the timeout"""
+    print("\nTesting timeout start and queue timeout...")
+
+    async def run():
+        pool = AIPool(max_concurrency=1, max_queued=4, timeout=0.15, queue_timeout=1)
+
+        # Each call runs 0.1s; the last one waits 0.2s for the thread first
+        results = await asyncio.gather(*(pool.run(lambda i=i: time.sleep(0.1) or i) for i in range(3)))
+        assert results == [0, 1, 2]
+        assert pool.stats()["timeouts"] == 0
+
+        # A call may be given a longer budget than the pool's
+        assert await pool.run(time.sleep, 0.2, timeout=0.5) is None
+
+        # A call that waits too long for a thread is refused and never runs
+        pool.queue_timeout = 0.05
+        ran = []
+        blocker = asyncio.create_task(pool.run(time.sleep, 0.1))
+        await asyncio.sleep(0.01)
+        try:
+            await pool.run(ran.append, 1)
+            raise AssertionError("Expected 503")
+        except HTTPException as e:
+            assert e.status_code == 503
+        await blocker
+        await asyncio.sleep(0.01)
+        assert ran == []
+        stats = pool.stats()
+        assert stats["rejected"] == 1 and stats["in_flight"] == 0
+
+    asyncio.run(run())
+
+    print("✓ Queued calls not timed out, slow queues answered with 503")
+
+
+def test_abandoned_call_is_cancelled():
+    """Test that a timed-out call's response stream is closed"""
+    print("\nTesting cancellation of abandoned calls...")
+
+    gateway = AIGateway(requests_per_minute=None)
+    opened = []
+
+    class Response:
+        """SDK message stream stand-in, streaming until closed."""
+
+        def __init__(self):
+            self.closed = threading.Event()
+
+        def close(self):
+            self.closed.set()
+
+        @property
+        def text_stream(self):
+            while not self.closed.wait(0.01):
+                yield "token"
+
+    class Manager:
+        def __enter__(self):
+            opened.append(Response())
+            return opened[-1]
+
+        def __exit__(self, *exc_info):
+            return False
+
+    client = GatewayClient(SimpleNamespace(messages=SimpleNamespace(stream=lambda **request: Manager())), gateway)
+
+    def extract():
+        # Like document extraction, continue with follow-up requests
+        for _ in range(3):
+            with client.messages.stream(model="m", messages=[]) as stream:
+                for _ in stream.text_stream:
+                    pass
+
+    async def run():
+        pool = AIPool(max_concurrency=1, max_queued=0, timeout=0.05)
+        try:
+            await pool.run(extract)
+            raise AssertionError("Expected 504")
+        except HTTPException as e:
+            assert e.status_code == 504
+        await asyncio.sleep(0.1)
+        assert pool.stats()["in_flight"] == 0
+
+    asyncio.run(run())
+
+    # The open response was closed and no follow-up request was sent
+    assert len(opened) == 1 and opened[0].closed.is_set()
+    assert gateway.stats()["in_flight"] == 0
+
+    print("✓ Response closed on timeout, thread freed, no further requests")
+
+
+def test_stream_delivers_chunks_incrementally():
+    """Test open_stream: incremental chunks, TTFT, close, errors, stalls"""
+    print("\nTesting streamed calls...")
+
+    async def run():
+        pool = AIPool(max_concurrency=1, max_queued=0, timeout=1)
+        produced = []
+
+        def words(count, delay):
+            for i in range(count):
+                time.sleep(delay)
+                produced.append(i)
+                yield f"word{i}"
+
+        started = time.monotonic()
+        arrivals = []
+        stream = pool.open_stream(words, 3, 0.1)
+        async for chunk in stream:
+            arrivals.append((chunk, time.monotonic() - started))
+        assert [chunk for chunk, _ in arrivals] == ["word0", "word1", "word2"]
+        # First chunk as soon as it exists, not after the whole reply
+        assert arrivals[0][1] < 0.2 and arrivals[-1][1] >= 0.3
+        assert 90 <= stream.ttft_ms < 200 and stream.chunks == 3
+        await asyncio.sleep(0.01)
+        stats = pool.stats()
+        assert stats["streams"] == 1 and stats["in_flight"] == 0
+        assert stats["ttft_ms"]["samples"] == 1
+
+        # Closing early stops the generator and frees the thread
+        produced.clear()
+        stream = pool.open_stream(words, 50, 0.02)
+        assert await stream.__anext__() == "word0"
+        await stream.aclose()
+        await asyncio.sleep(0.1)
+        assert len(produced) < 5 and pool.stats()["in_flight"] == 0
+
+        # A saturated pool refuses the stream before it starts
+        blocker = pool.open_stream(words, 1, 0.2)
+        try:
+            pool.open_stream(words, 1, 0)
+            raise AssertionError("Expected 503")
+        except HTTPException as e:
+            assert e.status_code == 503
+        assert [chunk async for chunk in blocker] == ["word0"]
+
+        # Errors from the generator reach the consumer after earlier chunks
+        def failing():
+            yield "partial"
+            raise ValueError("stream broke")
+
+        stream = pool.open_stream(failing)
+        assert await stream.__anext__() == "partial"
+        try:
+            await stream.__anext__()
+            raise AssertionError("Expected ValueError")
+        except ValueError:
+            pass
+
+        # A stalled stream is answered with 504
+        pool.timeout = 0.05
+        stream = pool.open_stream(words, 1, 0.2)
+        try:
+            await stream.__anext__()
+            raise AssertionError("Expected 504")
+        except HTTPException as e:
+            assert e.status_code == 504
+        assert pool.stats()["timeouts"] == 1
+
+    asyncio.run(run())
+
+    print("✓ Chunks forwarded as produced, first-chunk time recorded")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("AI POOL TEST")
+    print("=" * 60)
+
+    try:
+        test_event_loop_stays_responsive()
+        test_concurrency_and_queue_limits()
+        test_chat_ahead_of_background_work()
+        test_timeout_frees_slot()
+        test_deadline_starts_when_running()
+        test_abandoned_call_is_cancelled()
+        test_stream_delivers_chunks_incrementally()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
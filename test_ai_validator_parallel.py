@@ -0,0 +1,289 @@
+"""
+Quick test script to verify parallel AI validation checks.
+Uses a fake Anthropic client with random latencies (no API key or network
+needed) and checks that the checks overlap, that issues come out in the
+same order as a sequential run, that per-check timings are reported, and
+that batched commitment alignment prompts give the same verdicts in a
+handful of calls, and that the API runs each check as its own AI pool call.
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.pyramid_builder.core.pyramid_manager import PyramidManager
+from src.pyramid_builder.models.pyramid import Horizon, StatementType
+from src.pyramid_builder.ai.response_cache import ResponseCache
+from src.pyramid_builder.validation.ai_validator import AIValidator
+from src.pyramid_builder.validation.validator import ValidationResult
+
+# Canned replies that make every check report something
+REPLIES = {
+    "commitment-to-intent": {"is_aligned": False, "confidence": "high", "explanation": "Weak link"},
+    "timeline realism": {"is_realistic": False, "message": "Too much in H1"},
+    "language boldness": {"overall_boldness": "weak", "assessment": "Timid", "weak_intents": [{"number": 1, "issue": "Vague"}]},
+    "Strategic Coherence": {"is_coherent": False, "issues": ["Drivers ignore the vision"]},
+}
+
+
+class FakeMessages:
+    """Stands in for client.messages, sleeping a random time per call."""
+
+    def __init__(self, seed: int, drop_items=(), fail_batches=False):
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        # Batch item numbers to leave out of batched replies
+        self.drop_items = set(drop_items)
+        # Raise on batched prompts, like a rate-limited API
+        self.fail_batches = fail_batches
+
+    def create(self, model, max_tokens, messages):
+        prompt = messages[0]["content"]
+        with self.lock:
+            delay = self.rng.uniform(0.02, 0.1)
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(delay)
+        with self.lock:
+            self.active -= 1
+        if self.fail_batches and "JSON array" in prompt:
+            raise RuntimeError("429 rate limited")
+        reply = next(
+            (reply for marker, reply in REPLIES.items() if marker.lower() in prompt.lower()),
+            {"is_coherent": False, "issues": ["Drivers ignore the vision"]},
+        )
+        if "JSON array" in prompt:
+            items = prompt.count("] Iconic Commitment:")
+            reply = [
+                {"item": number, **reply} for number in range(1, items + 1)
+                if number not in self.drop_items
+            ]
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=json.dumps(reply))],
+            stop_reason="end_turn",
+        )
+
+
+def build_pyramid():
+    manager = PyramidManager()
+    manager.create_new_pyramid("Parallel AI", "Test Org", "Test User")
+    manager.add_vision_statement(StatementType.VISION, "Every customer tells a friend about us")
+    driver = manager.add_strategic_driver("Customer", "Obsess over customers")
+    intents = [
+        manager.add_strategic_intent(f"Customers rave about onboarding {i}", driver.id)
+        for i in range(3)
+    ]
+    for i in range(4):
+        manager.add_iconic_commitment(
+            f"Launch programme {i}", "Deliver the programme", Horizon.H1, driver.id,
+            [intents[i % 3].id],
+        )
+    return manager.pyramid
+
+
+def make_validator(pyramid, seed: int, max_concurrent_checks=None, alignment_batch_size=1, **fake) -> AIValidator:
+    validator = AIValidator(
+        pyramid, api_key="test-key", max_concurrent_checks=max_concurrent_checks,
+        cache=ResponseCache(), alignment_batch_size=alignment_batch_size,
+    )
+    validator.client = SimpleNamespace(messages=FakeMessages(seed, **fake))
+    return validator
+
+
+def sequential_issues(validator: AIValidator):
+    """Reference: the checks one after another on one result."""
+    result = ValidationResult()
+    validator._check_strategic_coherence(result)
+    validator._check_commitment_intent_alignment(result)
+    validator._check_horizon_realism(result)
+    validator._check_language_boldness(result)
+    return [issue.to_dict() for issue in result.issues]
+
+
+def test_checks_run_concurrently_in_stable_order():
+    """Test overlap, merge order and timings"""
+    print("Testing parallel AI checks...")
+
+    pyramid = build_pyramid()
+    expected = sequential_issues(make_validator(pyramid, seed=0))
+    assert expected, "Fake replies should produce issues"
+
+    for seed in range(5):
+        validator = make_validator(pyramid, seed)
+        started = time.perf_counter()
+        result = validator.validate_with_ai(ValidationResult())
+        elapsed = time.perf_counter() - started
+
+        assert [issue.to_dict() for issue in result.issues] == expected
+        # 7 calls of up to 0.1s each, at most 4 at a time: 2 rounds at most
+        assert elapsed < 0.3, elapsed
+        assert validator.client.messages.peak == 4
+
+        timings = result.summary["ai_check_timings_ms"]
+        assert list(timings) == [
+            "strategic_coherence",
+            *[f"commitment_intent_alignment:{c.id}" for c in pyramid.iconic_commitments],
+            "horizon_realism",
+            "language_boldness",
+        ]
+        assert len(timings) == 7 and all(ms >= 20 for ms in timings.values())
+        assert validator.check_timings == timings
+
+    print("✓ Checks overlap, issues merged in check order, timings reported")
+
+
+def test_concurrency_limit():
+    """Test that max_concurrent_checks bounds calls in flight"""
+    print("\nTesting concurrency limit...")
+
+    validator = make_validator(build_pyramid(), seed=0, max_concurrent_checks=2)
+    validator.validate_with_ai(ValidationResult())
+    assert validator.client.messages.peak == 2
+
+    # Nothing to check: no calls, no timings beyond the always-on checks
+    empty = PyramidManager()
+    empty.create_new_pyramid("Empty", "Test Org", "Test User")
+    validator = make_validator(empty.pyramid, seed=0)
+    result = validator.validate_with_ai(ValidationResult())
+    assert set(result.summary["ai_check_timings_ms"]) == {
+        "strategic_coherence", "horizon_realism", "language_boldness",
+    }
+
+    print("✓ At most max_concurrent_checks calls in flight")
+
+
+def test_batched_alignment():
+    """Test batched alignment prompts against one call per commitment"""
+    print("\nTesting batched commitment alignment...")
+
+    manager = PyramidManager()
+    manager.create_new_pyramid("Batched AI", "Test Org", "Test User")
+    driver = manager.add_strategic_driver("Customer", "Obsess over customers")
+    intents = [
+        manager.add_strategic_intent(f"Customers rave about onboarding {i}", driver.id)
+        for i in range(5)
+    ]
+    for i in range(60):
+        manager.add_iconic_commitment(
+            f"Programme {i}", "Deliver the programme " * (1 + i % 7), Horizon.H2, driver.id,
+            [intents[i % 5].id],
+        )
+    pyramid = manager.pyramid
+
+    def alignment_issues(validator):
+        result = ValidationResult()
+        validator._check_commitment_intent_alignment(result)
+        return [issue.to_dict() for issue in result.issues], validator.client.messages.calls
+
+    expected, calls = alignment_issues(make_validator(pyramid, seed=0, alignment_batch_size=1))
+    assert len(expected) == 60 and calls == 60
+
+    # Automatic batch size: a handful of calls, same verdicts in the same order
+    batched = make_validator(pyramid, seed=0, alignment_batch_size=None)
+    issues, calls = alignment_issues(batched)
+    assert issues == expected
+    assert 1 < calls <= 5, calls
+
+    # Batches respect the reply budget
+    batched.ALIGNMENT_BATCH_OUTPUT_TOKENS = 1500
+    batches = batched._plan_alignment_batches(batched._get_commitments_to_align())
+    assert all(len(batch) <= 10 for _, batch in batches)
+    assert [c for _, batch in batches for c, _ in batch] == list(pyramid.iconic_commitments)
+
+    # Items missing from a batched reply are asked about one by one
+    validator = make_validator(pyramid, seed=0, alignment_batch_size=20, drop_items={3, 7})
+    issues, calls = alignment_issues(validator)
+    assert issues == expected
+    assert calls == 3 + 3 * 2
+
+    # A failed batched call skips its batch instead of one call per item
+    validator = make_validator(pyramid, seed=0, alignment_batch_size=20, fail_batches=True)
+    issues, calls = alignment_issues(validator)
+    assert issues == [] and calls == 3
+
+    # validate_with_ai runs the batches alongside the other checks
+    validator = make_validator(pyramid, seed=0, alignment_batch_size=20)
+    result = validator.validate_with_ai(ValidationResult())
+    timings = result.summary["ai_check_timings_ms"]
+    assert [name for name in timings if name.startswith("commitment")] == [
+        "commitment_intent_alignment:batch1",
+        "commitment_intent_alignment:batch2",
+        "commitment_intent_alignment:batch3",
+    ]
+    alignment = [i.to_dict() for i in result.issues if i.category == "AI: Commitment-Intent Alignment"]
+    assert alignment == expected
+    # No vision, so no coherence call: 3 batches, horizon and boldness
+    assert validator.client.messages.calls == 5
+
+    print("✓ 60 commitments checked in a handful of calls with identical results")
+
+
+def test_api_checks_share_ai_pool():
+    """Test that the API runs each check as its own AI pool call"""
+    print("\nTesting checks on the AI pool...")
+
+    import asyncio
+
+    import api.ai_pool
+    from api.ai_pool import AIPool
+    # The routers package imports every router, exporters included
+    from api.routers.validation import _validate_in_ai_pool
+
+    pyramid = build_pyramid()
+    expected = sequential_issues(make_validator(pyramid, seed=0))
+    original = api.ai_pool.ai_pool
+    try:
+        # Pool concurrency holds across checks, not per validation (two of
+        # the three threads take background calls)
+        api.ai_pool.ai_pool = pool = AIPool(max_concurrency=3, max_queued=16, timeout=5)
+        validator = make_validator(pyramid, seed=0)
+        result, skipped = asyncio.run(_validate_in_ai_pool(validator))
+        assert [issue.to_dict() for issue in result.issues] == expected
+        assert validator.client.messages.peak == 2
+        assert pool.completed == 7 and skipped == []
+        assert len(result.summary["ai_check_timings_ms"]) == 7
+
+        # Checks refused by a saturated pool are skipped, the rest kept
+        api.ai_pool.ai_pool = AIPool(max_concurrency=1, max_queued=0, timeout=5)
+        validator = make_validator(pyramid, seed=0)
+        result, skipped = asyncio.run(_validate_in_ai_pool(validator))
+        assert list(result.summary["ai_check_timings_ms"]) == ["strategic_coherence"]
+        assert len(skipped) == 6 and all("busy" in reason for _, reason in skipped)
+        assert result.issues
+    finally:
+        api.ai_pool.ai_pool = original
+
+    print("✓ One pool call per check; refused checks skipped, not a failure")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PARALLEL AI VALIDATION TEST")
+    print("=" * 60)
+
+    try:
+        test_checks_run_concurrently_in_stable_order()
+        test_concurrency_limit()
+        test_batched_alignment()
+        test_api_checks_share_ai_pool()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
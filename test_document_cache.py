@@ -0,0 +1,131 @@
+"""
+Quick test script to verify the document parse and extraction cache.
+Tests that results are keyed by file content hash (plus parse options,
+organization name and extractor fingerprint), that only successful results
+are stored, that entries persist on disk between cache instances, and that
+the size cap evicts least recently used entries.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.pyramid_builder.ai.document_cache import DocumentCache, file_hash
+from src.pyramid_builder.ai.document_extractor import DocumentExtractor
+
+PARSED = {"success": True, "format": "pdf", "num_pages": 2, "blocks": [{"page": 1, "content": "Vision"}]}
+EXTRACTED = {"success": True, "elements": {"vision": {"statement": "Be great"}}, "metadata": {"chunks": 1}}
+
+
+def test_parsed_layer():
+    """Test parse results keyed by hash, extension and options"""
+    print("Testing parsed layer...")
+
+    cache = DocumentCache()
+    deck = file_hash(b"strategy deck v1")
+    assert deck == file_hash(b"strategy deck v1") and len(deck) == 64
+
+    assert cache.get_parsed(deck, "deck.pdf", max_chars=1000) is None
+    cache.put_parsed(deck, "deck.pdf", PARSED, max_chars=1000)
+    assert cache.get_parsed(deck, "deck.pdf", max_chars=1000) == PARSED
+
+    # Renamed file, same bytes: still a hit
+    assert cache.get_parsed(deck, "Deck-copy.PDF", max_chars=1000) == PARSED
+    # Edited file, other parser or other budget: misses
+    assert cache.get_parsed(file_hash(b"strategy deck v2"), "deck.pdf", max_chars=1000) is None
+    assert cache.get_parsed(deck, "deck.docx", max_chars=1000) is None
+    assert cache.get_parsed(deck, "deck.pdf", max_chars=2000) is None
+
+    # Failures are not cached
+    failed = file_hash(b"corrupt")
+    cache.put_parsed(failed, "bad.pdf", {"success": False, "error": "Parse error"})
+    assert cache.get_parsed(failed, "bad.pdf") is None
+
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["parsed"] == {"hits": 2, "misses": 5}
+
+    print("✓ Keyed by content, extension and options")
+
+
+def test_extracted_layer():
+    """Test extraction results keyed by hashes, organization and fingerprint"""
+    print("\nTesting extracted layer...")
+
+    cache = DocumentCache()
+    hashes = [file_hash(b"one"), file_hash(b"two")]
+    cache.put_extracted(hashes, "Acme", "fp1", EXTRACTED)
+
+    assert cache.get_extracted(hashes, "Acme", "fp1") == EXTRACTED
+    assert cache.get_extracted(list(reversed(hashes)), "Acme", "fp1") is None
+    assert cache.get_extracted(hashes, "Globex", "fp1") is None
+    assert cache.get_extracted(hashes, None, "fp1") is None
+    assert cache.get_extracted(hashes, "Acme", "fp2") is None
+
+    cache.put_extracted(hashes, None, "fp1", {"success": False, "error": "Extraction failed"})
+    assert cache.get_extracted(hashes, None, "fp1") is None
+
+    # The fingerprint follows the model and the prompt
+    extractor = DocumentExtractor(api_key="test-key")
+    fingerprint = extractor.cache_fingerprint
+    assert fingerprint == DocumentExtractor(api_key="test-key").cache_fingerprint
+    extractor.extraction_instructions += "\nAlso extract risks."
+    assert extractor.cache_fingerprint != fingerprint
+
+    assert cache.stats()["extracted"] == {"hits": 1, "misses": 5}
+
+    print("✓ Keyed by file order, organization and fingerprint")
+
+
+def test_persistence_and_eviction():
+    """Test entries survive a new instance and the size cap evicts LRU"""
+    print("\nTesting persistence and eviction...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "documents.db")
+        deck = file_hash(b"deck")
+        DocumentCache(path).put_parsed(deck, "deck.pdf", PARSED)
+
+        # Another worker (or a restart) sees it
+        reopened = DocumentCache(path)
+        started = time.perf_counter()
+        assert reopened.get_parsed(deck, "deck.pdf") == PARSED
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        assert elapsed_ms < 50, f"cache hit took {elapsed_ms:.1f}ms"
+
+        big = {"success": True, "blocks": [{"content": "x" * 4000}]}
+        small = DocumentCache(os.path.join(directory, "small.db"), max_bytes=10000)
+        for name in ("a", "b", "c"):
+            small.put_parsed(file_hash(name.encode()), f"{name}.pdf", big)
+        assert small.get_parsed(file_hash(b"a"), "a.pdf") is None
+        assert small.get_parsed(file_hash(b"c"), "c.pdf") == big
+        stats = small.stats()
+        assert stats["evictions"] == 1 and stats["bytes"] <= 10000
+
+    print(f"✓ Persisted across instances (hit in {elapsed_ms:.1f}ms), LRU eviction at size cap")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("DOCUMENT CACHE TEST")
+    print("=" * 60)
+
+    try:
+        test_parsed_layer()
+        test_extracted_layer()
+        test_persistence_and_eviction()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,244 @@
+"""
+Quick test script to verify chunked extraction of long documents.
+Uses a fake Anthropic client (no API key or network needed) and checks
+that a 100-page PDF is split on page boundaries into bounded chunks, that
+the chunks are extracted concurrently, that elements found in several
+chunks are merged into one, and that the API runs each chunk as its own
+AI pool call.
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.pyramid_builder.ai.document_extractor import DocumentExtractor
+from src.pyramid_builder.ai.prompt_cache import PromptCacheStats, UsageTrackingClient
+
+
+class FakeStream:
+    """messages.stream() over a fake create() response, sent in small pieces."""
+
+    def __init__(self, response, piece=40):
+        self.response = response
+        self.piece = piece
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    @property
+    def text_stream(self):
+        text = self.response.content[0].text
+        return (text[i:i + self.piece] for i in range(0, len(text), self.piece))
+
+    def get_final_message(self):
+        return SimpleNamespace(**{"usage": None, **vars(self.response)})
+
+
+class PageReader:
+    """
+    Fake client.messages reporting the values named on the pages it is sent.
+    Every page names the value "Trust"; page N also names "Value N".
+    """
+
+    def __init__(self, latency=0.1, fail_on_page=None, slow_page=None):
+        self.latency = latency
+        self.fail_on_page = fail_on_page
+        self.slow_page = slow_page
+        self.prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create(self, **request):
+        prompt = request["messages"][0]["content"]
+        with self._lock:
+            self.prompts.append(prompt)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        pages = [int(n) for n in re.findall(r"^\[Page (\d+)\]$", prompt, re.MULTILINE)]
+        time.sleep(self.latency * (10 if self.slow_page in pages else 1))
+        with self._lock:
+            self.in_flight -= 1
+
+        if self.fail_on_page in pages:
+            text = "not json"
+        else:
+            values = [{"name": f"Value {n}", "description": "", "confidence": "MEDIUM", "source_quote": f"page {n}"} for n in pages]
+            values.append({"name": "trust!", "description": "", "confidence": "LOW", "source_quote": "first"})
+            values.append({"name": "Trust", "description": "Keep promises", "confidence": "HIGH", "source_quote": "x"})
+            text = json.dumps({
+                "context": {"socc_items": [{"quadrant": "strength", "title": "Loyal customers", "tags": [f"p{pages[0]}"]}]},
+                "vision": {"statement": f"Vision from page {pages[0]}", "confidence": "HIGH" if 40 in pages else "MEDIUM"},
+                "values": values,
+                "extraction_summary": {"extraction_completeness": "MEDIUM", "missing_elements": ["Enablers", f"Part {pages[0]}"]},
+            })
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)], stop_reason="end_turn")
+
+    def stream(self, **request):
+        return FakeStream(self.create(**request))
+
+
+def make_extractor(messages, **kwargs):
+    extractor = DocumentExtractor(api_key="test-key", **kwargs)
+    extractor.client = UsageTrackingClient(SimpleNamespace(messages=messages), PromptCacheStats())
+    return extractor
+
+
+def pdf(pages: int, page_length=3000):
+    body = "Our customers trust us to deliver. " * (page_length // 35)
+    return {
+        "success": True,
+        "format": "pdf",
+        "blocks": [{"page": n, "content": f"Value {n} matters.\n{body}"} for n in range(1, pages + 1)],
+    }
+
+
+def test_short_document_single_request():
+    """Test that documents under the limit are sent whole, as before"""
+    print("Testing short document...")
+
+    messages = PageReader(latency=0)
+    result = make_extractor(messages).extract_pyramid_elements(pdf(5), organization_name="Acme")
+
+    assert result["success"]
+    assert len(messages.prompts) == 1
+    assert "part 1 of" not in messages.prompts[0]
+    assert result["metadata"] == {"document_format": "pdf", "document_length": result["metadata"]["document_length"],
+                                  "organization_name": "Acme"}
+    assert len(result["elements"]["values"]) == 7
+
+    print("✓ One request, unchanged result shape")
+
+
+def test_long_document_chunked():
+    """Test splitting, concurrency and merging for a 100-page PDF"""
+    print("\nTesting 100-page document...")
+
+    messages = PageReader(latency=0.2)
+    extractor = make_extractor(messages)
+    started = time.perf_counter()
+    result = extractor.extract_pyramid_elements(pdf(100))
+    elapsed = time.perf_counter() - started
+
+    assert result["success"], result.get("error")
+    chunks = result["metadata"]["chunks"]
+    assert result["metadata"]["document_length"] > 300000
+    assert len(messages.prompts) == chunks >= 7
+
+    # Every page sent exactly once, chunks start on a page and stay in bounds
+    sent = [int(n) for p in messages.prompts for n in re.findall(r"^\[Page (\d+)\]$", p, re.MULTILINE)]
+    assert sorted(sent) == list(range(1, 101))
+    for prompt in messages.prompts:
+        content = prompt.split("=== DOCUMENT CONTENT ===\n")[1].split("\n=== END DOCUMENT ===")[0]
+        assert content.startswith("[Page ") and len(content) <= extractor.MAX_DOCUMENT_LENGTH
+        assert f"of {chunks} of a" in prompt
+
+    # Bounded concurrency, well under the sequential time
+    assert 1 < messages.max_in_flight <= extractor.MAX_CONCURRENT_CHUNKS
+    assert elapsed < chunks * 0.2 * 0.6
+
+    # One "Trust" despite a mention in every chunk; highest confidence kept
+    elements = result["elements"]
+    names = [value["name"] for value in elements["values"]]
+    assert names.count("Trust") + names.count("trust!") == 1
+    trust = next(value for value in elements["values"] if value["name"] == "Trust")
+    assert trust["confidence"] == "HIGH" and trust["description"] == "Keep promises"
+    assert len(elements["values"]) == 101
+
+    socc = elements["context"]["socc_items"]
+    assert len(socc) == 1 and len(socc[0]["tags"]) == chunks
+    assert elements["vision"]["confidence"] == "HIGH" and "page" in elements["vision"]["statement"]
+    assert elements["extraction_summary"]["missing_elements"] == ["Enablers"]
+
+    print(f"✓ {chunks} chunks in {elapsed:.2f}s, {len(names)} distinct values")
+
+
+def test_failed_chunk_reported():
+    """Test that one failed chunk keeps the rest and is reported"""
+    print("\nTesting a failed chunk...")
+
+    messages = PageReader(latency=0, fail_on_page=50)
+    result = make_extractor(messages).extract_pyramid_elements(pdf(100))
+
+    assert result["success"]
+    failed = result["metadata"]["failed_chunks"]
+    assert len(failed) == 1 and "JSON" in failed[0]["error"]
+    assert "could not be extracted" in result["elements"]["extraction_summary"]["notes"]
+    assert "Value 50" not in [value["name"] for value in result["elements"]["values"]]
+    assert "Value 1" in [value["name"] for value in result["elements"]["values"]]
+
+    # Oversized single sections are cut at line breaks
+    extractor = make_extractor(PageReader(latency=0))
+    text = "\n".join(f"Line {i} " + "x" * 90 for i in range(2000))
+    chunks = extractor._split_into_chunks(text)
+    assert "".join(chunks) == text
+    assert all(len(chunk) <= extractor.MAX_DOCUMENT_LENGTH for chunk in chunks)
+    assert all(chunk.endswith("\n") for chunk in chunks[:-1])
+
+    print("✓ Partial results kept, failure listed in metadata")
+
+
+def test_api_chunks_share_ai_pool():
+    """Test that the API runs each chunk as its own AI pool call"""
+    print("\nTesting chunks on the AI pool...")
+
+    import asyncio
+
+    import api.ai_pool
+    from api.ai_pool import AIPool
+    # The routers package imports every router, exporters included
+    from api.routers import documents
+    from api.routers.documents import _extract_in_ai_pool
+
+    messages = PageReader(latency=0.1, slow_page=50)
+    extractor = make_extractor(messages)
+    original = api.ai_pool.ai_pool, documents.AI_EXTRACTION_TIMEOUT
+    # Chunks get the extraction budget, not the (here too short) default one
+    api.ai_pool.ai_pool = pool = AIPool(max_concurrency=2, max_queued=16, timeout=0.05)
+    documents.AI_EXTRACTION_TIMEOUT = 0.5
+    try:
+        result = asyncio.run(_extract_in_ai_pool(extractor, pdf(100), None))
+    finally:
+        api.ai_pool.ai_pool, documents.AI_EXTRACTION_TIMEOUT = original
+
+    # Pool concurrency holds across chunks; the slow chunk times out alone
+    assert messages.max_in_flight <= 2
+    assert pool.completed >= result["metadata"]["chunks"] - 1
+    assert result["success"]
+    failed = result["metadata"]["failed_chunks"]
+    assert len(failed) == 1 and "timed out" in failed[0]["error"]
+    assert "Value 1" in [value["name"] for value in result["elements"]["values"]]
+
+    print("✓ One pool call per chunk; a timed-out chunk is reported, not a 504")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("DOCUMENT CHUNKING TEST")
+    print("=" * 60)
+
+    try:
+        test_short_document_single_request()
+        test_long_document_chunked()
+        test_failed_chunk_reported()
+        test_api_chunks_share_ai_pool()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
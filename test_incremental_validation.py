@@ -0,0 +1,163 @@
+"""
+Quick test script to verify incremental validation.
+Applies random sequences of manager mutations and checks that the
+change-tracked validator always matches a from-scratch validation run.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.pyramid_builder.core.pyramid_manager import PyramidManager
+from src.pyramid_builder.models.pyramid import Horizon, StatementType, Value
+from src.pyramid_builder.validation.validator import PyramidValidator
+
+PHRASES = [
+    "Customers tell their friends about us",
+    "We will leverage synergies to drive excellence",
+    "We aim to enhance and optimise our world-class platform",
+    "Launch the new partner portal",
+    "Deliver onboarding to every region",
+    "Engage with stakeholders going forward",
+]
+
+
+def assert_matches_full_run(manager: PyramidManager):
+    """Incremental result must equal a fresh validator's result."""
+    incremental = manager.get_validator().validate_all().to_dict()
+    full = PyramidValidator(manager.pyramid).validate_all().to_dict()
+    assert incremental == full, "Incremental validation diverged from full run"
+
+
+def random_mutation(manager: PyramidManager, rng: random.Random):
+    """Apply one random add/update/remove through the manager."""
+    pyramid = manager.pyramid
+    drivers = pyramid.strategic_drivers
+    intents = pyramid.strategic_intents
+    commitments = pyramid.iconic_commitments
+    teams = pyramid.team_objectives
+    text = rng.choice(PHRASES)
+    action = rng.randrange(14)
+
+    if action == 0:
+        manager.add_strategic_driver(f"Driver {rng.randrange(100)}", text)
+    elif action == 1 and drivers:
+        manager.add_strategic_intent(text, rng.choice(drivers).id)
+    elif action == 2 and drivers:
+        manager.add_iconic_commitment(
+            text, rng.choice(PHRASES), rng.choice(list(Horizon)),
+            rng.choice(drivers).id,
+            [i.id for i in rng.sample(intents, min(len(intents), rng.randrange(3)))],
+            target_date=rng.choice([None, "Q4 2026"]),
+        )
+    elif action == 3 and commitments:
+        manager.add_team_objective(
+            text, "Team contribution", "Team", primary_commitment_id=rng.choice(commitments).id
+        )
+    elif action == 4:
+        manager.add_value(f"Value {rng.randrange(100)}")
+    elif action == 5:
+        manager.add_vision_statement(rng.choice(list(StatementType)), text)
+    elif action == 6 and intents and drivers:
+        manager.update_strategic_intent(
+            rng.choice(intents).id, statement=text, driver_id=rng.choice(drivers).id
+        )
+    elif action == 7 and commitments and drivers:
+        manager.update_iconic_commitment(
+            rng.choice(commitments).id, name=text,
+            primary_driver_id=rng.choice(drivers).id,
+            primary_intent_ids=[i.id for i in rng.sample(intents, min(len(intents), rng.randrange(2)))],
+        )
+    elif action == 8 and commitments and len(drivers) > 1:
+        commitment = rng.choice(commitments)
+        candidates = [d for d in drivers if d.id != commitment.primary_driver_id]
+        manager.add_secondary_alignment_to_commitment(
+            commitment.id, rng.choice(candidates).id, weighting=rng.choice([0.2, 0.9, 1.0])
+        )
+    elif action == 9 and drivers:
+        manager.remove_strategic_driver(rng.choice(drivers).id)
+    elif action == 10 and intents:
+        manager.remove_strategic_intent(rng.choice(intents).id)
+    elif action == 11 and commitments:
+        manager.remove_iconic_commitment(rng.choice(commitments).id)
+    elif action == 12 and teams:
+        manager.remove_team_objective(rng.choice(teams).id)
+    elif action == 13 and pyramid.vision and pyramid.vision.statements:
+        manager.update_vision_statement(rng.choice(pyramid.vision.statements).id, statement=text)
+
+
+def test_random_mutations_match_full_validation():
+    """Test incremental results against full runs after every mutation"""
+    print("Testing incremental validation against full runs...")
+
+    for seed in range(40):
+        rng = random.Random(seed)
+        manager = PyramidManager()
+        manager.create_new_pyramid("Incremental Test", "Test Org", "Test User")
+        assert_matches_full_run(manager)
+
+        for _ in range(60):
+            random_mutation(manager, rng)
+            assert_matches_full_run(manager)
+
+    print("✓ Incremental validation matches full runs across 40 random histories")
+
+
+def test_untracked_edits_force_full_refresh():
+    """Test that edits bypassing the manager are still picked up"""
+    print("\nTesting edits that bypass the manager...")
+
+    manager = PyramidManager()
+    manager.create_new_pyramid("Incremental Test", "Test Org", "Test User")
+    for name in ["Trust", "Bold", "Curious"]:
+        manager.add_value(name)
+    assert_matches_full_run(manager)
+
+    manager.pyramid.values.append(Value(name="Direct"))
+    assert_matches_full_run(manager)
+
+    manager.pyramid.values = manager.pyramid.values[:1]
+    assert_matches_full_run(manager)
+
+    print("✓ Direct list edits trigger a full refresh")
+
+
+def test_validator_follows_pyramid_replacement():
+    """Test that a new or loaded pyramid gets a fresh validator"""
+    print("\nTesting pyramid replacement...")
+
+    manager = PyramidManager()
+    manager.create_new_pyramid("First", "Test Org", "Test User")
+    first = manager.get_validator()
+    assert manager.get_validator() is first
+
+    manager.create_new_pyramid("Second", "Test Org", "Test User")
+    second = manager.get_validator()
+    assert second is not first
+    assert second.validate_all().summary["pyramid_name"] == "Second"
+
+    print("✓ Validator rebound after pyramid replacement")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("INCREMENTAL VALIDATION TEST")
+    print("=" * 60)
+
+    try:
+        test_random_mutations_match_full_validation()
+        test_untracked_edits_force_full_refresh()
+        test_validator_follows_pyramid_replacement()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
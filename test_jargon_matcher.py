@@ -0,0 +1,82 @@
+"""
+Quick test script to verify the compiled jargon phrase matcher.
+Tests that it agrees with plain per-phrase substring checks, including
+nested and overlapping phrases, for every shared phrase list.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.pyramid_builder.models.jargon import (
+    INTENT_VANILLA_PHRASES,
+    JARGON_KEYWORDS,
+    VANILLA_PHRASES,
+    PhraseMatcher,
+)
+
+
+def substring_matches(phrases, text):
+    """Reference implementation: one substring search per phrase."""
+    text_lower = text.lower()
+    return [phrase for phrase in phrases if phrase.lower() in text_lower]
+
+
+def test_matches_substring_semantics():
+    """Test the matcher against per-phrase substring checks"""
+    print("Testing matcher against substring checks...")
+
+    rng = random.Random(0)
+    for phrases in [VANILLA_PHRASES, INTENT_VANILLA_PHRASES, JARGON_KEYWORDS]:
+        matcher = PhraseMatcher(phrases)
+        fragments = phrases + ["customers", "every", "region", " ", "-", "ment", "s", "TO"]
+        for _ in range(2000):
+            # Glue fragments with and without spaces to create overlaps
+            text = "".join(
+                rng.choice(fragments) + rng.choice(["", " "])
+                for _ in range(rng.randrange(12))
+            )
+            assert matcher.find(text) == substring_matches(phrases, text), text
+            assert matcher.count(text) == len(substring_matches(phrases, text))
+
+    print("✓ Matcher agrees with substring checks")
+
+
+def test_nested_and_overlapping_phrases():
+    """Test phrases that share a start or overlap each other"""
+    print("\nTesting nested and overlapping phrases...")
+
+    matcher = PhraseMatcher(VANILLA_PHRASES)
+    assert matcher.find("Drive ALIGNMENT with best practices") == [
+        "align", "alignment", "best practice", "best practices", "drive",
+    ]
+    # "enhance" overlaps the start of "excellence"
+    assert matcher.find("enhancexcellence") == ["enhance", "excellence"]
+    assert matcher.find("Customers rave about us") == []
+    assert matcher.find("") == []
+    assert PhraseMatcher([]).find("anything") == []
+
+    print("✓ Nested and overlapping phrases all reported")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("JARGON MATCHER TEST")
+    print("=" * 60)
+
+    try:
+        test_matches_substring_semantics()
+        test_nested_and_overlapping_phrases()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
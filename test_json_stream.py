@@ -0,0 +1,169 @@
+"""
+Quick test script to verify tolerant JSON parsing of AI responses.
+Tests that JSON is found inside fences and prose, that streamed text is
+parsed incrementally, that truncated responses yield their complete
+elements, and that document extraction continues a response cut off at
+max_tokens instead of failing (fake client, no API key needed).
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.pyramid_builder.ai.json_stream import IncrementalJSONParser, parse_json_response
+from test_document_chunking import FakeStream, make_extractor
+
+
+def test_fences_and_prose():
+    """Test that the JSON value is found around markdown and prose"""
+    print("Testing fences and prose...")
+
+    value = {"has_jargon": True, "jargon_words": ["leverage"], "note": "a ```fence``` {inside}"}
+    text = json.dumps(value)
+    assert parse_json_response(text) == value
+    assert parse_json_response(f"```json\n{text}\n```") == value
+    assert parse_json_response(f"Here is the analysis:\n```\n{text}\n```\nHope it helps!") == value
+    assert parse_json_response('[{"item": 1}]') == [{"item": 1}]
+
+    for bad in ["No JSON here", ""]:
+        try:
+            parse_json_response(bad)
+            assert False, "expected JSONDecodeError"
+        except json.JSONDecodeError:
+            pass
+
+    print("✓ Fenced, bare and embedded JSON parsed")
+
+
+def test_incremental_feed():
+    """Test that text fed in pieces parses like the whole"""
+    print("\nTesting incremental parsing...")
+
+    value = {"values": [{"name": f"Value {i}", "quote": 'say "hi", {ok}'} for i in range(20)], "done": True}
+    text = "```json\n" + json.dumps(value, indent=2) + "\n```"
+    for size in (1, 3, 64):
+        parser = IncrementalJSONParser()
+        for i in range(0, len(text), size):
+            parser.feed(text[i:i + size])
+        assert parser.complete and parser.value() == value
+        assert parser.text == text
+
+    print("✓ Same result for 1, 3 and 64 character pieces")
+
+
+def test_truncation_salvage():
+    """Test that truncated responses keep their complete elements"""
+    print("\nTesting truncation salvage...")
+
+    assert parse_json_response('{"values": [{"name": "Trust"}, {"name": "Curio') == {"values": [{"name": "Trust"}]}
+    # Elements of arrays are whole or dropped; other objects keep complete members
+    assert parse_json_response('[{"item": 1}, {"item": 2, "is_aligned": tr') == [{"item": 1}]
+    assert parse_json_response('{"summary": {"confidence": "HIGH", "notes": "cut') == {"summary": {"confidence": "HIGH"}}
+    assert parse_json_response('{"vision": {"statement": "X"}, "values": [') == {"vision": {"statement": "X"}, "values": []}
+
+    parser = IncrementalJSONParser()
+    parser.feed('{"a": [1, 2')
+    assert not parser.complete and parser.value() == {"a": [1]}
+
+    # Every prefix of random documents salvages to valid JSON
+    random.seed(7)
+
+    def generate(depth=0):
+        roll = random.random()
+        if depth > 3 or roll < 0.3:
+            return random.choice([1, -2.5, True, None, 'x,}]\\"y', ""])
+        if roll < 0.65:
+            return [generate(depth + 1) for _ in range(random.randint(0, 4))]
+        return {f"k{i}": generate(depth + 1) for i in range(random.randint(0, 4))}
+
+    for _ in range(100):
+        value = {"root": generate()}
+        text = json.dumps(value, indent=random.choice([None, 2]))
+        for cut in range(1, len(text)):
+            assert isinstance(parse_json_response(text[:cut]), dict)
+        assert parse_json_response(text) == value
+
+    print("✓ Complete elements kept from every truncation point")
+
+
+class TruncatingWriter:
+    """
+    Fake client.messages writing one reply `limit` characters per request;
+    a request with an assistant prefill continues after it.
+    """
+
+    def __init__(self, reply: str, limit: int):
+        self.reply = reply
+        self.limit = limit
+        self.requests = []
+
+    def stream(self, **request):
+        self.requests.append(request)
+        messages = request["messages"]
+        prefill = messages[-1]["content"] if messages[-1]["role"] == "assistant" else ""
+        assert self.reply.startswith(prefill) and prefill == prefill.rstrip()
+        rest = self.reply[len(prefill):]
+        return FakeStream(SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=rest[:self.limit])],
+            stop_reason="max_tokens" if len(rest) > self.limit else "end_turn",
+        ), piece=7)
+
+
+def test_extraction_continues():
+    """Test that extraction continues truncated responses, then salvages"""
+    print("\nTesting extraction continuation...")
+
+    values = [{"name": f"Value {i}", "description": "We mean it", "confidence": "HIGH"} for i in range(30)]
+    elements = {"vision": {"statement": "Loved by customers"}, "values": values,
+                "extraction_summary": {"notes": "Clear document"}}
+    reply = json.dumps(elements, indent=2)
+    parsed = {"success": True, "format": "docx", "blocks": [{"type": "paragraph", "content": "Our values. " * 20}]}
+
+    # Cut off twice, completed by the second continuation
+    messages = TruncatingWriter(reply, limit=len(reply) // 3 + 1)
+    result = make_extractor(messages).extract_pyramid_elements(parsed)
+    assert result["success"] and result["elements"] == elements
+    assert len(messages.requests) == 3
+    assert messages.requests[0]["messages"][0] == messages.requests[2]["messages"][0]
+
+    # Out of continuations: the complete values are kept and noted
+    messages = TruncatingWriter(reply, limit=len(reply) // 6)
+    result = make_extractor(messages).extract_pyramid_elements(parsed)
+    assert result["success"] and len(messages.requests) == 3
+    kept = result["elements"]["values"]
+    assert 0 < len(kept) < len(values) and kept == values[:len(kept)]
+    assert "cut off" in result["elements"]["extraction_summary"]["notes"]
+
+    # Nothing complete at all: reported as truncated, as before
+    messages = TruncatingWriter('{"notes": "' + "x" * 1000 + '"}', limit=50)
+    result = make_extractor(messages).extract_pyramid_elements(parsed)
+    assert not result["success"] and "truncated" in result["error"]
+
+    print("✓ Continued after max_tokens; complete elements kept when out of continuations")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TOLERANT JSON PARSING TEST")
+    print("=" * 60)
+
+    try:
+        test_fences_and_prose()
+        test_incremental_feed()
+        test_truncation_salvage()
+        test_extraction_continues()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,155 @@
+"""
+Quick test script to verify the mock Anthropic server used by the AI benchmark.
+Tests that the real SDK gets canned replies chosen by prompt marker, both
+plain and streamed, that the latency model is applied, and that injected
+429s are retried by the AI gateway.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import anthropic
+
+from benchmarks.mock_anthropic import LatencyModel, MockAnthropicServer
+from src.pyramid_builder.ai.gateway import AIGateway, GatewayClient
+
+
+def make_client(server: MockAnthropicServer) -> anthropic.Anthropic:
+    return anthropic.Anthropic(api_key="test-key", base_url=server.url, max_retries=0)
+
+
+def ask(client, prompt: str, **kwargs):
+    return client.messages.create(
+        model="claude-sonnet-4-20250514",
+        max_tokens=500,
+        messages=[{"role": "user", "content": prompt}],
+        **kwargs,
+    )
+
+
+def test_canned_replies():
+    """Test that replies are chosen by prompt marker"""
+    print("Testing canned replies...")
+
+    with MockAnthropicServer() as server:
+        client = make_client(server)
+
+        reply = json.loads(ask(client, 'Respond with JSON: {"is_coherent": true/false}').content[0].text)
+        assert "is_coherent" in reply
+
+        batch = ask(client, (
+            "[1] Iconic Commitment: A\n[2] Iconic Commitment: B\n[3] Iconic Commitment: C\n"
+            "Respond with a JSON array holding one object per commitment"
+        ))
+        items = json.loads(batch.content[0].text)
+        assert [item["item"] for item in items] == [1, 2, 3]
+
+        chat = ask(client, "How is my strategy looking?")
+        assert chat.content[0].text and chat.usage.output_tokens > 0
+
+        stats = server.stats()
+        assert stats["requests"] == 3 and stats["by_marker"]["default"] == 1
+
+    with MockAnthropicServer(responses={"ping": "pong"}) as server:
+        assert ask(make_client(server), "ping").content[0].text == "pong"
+
+    print("✓ Marker-matched replies, custom replies tried first")
+
+
+def test_streaming():
+    """Test that streamed replies arrive as text deltas"""
+    print("\nTesting streaming...")
+
+    with MockAnthropicServer(chunk_interval=0) as server:
+        client = make_client(server)
+        with client.messages.stream(
+            model="claude-sonnet-4-20250514",
+            max_tokens=500,
+            messages=[{"role": "user", "content": "Tell me about my pyramid"}],
+        ) as stream:
+            fragments = list(stream.text_stream)
+            final = stream.get_final_message()
+
+        assert len(fragments) > 1
+        assert "".join(fragments) == final.content[0].text
+        assert server.stats()["streams"] == 1
+
+    print(f"✓ Streamed {len(fragments)} fragments")
+
+
+def test_latency():
+    """Test the latency model"""
+    print("\nTesting latency...")
+
+    assert LatencyModel("fixed:0.2").sample() == 0.2
+    samples = [LatencyModel("uniform:0.1,0.3").sample() for _ in range(100)]
+    assert all(0.1 <= s <= 0.3 for s in samples)
+    assert all(s > 0 for s in (LatencyModel("lognormal:0.2,0.5").sample() for _ in range(100)))
+    try:
+        LatencyModel("gaussian:1")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+    with MockAnthropicServer(latency="fixed:0.2") as server:
+        started = time.perf_counter()
+        ask(make_client(server), "Hello")
+        assert time.perf_counter() - started >= 0.2
+
+    print("✓ Replies delayed as specified")
+
+
+def test_injected_errors_retried():
+    """Test that injected 429s reach the gateway and are retried"""
+    print("\nTesting error injection...")
+
+    with MockAnthropicServer(error_rate=1.0) as server:
+        try:
+            ask(make_client(server), "Hello")
+            assert False, "expected RateLimitError"
+        except anthropic.RateLimitError as e:
+            assert e.response.headers["retry-after"] == "1"
+
+        # The first retry succeeds
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            server.error_rate = 0.0
+
+        gateway = AIGateway(requests_per_minute=None, max_retries=2, sleep=sleep)
+        reply = ask(GatewayClient(make_client(server), gateway), "Hello")
+
+        assert reply.content[0].text
+        assert len(sleeps) == 1 and sleeps[0] >= 1
+        assert server.stats()["errors"] == 2
+        assert gateway.stats()["lanes"]["interactive"]["retries"] == 1
+
+    print("✓ 429 with retry-after, retried after the advertised delay")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MOCK ANTHROPIC SERVER TEST")
+    print("=" * 60)
+
+    try:
+        test_canned_replies()
+        test_streaming()
+        test_latency()
+        test_injected_errors_retried()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,113 @@
+"""
+Quick test script to verify the document parsing process pool.
+Tests that files are parsed in parallel and yielded as each finishes, that
+parser errors become error results, and that a file exceeding the timeout
+is reported without holding up the rest or later uploads.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from api.parse_pool import ParsePool
+
+
+def slow_parse(file_content: bytes, filename: str):
+    """Stand-in parser (runs in a worker process): sleeps as long as the file says."""
+    time.sleep(float(file_content))
+    if filename.startswith("corrupt"):
+        raise ValueError("not a PDF")
+    return {"success": True, "format": "pdf", "blocks": [{"page": 1, "content": filename}]}
+
+
+async def parse_all(pool, files):
+    started = time.monotonic()
+    results = []
+    async for index, result in pool.parse_each(files):
+        results.append((index, result, round(time.monotonic() - started, 2)))
+    return results, time.monotonic() - started
+
+
+def test_parallel_parsing():
+    """Test that an upload takes about as long as its slowest file"""
+    print("Testing parallel parsing...")
+
+    pool = ParsePool(parse=slow_parse, max_workers=5, timeout=10)
+    # Start the worker processes first; spawning is a one-off cost
+    asyncio.run(parse_all(pool, [(f"warm{i}.pdf", b"0") for i in range(5)]))
+
+    files = [("a.pdf", b"0.8"), ("b.pdf", b"0.2"), ("c.pdf", b"0.5"), ("d.pdf", b"0.1"), ("e.pdf", b"0.3")]
+    results, elapsed = asyncio.run(parse_all(pool, files))
+
+    assert sorted(index for index, _, _ in results) == [0, 1, 2, 3, 4]
+    # Yielded as each finishes, not in upload order
+    assert [index for index, _, _ in results] == [3, 1, 4, 2, 0]
+    assert results[0][2] < 0.5
+    assert all(result["success"] for _, result, _ in results)
+    assert elapsed < 1.5, f"took {elapsed:.2f}s, sum of files is 1.9s"
+
+    print(f"✓ 5 files in {elapsed:.2f}s (slowest 0.8s, sum 1.9s)")
+
+
+def test_parser_errors_reported():
+    """Test that an exception in the parser becomes an error result"""
+    print("\nTesting parser errors...")
+
+    pool = ParsePool(parse=slow_parse, max_workers=2, timeout=10)
+    results, _ = asyncio.run(parse_all(pool, [("corrupt.pdf", b"0"), ("fine.pdf", b"0.1")]))
+    by_index = {index: result for index, result, _ in results}
+
+    assert by_index[0] == {"success": False, "error": "Parse error: not a PDF"}
+    assert by_index[1]["success"]
+    assert pool.stats()["failed"] == 1 and pool.stats()["parsed"] == 1
+
+    print("✓ Failed file reported, the other parsed")
+
+
+def test_timeout():
+    """Test per-file timeouts and recovery"""
+    print("\nTesting per-file timeout...")
+
+    pool = ParsePool(parse=slow_parse, max_workers=2, timeout=1.5)
+    asyncio.run(parse_all(pool, [("warm.pdf", b"0"), ("warm2.pdf", b"0")]))
+
+    # Three files on two workers: the queued one gets its full allowance
+    files = [("stuck.pdf", b"30"), ("quick.pdf", b"1"), ("queued.pdf", b"1")]
+    results, elapsed = asyncio.run(parse_all(pool, files))
+    by_index = {index: result for index, result, _ in results}
+
+    assert by_index[0] == {"success": False, "error": "Parsing timed out after 1.5s"}
+    assert by_index[1]["success"] and by_index[2]["success"]
+    assert elapsed < 5
+    assert pool.stats()["timeouts"] == 1 and pool.stats()["restarts"] == 1
+
+    # The stuck worker is gone; new uploads get a fresh pool
+    results, elapsed = asyncio.run(parse_all(pool, [("next.pdf", b"0.1")]))
+    assert results[0][1]["success"]
+
+    print(f"✓ Stuck file timed out, others parsed, pool replaced")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PARSE POOL TEST")
+    print("=" * 60)
+
+    try:
+        test_parallel_parsing()
+        test_parser_errors_reported()
+        test_timeout()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
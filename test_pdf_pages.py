@@ -0,0 +1,148 @@
+"""
+Quick test script to verify lazy PDF page extraction with a text budget.
+Tests that page text is extracted only as pages are consumed, that reading
+stops at a character or token budget, and that the extraction budget is
+passed from document import through the parse pool and reported in the
+extraction result. Pages are simple stand-ins with extract_text().
+"""
+
+import asyncio
+import json
+import sys
+from itertools import islice
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from api.parse_pool import ParsePool
+from src.pyramid_builder.ai import document_parser
+from src.pyramid_builder.ai.document_extractor import DocumentExtractor
+from src.pyramid_builder.ai.document_parser import DocumentParser
+from src.pyramid_builder.ai.prompt_cache import PromptCacheStats, UsageTrackingClient
+from test_document_chunking import FakeStream
+
+
+class Page:
+    """A PDF page stand-in counting text extractions."""
+
+    extracted = 0
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def extract_text(self) -> str:
+        Page.extracted += 1
+        return self.text
+
+
+def pages(count: int, length=1000):
+    return [Page("" if n == 3 else f"Page {n} ".ljust(length, "x")) for n in range(1, count + 1)]
+
+
+def echo_parse(file_content: bytes, filename: str, **options):
+    """Stand-in parser (runs in a worker process) reporting its options."""
+    return {"success": True, "format": "pdf", "options": options}
+
+
+def test_pages_extracted_lazily():
+    """Test that only consumed pages are extracted"""
+    print("Testing lazy page extraction...")
+
+    Page.extracted = 0
+    blocks = DocumentParser._pages_within_budget(pages(100), None)
+    first = next(blocks)
+    assert first["page"] == 1 and first["type"] == "page"
+    assert Page.extracted == 1
+
+    # Page 3 has no text and is skipped
+    assert [block["page"] for block in islice(blocks, 3)] == [2, 4, 5]
+    assert Page.extracted == 5
+
+    print("✓ Page text extracted on demand")
+
+
+def test_budget_stops_reading():
+    """Test character and token budgets"""
+    print("\nTesting text budgets...")
+
+    Page.extracted = 0
+    blocks = list(DocumentParser._pages_within_budget(pages(100), 5500))
+    assert [block["page"] for block in blocks] == [1, 2, 4, 5, 6, 7]
+    assert sum(len(block["content"]) for block in blocks) == 5500
+    assert blocks[-1]["truncated"] and len(blocks[-1]["content"]) == 500
+    assert Page.extracted == 7
+
+    # A budget met exactly at the last page leaves nothing unread
+    blocks = list(DocumentParser._pages_within_budget(pages(4), 3000))
+    assert "truncated" not in blocks[-1]
+
+    # Met exactly with pages left: flagged, nothing cut
+    blocks = list(DocumentParser._pages_within_budget(pages(10), 3000))
+    assert blocks[-1]["truncated"] and len(blocks[-1]["content"]) == 1000
+
+    assert DocumentParser._char_budget(None, 1000) == 4000
+    assert DocumentParser._char_budget(3000, 1000) == 3000
+    assert DocumentParser._char_budget(None, None) is None
+
+    if not document_parser.PDF_AVAILABLE:
+        try:
+            next(DocumentParser.iter_pdf_pages(b"%PDF-1.4"))
+            assert False, "expected ImportError"
+        except ImportError:
+            pass
+
+    print("✓ Reading stops at the budget")
+
+
+def test_budget_reported_in_extraction():
+    """Test that unread pages are noted in the extraction result"""
+    print("\nTesting budget note in extraction...")
+
+    extractor = DocumentExtractor(api_key="test-key")
+    reply = json.dumps({"values": [], "extraction_summary": {"notes": "Looks like a strategy"}})
+    extractor.client = UsageTrackingClient(SimpleNamespace(messages=SimpleNamespace(
+        stream=lambda **request: FakeStream(SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=reply)], stop_reason="end_turn"
+        ))
+    )), PromptCacheStats())
+
+    blocks = list(DocumentParser._pages_within_budget(pages(100), 2500))
+    result = extractor.extract_pyramid_elements({"success": True, "format": "pdf", "blocks": blocks})
+    assert result["success"] and result["metadata"]["truncated"]
+    notes = result["elements"]["extraction_summary"]["notes"]
+    assert notes == "Looks like a strategy; Text after page 4 was not read (text budget reached)"
+
+    assert DocumentExtractor.MAX_TOTAL_LENGTH == DocumentExtractor.MAX_DOCUMENT_LENGTH * DocumentExtractor.MAX_CHUNKS
+
+    # The parse pool hands the budget to the parser
+    pool = ParsePool(parse=echo_parse, max_workers=1, timeout=30)
+
+    async def parse():
+        return [result async for _, result in pool.parse_each([("a.pdf", b"")], max_chars=1234)]
+
+    assert asyncio.run(parse())[0]["options"] == {"max_chars": 1234}
+
+    print("✓ Unread text noted, budget passed to parse workers")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PDF PAGE BUDGET TEST")
+    print("=" * 60)
+
+    try:
+        test_pages_extracted_lazily()
+        test_budget_stops_reading()
+        test_budget_reported_in_extraction()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
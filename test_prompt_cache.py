@@ -0,0 +1,204 @@
+"""
+Quick test script to verify prompt caching of static prompt prefixes.
+Tests that coach, chat and document extraction requests put their static
+instructions in an identical cached system block ahead of the variable
+content, and that token usage including cache reads and writes is
+accounted. Uses a fake client (no API key or network needed).
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.pyramid_builder.ai.coach import AICoach
+from src.pyramid_builder.ai.document_extractor import DocumentExtractor
+from src.pyramid_builder.ai.prompt_cache import PromptCacheStats, UsageTrackingClient, cached_system
+from src.pyramid_builder.ai.response_cache import CachingClient, ResponseCache
+from test_ai_validator_parallel import build_pyramid
+from test_document_chunking import FakeStream
+
+
+class PrefixCachingMessages:
+    """
+    Fake client.messages imitating Anthropic prompt caching: the text up to
+    a cache_control breakpoint seen before is read from cache.
+    """
+
+    def __init__(self, reply="{}"):
+        self.reply = reply
+        self.requests = []
+        self._cached = set()
+
+    def create(self, **request):
+        self.requests.append(request)
+        read = written = 0
+        prefix = ""
+        for block in request.get("system") or []:
+            prefix += block["text"]
+            if "cache_control" in block:
+                if prefix in self._cached:
+                    read = len(prefix) // 4
+                else:
+                    self._cached.add(prefix)
+                    written = len(prefix) // 4 - read
+        total = sum(len(b["text"]) for b in request.get("system") or []) // 4
+        total += sum(len(m["content"]) for m in request["messages"]) // 4
+        usage = SimpleNamespace(
+            input_tokens=total - read - written,
+            cache_read_input_tokens=read,
+            cache_creation_input_tokens=written,
+            output_tokens=10,
+        )
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=self.reply)],
+            stop_reason="end_turn",
+            usage=usage,
+        )
+
+    def stream(self, **request):
+        return FakeStream(self.create(**request))
+
+
+def fake_client(stats: PromptCacheStats, reply="{}"):
+    messages = PrefixCachingMessages(reply)
+    return UsageTrackingClient(SimpleNamespace(messages=messages), stats), messages
+
+
+def test_cached_system_blocks():
+    """Test system block layout"""
+    print("Testing cached system blocks...")
+
+    assert cached_system("static") == [
+        {"type": "text", "text": "static", "cache_control": {"type": "ephemeral"}}
+    ]
+    blocks = cached_system("static", "a", "", None, "b", cache_variable=True)
+    assert [b["text"] for b in blocks] == ["static", "a\n\nb"]
+    assert all("cache_control" in b for b in blocks)
+    assert "cache_control" not in cached_system("static", "a")[1]
+
+    print("✓ Static prefix marked for caching, variable text after it")
+
+
+def test_usage_accounting():
+    """Test token accounting, and that response cache hits are not counted"""
+    print("\nTesting usage accounting...")
+
+    stats = PromptCacheStats()
+    client, messages = fake_client(stats)
+    request = {"model": "m", "max_tokens": 10, "system": cached_system("x" * 4000),
+               "messages": [{"role": "user", "content": "hi"}]}
+    client.messages.create(**request)
+    client.messages.create(**request)
+
+    result = stats.stats()
+    assert result["calls"] == 2 and result["cache_writes"] == 1 and result["cache_hits"] == 1
+    assert result["cache_write_tokens"] == 1000 and result["cache_read_tokens"] == 1000
+    assert result["cached_input_ratio"] == 0.5
+
+    # Answered by the response cache: no API call, no usage
+    cached = CachingClient(client, ResponseCache())
+    cached.messages.create(**request)
+    cached.messages.create(**request)
+    assert stats.stats()["calls"] == 3
+
+    stats.reset()
+    assert stats.stats()["calls"] == 0 and stats.stats()["cached_input_ratio"] is None
+
+    print("✓ Cache reads and writes counted per call")
+
+
+def test_coach_prompts_share_prefix():
+    """Test that coach requests keep static instructions in a stable prefix"""
+    print("\nTesting coach prompt prefixes...")
+
+    stats = PromptCacheStats()
+    coach = AICoach(pyramid=build_pyramid(), api_key="test-key")
+    coach.client, messages = fake_client(stats, reply=json.dumps({"has_suggestion": False}))
+
+    for content in ["Grow revenue", "Delight every customer", "Be the obvious choice"]:
+        coach.suggest_field_improvement("strategic_driver", "name", content)
+    systems = [r["system"] for r in messages.requests]
+    assert systems[0] == systems[1] == systems[2]
+    assert "Grow revenue" not in json.dumps(systems[0])
+    assert "Delight every customer" in messages.requests[1]["messages"][0]["content"]
+    assert stats.stats()["cache_hits"] == 2
+
+    # Other tiers have their own prefix
+    coach.suggest_field_improvement("iconic_commitment", "name", "Launch it")
+    assert messages.requests[-1]["system"] != systems[0]
+
+    coach.generate_draft("strategic_intent", {"user_guidance": "Focus on retention"})
+    coach.generate_draft("strategic_intent", {"user_guidance": "Focus on growth"})
+    first, second = messages.requests[-2:]
+    assert first["system"] == second["system"]
+    assert "retention" in first["messages"][0]["content"]
+
+    # Chat: instructions fixed, pyramid state cached while unchanged
+    coach.chat("How is my pyramid?")
+    coach.chat("And the drivers?")
+    first, second = messages.requests[-2:]
+    assert first["system"] == second["system"]
+    assert "CURRENT PYRAMID STATE" in first["system"][1]["text"]
+    assert "CURRENT PYRAMID STATE" not in first["system"][0]["text"]
+    coach.pyramid.strategic_drivers[0].name = "Customer Love"
+    coach.chat("And now?")
+    assert messages.requests[-1]["system"][0] == first["system"][0]
+    assert messages.requests[-1]["system"][1] != first["system"][1]
+
+    # Pruned per question: not worth a cache write
+    coach.cache_pyramid_context = False
+    coach.chat("What about values?")
+    assert "cache_control" not in messages.requests[-1]["system"][1]
+    assert "cache_control" in messages.requests[-1]["system"][0]
+
+    print("✓ Only the variable suffix changes between calls")
+
+
+def test_extraction_prefix():
+    """Test that extraction instructions are a cached prefix shared by documents"""
+    print("\nTesting document extraction prefix...")
+
+    stats = PromptCacheStats()
+    extractor = DocumentExtractor(api_key="test-key")
+    extractor.client, messages = fake_client(stats, reply=json.dumps({"socc_items": []}))
+
+    for text in ["Our vision is to be loved by customers. " * 10, "We value trust and curiosity. " * 10]:
+        parsed = {"success": True, "format": "docx", "blocks": [{"type": "paragraph", "content": text}]}
+        assert extractor.extract_pyramid_elements(parsed)["success"]
+
+    first, second = messages.requests
+    assert first["system"] == second["system"]
+    assert "EXTRACTION PHILOSOPHY" in first["system"][0]["text"]
+    assert "loved by customers" in first["messages"][0]["content"]
+    assert "loved by customers" not in json.dumps(first["system"])
+    result = stats.stats()
+    assert result["cache_writes"] == 1 and result["cache_hits"] == 1
+    assert result["cache_read_tokens"] > 2000
+
+    print("✓ Second document reads the instructions from cache")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PROMPT CACHE TEST")
+    print("=" * 60)
+
+    try:
+        test_cached_system_blocks()
+        test_usage_accounting()
+        test_coach_prompts_share_prefix()
+        test_extraction_prefix()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
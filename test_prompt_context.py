@@ -0,0 +1,154 @@
+"""
+Quick test script to verify the AI coach prompt context renderer.
+Tests that cached rendering matches a fresh render, that only tiers changed
+since the last render are re-rendered, and that a question prunes the
+detail sections down to the tiers it relates to.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.pyramid_builder.ai.prompt_context import TIER_SECTIONS, PromptContextRenderer
+from src.pyramid_builder.core.pyramid_manager import PyramidManager
+from src.pyramid_builder.models.pyramid import Horizon, StatementType
+
+
+def build_manager() -> PyramidManager:
+    manager = PyramidManager()
+    manager.create_new_pyramid("Prompt Context", "Test Org", "Test User")
+    manager.add_vision_statement(StatementType.VISION, "Every customer tells a friend about us")
+    manager.add_value("Trust", "We keep our promises")
+    manager.add_value("Curiosity")
+    manager.add_behaviour("We answer every customer within a day")
+    driver = manager.add_strategic_driver("Customer Obsession", "Obsess over customers")
+    other = manager.add_strategic_driver("Operational Excellence", "Run a tight ship")
+    intents = [
+        manager.add_strategic_intent(f"Customers rave about onboarding {i}", driver.id)
+        for i in range(7)
+    ]
+    manager.add_enabler("Data Platform", "Shared customer data")
+    for i in range(6):
+        manager.add_iconic_commitment(
+            f"Launch programme {i}", "Deliver the programme", Horizon.H1,
+            (driver if i % 2 else other).id, [intents[i].id],
+        )
+    return manager
+
+
+def fresh(manager: PyramidManager, question=None) -> str:
+    return PromptContextRenderer(manager.pyramid).render(question)
+
+
+def test_cached_render_matches_fresh():
+    """Test that a cached render always equals a render from scratch"""
+    print("Testing cached rendering...")
+
+    manager = build_manager()
+    renderer = manager.get_prompt_context()
+    assert renderer is manager.get_prompt_context()
+
+    text = renderer.render()
+    assert text == fresh(manager)
+    for heading in ["PURPOSE STATEMENTS", "VALUES", "STRATEGIC DRIVERS", "STRATEGIC INTENTS",
+                    "ENABLERS", "ICONIC COMMITMENTS", "... and 2 more"]:
+        assert heading in text, heading
+    assert "Summary: Purpose Statements: 1 | Values: 2 | Behaviours: 1 | Drivers: 2" in text
+
+    # Nothing changed: the same text, no fragment work at all
+    renders = renderer.fragment_renders
+    assert renderer.render() is text
+    assert renderer.fragment_renders == renders
+
+    print("✓ Cached text identical to a fresh render")
+
+
+def test_only_changed_tiers_rerendered():
+    """Test per-tier fragment invalidation"""
+    print("\nTesting per-tier invalidation...")
+
+    manager = build_manager()
+    renderer = manager.get_prompt_context()
+    renderer.render()
+    assert renderer.fragment_renders == len(TIER_SECTIONS)
+
+    # A value edit touches only the values fragment
+    renders = renderer.fragment_renders
+    value = manager.pyramid.values[0]
+    manager.update_value(value.id, name="Radical Trust")
+    text = renderer.render()
+    assert renderer.fragment_renders == renders + 1
+    assert "Radical Trust" in text and text == fresh(manager)
+
+    # Drivers feed the intent and commitment sections too
+    renders = renderer.fragment_renders
+    driver = manager.pyramid.strategic_drivers[0]
+    manager.update_strategic_driver(driver.id, name="Customer Love")
+    text = renderer.render()
+    assert renderer.fragment_renders == renders + 3
+    assert "(Driver: Customer Love)" in text and text == fresh(manager)
+
+    # Loading a different pyramid starts over
+    manager.create_new_pyramid("Another One", "Test Org", "Test User")
+    renderer = manager.get_prompt_context()
+    assert renderer.render() == fresh(manager)
+    assert "VALUES" not in renderer.render()
+
+    print("✓ Only fragments reading a changed tier were rebuilt")
+
+
+def test_question_prunes_sections():
+    """Test relevance pruning by keyword and by item name"""
+    print("\nTesting relevance pruning...")
+
+    manager = build_manager()
+    renderer = manager.get_prompt_context()
+
+    text = renderer.render("Are our values distinctive enough?")
+    assert "### VALUES" in text and "### BEHAVIOURS" in text
+    assert "### ICONIC COMMITMENTS" not in text and "### STRATEGIC INTENTS" not in text
+    assert "omitted as not relevant" in text
+    # Every tier still appears in the summary line
+    assert "Commitments: H1:6" in text
+    assert len(text) < len(renderer.render())
+
+    # Commitments bring their drivers and intents along
+    text = renderer.render("Is launch programme 3 in the right horizon?")
+    assert "### ICONIC COMMITMENTS" in text and "### STRATEGIC DRIVERS" in text
+    assert "### STRATEGIC INTENTS" in text and "### VALUES" not in text
+
+    # An item name alone is enough, as whole words only
+    text = renderer.render("How does the data platform help?")
+    assert "### ENABLERS" in text and "### VALUES" not in text
+    assert "### ENABLERS" not in renderer.render("Can the metadata platformer help with trust?")
+
+    # A question about nothing in particular gets everything
+    assert renderer.render("What should I do next?") == renderer.render()
+    assert renderer.render("Are our values distinctive enough?") == fresh(
+        manager, "Are our values distinctive enough?"
+    )
+
+    print("✓ Detail limited to related tiers, summary kept for all")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PROMPT CONTEXT TEST")
+    print("=" * 60)
+
+    try:
+        test_cached_render_matches_fresh()
+        test_only_changed_tiers_rerendered()
+        test_question_prunes_sections()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,234 @@
+"""
+Quick test script to verify the pyramid lookup index.
+Tests that by-ID lookups and relationship queries stay consistent through
+manager mutations, direct list edits, and save/load round trips, and that
+misses and copies do not rebuild the index.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from uuid import uuid4
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.pyramid_builder.core.pyramid_manager import PyramidManager
+from src.pyramid_builder.models.pyramid import Horizon, StrategicDriver, StrategyPyramid, Value
+
+
+def build_manager() -> PyramidManager:
+    """Build a small pyramid through the manager."""
+    manager = PyramidManager()
+    manager.create_new_pyramid("Index Test", "Test Org", "Test User")
+    for name in ["Trust", "Bold", "Curious"]:
+        manager.add_value(name)
+    driver = manager.add_strategic_driver("Experience", "Customer experience first")
+    intent = manager.add_strategic_intent(
+        "Customers tell their friends about us unprompted", driver.id
+    )
+    commitment = manager.add_iconic_commitment(
+        "Launch new onboarding", "Deliver a redesigned onboarding flow",
+        Horizon.H1, driver.id, [intent.id], target_date="Q2 2026",
+    )
+    team = manager.add_team_objective(
+        "Onboarding revamp", "Ship the new onboarding flow", "Product",
+        primary_commitment_id=commitment.id,
+    )
+    manager.add_individual_objective(
+        "Design onboarding", "Design all onboarding screens", "Alex",
+        team_objective_ids=[team.id],
+    )
+    return manager
+
+
+def test_lookups_after_manager_mutations():
+    """Test that add/update/remove keep the index consistent"""
+    print("Testing lookups after manager mutations...")
+
+    manager = build_manager()
+    pyramid = manager.pyramid
+
+    for tier in ["values", "strategic_drivers", "strategic_intents",
+                 "iconic_commitments", "team_objectives", "individual_objectives"]:
+        for item in getattr(pyramid, tier):
+            assert pyramid.get_item_by_id(tier, item.id) is item
+
+    value = pyramid.values[1]
+    assert manager.update_value(value.id, name="Brave")
+    assert pyramid.get_value_by_id(value.id).name == "Brave"
+
+    assert manager.remove_value(value.id)
+    assert pyramid.get_value_by_id(value.id) is None
+    assert [v.name for v in pyramid.values] == ["Trust", "Curious"]
+    assert not manager.remove_value(value.id)
+    assert not manager.update_value(uuid4(), name="Missing")
+
+    print("✓ Index consistent through add/update/remove")
+
+
+def test_direct_list_edits_are_detected():
+    """Test that edits bypassing the manager trigger a rebuild"""
+    print("\nTesting direct list edits...")
+
+    manager = build_manager()
+    pyramid = manager.pyramid
+
+    # Append directly (as older code paths do)
+    extra = Value(name="Direct")
+    pyramid.values.append(extra)
+    assert pyramid.get_value_by_id(extra.id) is extra
+
+    # Replace the list entirely (as the Streamlit pages do)
+    removed = pyramid.values[0]
+    pyramid.values = [v for v in pyramid.values if v.id != removed.id]
+    assert pyramid.get_value_by_id(removed.id) is None
+
+    # Replace an element in place: same list, same length
+    old_driver = pyramid.strategic_drivers[0]
+    new_driver = StrategicDriver(name="Growth", description="Grow the business")
+    pyramid.strategic_drivers[0] = new_driver
+    assert pyramid.get_driver_by_id(old_driver.id) is None
+    assert pyramid.get_driver_by_id(new_driver.id) is new_driver
+
+    # ...and found through a relationship query that would return the old item
+    intent = pyramid.strategic_intents[0]
+    old_intent = intent.model_copy()
+    pyramid.strategic_intents[0] = old_intent
+    children = pyramid.get_children("intent_driver", intent.driver_id)
+    assert len(children) == 1 and children[0] is old_intent
+
+    # Removal in place
+    del pyramid.values[0]
+    assert pyramid.get_value_by_id(extra.id) is not None
+    assert len(pyramid._index.items(pyramid, "values")) == len(pyramid.values)
+
+    print("✓ Direct edits detected")
+
+
+def test_lookups_do_not_rebuild():
+    """Test that misses and copies reuse the index instead of rescanning"""
+    print("\nTesting lookups without rebuilds...")
+
+    manager = build_manager()
+    pyramid = manager.pyramid
+    index = pyramid._index
+    rebuilds = []
+    rebuild = index.rebuild
+    index.rebuild = lambda target: rebuilds.append(target) or rebuild(target)
+
+    # A miss is a dictionary miss, not a scan of the tier
+    assert pyramid.get_value_by_id(uuid4()) is None
+    assert pyramid.get_driver_by_id(uuid4()) is None
+
+    # Manager removals update the index without rebuilding it
+    value = pyramid.values[0]
+    assert manager.remove_value(value.id)
+    assert pyramid.get_value_by_id(pyramid.values[0].id) is pyramid.values[0]
+    assert rebuilds == []
+    del index.rebuild
+
+    # A deep copy carries a valid index for its own lists
+    copy = pyramid.model_copy(deep=True)
+    assert copy.get_value_by_id(copy.values[0].id) is copy.values[0]
+    assert copy._index is not index and copy._index.is_fresh(copy)
+
+    print("✓ No rebuild on misses, removals or copies")
+
+
+def test_index_rebuilt_on_load():
+    """Test that from_dict and load_from_file rebuild the index"""
+    print("\nTesting index rebuild on load...")
+
+    manager = build_manager()
+    commitment = manager.pyramid.iconic_commitments[0]
+
+    restored = StrategyPyramid.from_dict(manager.pyramid.to_dict())
+    assert restored.get_commitment_by_id(commitment.id).name == commitment.name
+    assert restored == manager.pyramid
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "pyramid.json")
+        manager.save_pyramid(path)
+        loaded = PyramidManager().load_pyramid(path)
+    assert loaded.get_commitment_by_id(commitment.id) is loaded.iconic_commitments[0]
+
+    print("✓ Index rebuilt on from_dict/load_from_file")
+
+
+def test_relationship_queries_match_scans():
+    """Test that adjacency queries agree with brute-force scans"""
+    print("\nTesting relationship queries...")
+
+    manager = build_manager()
+    pyramid = manager.pyramid
+    driver = pyramid.strategic_drivers[0]
+    other = manager.add_strategic_driver("Partnership", "Grow through our partners")
+    second_intent = manager.add_strategic_intent(
+        "Partners choose us before anyone else in the market", other.id
+    )
+    second = manager.add_iconic_commitment(
+        "Launch partner portal", "Deliver a self-service partner portal",
+        Horizon.H2, other.id, [second_intent.id],
+    )
+    manager.add_secondary_alignment_to_commitment(second.id, driver.id, weighting=0.3)
+
+    def check():
+        for d in pyramid.strategic_drivers:
+            primary = [c for c in pyramid.iconic_commitments if c.primary_driver_id == d.id]
+            secondary = [
+                c for c in pyramid.iconic_commitments
+                if any(a.target_id == d.id for a in c.secondary_alignments) and c not in primary
+            ]
+            assert pyramid.get_commitments_by_driver(d.id) == primary
+            assert pyramid.get_commitments_by_driver(d.id, primary_only=False) == primary + secondary
+            assert manager.get_intents_by_driver(d.id) == [
+                i for i in pyramid.strategic_intents if i.driver_id == d.id
+            ]
+        assert manager.find_orphaned_intents() == [
+            i for i in pyramid.strategic_intents
+            if not any(i.id in c.primary_intent_ids for c in pyramid.iconic_commitments)
+        ]
+
+    check()
+    assert len(pyramid.get_commitments_by_driver(driver.id, primary_only=False)) == 2
+
+    # Re-point the commitment and unlink its intent
+    manager.update_iconic_commitment(second.id, primary_driver_id=driver.id, primary_intent_ids=[])
+    check()
+    assert second_intent in manager.find_orphaned_intents()
+
+    # Remove an intent and a driver's only commitment
+    manager.remove_strategic_intent(second_intent.id)
+    manager.remove_iconic_commitment(pyramid.iconic_commitments[0].id)
+    check()
+
+    team = pyramid.team_objectives[0]
+    individual = pyramid.individual_objectives[0]
+    assert pyramid.get_individual_objectives_by_team_objective(team.id) == [individual]
+    assert pyramid.get_parents("individual_team_objective", individual.id) == [team]
+
+    print("✓ Relationship queries match brute-force scans")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PYRAMID INDEX TEST")
+    print("=" * 60)
+
+    try:
+        test_lookups_after_manager_mutations()
+        test_direct_list_edits_are_detected()
+        test_lookups_do_not_rebuild()
+        test_index_rebuilt_on_load()
+        test_relationship_queries_match_scans()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,240 @@
+"""
+Quick test script to verify the AI response cache.
+Tests keying, TTL expiry, LRU and size eviction, persistence to a SQLite
+file, the bypass flag, and that a re-run of AI validation on an unchanged
+pyramid makes no API calls, with per-commitment alignment verdicts reused
+for unchanged commitments. No API key or network is needed.
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.pyramid_builder.ai.response_cache import CachingClient, ResponseCache
+from src.pyramid_builder.core.pyramid_manager import PyramidManager
+from src.pyramid_builder.models.pyramid import Horizon
+from src.pyramid_builder.validation.ai_validator import AIValidator
+from src.pyramid_builder.validation.validator import ValidationResult
+from test_ai_validator_parallel import FakeMessages, build_pyramid
+
+
+class CountingMessages:
+    """Fake client.messages returning numbered replies."""
+
+    def __init__(self, stop_reason="end_turn"):
+        self.calls = 0
+        self.stop_reason = stop_reason
+
+    def create(self, **request):
+        self.calls += 1
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=f"reply {self.calls}")],
+            stop_reason=self.stop_reason,
+        )
+
+
+def request(prompt, model="claude-sonnet-4-20250514", max_tokens=256):
+    return {"model": model, "max_tokens": max_tokens, "messages": [{"role": "user", "content": prompt}]}
+
+
+def test_cached_client():
+    """Test hits, misses, keying and bypass"""
+    print("Testing cached client...")
+
+    cache = ResponseCache()
+    messages = CountingMessages()
+    client = CachingClient(SimpleNamespace(messages=messages), cache)
+
+    assert client.messages.create(**request("a")).content[0].text == "reply 1"
+    assert client.messages.create(**request("a")).content[0].text == "reply 1"
+    assert messages.calls == 1
+
+    # Model, max_tokens and prompt are all part of the key
+    client.messages.create(**request("a", max_tokens=512))
+    client.messages.create(**request("a", model="other-model"))
+    client.messages.create(**request("b"))
+    assert messages.calls == 4
+
+    # Bypass asks again and stores the fresh reply
+    fresh = CachingClient(SimpleNamespace(messages=messages), cache, bypass=True)
+    assert fresh.messages.create(**request("a")).content[0].text == "reply 5"
+    assert client.messages.create(**request("a")).content[0].text == "reply 5"
+
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 4 and stats["bypasses"] == 1
+    assert stats["entries"] == 4
+
+    # Truncated replies are not cached
+    truncated = CountingMessages(stop_reason="max_tokens")
+    client = CachingClient(SimpleNamespace(messages=truncated), cache)
+    client.messages.create(**request("c"))
+    client.messages.create(**request("c"))
+    assert truncated.calls == 2
+
+    print("✓ Repeated requests served from cache, bypass refreshes")
+
+
+def test_ttl_and_eviction():
+    """Test TTL expiry, LRU entry cap and byte cap"""
+    print("\nTesting TTL and eviction...")
+
+    cache = ResponseCache(ttl=0.05)
+    cache.put("k", "m", "value")
+    assert cache.get("k") == "value"
+    time.sleep(0.1)
+    assert cache.get("k") is None
+    assert cache.stats()["expirations"] == 1
+
+    cache = ResponseCache(max_entries=2)
+    cache.put("k1", "m", "one")
+    time.sleep(0.01)
+    cache.put("k2", "m", "two")
+    time.sleep(0.01)
+    cache.get("k1")  # k2 is now least recently used
+    time.sleep(0.01)
+    cache.put("k3", "m", "three")
+    assert cache.get("k2") is None
+    assert cache.get("k1") == "one" and cache.get("k3") == "three"
+    assert cache.stats()["evictions"] == 1
+
+    cache = ResponseCache(max_entries=None, max_bytes=10)
+    for i in range(4):
+        cache.put(f"k{i}", "m", "xxxx")
+        time.sleep(0.01)
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["bytes"] == 8
+
+    print("✓ Expired and least recently used entries removed")
+
+
+def test_persists_to_file():
+    """Test that a file-backed cache survives a new instance"""
+    print("\nTesting file-backed cache...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "ai_cache.db")
+        ResponseCache(path).put("k", "m", "kept")
+        assert ResponseCache(path).get("k") == "kept"
+
+    print("✓ Cached responses shared through the database file")
+
+
+def test_revalidation_makes_no_calls():
+    """Test that AI validation of an unchanged pyramid is served from cache"""
+    print("\nTesting repeated AI validation...")
+
+    pyramid = build_pyramid()
+    cache = ResponseCache()
+    messages = FakeMessages(seed=0)
+    calls = []
+    create = messages.create
+    messages.create = lambda **kwargs: calls.append(1) or create(**kwargs)
+
+    def validate():
+        validator = AIValidator(pyramid, api_key="test-key", cache=cache)
+        validator.client = CachingClient(SimpleNamespace(messages=messages), cache)
+        return [issue.to_dict() for issue in validator.validate_with_ai(ValidationResult()).issues]
+
+    first = validate()
+    api_calls = len(calls)
+    # Coherence, horizon, boldness, and one batch for the 4 commitments
+    assert api_calls == 4
+    assert validate() == first
+    assert len(calls) == api_calls
+    # 4 stored alignment verdicts plus 3 cached prompts
+    assert cache.stats()["hits"] == 7
+
+    # Renaming one commitment re-asks only the prompts that mention it:
+    # its own alignment check and the whole-pyramid coherence check
+    pyramid.iconic_commitments[0].name = "Launch a renamed programme"
+    validate()
+    assert len(calls) == api_calls + 2
+
+    print("✓ Unchanged prompts answered from cache, edits re-ask only affected checks")
+
+
+def test_alignment_verdicts_cover_every_commitment():
+    """Test per-commitment verdicts on a large pyramid"""
+    print("\nTesting per-commitment alignment verdicts...")
+
+    manager = PyramidManager()
+    manager.create_new_pyramid("Large", "Test Org", "Test User")
+    driver = manager.add_strategic_driver("Customer", "Obsess over customers")
+    intent = manager.add_strategic_intent("Customers rave about onboarding", driver.id)
+    for i in range(60):
+        manager.add_iconic_commitment(
+            f"Programme {i}", "Deliver the programme", Horizon.H2, driver.id, [intent.id]
+        )
+
+    cache = ResponseCache()
+    messages = CountingMessages()
+    reply = json.dumps({"is_aligned": False, "confidence": "high", "explanation": "Off target"})
+    create = messages.create
+    messages.create = lambda **kwargs: (
+        create(**kwargs),
+        SimpleNamespace(content=[SimpleNamespace(type="text", text=reply)], stop_reason="end_turn"),
+    )[1]
+
+    def check_alignment(bypass_cache=False):
+        # Raw client: only the verdict store can save calls here
+        validator = AIValidator(
+            manager.pyramid, api_key="test-key", cache=cache, bypass_cache=bypass_cache,
+            alignment_batch_size=1,
+        )
+        validator.client = SimpleNamespace(messages=messages)
+        result = ValidationResult()
+        validator._check_commitment_intent_alignment(result)
+        return result
+
+    assert len(check_alignment().issues) == 60
+    assert messages.calls == 60
+
+    # Unchanged: every verdict reused
+    assert len(check_alignment().issues) == 60
+    assert messages.calls == 60
+
+    # One edited commitment, one new one: two calls
+    manager.update_iconic_commitment(manager.pyramid.iconic_commitments[5].id, description="Deliver it faster")
+    manager.add_iconic_commitment("Programme 60", "Deliver the programme", Horizon.H2, driver.id, [intent.id])
+    assert len(check_alignment().issues) == 61
+    assert messages.calls == 62
+
+    # Editing the linked intent's text changes every commitment's verdict key
+    manager.update_strategic_intent(intent.id, statement="Customers finish onboarding in a day")
+    check_alignment()
+    assert messages.calls == 62 + 61
+
+    # Bypass re-asks everything
+    check_alignment(bypass_cache=True)
+    assert messages.calls == 62 + 61 * 2
+
+    print("✓ All 60+ commitments checked, only new or edited ones re-sent")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("AI RESPONSE CACHE TEST")
+    print("=" * 60)
+
+    try:
+        test_cached_client()
+        test_ttl_and_eviction()
+        test_persists_to_file()
+        test_revalidation_makes_no_calls()
+        test_alignment_verdicts_cover_every_commitment()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
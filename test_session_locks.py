@@ -0,0 +1,187 @@
+"""
+Quick test script to verify per-session API locking.
+Fires parallel mutations and validations at one session through the
+endpoint decorators and checks that no update is lost, that validation
+never sees a half-applied change, and that sessions don't block each other.
+"""
+
+import asyncio
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from api.session_locks import SessionLockManager, reads_session, session_locks, writes_session
+from api.session_store import MemorySessionStore
+from src.pyramid_builder.core.pyramid_manager import PyramidManager
+from src.pyramid_builder.validation.validator import PyramidValidator
+
+
+def new_store(*session_ids) -> MemorySessionStore:
+    store = MemorySessionStore()
+    for session_id in session_ids:
+        manager = PyramidManager()
+        manager.create_new_pyramid("Lock Test", "Test Org", "Test User")
+        store[session_id] = manager
+    return store
+
+
+def make_endpoints(store: MemorySessionStore, rng: random.Random, log: list):
+    """Endpoints shaped like the routers', yielding to the loop mid-change."""
+
+    @writes_session
+    async def add_value(session_id: str, name: str):
+        log.append(("write-start", session_id))
+        manager = store[session_id]
+        # Read-modify-write across awaits: loses updates if interleaved
+        values = list(manager.pyramid.values)
+        await asyncio.sleep(rng.random() / 1000)
+        manager.add_value(name)
+        manager.pyramid.values = values + manager.pyramid.values[-1:]
+        store.save(session_id, manager)
+        log.append(("write-end", session_id))
+
+    @reads_session
+    async def validate(session_id: str):
+        log.append(("read-start", session_id))
+        manager = store[session_id]
+        before = len(manager.pyramid.values)
+        await asyncio.sleep(rng.random() / 1000)
+        result = manager.get_validator().validate_all().to_dict()
+        assert len(manager.pyramid.values) == before, "Pyramid changed under a reader"
+        assert result == PyramidValidator(manager.pyramid).validate_all().to_dict()
+        log.append(("read-end", session_id))
+        return result
+
+    @reads_session
+    async def export(request):
+        # Nested endpoint call on the same session must not deadlock
+        return await validate(session_id=request.session_id)
+
+    return add_value, validate, export
+
+
+def check_exclusion(log: list):
+    """Writers never overlap anything; readers overlap each other."""
+    readers = writers = max_readers = 0
+    for event, _ in log:
+        if event == "write-start":
+            assert readers == 0 and writers == 0, "Writer overlapped another request"
+            writers += 1
+        elif event == "write-end":
+            writers -= 1
+        elif event == "read-start":
+            assert writers == 0, "Reader overlapped a writer"
+            readers += 1
+            max_readers = max(max_readers, readers)
+        else:
+            readers -= 1
+    return max_readers
+
+
+def test_parallel_mutations_and_validations():
+    """Test a burst of mixed requests against one session"""
+    print("Testing parallel mutations and validations on one session...")
+
+    async def run(seed: int):
+        rng = random.Random(seed)
+        store = new_store("s1")
+        log = []
+        add_value, validate, export = make_endpoints(store, rng, log)
+
+        calls = []
+        for i in range(50):
+            calls.append(add_value(session_id="s1", name=f"Value {i}"))
+            calls.append(validate(session_id="s1"))
+            calls.append(export(SimpleNamespace(session_id="s1")))
+        rng.shuffle(calls)
+        await asyncio.gather(*calls)
+
+        names = {value.name for value in store["s1"].pyramid.values}
+        assert names == {f"Value {i}" for i in range(50)}, "Lost update"
+        assert check_exclusion(log) > 1, "Readers never ran concurrently"
+        assert session_locks.stats()["active_locks"] == 0
+
+    for seed in range(5):
+        asyncio.run(run(seed))
+
+    print("✓ No lost updates, writers exclusive, readers shared")
+
+
+def test_unlocked_mutations_lose_updates():
+    """Test that the stress pattern really races without the lock"""
+    print("\nTesting the same burst without locking...")
+
+    async def run():
+        store = new_store("s1")
+        rng = random.Random(0)
+        add_value, _, _ = make_endpoints(store, rng, [])
+        unlocked = add_value.__wrapped__
+        await asyncio.gather(*(unlocked(session_id="s1", name=f"Value {i}") for i in range(50)))
+        return len(store["s1"].pyramid.values)
+
+    assert asyncio.run(run()) < 50
+
+    print("✓ Unlocked endpoints lose updates, so the locked test is meaningful")
+
+
+def test_sessions_do_not_block_each_other():
+    """Test that a writer on one session does not block another session"""
+    print("\nTesting independent sessions...")
+
+    async def run():
+        locks = SessionLockManager()
+        release = asyncio.Event()
+
+        async def slow_writer():
+            async with locks.write("s1"):
+                await release.wait()
+
+        task = asyncio.create_task(slow_writer())
+        await asyncio.sleep(0)
+        async with locks.write("s2"):
+            pass
+        async with locks.read("s2"):
+            pass
+        assert locks.stats() == {"active_locks": 1, "held_locks": 1}
+
+        release.set()
+        await task
+        assert locks.stats() == {"active_locks": 0, "held_locks": 0}
+
+        # Upgrading a held read lock would deadlock, so it is refused
+        async with locks.read("s1"):
+            try:
+                async with locks.write("s1"):
+                    pass
+                raise AssertionError("Expected RuntimeError")
+            except RuntimeError:
+                pass
+
+    asyncio.run(run())
+
+    print("✓ Sessions lock independently and locks are released")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("SESSION LOCK TEST")
+    print("=" * 60)
+
+    try:
+        test_parallel_mutations_and_validations()
+        test_unlocked_mutations_lose_updates()
+        test_sessions_do_not_block_each_other()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,403 @@
+"""
+Quick test script to verify the API session stores.
+Tests the in-memory and SQLite backends, LRU caching and eviction, spill to
+disk, that two SQLite stores on one database (as in two uvicorn workers)
+see each other's writes and refuse stale ones, and that derived values
+follow revisions.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from api.session_store import (
+    SESSION_STORES,
+    MemorySessionStore,
+    SessionConflictError,
+    SQLiteSessionStore,
+    create_session_store,
+)
+from src.pyramid_builder.core.pyramid_manager import PyramidManager
+from src.pyramid_builder.models.context import SOCCAnalysis, SOCCItem
+from src.pyramid_builder.models.pyramid import TRUSTED_CONTEXT, StrategyPyramid
+
+
+def dump_manager(manager: PyramidManager) -> str:
+    return json.dumps(manager.pyramid.to_dict(), default=str)
+
+
+def load_manager(data: str) -> PyramidManager:
+    return PyramidManager(pyramid=StrategyPyramid.model_validate_json(data, context=TRUSTED_CONTEXT))
+
+
+def new_manager(name: str) -> PyramidManager:
+    manager = PyramidManager()
+    manager.create_new_pyramid(name, "Test Org", "Test User")
+    return manager
+
+
+def pyramid_store(path: str, **limits) -> SQLiteSessionStore:
+    """SQLite store serializing PyramidManagers the way the pyramids router does."""
+    return SQLiteSessionStore(
+        path,
+        "pyramids",
+        dump=dump_manager,
+        load=load_manager,
+        **limits,
+    )
+
+
+def check_dict_idioms(store):
+    """Exercise the dict-style access the routers rely on."""
+    assert "missing" not in store
+    assert store.get("missing") is None
+    try:
+        store["missing"]
+        raise AssertionError("Expected KeyError")
+    except KeyError:
+        pass
+
+    manager = PyramidManager()
+    manager.create_new_pyramid("Store Test", "Test Org", "Test User")
+    store["s1"] = manager
+    assert "s1" in store
+
+    manager.add_value("Trust")
+    store.save("s1", manager)
+    assert [v.name for v in store["s1"].pyramid.values] == ["Trust"]
+
+    del store["s1"]
+    assert "s1" not in store
+    assert not store.delete("s1")
+
+
+def test_memory_store():
+    """Test the in-memory backend"""
+    print("Testing in-memory session store...")
+
+    store = MemorySessionStore(max_sessions=2)
+    check_dict_idioms(store)
+
+    manager = PyramidManager()
+    store["s1"] = manager
+    assert store["s1"] is manager
+
+    print("✓ In-memory store works")
+
+
+def test_sqlite_store():
+    """Test the SQLite backend and its LRU cache"""
+    print("\nTesting SQLite session store...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "sessions.db")
+        store = pyramid_store(path, max_sessions=2)
+        check_dict_idioms(store)
+
+        for i in range(4):
+            store[f"s{i}"] = new_manager(f"Pyramid {i}")
+        assert store.stats()["cached_sessions"] == 2
+
+        # Evicted sessions are reloaded from the database
+        assert store["s0"].pyramid.metadata.project_name == "Pyramid 0"
+        cached = store["s0"]
+        assert store["s0"] is cached
+
+        journal_mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert journal_mode == "wal"
+
+        # Context analyses round-trip through JSON
+        socc = SQLiteSessionStore(
+            path, "socc",
+            dump=lambda analysis: analysis.model_dump_json(),
+            load=SOCCAnalysis.model_validate_json,
+        )
+        analysis = SOCCAnalysis(session_id="s0")
+        analysis.items.append(SOCCItem(
+            quadrant="strength", title="Team", description="Skilled", created_by="Test User"
+        ))
+        socc["s0"] = analysis
+        socc._cache.clear()
+        assert socc["s0"].items[0].title == "Team"
+        assert "s0" in store and "s1" not in socc
+
+    print("✓ SQLite store persists and caches sessions")
+
+
+def test_memory_eviction_and_spill():
+    """Test LRU, byte-cap and idle-TTL eviction with spill to disk"""
+    print("\nTesting eviction and spill to disk...")
+
+    # Without a spill directory, evicted sessions are gone
+    store = MemorySessionStore(max_sessions=2)
+    for i in range(3):
+        store[f"s{i}"] = new_manager(f"Pyramid {i}")
+    assert "s0" not in store and "s2" in store
+    assert store.stats()["evictions"] == 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = MemorySessionStore(
+            max_sessions=2, spill_dir=tmp, namespace="pyramids",
+            dump=dump_manager, load=load_manager,
+        )
+        for i in range(3):
+            store[f"s{i}"] = new_manager(f"Pyramid {i}")
+        store["s1"]  # s1 becomes most recently used
+
+        # s0 was least recently used, spilled, and comes back on access
+        assert "s0" in store
+        assert store["s0"].pyramid.metadata.project_name == "Pyramid 0"
+        # ...which evicts s2, the least recently used now
+        assert store["s2"].pyramid.metadata.project_name == "Pyramid 2"
+        stats = store.stats()
+        assert stats["spills"] == 3 and stats["rehydrations"] == 2
+        assert stats["cached_sessions"] == 2
+
+        # Deleting removes spilled sessions too
+        assert store.delete("s1")
+        assert "s1" not in store and not store.delete("s1")
+
+        # Byte cap
+        size = len(dump_manager(new_manager("Pyramid 0")))
+        capped = MemorySessionStore(
+            max_sessions=None, max_bytes=size * 2, spill_dir=tmp, namespace="capped",
+            dump=dump_manager, load=load_manager,
+        )
+        for i in range(4):
+            capped[f"s{i}"] = new_manager(f"Pyramid {i}")
+        assert capped.stats()["cached_sessions"] == 2
+        assert capped.stats()["cached_bytes"] <= size * 2
+        assert capped["s0"].pyramid.metadata.project_name == "Pyramid 0"
+
+        # Idle TTL
+        idle = MemorySessionStore(
+            idle_ttl=0.05, spill_dir=tmp, namespace="idle",
+            dump=dump_manager, load=load_manager,
+        )
+        idle["s0"] = new_manager("Pyramid 0")
+        time.sleep(0.1)
+        assert idle.stats()["expirations"] == 1
+        assert idle.stats()["cached_sessions"] == 0
+        assert idle["s0"].pyramid.metadata.project_name == "Pyramid 0"
+        assert idle.stats()["misses"] == 1
+
+    print("✓ Sessions evicted by LRU, size and TTL, and rehydrated from disk")
+
+
+def test_store_group():
+    """Test that the default in-memory stores never drop sessions, and grouped stores evict together"""
+    print("\nTesting default limits and store groups...")
+
+    # In memory without a spill directory, caps and TTL are off
+    original = {name: os.environ.pop(name, None) for name in ("SESSION_STORE_PATH", "SESSION_SPILL_DIR")}
+    registered = dict(SESSION_STORES)
+    try:
+        store = create_session_store("pyramids", dump=dump_manager, load=load_manager)
+        assert isinstance(store, MemorySessionStore)
+        assert store.max_sessions is None and store.max_bytes is None and store.idle_ttl is None
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ["SESSION_SPILL_DIR"] = tmp
+            assert create_session_store("capped", dump=dump_manager, load=load_manager).max_sessions == 1000
+    finally:
+        for name, value in original.items():
+            os.environ.pop(name, None)
+            if value is not None:
+                os.environ[name] = value
+        SESSION_STORES.clear()
+        SESSION_STORES.update(registered)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stores = {}
+        pyramids, socc = [
+            MemorySessionStore(
+                max_sessions=2, spill_dir=tmp, namespace=namespace,
+                dump=dump_manager, load=load_manager,
+            )
+            for namespace in ("pyramids", "socc")
+        ]
+        pyramids.join(stores, "pyramids")
+        socc.join(stores, "socc")
+        assert pyramids._lock is socc._lock
+
+        for i in range(2):
+            pyramids[f"s{i}"] = new_manager(f"Pyramid {i}")
+            socc[f"s{i}"] = new_manager(f"Context {i}")
+        # s0 used through the pyramid store only: still recent for socc
+        pyramids["s0"]
+        pyramids["s2"] = new_manager("Pyramid 2")
+
+        # s1 left both caches together, spilled
+        assert "s1" not in pyramids._cache and "s1" not in socc._cache
+        assert "s0" in socc._cache
+        assert socc.stats()["evictions"] == 1
+        assert socc["s1"].pyramid.metadata.project_name == "Context 1"
+
+    print("✓ No eviction without a spill directory; grouped stores evict together")
+
+
+def test_sqlite_stores_share_state():
+    """Test two stores on one database see each other's writes"""
+    print("\nTesting SQLite stores shared between workers...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "sessions.db")
+        worker_a = pyramid_store(path)
+        worker_b = pyramid_store(path)
+
+        manager = PyramidManager()
+        manager.create_new_pyramid("Shared", "Test Org", "Test User")
+        worker_a["shared"] = manager
+        assert worker_b["shared"].pyramid.metadata.project_name == "Shared"
+
+        # B caches its copy; A's next write must invalidate it
+        manager.add_value("Trust")
+        worker_a.save("shared", manager)
+        assert [v.name for v in worker_b["shared"].pyramid.values] == ["Trust"]
+
+        del worker_b["shared"]
+        assert "shared" not in worker_a
+
+    print("✓ Writes from one worker are visible to the other")
+
+
+def test_concurrent_writes_conflict():
+    """Test that a write based on a stale read is refused, not lost"""
+    print("\nTesting conflicting writes from two workers...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "sessions.db")
+        worker_a = pyramid_store(path)
+        worker_b = pyramid_store(path)
+        worker_a["s"] = new_manager("Conflict")
+
+        # Both workers read the same revision, then both edit it
+        manager_a, manager_b = worker_a["s"], worker_b["s"]
+        manager_a.add_value("Trust")
+        worker_a.save("s", manager_a)
+        manager_b.add_value("Bold")
+        try:
+            worker_b.save("s", manager_b)
+            assert False, "expected SessionConflictError"
+        except SessionConflictError as e:
+            assert e.status_code == 409
+
+        # B's retry starts from A's update
+        manager_b = worker_b["s"]
+        assert [v.name for v in manager_b.pyramid.values] == ["Trust"]
+        manager_b.add_value("Bold")
+        worker_b.save("s", manager_b)
+        assert [v.name for v in worker_a["s"].pyramid.values] == ["Trust", "Bold"]
+
+        # Saving a new value replaces the session unconditionally
+        worker_a["s"] = new_manager("Replaced")
+        assert worker_b["s"].pyramid.metadata.project_name == "Replaced"
+
+    print("✓ Stale write refused with 409; retry keeps both updates")
+
+
+def test_api_updates_reload_on_other_worker():
+    """Test a session updated through the API loads in another worker"""
+    print("\nTesting API updates across workers...")
+
+    # The routers package imports every router, exporters included
+    from api.routers import pyramids
+    from api.routers.pyramids import UpdateValueRequest
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "sessions.db")
+        worker_a, worker_b = [
+            SQLiteSessionStore(path, "pyramids", dump=pyramids.dump_manager, load=pyramids.load_manager)
+            for _ in range(2)
+        ]
+
+        manager = new_manager("Reload")
+        value = manager.add_value("Trust")
+        worker_a["s"] = manager
+
+        # Updates don't re-validate, so this name is stored as given
+        original = pyramids.active_pyramids
+        pyramids.active_pyramids = worker_a
+        try:
+            request = UpdateValueRequest(value_id=value.id, name="one two three four five")
+            assert asyncio.run(pyramids.update_value("s", request)) == {"success": True}
+        finally:
+            pyramids.active_pyramids = original
+
+        assert worker_b["s"].pyramid.values[0].name == "one two three four five"
+
+    print("✓ Sessions saved through the API load in every worker")
+
+
+def test_derived_values_follow_revisions():
+    """Test derive() caches per revision, locally and across workers"""
+    print("\nTesting derived values...")
+
+    builds = []
+
+    def value_names(manager):
+        builds.append(1)
+        return [v.name for v in manager.pyramid.values]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "sessions.db")
+        for worker_a, worker_b in [
+            (MemorySessionStore(), None),
+            (pyramid_store(path), pyramid_store(path)),
+        ]:
+            builds.clear()
+            manager = new_manager("Derived")
+            manager.add_value("Trust")
+            worker_a["s"] = manager
+
+            assert worker_a.derive("s", "names", value_names) == ["Trust"]
+            assert worker_a.derive("s", "names", value_names) == ["Trust"]
+            assert len(builds) == 1
+
+            manager.add_value("Bold")
+            worker_a.save("s", manager)
+            assert worker_a.derive("s", "names", value_names) == ["Trust", "Bold"]
+            assert len(builds) == 2
+
+            if worker_b is not None:
+                assert worker_b.derive("s", "names", value_names) == ["Trust", "Bold"]
+                manager.add_value("Kind")
+                worker_a.save("s", manager)
+                assert worker_b.derive("s", "names", value_names) == ["Trust", "Bold", "Kind"]
+
+            assert worker_a.derive("missing", "names", value_names, default=[]) == []
+
+    print("✓ Derived values rebuilt only after the session is saved")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("SESSION STORE TEST")
+    print("=" * 60)
+
+    try:
+        test_memory_store()
+        test_sqlite_store()
+        test_memory_eviction_and_spill()
+        test_store_group()
+        test_sqlite_stores_share_state()
+        test_concurrent_writes_conflict()
+        test_api_updates_reload_on_other_worker()
+        test_derived_values_follow_revisions()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,179 @@
+"""
+Quick test script to verify binary pyramid snapshots.
+Tests that snapshots round-trip every tier, that PyramidManager picks the
+format from the file name and detects it on load, that trusted snapshots
+skip the model validators while others are fully validated, and that
+corrupt or foreign files are rejected.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pydantic import ValidationError
+
+from benchmarks.validation_benchmark import build_pyramid
+from src.pyramid_builder.core.pyramid_manager import PyramidManager
+from src.pyramid_builder.models import snapshot
+from src.pyramid_builder.models.pyramid import StrategyPyramid
+from src.pyramid_builder.models.snapshot import (
+    SnapshotError,
+    dumps_snapshot,
+    loads_snapshot,
+    snapshot_header,
+)
+
+
+def test_round_trip():
+    """Test that a snapshot restores the pyramid exactly"""
+    print("Testing snapshot round trip...")
+
+    manager = build_pyramid(500)
+    pyramid = manager.pyramid
+    pyramid.validation_results = {"errors": 0, "notes": ["ünïcode ✓"]}
+
+    for compression in [None, "zlib"] + (["zstd"] if snapshot.ZSTD_AVAILABLE else []):
+        data = dumps_snapshot(pyramid, compression=compression)
+        loaded = loads_snapshot(data)
+        assert loaded.model_dump() == pyramid.model_dump()
+
+        # Lookups work on the loaded pyramid (index rebuilt)
+        commitment = pyramid.iconic_commitments[7]
+        assert loaded.get_commitment_by_id(commitment.id).name == commitment.name
+        assert len(loaded.get_commitments_by_driver(commitment.primary_driver_id)) == len(
+            pyramid.get_commitments_by_driver(commitment.primary_driver_id)
+        )
+
+    header = snapshot_header(data)
+    assert header["counts"]["iconic_commitments"] == len(pyramid.iconic_commitments)
+    assert len(dumps_snapshot(pyramid, "zlib")) < len(dumps_snapshot(pyramid)) < len(json.dumps(pyramid.to_dict(), indent=2))
+
+    try:
+        dumps_snapshot(pyramid, compression="lz4")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+    print("✓ All tiers restored, smaller than JSON")
+
+
+def test_manager_formats():
+    """Test format choice on save and detection on load"""
+    print("\nTesting PyramidManager save/load...")
+
+    manager = build_pyramid(100)
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = Path(directory) / "strategy.json"
+        snapshot_path = Path(directory) / "strategy.pyrsnap"
+        other_path = Path(directory) / "strategy.bin"
+
+        manager.save_pyramid(str(json_path))
+        manager.save_pyramid(str(snapshot_path))
+        manager.save_pyramid(str(other_path), format="snapshot", compression="zlib")
+
+        assert json.loads(json_path.read_text())["metadata"]["project_name"] == "Benchmark"
+        assert snapshot.is_snapshot(snapshot_path) and snapshot.is_snapshot(other_path)
+        assert not snapshot.is_snapshot(json_path)
+
+        # Each save stamps last_modified
+        expected = manager.pyramid.model_dump(exclude={"metadata": {"last_modified"}})
+        for path in (json_path, snapshot_path, other_path):
+            loaded = PyramidManager().load_pyramid(str(path))
+            assert loaded.model_dump(exclude={"metadata": {"last_modified"}}) == expected
+
+        for kwargs in ({"format": "yaml"}, {"format": "json", "compression": "zlib"}):
+            try:
+                manager.save_pyramid(str(json_path), **kwargs)
+                assert False, "expected ValueError"
+            except ValueError:
+                pass
+
+    print("✓ .pyrsnap saved as snapshot, both formats detected on load")
+
+
+def test_trusted_validation():
+    """Test that only trusted snapshots skip the model validators"""
+    print("\nTesting trusted loading...")
+
+    manager = build_pyramid(50)
+    # A name the driver validator would reject
+    manager.pyramid.strategic_drivers[0].name = "Far too many words in this name"
+    data = dumps_snapshot(manager.pyramid)
+
+    loaded = loads_snapshot(data)
+    assert loaded.strategic_drivers[0].name == "Far too many words in this name"
+
+    try:
+        loads_snapshot(data, trusted=False)
+        assert False, "expected ValidationError"
+    except ValidationError:
+        pass
+
+    # Saved by other models: validated in full
+    original = snapshot.schema_fingerprint
+    snapshot.schema_fingerprint = lambda: "another-version"
+    try:
+        loads_snapshot(data)
+        assert False, "expected ValidationError"
+    except ValidationError:
+        pass
+    finally:
+        snapshot.schema_fingerprint = original
+
+    # Validation outside snapshots is unchanged
+    try:
+        StrategyPyramid.model_validate(manager.pyramid.model_dump())
+        assert False, "expected ValidationError"
+    except ValidationError:
+        pass
+
+    print("✓ Validators skipped for trusted snapshots only")
+
+
+def test_rejects_bad_files():
+    """Test corrupt and foreign data"""
+    print("\nTesting corrupt snapshots...")
+
+    data = dumps_snapshot(build_pyramid(20).pyramid, compression="zlib")
+    plain = dumps_snapshot(build_pyramid(20).pyramid)
+    bad = [
+        b'{"metadata": {}}',
+        data[:8],
+        data[:8] + bytes([99]) + data[9:],
+        data[:-10],
+        plain[:-1] + b"!",
+    ]
+    for candidate in bad:
+        try:
+            loads_snapshot(candidate)
+            assert False, "expected SnapshotError"
+        except SnapshotError:
+            pass
+
+    print("✓ Wrong magic, version, truncation and checksum rejected")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PYRAMID SNAPSHOT TEST")
+    print("=" * 60)
+
+    try:
+        test_round_trip()
+        test_manager_formats()
+        test_trusted_validation()
+        test_rejects_bad_files()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,138 @@
+"""
+Quick test script to verify static prompt assets and lazy AI imports.
+Tests that static assets are loaded once per process, that AI services
+share one client and read no files when created, that the AI modules don't
+import the Anthropic SDK until a client is needed, and that LazyImport
+defers and reports imports.
+"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from api.lazy_imports import LazyImport
+from src.pyramid_builder.ai.assets import StaticAssets, static_assets
+from src.pyramid_builder.ai.document_extractor import DocumentExtractor
+from src.pyramid_builder.core.pyramid_manager import PyramidManager
+from src.pyramid_builder.validation.ai_validator import AIValidator
+
+
+def test_assets_loaded_once():
+    """Test that assets load on first use only"""
+    print("Testing static assets...")
+
+    assets = StaticAssets()
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "guide.md"
+        path.write_text("Use plain language.", encoding="utf-8")
+        assets.register_file("guide", path)
+        assets.register_file("missing", Path(directory) / "missing.md")
+        assert assets.stats()["loads"] == 0
+
+        assert assets.get("guide") == "Use plain language."
+        path.write_text("Edited", encoding="utf-8")
+        assert assets.get("guide") == "Use plain language."
+        assert assets.get("missing") == ""
+
+        # Reloaded after clear()
+        assets.clear()
+        assert assets.get("guide") == "Edited"
+
+    built = []
+    assert assets.get("built", lambda: built.append(1) or "text") == "text"
+    assert assets.get("built", lambda: built.append(1) or "other") == "text"
+    assert built == [1]
+
+    try:
+        assets.get("unknown")
+        assert False, "expected KeyError"
+    except KeyError:
+        pass
+
+    stats = assets.stats()
+    assert stats["loads"] == 4 and stats["loaded"]["guide"] == len("Edited")
+
+    print("✓ Loaded once, reloaded only after clear()")
+
+
+def test_services_share_setup():
+    """Test that service instances share the client and static prompts"""
+    print("\nTesting per-instance setup...")
+
+    manager = PyramidManager()
+    pyramid = manager.create_new_pyramid("Assets", "Acme", "Test")
+    first = AIValidator(pyramid, api_key="test-key")
+    assert "Strategic" in first.product_definition
+    extractors = [DocumentExtractor(api_key="test-key", timeout=30)]
+    loads = static_assets.stats()["loads"]
+
+    # Later instances reuse what the first ones loaded
+    second = AIValidator(pyramid, api_key="test-key")
+    assert second.product_definition is first.product_definition
+    extractors += [DocumentExtractor(api_key="test-key", timeout=30) for _ in range(2)]
+    assert extractors[2].extraction_instructions is extractors[0].extraction_instructions
+    assert static_assets.stats()["loads"] == loads
+
+    # One HTTP connection pool for every instance
+    pools = {id(extractor.client._client._client._client) for extractor in extractors}
+    pools.add(id(first.client._client._client._client._client))
+    assert len(pools) == 1
+
+    print("✓ One client and one copy of each prompt per process")
+
+
+def test_lazy_imports():
+    """Test that AI modules don't import the SDK, and LazyImport"""
+    print("\nTesting lazy imports...")
+
+    code = (
+        "import sys\n"
+        "import src.pyramid_builder.ai.coach, src.pyramid_builder.validation.ai_validator\n"
+        "import src.pyramid_builder.ai.document_cache, api.lazy_imports\n"
+        "assert 'anthropic' not in sys.modules and 'httpx' not in sys.modules\n"
+        "from src.pyramid_builder.ai.coach import AICoach\n"
+        "AICoach(api_key='test-key')\n"
+        "assert 'anthropic' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent, check=True)
+
+    decoder = LazyImport("json", "JSONDecoder")
+    assert not decoder.loaded
+    assert decoder.available and decoder.loaded
+    assert decoder().decode("[1]") == [1]
+    assert decoder.__name__ == "JSONDecoder"
+
+    missing = LazyImport("no_such_module_here", "Thing")
+    assert not missing.available
+    try:
+        missing()
+        assert False, "expected ImportError"
+    except ImportError:
+        pass
+
+    print("✓ SDK imported with the first client; LazyImport defers imports")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("STATIC ASSETS AND LAZY IMPORTS TEST")
+    print("=" * 60)
+
+    try:
+        test_assets_loaded_once()
+        test_services_share_setup()
+        test_lazy_imports()
+
+        print("\n" + "=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)